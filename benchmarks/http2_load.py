@@ -0,0 +1,218 @@
+"""
+Throughput and connection count of concurrent `tts.generate()` calls over HTTP/1.1 and HTTP/2.
+
+A local stand-in server answers `POST /tts/bytes` with `--size` bytes of audio after `--delay`
+milliseconds, over HTTP/1.1 or cleartext HTTP/2 (prior knowledge, as TLS is not needed
+locally), and counts the connections it accepts. For every concurrency level, a fresh
+`AsyncCartesia` client sends `--rounds` waves of that many concurrent requests in three modes:
+
+- `HTTP/1.1`: the default client.
+- `fallback`: `DefaultAsyncHttpxClient(http2=True)` talking to a server without HTTP/2, which
+  uses HTTP/1.1 with the pool limits of the HTTP/2 mode.
+- `HTTP/2`: the same client, speaking HTTP/2.
+
+The server shares the process (and the GIL) with the client, so absolute rates are lower
+than against a real deployment; compare the rows with each other.
+
+Requires the `http2` extra (`pip install 'cartesia[http2]'`).
+
+Run:
+    python benchmarks/http2_load.py --concurrency 10 100 1000 --rounds 3
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import argparse
+import threading
+from typing import Any, Dict, List, Tuple, Optional
+
+import httpx
+from h2.config import H2Configuration
+from h2.events import StreamEnded, DataReceived, WindowUpdated, ConnectionTerminated
+from h2.settings import SettingCodes
+from h2.connection import H2Connection
+
+from cartesia import AsyncCartesia, DefaultAsyncHttpxClient
+
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+GENERATE_ARGS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+    "transcript": "Hello, world!",
+    "voice": {"mode": "id", "id": "voice-id"},
+}
+
+
+class StandInServer:
+    """Serves fixed-size audio responses over HTTP/1.1 and h2c on an event loop in its own thread."""
+
+    def __init__(self, *, delay: float, size: int, max_streams: int) -> None:
+        self.delay = delay
+        self.max_streams = max_streams
+        self.body = bytes(size)
+        self.connections = 0
+        self.open_connections = 0
+        self.peak_connections = 0
+        self._loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._server: Optional[asyncio.Server] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        return f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    def start(self) -> None:
+        self._thread.start()
+        self._started.wait()
+
+    def reset(self) -> None:
+        self.connections = 0
+        self.peak_connections = self.open_connections
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0, backlog=4096))
+        self._started.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.open_connections += 1
+        self.peak_connections = max(self.peak_connections, self.open_connections)
+        try:
+            start = await reader.readexactly(len(_H2_PREFACE))
+            if start == _H2_PREFACE:
+                await self._serve_h2(start, reader, writer)
+            else:
+                await self._serve_http11(start, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.open_connections -= 1
+            writer.close()
+
+    async def _serve_http11(self, start: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        buffered = start
+        while True:
+            head = buffered + await reader.readuntil(b"\r\n\r\n") if b"\r\n\r\n" not in buffered else buffered
+            buffered = b""
+            headers = head.decode("latin-1").lower()
+            length = 0
+            for line in headers.split("\r\n"):
+                if line.startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            await asyncio.sleep(self.delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: audio/raw\r\nContent-Length: %d\r\n\r\n" % len(self.body) + self.body
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, preface: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = H2Connection(config=H2Configuration(client_side=False))
+        conn.initiate_connection()
+        conn.update_settings({SettingCodes.MAX_CONCURRENT_STREAMS: self.max_streams})
+        writer.write(conn.data_to_send())
+        # response bodies still waiting for flow-control window, by stream
+        pending: Dict[int, memoryview] = {}
+
+        def flush() -> None:
+            for stream_id, data in list(pending.items()):
+                window = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                while data and window > 0:
+                    conn.send_data(stream_id, data[:window].tobytes())
+                    data = data[window:]
+                    window = min(conn.local_flow_control_window(stream_id), conn.max_outbound_frame_size)
+                if data:
+                    pending[stream_id] = data
+                else:
+                    conn.end_stream(stream_id)
+                    del pending[stream_id]
+            writer.write(conn.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.delay)
+            conn.send_headers(
+                stream_id, [(":status", "200"), ("content-type", "audio/raw"), ("content-length", str(len(self.body)))]
+            )
+            pending[stream_id] = memoryview(self.body)
+            flush()
+
+        tasks: List[asyncio.Task[None]] = []
+        data = preface
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, StreamEnded):
+                    tasks.append(asyncio.ensure_future(respond(event.stream_id)))
+                elif isinstance(event, WindowUpdated):
+                    flush()
+                elif isinstance(event, ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+        for task in tasks:
+            task.cancel()
+
+
+def make_http_client(mode: str) -> Optional[httpx.AsyncClient]:
+    if mode == "HTTP/2":
+        # cleartext HTTP/2 has no TLS handshake to negotiate it in, so disable HTTP/1.1 to use it
+        return DefaultAsyncHttpxClient(http1=False, http2=True)
+    if mode == "fallback":
+        # without TLS there is no ALPN, so this client speaks HTTP/1.1 like it would to a server without h2
+        return DefaultAsyncHttpxClient(http2=True)
+    return None
+
+
+async def run(url: str, server: StandInServer, *, mode: str, concurrency: int, rounds: int) -> Tuple[float, int, int]:
+    """Returns requests per second, connections opened and peak open connections."""
+    http_client = make_http_client(mode)
+    server.reset()
+    # a generous timeout, as requests beyond the pool's `max_connections` wait for a free connection
+    async with AsyncCartesia(
+        api_key="benchmark", base_url=url, http_client=http_client, max_retries=0, timeout=600
+    ) as client:
+
+        async def generate() -> int:
+            response = await client.tts.generate(**GENERATE_ARGS)
+            return len(await response.read())
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            sizes = await asyncio.gather(*(generate() for _ in range(concurrency)))
+            assert all(size == len(server.body) for size in sizes)
+        elapsed = time.perf_counter() - start
+    return concurrency * rounds / elapsed, server.connections, server.peak_connections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=3, help="waves of concurrent requests per run")
+    parser.add_argument("--delay", type=float, default=50, help="server generation time in ms")
+    parser.add_argument("--size", type=int, default=32_768, help="response size in bytes")
+    parser.add_argument("--max-streams", type=int, default=100, help="concurrent streams per HTTP/2 connection")
+    args = parser.parse_args()
+
+    server = StandInServer(delay=args.delay / 1000, size=args.size, max_streams=args.max_streams)
+    server.start()
+
+    print(f"{'concurrency':>11} {'mode':>8} {'req/s':>8} {'opened':>7} {'peak open':>10}")
+    for concurrency in args.concurrency:
+        for mode in ("HTTP/1.1", "fallback", "HTTP/2"):
+            rate, opened, peak = asyncio.run(
+                run(server.url, server, mode=mode, concurrency=concurrency, rounds=args.rounds)
+            )
+            print(f"{concurrency:>11} {mode:>8} {rate:>8.0f} {opened:>7} {peak:>10}")
+
+
+if __name__ == "__main__":
+    main()
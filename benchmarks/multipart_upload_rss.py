@@ -0,0 +1,100 @@
+"""
+Peak resident memory of `client.stt.transcribe()` uploading a large file.
+
+Each mode runs in a fresh interpreter so peak RSS is not shared between them, and
+uploads through a transport that consumes the multipart body chunk by chunk, as a
+socket would. `path` passes the file's path, `handle` an open binary file and
+`bytes` the file's contents, which is what a path used to be turned into.
+
+Run:
+    python benchmarks/multipart_upload_rss.py --size-mb 1024
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+from typing import Tuple
+from pathlib import Path
+
+import httpx
+
+from cartesia import Cartesia
+
+MODES = ["path", "handle", "bytes"]
+
+
+class DrainTransport(httpx.BaseTransport):
+    def __init__(self) -> None:
+        self.received = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.SyncByteStream)
+        for chunk in request.stream:
+            self.received += len(chunk)
+        return httpx.Response(200, json={"type": "transcript", "text": ""})
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / (1 << 10)
+
+
+def upload(mode: str, path: Path) -> Tuple[float, float, int]:
+    transport = DrainTransport()
+    client = Cartesia(api_key="benchmark", http_client=httpx.Client(transport=transport), max_retries=0)
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if mode == "path":
+        client.stt.transcribe(file=path, model="ink-whisper")
+    elif mode == "handle":
+        with path.open("rb") as file:
+            client.stt.transcribe(file=file, model="ink-whisper")
+    else:
+        client.stt.transcribe(file=(path.name, path.read_bytes()), model="ink-whisper")
+    elapsed = time.perf_counter() - start
+    return peak_rss_mb() - baseline, elapsed, transport.received
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=1024, help="size of the uploaded file")
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        growth, elapsed, received = upload(args.run, Path(args.file))
+        print(f"{growth:.1f} {elapsed:.3f} {received}")
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "recording.wav"
+        with path.open("wb") as file:
+            block = os.urandom(1 << 20)
+            for _ in range(args.size_mb):
+                file.write(block)
+
+        print(f"{'mode':>8} {'peak RSS growth':>16} {'seconds':>8} {'MB/s':>8}")
+        for mode in args.modes:
+            output = subprocess.run(
+                [sys.executable, __file__, "--run", mode, "--file", str(path)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            growth_s, elapsed_s, received_s = output.split()
+            growth, elapsed, received = float(growth_s), float(elapsed_s), int(received_s)
+            throughput = received / (1 << 20) / elapsed
+            print(f"{mode:>8} {growth:>13.1f} MB {elapsed:>8.2f} {throughput:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Single-core throughput of `PCMTranscoder`, in input samples per second.
+
+Audio is fed in `--chunk-ms` chunks, as it would arrive from `WebSocketContext.receive()`,
+through each conversion and backend. The `realtime` column is how many concurrent
+streams one core could keep up with.
+
+Run:
+    python benchmarks/pcm_transcode.py --seconds 10 --chunk-ms 20
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import struct
+import argparse
+from typing import List, Tuple
+
+from cartesia.lib._transcode import PCMTranscoder
+
+CONVERSIONS: List[Tuple[str, int, str, int]] = [
+    ("pcm_f32le", 24000, "pcm_mulaw", 8000),
+    ("pcm_f32le", 24000, "pcm_s16le", 16000),
+    ("pcm_s16le", 44100, "pcm_s16le", 16000),
+    ("pcm_s16le", 16000, "pcm_alaw", 16000),
+    ("pcm_mulaw", 8000, "pcm_s16le", 16000),
+]
+
+
+def build_chunks(encoding: str, rate: int, seconds: float, chunk_ms: float) -> List[bytes]:
+    n = int(rate * seconds)
+    signal = [0.4 * math.sin(2 * math.pi * 440 * i / rate) for i in range(n)]
+    if encoding == "pcm_f32le":
+        audio = struct.pack(f"<{n}f", *signal)
+    else:
+        audio = struct.pack(f"<{n}h", *(int(x * 32767) for x in signal))
+        if encoding != "pcm_s16le":
+            to_g711 = PCMTranscoder(
+                from_encoding="pcm_s16le",
+                from_sample_rate=rate,
+                to_encoding=encoding,  # type: ignore[arg-type]
+                to_sample_rate=rate,
+            )
+            audio = to_g711.convert(audio)
+    width = len(audio) // n
+    step = max(int(rate * chunk_ms / 1000) * width, width)
+    return [audio[i : i + step] for i in range(0, len(audio), step)]
+
+
+def measure(transcoder: PCMTranscoder, chunks: List[bytes]) -> float:
+    start = time.perf_counter()
+    for chunk in chunks:
+        transcoder.convert(chunk)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0, help="seconds of audio per run")
+    parser.add_argument("--chunk-ms", type=float, default=20.0)
+    parser.add_argument("--backends", nargs="+", default=["numpy", "python"])
+    args = parser.parse_args()
+
+    print(f"{'conversion':>40} {'backend':>8} {'samples/s':>12} {'realtime':>9}")
+    for from_encoding, from_rate, to_encoding, to_rate in CONVERSIONS:
+        chunks = build_chunks(from_encoding, from_rate, args.seconds, args.chunk_ms)
+        label = f"{from_encoding}@{from_rate} -> {to_encoding}@{to_rate}"
+        for backend in args.backends:
+            try:
+                transcoder = PCMTranscoder(
+                    from_encoding=from_encoding,  # type: ignore[arg-type]
+                    from_sample_rate=from_rate,
+                    to_encoding=to_encoding,  # type: ignore[arg-type]
+                    to_sample_rate=to_rate,
+                    backend=backend,  # type: ignore[arg-type]
+                )
+            except ImportError:
+                print(f"{label:>40} {backend:>8} {'n/a':>12}")
+                continue
+            # Warm up lookup tables.
+            transcoder.convert(chunks[0])
+            transcoder.flush()
+            elapsed = measure(transcoder, chunks)
+            throughput = from_rate * args.seconds / elapsed
+            print(f"{label:>40} {backend:>8} {throughput:>12.0f} {throughput / from_rate:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
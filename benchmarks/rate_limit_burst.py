@@ -0,0 +1,93 @@
+"""
+A burst of concurrent `tts.generate()` calls against a concurrency-limited API, with and without a
+`ConcurrencyGovernor`.
+
+A mock transport stands in for the API: it serves up to `--capacity` requests at once, each taking
+`--delay` milliseconds, and answers any request beyond that with a `429` and a `retry-after-ms`
+header of `--retry-after` milliseconds. `--requests` calls are started at once on an
+`AsyncCartesia` client with the default two retries, and the run reports how many succeeded, how
+many failed with `RateLimitError`, how many `429`s the API sent and how long the burst took.
+
+Run:
+    python benchmarks/rate_limit_burst.py --requests 200 --capacity 16
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import argparse
+from typing import Any, Dict, Tuple, Optional
+
+import httpx
+
+from cartesia import AsyncCartesia, RateLimitError, ConcurrencyGovernor
+
+GENERATE_ARGS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+    "transcript": "Hello, world!",
+    "voice": {"mode": "id", "id": "voice-id"},
+}
+
+
+class LimitedAPI:
+    def __init__(self, *, capacity: int, delay: float, retry_after: float) -> None:
+        self.capacity = capacity
+        self.delay = delay
+        self.retry_after = retry_after
+        self.active = 0
+        self.rejected = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:  # noqa: ARG002
+        if self.active >= self.capacity:
+            self.rejected += 1
+            return httpx.Response(429, headers={"retry-after-ms": str(self.retry_after * 1000)})
+        self.active += 1
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return httpx.Response(200, content=bytes(1024))
+
+
+async def run(args: argparse.Namespace, governor: Optional[ConcurrencyGovernor]) -> Tuple[int, int, int, float]:
+    """Returns successes, failures, 429s and seconds taken."""
+    api = LimitedAPI(capacity=args.capacity, delay=args.delay / 1000, retry_after=args.retry_after / 1000)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(api))
+    async with AsyncCartesia(
+        api_key="benchmark", base_url="http://localhost", http_client=http_client, governor=governor
+    ) as client:
+
+        async def generate() -> bool:
+            try:
+                response = await client.tts.generate(**GENERATE_ARGS)
+                await response.read()
+                return True
+            except RateLimitError:
+                return False
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(generate() for _ in range(args.requests)))
+        elapsed = time.perf_counter() - start
+    succeeded = sum(results)
+    return succeeded, len(results) - succeeded, api.rejected, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=16, help="requests the API serves at once")
+    parser.add_argument("--delay", type=float, default=50, help="generation time in ms")
+    parser.add_argument("--retry-after", type=float, default=100, help="retry-after-ms sent with a 429")
+    args = parser.parse_args()
+
+    print(f"{'client':>9} {'ok':>5} {'failed':>7} {'429s':>6} {'seconds':>8}")
+    for name in ("plain", "governed"):
+        governor = ConcurrencyGovernor(initial_limit=args.capacity * 2) if name == "governed" else None
+        succeeded, failed, rejected, elapsed = asyncio.run(run(args, governor))
+        print(f"{name:>9} {succeeded:>5} {failed:>7} {rejected:>6} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+SSE framing throughput for `tts.generate_sse()`-shaped streams: line-joining vs. buffer scanning.
+
+Each event is a TTS `chunk` whose base64 `data` field makes the `data:` line `--sizes`
+bytes long, and the stream is delivered in `--chunk-size` pieces as read off the socket.
+The `joined` decoder is the previous implementation, which grew each event with
+`data += line` and then split and decoded it again line by line; `scanned` is the current
+`SSEDecoder`. Events are counted once `.json()` has been called on them.
+
+Run:
+    python benchmarks/sse_decode.py --sizes 1024 65536 1048576 --chunk-size 16384
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+from typing import Any, List, Callable, Iterator, Optional
+
+from cartesia._streaming import SSEDecoder, ServerSentEvent
+
+
+class JoinedSSEDecoder:
+    """The decoder as it was before buffer scanning, kept here for comparison."""
+
+    def __init__(self) -> None:
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+        self._last_event_id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+        for chunk in self._iter_chunks(iterator):
+            for raw_line in chunk.splitlines():
+                sse = self.decode(raw_line.decode("utf-8"))
+                if sse:
+                    yield sse
+
+    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
+        data = b""
+        for chunk in iterator:
+            for line in chunk.splitlines(keepends=True):
+                data += line
+                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
+                    yield data
+                    data = b""
+        if data:
+            yield data
+
+    def decode(self, line: str) -> Optional[ServerSentEvent]:
+        if not line:
+            if not self._event and not self._data and not self._last_event_id and self._retry is None:
+                return None
+            sse = ServerSentEvent(
+                event=self._event, data="\n".join(self._data), id=self._last_event_id, retry=self._retry
+            )
+            self._event = None
+            self._data = []
+            self._retry = None
+            return sse
+        if line.startswith(":"):
+            return None
+        fieldname, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if fieldname == "event":
+            self._event = value
+        elif fieldname == "data":
+            self._data.append(value)
+        elif fieldname == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif fieldname == "retry":
+            try:
+                self._retry = int(value)
+            except (TypeError, ValueError):
+                pass
+        return None
+
+
+def build_stream(event_size: int, total_size: int) -> bytes:
+    overhead = len(json.dumps({"type": "chunk", "context_id": "ctx", "data": ""}))
+    payload = "A" * max(4, (event_size - overhead) // 4 * 4)
+    event = b"data: " + json.dumps({"type": "chunk", "context_id": "ctx", "data": payload}).encode() + b"\n\n"
+    return event * max(1, total_size // len(event))
+
+
+def chunked(stream: bytes, chunk_size: int) -> List[bytes]:
+    return [stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def measure(decode: Callable[[Iterator[bytes]], Iterator[ServerSentEvent]], chunks: List[bytes]) -> float:
+    """Returns stream bytes decoded per second."""
+    start = time.perf_counter()
+    for sse in decode(iter(chunks)):
+        sse.json()
+    elapsed = time.perf_counter() - start
+    return sum(len(chunk) for chunk in chunks) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 65536, 1048576], help="event sizes in bytes")
+    parser.add_argument("--chunk-size", type=int, default=16384)
+    parser.add_argument("--total", type=int, default=32 * 1024 * 1024, help="stream size per run in bytes")
+    args = parser.parse_args()
+
+    decoders: List[Any] = [
+        ("joined", lambda chunks: JoinedSSEDecoder().iter_bytes(chunks)),
+        ("scanned", lambda chunks: SSEDecoder().iter_bytes(chunks)),
+    ]
+
+    print(f"{'event':>10} {'joined MB/s':>12} {'scanned MB/s':>13} {'speedup':>8}")
+    for size in args.sizes:
+        chunks = chunked(build_stream(size, args.total), args.chunk_size)
+        rates = [measure(decode, chunks) for _, decode in decoders]
+        print(f"{size:>10} {rates[0] / 1e6:>12.1f} {rates[1] / 1e6:>13.1f} {rates[1] / rates[0]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Audio throughput of TTS chunk parsing: pydantic models vs. `raw_audio=True`.
+
+Each frame is a WebSocket `chunk` message carrying `--samples` pcm_f32le samples. The
+model path runs `json.loads` + `construct_type_unchecked` and then reads `Chunk.audio`
+`--reads` times (each access decodes the base64 payload again). The raw path builds an
+`AudioChunk`, decoding the payload once.
+
+Run:
+    python benchmarks/tts_audio_decode.py --frames 2000 --samples 4410 --reads 2
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import base64
+import argparse
+from typing import Any, List, Callable
+
+from cartesia.lib._tts import TTSResourceConnection
+
+
+def build_frames(n_frames: int, n_samples: int) -> List[bytes]:
+    audio = bytes(4 * n_samples)
+    payload = base64.b64encode(audio).decode()
+    return [
+        json.dumps(
+            {
+                "type": "chunk",
+                "context_id": "ctx",
+                "data": payload,
+                "done": False,
+                "status_code": 206,
+                "step_time": float(i),
+            }
+        ).encode()
+        for i in range(n_frames)
+    ]
+
+
+def measure(parse: Callable[[bytes], Any], frames: List[bytes], reads: int) -> float:
+    """Returns decoded audio bytes per second."""
+    total = 0
+    start = time.perf_counter()
+    for frame in frames:
+        event = parse(frame)
+        for _ in range(reads):
+            total += len(event.audio)
+    elapsed = time.perf_counter() - start
+    return total / reads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=2_000)
+    parser.add_argument("--samples", type=int, default=4_410, help="pcm_f32le samples per chunk")
+    parser.add_argument("--reads", type=int, default=2, help="how many times the consumer reads `.audio`")
+    args = parser.parse_args()
+
+    frames = build_frames(args.frames, args.samples)
+    model = TTSResourceConnection(object(), raw_audio=False)  # type: ignore[arg-type]
+    raw = TTSResourceConnection(object(), raw_audio=True)  # type: ignore[arg-type]
+
+    print(f"{'path':>8} {'MB/s':>10}")
+    for name, connection in (("model", model), ("raw", raw)):
+        rate = measure(connection.parse_event, frames, args.reads)
+        print(f"{name:>8} {rate / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
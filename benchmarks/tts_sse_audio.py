@@ -0,0 +1,86 @@
+"""
+Per-event cost of reading audio from a `tts.generate_sse()` stream.
+
+A stream of `--events` TTS `chunk` events, each carrying `--samples` pcm_f32le samples, is
+served from memory and read in four ways: iterating `TTSSSEChunkEvent` models and reading
+`.audio`, iterating with `raw_audio=True`, `stream.iter_audio()`, and a baseline that only
+base64-decodes pre-extracted payloads. The per-event overhead is the time above the baseline.
+
+Run:
+    python benchmarks/tts_sse_audio.py --events 2000 --samples 4410
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import base64
+import argparse
+from typing import Any, List, Callable
+
+import httpx
+
+from cartesia import Cartesia
+from cartesia.lib._raw_audio import AudioStream, RawAudioStream
+from cartesia.types.tts_sse_event import TTSSSEEvent
+
+
+def build_body(n_events: int, n_samples: int) -> List[bytes]:
+    payload = base64.b64encode(bytes(4 * n_samples)).decode()
+    events = [
+        b"data: "
+        + json.dumps(
+            {"type": "chunk", "context_id": "ctx", "data": payload, "done": False, "status_code": 206, "step_time": 1.0}
+        ).encode()
+        + b"\n\n"
+        for _ in range(n_events)
+    ]
+    body = b"".join(events)
+    # delivered in 16 KiB reads, as off a socket
+    return [body[i : i + 16384] for i in range(0, len(body), 16384)]
+
+
+def measure(read: Callable[[], int], n_events: int) -> float:
+    """Returns microseconds per event."""
+    start = time.perf_counter()
+    total = read()
+    elapsed = time.perf_counter() - start
+    assert total > 0
+    return elapsed / n_events * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--samples", type=int, default=4_410, help="pcm_f32le samples per chunk")
+    args = parser.parse_args()
+
+    body = build_body(args.events, args.samples)
+    payloads = [base64.b64encode(bytes(4 * args.samples))] * args.events
+    client = Cartesia(api_key="benchmark", base_url="http://localhost")
+
+    def stream(cls: Any) -> Any:
+        return cls(cast_to=TTSSSEEvent, response=httpx.Response(200, content=iter(body)), client=client)
+
+    def models() -> int:
+        return sum(len(event.audio or b"") for event in stream(AudioStream[TTSSSEEvent]))
+
+    def raw_audio() -> int:
+        return sum(len(event.audio or b"") for event in stream(RawAudioStream))
+
+    def iter_audio() -> int:
+        return sum(len(audio) for audio in stream(AudioStream[TTSSSEEvent]).iter_audio())
+
+    def baseline() -> int:
+        return sum(len(base64.b64decode(payload)) for payload in payloads)
+
+    print(f"{'path':>12} {'us/event':>10} {'overhead':>10}")
+    floor = measure(baseline, args.events)
+    for name, read in (("models", models), ("raw_audio", raw_audio), ("iter_audio", iter_audio)):
+        cost = measure(read, args.events)
+        print(f"{name:>12} {cost:>10.1f} {cost - floor:>10.1f}")
+    print(f"{'b64 only':>12} {floor:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
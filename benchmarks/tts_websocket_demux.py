@@ -0,0 +1,148 @@
+"""
+Throughput of sync `WebSocketContext.receive()` with many contexts on one connection.
+
+Compares the background reader thread (current implementation) against the previous
+design, where whichever context was reading acted as the router for every other context.
+Frames are served from memory so the numbers reflect client-side cost only; use
+`--work-us` to simulate per-event consumer I/O. The `delivered` column shows events
+that reached their consumer, which the router design can lose when several threads race
+on the connection.
+
+Run:
+    python benchmarks/tts_websocket_demux.py --frames 20000 --contexts 1 8 64 --work-us 100
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import queue
+import argparse
+import threading
+from typing import Any, List, Callable, Iterator
+from collections import deque
+
+from websockets.protocol import State
+from websockets.exceptions import ConnectionClosedOK
+
+from cartesia.lib._tts import WebSocketContext, TTSResourceConnection
+
+
+class MemoryWS:
+    """Serves pre-built frames, then reports a clean close."""
+
+    def __init__(self, frames: List[bytes]) -> None:
+        self._frames = deque(frames)
+        self._lock = threading.Lock()
+        self.state = State.OPEN
+
+    def recv(self, decode: bool = True, timeout: Any = None) -> bytes:  # noqa: ARG002
+        with self._lock:
+            if not self._frames:
+                raise ConnectionClosedOK(rcvd=None, sent=None)
+            return self._frames.popleft()
+
+    def send(self, data: Any) -> None:
+        pass
+
+    def close(self, *, code: int = 1000, reason: str = "") -> None:  # noqa: ARG002
+        self.state = State.CLOSED
+
+
+def build_frames(n_contexts: int, n_frames: int) -> List[bytes]:
+    payload = "A" * 4096
+    per_context = max(n_frames // n_contexts, 1)
+    frames: List[bytes] = []
+    for i in range(per_context):
+        for c in range(n_contexts):
+            frames.append(
+                json.dumps(
+                    {
+                        "type": "chunk",
+                        "context_id": f"ctx-{c}",
+                        "data": payload,
+                        "done": False,
+                        "status_code": 206,
+                        "step_time": float(i),
+                    }
+                ).encode()
+            )
+    for c in range(n_contexts):
+        frames.append(json.dumps({"type": "done", "context_id": f"ctx-{c}", "done": True, "status_code": 200}).encode())
+    return frames
+
+
+def legacy_receive(ctx: WebSocketContext) -> Iterator[Any]:
+    """The previous router loop: drain our queue, otherwise read and route the next frame."""
+    connection = ctx._connection
+    my_queue = connection._context_queues[ctx._context_id]
+    while True:
+        try:
+            event = my_queue.get_nowait()
+            if isinstance(event, BaseException):
+                raise event
+            yield event
+            if event.type in ("done", "error"):
+                return
+            continue
+        except queue.Empty:
+            pass
+
+        try:
+            event = connection.parse_event(connection.recv_bytes())
+        except ConnectionClosedOK:
+            return
+
+        if event.context_id == ctx._context_id:
+            yield event
+            if event.type in ("done", "error"):
+                return
+        elif event.context_id in connection._context_queues:
+            connection._context_queues[event.context_id].put(event)
+
+
+def reader_receive(ctx: WebSocketContext) -> Iterator[Any]:
+    return ctx.receive()
+
+
+def run(
+    receive: Callable[[WebSocketContext], Iterator[Any]], n_contexts: int, n_frames: int, work: float
+) -> tuple[int, float]:
+    frames = build_frames(n_contexts, n_frames)
+    connection = TTSResourceConnection(MemoryWS(frames))  # type: ignore[arg-type]
+    contexts = [connection.context(f"ctx-{c}") for c in range(n_contexts)]
+    delivered = [0] * n_contexts
+
+    def consume(index: int) -> None:
+        for _ in receive(contexts[index]):
+            delivered[index] += 1
+            if work:
+                # Stand-in for I/O the consumer does per event, e.g. writing to an audio device.
+                time.sleep(work)
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(n_contexts)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return sum(delivered), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=20_000, help="approximate number of chunk frames per run")
+    parser.add_argument("--contexts", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--work-us", type=float, default=0.0, help="simulated per-event consumer I/O in microseconds")
+    args = parser.parse_args()
+
+    print(f"{'contexts':>8} {'mode':>8} {'delivered':>10} {'seconds':>8} {'events/s':>10}")
+    for n_contexts in args.contexts:
+        for name, receive in (("router", legacy_receive), ("reader", reader_receive)):
+            delivered, elapsed = run(receive, n_contexts, args.frames, args.work_us / 1e6)
+            print(f"{n_contexts:>8} {name:>8} {delivered:>10} {elapsed:>8.3f} {delivered / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Per-frame cost of WebSocket event parsing: pydantic models vs. `fast_parse=True`.
+
+Each frame type is parsed `--frames` times through `EventParser` with and without
+the fast-path factories, mirroring what `parse_event()` does on the TTS and STT
+connections. `orjson` is used for both paths when it is installed.
+
+Run:
+    python benchmarks/ws_event_parse.py --frames 100000
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+from typing import Any, Dict, List, Tuple, Mapping, Callable
+
+from cartesia.lib import _fast_events
+from cartesia.lib._fast_events import (
+    TTS_FAST_EVENTS,
+    STT_AUTO_FINALIZE_FAST_EVENTS,
+    STT_MANUAL_FINALIZE_FAST_EVENTS,
+    EventParser,
+)
+from cartesia.types.websocket_response import WebsocketResponse
+from cartesia.types.stt.stt_auto_finalize_websocket_response import STTAutoFinalizeWebsocketResponse
+from cartesia.types.stt.stt_manual_finalize_websocket_response import STTManualFinalizeWebsocketResponse
+
+CASES: List[Tuple[str, Any, Mapping[str, Callable[[Dict[str, Any]], Any]], Dict[str, Any]]] = [
+    (
+        "tts chunk",
+        WebsocketResponse,
+        TTS_FAST_EVENTS,
+        {"type": "chunk", "context_id": "ctx", "data": "A" * 1024, "done": False, "status_code": 206, "step_time": 1.0},
+    ),
+    (
+        "tts timestamps",
+        WebsocketResponse,
+        TTS_FAST_EVENTS,
+        {
+            "type": "timestamps",
+            "context_id": "ctx",
+            "done": False,
+            "status_code": 206,
+            "word_timestamps": {"words": ["hello", "world"], "start": [0.0, 0.4], "end": [0.35, 0.8]},
+        },
+    ),
+    (
+        "stt turn.update",
+        STTAutoFinalizeWebsocketResponse,
+        STT_AUTO_FINALIZE_FAST_EVENTS,
+        {"type": "turn.update", "request_id": "req", "transcript": "hello there, how are"},
+    ),
+    (
+        "stt transcript",
+        STTManualFinalizeWebsocketResponse,
+        STT_MANUAL_FINALIZE_FAST_EVENTS,
+        {"type": "transcript", "request_id": "req", "text": "hello ", "is_final": False, "duration": 0.1},
+    ),
+]
+
+
+def measure(parser: EventParser[Any], frame: bytes, n_frames: int) -> float:
+    """Returns frames parsed per second."""
+    start = time.perf_counter()
+    for _ in range(n_frames):
+        parser.parse(frame)
+    return n_frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"json decoder: {'orjson' if _fast_events.orjson is not None else 'json'}")
+    print(f"{'frame':>16} {'model/s':>10} {'fast/s':>10} {'speedup':>8}")
+    for name, type_, factories, payload in CASES:
+        frame = json.dumps(payload).encode()
+        model = measure(EventParser(type_), frame, args.frames)
+        fast = measure(EventParser(type_, factories), frame, args.frames)
+        print(f"{name:>16} {model:>10.0f} {fast:>10.0f} {fast / model:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
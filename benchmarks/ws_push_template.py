@@ -0,0 +1,100 @@
+"""
+Per-push CPU cost of `WebSocketContext.push()`: precompiled template vs. the full request path.
+
+A context is created with the given options and `--pushes` token-sized transcripts are
+pushed to a WebSocket stand-in that discards frames, so only request building,
+transforming and serialization are measured. `full` sends the same request through
+`ctx.send()`, which is what every `push()` did before templates.
+
+Run:
+    python benchmarks/ws_push_template.py --pushes 50000
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+import threading
+from typing import Any, Dict, List, Tuple
+
+from websockets.protocol import State
+from websockets.exceptions import ConnectionClosedOK
+
+from cartesia.lib._tts import WebSocketContext, TTSResourceConnection
+
+VOICE = {"mode": "id", "id": "6ccbfb76-1fc6-48f7-b71d-91ac6298247b"}
+
+CASES: List[Tuple[str, Dict[str, Any]]] = [
+    ("voice only", {"voice": VOICE}),
+    (
+        "typical agent",
+        {
+            "voice": VOICE,
+            "model_id": "sonic-3",
+            "output_format": {"container": "raw", "encoding": "pcm_s16le", "sample_rate": 24000},
+            "language": "en",
+            "add_timestamps": True,
+            "generation_config": {"speed": 1.0, "volume": 1.0},
+            "max_buffer_delay_ms": 300,
+        },
+    ),
+]
+
+
+class NullWS:
+    """Discards every frame; `recv` blocks until the connection is closed."""
+
+    def __init__(self) -> None:
+        self._closed = threading.Event()
+
+    @property
+    def state(self) -> State:
+        return State.CLOSED if self._closed.is_set() else State.OPEN
+
+    def send(self, data: Any) -> None:
+        pass
+
+    def recv(self, decode: bool = True, timeout: Any = None) -> Any:  # noqa: ARG002
+        self._closed.wait()
+        raise ConnectionClosedOK(rcvd=None, sent=None)
+
+    def close(self, *, code: int = 1000, reason: str = "") -> None:  # noqa: ARG002
+        self._closed.set()
+
+
+def measure_push(ctx: WebSocketContext, tokens: List[str]) -> float:
+    """Returns microseconds of CPU time per push."""
+    start = time.process_time()
+    for token in tokens:
+        ctx.push(token)
+    return (time.process_time() - start) / len(tokens) * 1e6
+
+
+def measure_full(ctx: WebSocketContext, tokens: List[str], voice: Any) -> float:
+    start = time.process_time()
+    for token in tokens:
+        ctx.send(transcript=token, voice=voice)
+    return (time.process_time() - start) / len(tokens) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pushes", type=int, default=50_000)
+    args = parser.parse_args()
+
+    words = "the quick brown fox jumps over the lazy dog and keeps on running".split()
+    tokens = [f" {words[i % len(words)]}" for i in range(args.pushes)]
+
+    print(f"{'context':>14} {'full us':>8} {'template us':>12} {'speedup':>8}")
+    for name, options in CASES:
+        connection = TTSResourceConnection(NullWS())  # type: ignore[arg-type]
+        try:
+            full = measure_full(connection.context("full", **options), tokens, options["voice"])
+            template = measure_push(connection.context("template", **options), tokens)
+        finally:
+            connection.close()
+        print(f"{name:>14} {full:>8.2f} {template:>12.2f} {full / template:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
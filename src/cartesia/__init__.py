@@ -17,7 +17,9 @@ from ._client import (
     RequestOptions,
 )
 from ._models import BaseModel
+from ._timing import TimingEvent
 from ._version import __title__, __version__
+from ._governor import ConcurrencyGovernor
 from ._response import APIResponse as APIResponse, AsyncAPIResponse as AsyncAPIResponse
 from ._constants import DEFAULT_TIMEOUT, DEFAULT_MAX_RETRIES, DEFAULT_CONNECTION_LIMITS
 from ._exceptions import (
@@ -30,14 +32,17 @@ from ._exceptions import (
     APITimeoutError,
     BadRequestError,
     APIConnectionError,
+    TTSGenerationError,
     AuthenticationError,
     InternalServerError,
     PermissionDeniedError,
+    STTTranscriptionError,
     WebSocketQueueFullError,
     UnprocessableEntityError,
     APIResponseValidationError,
     WebSocketConnectionClosedError,
 )
+from .lib._timing import LatencyHistogram, OpenTelemetryObserver
 from ._base_client import DefaultHttpxClient, DefaultAioHttpClient, DefaultAsyncHttpxClient
 from ._utils._logs import setup_logging as _setup_logging
 from .types.websocket_reconnection import ReconnectingEvent, ReconnectingOverrides
@@ -88,6 +93,12 @@ __all__ = [
     "ReconnectingOverrides",
     "WebSocketQueueFullError",
     "WebSocketConnectionClosedError",
+    "TTSGenerationError",
+    "STTTranscriptionError",
+    "TimingEvent",
+    "LatencyHistogram",
+    "OpenTelemetryObserver",
+    "ConcurrencyGovernor",
 ]
 
 if not _t.TYPE_CHECKING:
@@ -11,6 +11,7 @@ import logging
 import platform
 import warnings
 import email.utils
+import importlib.util
 from types import TracebackType
 from random import random
 from typing import (
@@ -25,12 +26,14 @@ from typing import (
     Iterable,
     Iterator,
     Optional,
+    Sequence,
     Generator,
     AsyncIterator,
     cast,
     overload,
 )
 from typing_extensions import Literal, override, get_origin
+from concurrent.futures import ThreadPoolExecutor
 
 import anyio
 import httpx
@@ -64,6 +67,9 @@ from ._types import (
 from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
 from ._compat import PYDANTIC_V1, model_copy, model_dump
 from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
+from ._timing import Timings, TimingObserver
+from ._governor import ConcurrencyGovernor, release_when_closed
+from ._prefetch import prefetch_pages, async_prefetch_pages
 from ._response import (
     APIResponse,
     BaseAPIResponse,
@@ -76,16 +82,19 @@ from ._constants import (
     DEFAULT_MAX_RETRIES,
     INITIAL_RETRY_DELAY,
     RAW_RESPONSE_HEADER,
+    HTTP2_CONNECTION_LIMITS,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
 )
 from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
 from ._exceptions import (
+    CartesiaError,
     APIStatusError,
     APITimeoutError,
     APIConnectionError,
     APIResponseValidationError,
 )
+from ._keep_alive import KeepAlive, AsyncKeepAlive
 from ._utils._json import openapi_dumps
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -256,7 +265,16 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    def iter_pages(self: SyncPageT) -> Iterator[SyncPageT]:
+    def iter_pages(self: SyncPageT, *, prefetch: int = 0) -> Iterator[SyncPageT]:
+        """Iterate over this page and the pages after it.
+
+        With `prefetch=N`, up to `N` pages are requested in a background thread ahead of
+        the page being consumed, so that network latency overlaps with processing.
+        """
+        if prefetch:
+            yield from prefetch_pages(self, _next_sync_page, prefetch)
+            return
+
         page = self
         while True:
             yield page
@@ -265,6 +283,11 @@ class BaseSyncPage(BasePage[_T], Generic[_T]):
             else:
                 return
 
+    def iter_items(self, *, prefetch: int = 0) -> Iterator[_T]:
+        """Iterate over the items of this page and the pages after it, see `iter_pages()`."""
+        for page in self.iter_pages(prefetch=prefetch):
+            yield from page._get_page_items()
+
     def get_next_page(self: SyncPageT) -> SyncPageT:
         info = self.next_page_info()
         if not info:
@@ -314,6 +337,29 @@ class AsyncPaginator(Generic[_T, AsyncPageT]):
         async for item in page:
             yield item
 
+    async def iter_pages(self, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+        """Fetch the first page and iterate over it and the pages after it, see `BaseAsyncPage.iter_pages()`."""
+        page = cast(
+            AsyncPageT,
+            await self,  # type: ignore
+        )
+        async for next_page in page.iter_pages(prefetch=prefetch):
+            yield next_page
+
+    async def iter_items(self, *, prefetch: int = 0) -> AsyncIterator[_T]:
+        """Fetch the first page and iterate over its items and those of the pages after it."""
+        async for page in self.iter_pages(prefetch=prefetch):
+            for item in page._get_page_items():
+                yield item
+
+
+def _next_sync_page(page: SyncPageT) -> Optional[SyncPageT]:
+    return page.get_next_page() if page.has_next_page() else None
+
+
+async def _next_async_page(page: AsyncPageT) -> Optional[AsyncPageT]:
+    return await page.get_next_page() if page.has_next_page() else None
+
 
 class BaseAsyncPage(BasePage[_T], Generic[_T]):
     _client: AsyncAPIClient = pydantic.PrivateAttr()
@@ -336,7 +382,17 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             for item in page._get_page_items():
                 yield item
 
-    async def iter_pages(self: AsyncPageT) -> AsyncIterator[AsyncPageT]:
+    async def iter_pages(self: AsyncPageT, *, prefetch: int = 0) -> AsyncIterator[AsyncPageT]:
+        """Iterate over this page and the pages after it.
+
+        With `prefetch=N`, up to `N` pages are requested in a background task ahead of
+        the page being consumed, so that network latency overlaps with processing.
+        """
+        if prefetch:
+            async for page in async_prefetch_pages(self, _next_async_page, prefetch):
+                yield page
+            return
+
         page = self
         while True:
             yield page
@@ -345,6 +401,12 @@ class BaseAsyncPage(BasePage[_T], Generic[_T]):
             else:
                 return
 
+    async def iter_items(self, *, prefetch: int = 0) -> AsyncIterator[_T]:
+        """Iterate over the items of this page and the pages after it, see `iter_pages()`."""
+        async for page in self.iter_pages(prefetch=prefetch):
+            for item in page._get_page_items():
+                yield item
+
     async def get_next_page(self: AsyncPageT) -> AsyncPageT:
         info = self.next_page_info()
         if not info:
@@ -380,6 +442,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         timeout: float | Timeout | None = DEFAULT_TIMEOUT,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        timing_observers: Sequence[TimingObserver] | None = None,
+        governor: ConcurrencyGovernor | None = None,
     ) -> None:
         self._version = version
         self._base_url = self._enforce_trailing_slash(URL(base_url))
@@ -390,6 +454,8 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         self._strict_response_validation = _strict_response_validation
         self._idempotency_header = None
         self._platform: Platform | None = None
+        self._timings = Timings(timing_observers)
+        self._governor = governor
 
         if max_retries is None:  # pyright: ignore[reportUnnecessaryComparison]
             raise TypeError(
@@ -777,6 +843,20 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         timeout = sleep_seconds * jitter
         return timeout if timeout >= 0 else 0
 
+    def _rate_limit_delay(self, response: httpx.Response) -> float | None:
+        """The delay a `429` response asks for, if it asks for one that `_calculate_retry_timeout()` would honour."""
+        if response.status_code != 429:
+            return None
+        retry_after = self._parse_retry_after_header(response.headers)
+        if retry_after is not None and 0 < retry_after <= 60:
+            return retry_after
+        return None
+
+    def _governor_holds_retry(self, response: httpx.Response) -> bool:
+        # The governor already holds every queued request back for the delay the API asked for,
+        # so sleeping for it again here would only make this retry wait twice as long.
+        return self._governor is not None and self._rate_limit_delay(response) is not None
+
     def _should_retry(self, response: httpx.Response) -> bool:
         # Note: this is not a standard header
         should_retry_header = response.headers.get("x-should-retry")
@@ -816,10 +896,18 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         return f"stainless-python-retry-{uuid.uuid4()}"
 
 
+def _default_limits(http2: bool) -> httpx.Limits:
+    if not http2:
+        return DEFAULT_CONNECTION_LIMITS
+    if importlib.util.find_spec("h2") is None:
+        raise CartesiaError("You need to install `cartesia[http2]` to use `http2=True`")
+    return HTTP2_CONNECTION_LIMITS
+
+
 class _DefaultHttpxClient(httpx.Client):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        kwargs.setdefault("limits", _default_limits(kwargs.get("http2", False)))
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
 
@@ -861,6 +949,9 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         http_client: httpx.Client | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        timing_observers: Sequence[TimingObserver] | None = None,
+        governor: ConcurrencyGovernor | None = None,
+        http2: bool = False,
         _strict_response_validation: bool,
     ) -> None:
         if not is_given(timeout):
@@ -889,13 +980,23 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            timing_observers=timing_observers,
+            governor=governor,
             _strict_response_validation=_strict_response_validation,
         )
+        if http2 and http_client is not None:
+            raise ValueError(
+                "The `http2` and `http_client` arguments are mutually exclusive; pass `http2=True` to your `http_client` instead"
+            )
+
         self._client = http_client or SyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            limits=_default_limits(http2),
+            http2=http2,
         )
+        self._keep_alive: KeepAlive | None = None
 
     def is_closed(self) -> bool:
         return self._client.is_closed
@@ -905,11 +1006,90 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
         The client will *not* be usable after this.
         """
+        self._stop_keep_alive()
         # If an error is thrown while constructing a client, self._client
         # may not be present
         if hasattr(self, "_client"):
             self._client.close()
 
+    def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        keep_alive_interval: float | None = None,
+        timeout: float | Timeout | None | NotGiven = not_given,
+    ) -> None:
+        """Open `n_connections` pooled connections to `base_url` ahead of the first request.
+
+        DNS resolution, the TCP handshake and TLS are then already done when the first real
+        request is sent. With `keep_alive_interval`, the connections are re-used by a small
+        request every `keep_alive_interval` seconds on a background thread until `.close()`
+        or the next `.warmup()` call, so that they are not dropped as idle. HTTPX closes
+        connections that have been idle for the pool's `keepalive_expiry` (5 seconds by
+        default), so the interval should be shorter than that.
+
+        An HTTP/2 client multiplexes requests over a single connection, so it opens one
+        connection regardless of `n_connections`.
+        """
+        if n_connections < 1:
+            raise ValueError(f"n_connections must be at least 1, got {n_connections}")
+        if keep_alive_interval is not None and keep_alive_interval <= 0:
+            raise ValueError(f"keep_alive_interval must be positive, got {keep_alive_interval}")
+
+        self._stop_keep_alive()
+        self._open_connections(n_connections, timeout)
+        if keep_alive_interval is not None:
+            self._keep_alive = KeepAlive(lambda: self._open_connections(n_connections, timeout), keep_alive_interval)
+
+    def _stop_keep_alive(self) -> None:
+        keep_alive = getattr(self, "_keep_alive", None)
+        if keep_alive is not None:
+            self._keep_alive = None
+            keep_alive.stop()
+
+    def _open_connections(self, n_connections: int, timeout: float | Timeout | None | NotGiven) -> None:
+        # Each request holds its connection until every request has been sent, so the pool
+        # has to use (or open) a separate connection for each of them.
+        options = FinalRequestOptions.construct(method="get", url="/", **make_request_options(timeout=timeout))
+
+        def send() -> httpx.Response:
+            request = self._build_request(options)
+            if self._timings:
+                self._timings.trace(request)
+            try:
+                return self._client.send(request, stream=True)
+            except httpx.TimeoutException as err:
+                raise APITimeoutError(request=request) from err
+            except Exception as err:
+                raise APIConnectionError(request=request) from err
+
+        if n_connections == 1:
+            response = send()
+            try:
+                response.read()
+            finally:
+                response.close()
+            return
+
+        with ThreadPoolExecutor(max_workers=n_connections, thread_name_prefix="cartesia-warmup") as executor:
+            futures = [executor.submit(send) for _ in range(n_connections)]
+        error: BaseException | None = None
+        for future in futures:
+            try:
+                response = future.result()
+            except BaseException as err:
+                error = error or err
+                continue
+            try:
+                # the body has to be read for the connection to go back to the pool
+                response.read()
+            except BaseException as err:
+                error = error or err
+            finally:
+                response.close()
+        if error is not None:
+            raise error
+
     def __enter__(self: _T) -> _T:
         return self
 
@@ -986,6 +1166,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             # ensure the idempotency key is reused between requests
             input_options.idempotency_key = self._idempotency_key()
 
+        started = time.perf_counter()
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
@@ -995,8 +1176,17 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             options = self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
+            build_started = time.perf_counter()
             request = self._build_request(options, retries_taken=retries_taken)
             self._prepare_request(request)
+            if self._timings:
+                self._timings.emit(
+                    "http.request_build",
+                    time.perf_counter() - build_started,
+                    method=request.method,
+                    path=request.url.path,
+                )
+                self._timings.trace(request)
 
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
@@ -1009,11 +1199,11 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
             response = None
             try:
-                response = self._client.send(
-                    request,
-                    stream=stream or self._should_stream_response_body(request=request),
-                    **kwargs,
-                )
+                send_stream = stream or self._should_stream_response_body(request=request)
+                if self._governor is None:
+                    response = self._client.send(request, stream=send_stream, **kwargs)
+                else:
+                    response = self._send_governed(request, stream=send_stream, kwargs=kwargs)
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
 
@@ -1059,12 +1249,13 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
                 if remaining_retries > 0 and self._should_retry(err.response):
                     err.response.close()
-                    self._sleep_for_retry(
-                        retries_taken=retries_taken,
-                        max_retries=max_retries,
-                        options=input_options,
-                        response=response,
-                    )
+                    if not self._governor_holds_retry(err.response):
+                        self._sleep_for_retry(
+                            retries_taken=retries_taken,
+                            max_retries=max_retries,
+                            options=input_options,
+                            response=response,
+                        )
                     continue
 
                 # If the response is streamed then we need to explicitly read the response
@@ -1078,7 +1269,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             break
 
         assert response is not None, "could not resolve response (should never happen)"
-        return self._process_response(
+        result = self._process_response(
             cast_to=cast_to,
             options=options,
             response=response,
@@ -1086,6 +1277,16 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             stream_cls=stream_cls,
             retries_taken=retries_taken,
         )
+        if self._timings:
+            self._timings.emit(
+                "http.total",
+                time.perf_counter() - started,
+                method=response.request.method,
+                path=response.request.url.path,
+                status_code=response.status_code,
+                retries=retries_taken,
+            )
+        return result
 
     def _sleep_for_retry(
         self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
@@ -1101,6 +1302,20 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
         time.sleep(timeout)
 
+    def _send_governed(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        """Send `request` once the governor has a slot for it, holding the slot until the response is closed."""
+        assert self._governor is not None
+        permit = self._governor.acquire()
+        try:
+            response = self._client.send(request, stream=stream, **kwargs)
+        except BaseException:
+            permit.release()
+            raise
+        if response.status_code == 429:
+            permit.throttle(self._rate_limit_delay(response))
+        release_when_closed(response, permit)
+        return response
+
     def _process_response(
         self,
         *,
@@ -1378,7 +1593,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 class _DefaultAsyncHttpxClient(httpx.AsyncClient):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
+        kwargs.setdefault("limits", _default_limits(kwargs.get("http2", False)))
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
 
@@ -1444,6 +1659,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         http_client: httpx.AsyncClient | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        timing_observers: Sequence[TimingObserver] | None = None,
+        governor: ConcurrencyGovernor | None = None,
+        http2: bool = False,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1471,13 +1689,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
+            timing_observers=timing_observers,
+            governor=governor,
             _strict_response_validation=_strict_response_validation,
         )
+        if http2 and http_client is not None:
+            raise ValueError(
+                "The `http2` and `http_client` arguments are mutually exclusive; pass `http2=True` to your `http_client` instead"
+            )
+
         self._client = http_client or AsyncHttpxClientWrapper(
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            limits=_default_limits(http2),
+            http2=http2,
         )
+        self._keep_alive: AsyncKeepAlive | None = None
 
     def is_closed(self) -> bool:
         return self._client.is_closed
@@ -1487,8 +1715,78 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
         The client will *not* be usable after this.
         """
+        await self._stop_keep_alive()
         await self._client.aclose()
 
+    async def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        keep_alive_interval: float | None = None,
+        timeout: float | Timeout | None | NotGiven = not_given,
+    ) -> None:
+        """Open `n_connections` pooled connections to `base_url` ahead of the first request.
+
+        DNS resolution, the TCP handshake and TLS are then already done when the first real
+        request is sent. With `keep_alive_interval`, the connections are re-used by a small
+        request every `keep_alive_interval` seconds in a background task until `.close()` or
+        the next `.warmup()` call, so that they are not dropped as idle. HTTPX closes
+        connections that have been idle for the pool's `keepalive_expiry` (5 seconds by
+        default), so the interval should be shorter than that.
+
+        An HTTP/2 client multiplexes requests over a single connection, so it opens one
+        connection regardless of `n_connections`.
+        """
+        if n_connections < 1:
+            raise ValueError(f"n_connections must be at least 1, got {n_connections}")
+        if keep_alive_interval is not None and keep_alive_interval <= 0:
+            raise ValueError(f"keep_alive_interval must be positive, got {keep_alive_interval}")
+
+        await self._stop_keep_alive()
+        await self._open_connections(n_connections, timeout)
+        if keep_alive_interval is not None:
+            self._keep_alive = AsyncKeepAlive(
+                lambda: self._open_connections(n_connections, timeout), keep_alive_interval
+            )
+
+    async def _stop_keep_alive(self) -> None:
+        keep_alive = self._keep_alive
+        if keep_alive is not None:
+            self._keep_alive = None
+            await keep_alive.stop()
+
+    async def _open_connections(self, n_connections: int, timeout: float | Timeout | None | NotGiven) -> None:
+        # Each request holds its connection until every request has been sent, so the pool
+        # has to use (or open) a separate connection for each of them.
+        options = FinalRequestOptions.construct(method="get", url="/", **make_request_options(timeout=timeout))
+
+        async def send() -> httpx.Response:
+            request = self._build_request(options)
+            if self._timings:
+                self._timings.async_trace(request)
+            try:
+                return await self._client.send(request, stream=True)
+            except httpx.TimeoutException as err:
+                raise APITimeoutError(request=request) from err
+            except Exception as err:
+                raise APIConnectionError(request=request) from err
+
+        results = await asyncio.gather(*(send() for _ in range(n_connections)), return_exceptions=True)
+        error: BaseException | None = None
+        for result in results:
+            if isinstance(result, BaseException):
+                error = error or result
+                continue
+            try:
+                # the body has to be read for the connection to go back to the pool
+                await result.aread()
+            except BaseException as err:
+                error = error or err
+            finally:
+                await result.aclose()
+        if error is not None:
+            raise error
+
     async def __aenter__(self: _T) -> _T:
         return self
 
@@ -1570,6 +1868,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             # ensure the idempotency key is reused between requests
             input_options.idempotency_key = self._idempotency_key()
 
+        started = time.perf_counter()
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
@@ -1579,8 +1878,17 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             options = await self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
+            build_started = time.perf_counter()
             request = self._build_request(options, retries_taken=retries_taken)
             await self._prepare_request(request)
+            if self._timings:
+                self._timings.emit(
+                    "http.request_build",
+                    time.perf_counter() - build_started,
+                    method=request.method,
+                    path=request.url.path,
+                )
+                self._timings.async_trace(request)
 
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
@@ -1593,11 +1901,11 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             response = None
             try:
-                response = await self._client.send(
-                    request,
-                    stream=stream or self._should_stream_response_body(request=request),
-                    **kwargs,
-                )
+                send_stream = stream or self._should_stream_response_body(request=request)
+                if self._governor is None:
+                    response = await self._client.send(request, stream=send_stream, **kwargs)
+                else:
+                    response = await self._send_governed(request, stream=send_stream, kwargs=kwargs)
             except httpx.TimeoutException as err:
                 log.debug("Encountered httpx.TimeoutException", exc_info=True)
 
@@ -1643,12 +1951,13 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
                 if remaining_retries > 0 and self._should_retry(err.response):
                     await err.response.aclose()
-                    await self._sleep_for_retry(
-                        retries_taken=retries_taken,
-                        max_retries=max_retries,
-                        options=input_options,
-                        response=response,
-                    )
+                    if not self._governor_holds_retry(err.response):
+                        await self._sleep_for_retry(
+                            retries_taken=retries_taken,
+                            max_retries=max_retries,
+                            options=input_options,
+                            response=response,
+                        )
                     continue
 
                 # If the response is streamed then we need to explicitly read the response
@@ -1662,7 +1971,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             break
 
         assert response is not None, "could not resolve response (should never happen)"
-        return await self._process_response(
+        result = await self._process_response(
             cast_to=cast_to,
             options=options,
             response=response,
@@ -1670,6 +1979,16 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             stream_cls=stream_cls,
             retries_taken=retries_taken,
         )
+        if self._timings:
+            self._timings.emit(
+                "http.total",
+                time.perf_counter() - started,
+                method=response.request.method,
+                path=response.request.url.path,
+                status_code=response.status_code,
+                retries=retries_taken,
+            )
+        return result
 
     async def _sleep_for_retry(
         self, *, retries_taken: int, max_retries: int, options: FinalRequestOptions, response: httpx.Response | None
@@ -1685,6 +2004,20 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
         await anyio.sleep(timeout)
 
+    async def _send_governed(self, request: httpx.Request, *, stream: bool, kwargs: HttpxSendArgs) -> httpx.Response:
+        """Send `request` once the governor has a slot for it, holding the slot until the response is closed."""
+        assert self._governor is not None
+        permit = await self._governor.async_acquire()
+        try:
+            response = await self._client.send(request, stream=stream, **kwargs)
+        except BaseException:
+            permit.release()
+            raise
+        if response.status_code == 429:
+            permit.throttle(self._rate_limit_delay(response))
+        release_when_closed(response, permit)
+        return response
+
     async def _process_response(
         self,
         *,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 from typing_extensions import Self, override
 
 import httpx
@@ -28,7 +28,9 @@ from ._utils import (
     get_async_library,
 )
 from ._compat import cached_property
+from ._timing import TimingObserver
 from ._version import __version__
+from ._governor import ConcurrencyGovernor
 from ._response import (
     to_raw_response_wrapper,
     to_streamed_response_wrapper,
@@ -103,10 +105,20 @@ class Cartesia(SyncAPIClient):
         max_retries: int = DEFAULT_MAX_RETRIES,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
+        # Callables that receive a `TimingEvent` for each phase of a request that is measured,
+        # e.g. `LatencyHistogram()` or `OpenTelemetryObserver()`.
+        timing_observers: Sequence[TimingObserver] | None = None,
+        # Queue requests and TTS WebSocket contexts through a `ConcurrencyGovernor`, which limits how
+        # many run at once and adapts the limit to rate limits. Share one instance between clients to
+        # govern them together.
+        governor: ConcurrencyGovernor | None = None,
         # Configure a custom httpx client.
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
+        # Use HTTP/2 for the default httpx client, so that concurrent requests are multiplexed over a
+        # few connections. Requires the `http2` extra; servers that do not offer HTTP/2 are spoken to over HTTP/1.1.
+        http2: bool = False,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -146,6 +158,9 @@ class Cartesia(SyncAPIClient):
             http_client=http_client,
             custom_headers=default_headers,
             custom_query=default_query,
+            timing_observers=timing_observers,
+            governor=governor,
+            http2=http2,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -263,11 +278,14 @@ class Cartesia(SyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         http_client: httpx.Client | None = None,
+        http2: bool | None = None,
         max_retries: int | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
+        timing_observers: Sequence[TimingObserver] | None = None,
+        governor: ConcurrencyGovernor | None = None,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -291,7 +309,9 @@ class Cartesia(SyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        # choosing the protocol creates a new default httpx client instead of sharing this one
+        if http2 is None:
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             token=token or self.token,
@@ -302,6 +322,9 @@ class Cartesia(SyncAPIClient):
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
+            timing_observers=self._timings.observers if timing_observers is None else timing_observers,
+            governor=governor or self._governor,
+            http2=bool(http2),
             **_extra_kwargs,
         )
 
@@ -386,10 +409,20 @@ class AsyncCartesia(AsyncAPIClient):
         max_retries: int = DEFAULT_MAX_RETRIES,
         default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
+        # Callables that receive a `TimingEvent` for each phase of a request that is measured,
+        # e.g. `LatencyHistogram()` or `OpenTelemetryObserver()`.
+        timing_observers: Sequence[TimingObserver] | None = None,
+        # Queue requests and TTS WebSocket contexts through a `ConcurrencyGovernor`, which limits how
+        # many run at once and adapts the limit to rate limits. Share one instance between clients to
+        # govern them together.
+        governor: ConcurrencyGovernor | None = None,
         # Configure a custom httpx client.
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
+        # Use HTTP/2 for the default httpx client, so that concurrent requests are multiplexed over a
+        # few connections. Requires the `http2` extra; servers that do not offer HTTP/2 are spoken to over HTTP/1.1.
+        http2: bool = False,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -429,6 +462,9 @@ class AsyncCartesia(AsyncAPIClient):
             http_client=http_client,
             custom_headers=default_headers,
             custom_query=default_query,
+            timing_observers=timing_observers,
+            governor=governor,
+            http2=http2,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -546,11 +582,14 @@ class AsyncCartesia(AsyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = not_given,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | None = None,
         max_retries: int | NotGiven = not_given,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
         default_query: Mapping[str, object] | None = None,
         set_default_query: Mapping[str, object] | None = None,
+        timing_observers: Sequence[TimingObserver] | None = None,
+        governor: ConcurrencyGovernor | None = None,
         _extra_kwargs: Mapping[str, Any] = {},
     ) -> Self:
         """
@@ -574,7 +613,9 @@ class AsyncCartesia(AsyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        # choosing the protocol creates a new default httpx client instead of sharing this one
+        if http2 is None:
+            http_client = http_client or self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             token=token or self.token,
@@ -585,6 +626,9 @@ class AsyncCartesia(AsyncAPIClient):
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
+            timing_observers=self._timings.observers if timing_observers is None else timing_observers,
+            governor=governor or self._governor,
+            http2=bool(http2),
             **_extra_kwargs,
         )
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Sequence
 from typing_extensions import Literal
 
 import httpx
@@ -17,6 +18,8 @@ __all__ = [
     "InternalServerError",
     "WebSocketConnectionClosedError",
     "WebSocketQueueFullError",
+    "TTSGenerationError",
+    "STTTranscriptionError",
 ]
 
 
@@ -113,14 +116,38 @@ class InternalServerError(APIStatusError):
 class WebSocketConnectionClosedError(CartesiaError):
     """Raised when a WebSocket connection closes with unsent messages."""
 
-    unsent_messages: list[str]
+    unsent_messages: list[str | bytes]
 
-    def __init__(self, message: str, *, unsent_messages: list[str]) -> None:
+    def __init__(self, message: str, *, unsent_messages: Sequence[str | bytes]) -> None:
         super().__init__(message)
-        self.unsent_messages = unsent_messages
+        self.unsent_messages = list(unsent_messages)
 
 
 class WebSocketQueueFullError(CartesiaError):
     """Raised when the outgoing WebSocket message queue exceeds its byte-size limit."""
 
     pass
+
+
+class TTSGenerationError(CartesiaError):
+    """Raised when a TTS WebSocket generation ends with an `error` event."""
+
+    status_code: int | None
+    event: object
+
+    def __init__(self, message: str, *, status_code: int | None, event: object) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.event = event
+
+
+class STTTranscriptionError(CartesiaError):
+    """Raised when an STT WebSocket transcription ends with an `error` event or without finishing."""
+
+    status_code: int | None
+    event: object
+
+    def __init__(self, message: str, *, status_code: int | None, event: object) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.event = event
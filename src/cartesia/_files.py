@@ -3,8 +3,8 @@ from __future__ import annotations
 import io
 import os
 import pathlib
-from typing import Sequence, cast, overload
-from typing_extensions import TypeVar, TypeGuard
+from typing import IO, Sequence, cast, overload
+from typing_extensions import Buffer, TypeVar, TypeGuard, override
 
 import anyio
 
@@ -66,7 +66,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
             path = pathlib.Path(file)
-            return (path.name, path.read_bytes())
+            return (path.name, open_path(path))
 
         return file
 
@@ -78,7 +78,7 @@ def _transform_file(file: FileTypes) -> HttpxFileTypes:
 
 def read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return pathlib.Path(file).read_bytes()
+        return open_path(file)
     return file
 
 
@@ -108,7 +108,7 @@ async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
     if is_file_content(file):
         if isinstance(file, os.PathLike):
             path = anyio.Path(file)
-            return (path.name, await path.read_bytes())
+            return (path.name, open_path(file))
 
         return file
 
@@ -120,11 +120,86 @@ async def _async_transform_file(file: FileTypes) -> HttpxFileTypes:
 
 async def async_read_file_content(file: FileContent) -> HttpxFileContent:
     if isinstance(file, os.PathLike):
-        return await anyio.Path(file).read_bytes()
+        return open_path(file)
 
     return file
 
 
+def open_path(path: os.PathLike[str]) -> IO[bytes]:
+    """Return a seekable reader over the file at `path` that opens it lazily.
+
+    httpx reads multipart file fields in fixed-size chunks, so uploading from the
+    returned reader keeps memory use independent of the file size. The file is
+    opened on the first read, closed once it is exhausted, and reopened if httpx
+    rewinds it to send the request again.
+    """
+    return cast(IO[bytes], _PathReader(path))
+
+
+class _PathReader(io.RawIOBase):
+    def __init__(self, path: os.PathLike[str]) -> None:
+        super().__init__()
+        self._path = os.fspath(path)
+        # fail early for missing files, as reading them eagerly did
+        os.stat(self._path)
+        self._position = 0
+        self._file: io.BufferedReader | None = None
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def tell(self) -> int:
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = os.path.getsize(self._path) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        self._position = position
+        if self._file is not None:
+            self._file.seek(position)
+        return position
+
+    @override
+    def readinto(self, buffer: Buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self._file is None:
+            self._file = open(self._path, "rb")
+            self._file.seek(self._position)
+
+        count = self._file.readinto(buffer)
+        self._position += count
+        if count == 0:
+            self._release()
+        return count
+
+    @override
+    def close(self) -> None:
+        self._release()
+        super().close()
+
+    def _release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 def deepcopy_with_paths(item: _T, paths: Sequence[Sequence[str]]) -> _T:
     """Copy only the containers along the given paths.
 
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import time
+import asyncio
+import logging
+import weakref
+import threading
+from typing import Deque, Iterator, Optional, AsyncIterator
+from collections import deque
+
+import httpx
+
+log: logging.Logger = logging.getLogger(__name__)
+
+__all__ = ["ConcurrencyGovernor", "GovernorPermit", "release_when_closed"]
+
+
+class GovernorPermit:
+    """A slot held by one request or WebSocket context while it runs.
+
+    Call `release()` once the work is finished, with `success=True` if it went through so
+    that the governor can raise its limit, and `throttle()` before releasing if the API
+    answered with a rate limit. Releasing more than once has no effect.
+    """
+
+    __slots__ = ("_governor", "_epoch", "_released")
+
+    def __init__(self, governor: ConcurrencyGovernor, epoch: int) -> None:
+        self._governor = governor
+        self._epoch = epoch
+        self._released = False
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Report a rate limit, and the `Retry-After` delay that came with it, if any."""
+        self._governor._throttle(self._epoch, retry_after)
+
+    def release(self, *, success: bool = False) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._governor._release(success)
+
+
+class _Waiter:
+    __slots__ = ("enqueued", "permit", "event", "loop", "future")
+
+    def __init__(
+        self,
+        *,
+        event: Optional[threading.Event] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        future: Optional[asyncio.Future[None]] = None,
+    ) -> None:
+        self.enqueued = time.monotonic()
+        self.permit: Optional[GovernorPermit] = None
+        self.event = event
+        self.loop = loop
+        self.future = future
+
+    def wake(self) -> None:
+        if self.event is not None:
+            self.event.set()
+            return
+        assert self.loop is not None and self.future is not None
+        self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyGovernor:
+    """Limits how many requests run at once, adapting the limit to the API's rate limits.
+
+    Every request sent by a client constructed with `governor=` (and every TTS WebSocket
+    context it opens) first takes a slot from the governor. While all slots are taken,
+    work waits in a first-in, first-out queue rather than being sent and rejected.
+
+    The limit follows AIMD: each successful request raises it by `1 / limit`, about one
+    slot per round of requests, up to `max_limit`, and a `429` response halves it, down to
+    `min_limit`. Requests that were already running when the limit was cut do not cut it
+    again, so a burst of `429`s counts once. A `Retry-After` (or `retry-after-ms`) header
+    on a `429` holds back the whole queue for that long, so that retries do not all arrive
+    at the same moment.
+
+    ```py
+    governor = ConcurrencyGovernor(initial_limit=16)
+    client = Cartesia(governor=governor)
+    ...
+    print(governor.limit, governor.queue_depth, governor.mean_wait)
+    ```
+
+    A governor is safe to share between threads, event loops and clients, so one instance
+    can cover every client in a process that uses the same API key.
+    """
+
+    def __init__(self, *, initial_limit: int = 8, min_limit: int = 1, max_limit: int = 256) -> None:
+        if min_limit < 1:
+            raise ValueError(f"min_limit must be at least 1, got {min_limit}")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                f"initial_limit must be between min_limit and max_limit, got {initial_limit} (min {min_limit}, max {max_limit})"
+            )
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._resume_at = 0.0
+        self._timer: Optional[threading.Timer] = None
+        # incremented on every cut to the limit; permits remember the value they were granted under
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+        self._acquired = 0
+        self._throttled = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed to run at once."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of requests waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def acquired(self) -> int:
+        """The number of slots handed out so far."""
+        return self._acquired
+
+    @property
+    def throttled(self) -> int:
+        """The number of rate-limit responses reported so far."""
+        return self._throttled
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until the queue resumes after a `Retry-After`, or `0` if it is not paused."""
+        return max(self._resume_at - time.monotonic(), 0.0)
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean seconds a request waited for its slot."""
+        return self._total_wait / self._acquired if self._acquired else 0.0
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    def acquire(self) -> GovernorPermit:
+        """Wait for a slot, blocking the current thread."""
+        with self._lock:
+            if self._can_grant():
+                return self._grant(0.0)
+            waiter = _Waiter(event=threading.Event())
+            self._waiters.append(waiter)
+
+        assert waiter.event is not None
+        try:
+            waiter.event.wait()
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        assert waiter.permit is not None
+        return waiter.permit
+
+    async def async_acquire(self) -> GovernorPermit:
+        """Wait for a slot without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._can_grant():
+                return self._grant(0.0)
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+
+        assert waiter.future is not None
+        try:
+            await waiter.future
+        except BaseException:
+            self._abandon(waiter)
+            raise
+        assert waiter.permit is not None
+        return waiter.permit
+
+    def _can_grant(self) -> bool:
+        return not self._waiters and self._in_flight < int(self._limit) and time.monotonic() >= self._resume_at
+
+    def _grant(self, waited: float) -> GovernorPermit:
+        self._in_flight += 1
+        self._acquired += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        return GovernorPermit(self, self._epoch)
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to the head of the queue. Must be called with the lock held."""
+        now = time.monotonic()
+        if now < self._resume_at:
+            return
+        while self._waiters and self._in_flight < int(self._limit):
+            waiter = self._waiters.popleft()
+            waiter.permit = self._grant(now - waiter.enqueued)
+            try:
+                waiter.wake()
+            except RuntimeError:
+                # the waiter's event loop has been closed, so nobody will use the slot
+                log.debug("Discarding a slot for a waiter on a closed event loop")
+                waiter.permit = None
+                self._in_flight -= 1
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Remove a waiter that stopped waiting, giving back its slot if it had been granted one."""
+        with self._lock:
+            if waiter.permit is None:
+                self._waiters.remove(waiter)
+                return
+        waiter.permit.release()
+
+    def _release(self, success: bool) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if success:
+                self._limit = min(self._limit + 1 / self._limit, float(self._max_limit))
+            self._wake_waiters()
+
+    def _throttle(self, epoch: int, retry_after: Optional[float]) -> None:
+        with self._lock:
+            self._throttled += 1
+            if epoch == self._epoch:
+                self._epoch += 1
+                self._limit = max(self._limit / 2, float(self._min_limit))
+                log.debug("Rate limited; lowering the concurrency limit to %i", int(self._limit))
+            if retry_after is None or retry_after <= 0:
+                return
+            resume_at = time.monotonic() + retry_after
+            if resume_at <= self._resume_at:
+                return
+            self._resume_at = resume_at
+            self._schedule_resume(retry_after)
+
+    def _schedule_resume(self, delay: float) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._resume)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _resume(self) -> None:
+        with self._lock:
+            remaining = self._resume_at - time.monotonic()
+            if remaining > 0:
+                # the timer fired early, or the pause was extended after it was started
+                self._schedule_resume(remaining)
+                return
+            self._timer = None
+            self._wake_waiters()
+
+
+class _PermitStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Wraps a response body, releasing the permit when the response is closed."""
+
+    def __init__(
+        self, stream: httpx.SyncByteStream | httpx.AsyncByteStream, permit: GovernorPermit, success: bool
+    ) -> None:
+        self._stream = stream
+        self._permit = permit
+        self._success = success
+
+    def __iter__(self) -> Iterator[bytes]:
+        assert isinstance(self._stream, httpx.SyncByteStream)
+        yield from self._stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        assert isinstance(self._stream, httpx.AsyncByteStream)
+        async for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            assert isinstance(self._stream, httpx.SyncByteStream)
+            self._stream.close()
+        finally:
+            self._permit.release(success=self._success)
+
+    async def aclose(self) -> None:
+        try:
+            assert isinstance(self._stream, httpx.AsyncByteStream)
+            await self._stream.aclose()
+        finally:
+            self._permit.release(success=self._success)
+
+
+def release_when_closed(response: httpx.Response, permit: GovernorPermit) -> None:
+    """Release `permit` once `response` is closed, which for a streamed response is when its body has been read.
+
+    A streamed response that is dropped without being closed gives the permit back when it is
+    garbage collected.
+    """
+    success = response.status_code < 400
+    if response.is_closed:
+        permit.release(success=success)
+        return
+    response.stream = _PermitStream(response.stream, permit, success)
+    weakref.finalize(response, permit.release)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import Callable, Optional, Awaitable
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class KeepAlive:
+    """Calls `ping` every `interval` seconds on a daemon thread until `stop()` is called.
+
+    A failed ping is logged and retried on the next tick, so a transient network error
+    does not end the keep-alive.
+    """
+
+    def __init__(self, ping: Callable[[], None], interval: float) -> None:
+        self._ping = ping
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cartesia-keep-alive", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._ping()
+            except Exception:
+                log.debug("Keep-alive ping failed", exc_info=True)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+class AsyncKeepAlive:
+    """Like `KeepAlive`, running `ping` in a task on the current event loop."""
+
+    def __init__(self, ping: Callable[[], Awaitable[None]], interval: float) -> None:
+        self._ping = ping
+        self._interval = interval
+        self._task: Optional[asyncio.Task[None]] = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self._ping()
+            except Exception:
+                log.debug("Keep-alive ping failed", exc_info=True)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
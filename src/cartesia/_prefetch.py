@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import queue
+import asyncio
+import threading
+from typing import Generic, TypeVar, Callable, Iterator, Optional, Awaitable, AsyncIterator
+
+_P = TypeVar("_P")
+
+
+def _check_depth(depth: int) -> None:
+    if depth < 1:
+        raise ValueError(f"Prefetch depth must be at least 1, got {depth}")
+
+
+class _Fetched(Generic[_P]):
+    """A page fetched ahead of the consumer, the end of the listing (`page is None`), or the error that ended it."""
+
+    __slots__ = ("page", "error")
+
+    def __init__(self, page: Optional[_P], error: Optional[BaseException] = None) -> None:
+        self.page = page
+        self.error = error
+
+
+def prefetch_pages(first: _P, fetch_next: Callable[[_P], Optional[_P]], depth: int) -> Iterator[_P]:
+    """Yield `first` and the pages after it, fetching up to `depth` pages ahead of the consumer.
+
+    Cursor pages can only be requested once the previous page has arrived, so look-ahead
+    is a chain: a background thread requests the next page as soon as the last one lands,
+    and pauses while `depth` fetched pages are waiting to be consumed. An error from a fetch
+    is raised when the consumer reaches the page that failed to load.
+    """
+    _check_depth(depth)
+
+    fetched: queue.Queue[_Fetched[_P]] = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def fetch_ahead() -> None:
+        page: Optional[_P] = first
+        try:
+            while page is not None:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                page = fetch_next(page)
+                fetched.put(_Fetched(page))
+        except BaseException as error:
+            fetched.put(_Fetched(None, error))
+
+    thread = threading.Thread(target=fetch_ahead, name="cartesia-page-prefetch", daemon=True)
+    thread.start()
+    try:
+        yield first
+        while True:
+            item = fetched.get()
+            slots.release()
+            if item.error is not None:
+                raise item.error
+            if item.page is None:
+                return
+            yield item.page
+    finally:
+        stopped.set()
+        # wake the fetcher if it is waiting for a free slot
+        slots.release()
+
+
+async def async_prefetch_pages(
+    first: _P, fetch_next: Callable[[_P], Awaitable[Optional[_P]]], depth: int
+) -> AsyncIterator[_P]:
+    """Async counterpart of `prefetch_pages`, fetching ahead in a task on the running loop."""
+    _check_depth(depth)
+
+    fetched: asyncio.Queue[_Fetched[_P]] = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def fetch_ahead() -> None:
+        page: Optional[_P] = first
+        try:
+            while page is not None:
+                await slots.acquire()
+                page = await fetch_next(page)
+                fetched.put_nowait(_Fetched(page))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as error:
+            fetched.put_nowait(_Fetched(None, error))
+
+    task = asyncio.get_running_loop().create_task(fetch_ahead())
+    try:
+        yield first
+        while True:
+            item = await fetched.get()
+            slots.release()
+            if item.error is not None:
+                raise item.error
+            if item.page is None:
+                return
+            yield item.page
+    finally:
+        task.cancel()
@@ -3,83 +3,190 @@
 from __future__ import annotations
 
 import typing
+import asyncio
 import threading
+from collections import deque
 
 from ._exceptions import WebSocketQueueFullError
 
+_SAMPLE_WIDTHS: dict[str, int] = {
+    "pcm_s16le": 2,
+    "pcm_s32le": 4,
+    "pcm_f16le": 2,
+    "pcm_f32le": 4,
+    "pcm_mulaw": 1,
+    "pcm_alaw": 1,
+}
 
-class SendQueue:
-    """Bounded byte-size queue for outgoing WebSocket messages.
 
-    Messages are stored as pre-serialized strings. The queue enforces a
-    maximum byte budget so that unbounded buffering cannot occur during
-    reconnection windows.
+def audio_bytes_per_second(encoding: str, sample_rate: int) -> int:
+    """Byte rate of mono audio in *encoding* at *sample_rate* Hz."""
+    try:
+        return _SAMPLE_WIDTHS[encoding] * sample_rate
+    except KeyError:
+        raise ValueError(f"Unsupported audio encoding: {encoding!r}") from None
+
+
+def _is_audio(data: str | bytes) -> bool:
+    # Text frames carry JSON commands; binary frames carry audio.
+    return not isinstance(data, str)
+
+
+class _QueueBudget:
+    """Byte accounting shared by :class:`SendQueue` and :class:`AsyncSendQueue`.
+
+    Text messages count against ``max_bytes``. Binary (audio) messages count
+    against ``max_audio_bytes`` when it is set, and against ``max_bytes``
+    otherwise. With ``drop_oldest_audio``, audio that does not fit evicts the
+    oldest queued audio instead of being refused; text is never evicted.
     """
 
-    def __init__(self, max_bytes: int = 1_048_576) -> None:
-        self._queue: list[tuple[str, int]] = []  # (data, byte_length)
+    # Whether a single message larger than its budget is accepted into an empty budget.
+    _accepts_oversized: typing.ClassVar[bool] = False
+
+    def __init__(
+        self,
+        max_bytes: int,
+        *,
+        max_audio_bytes: int | None,
+        drop_oldest_audio: bool,
+    ) -> None:
+        self._queue: deque[tuple[str | bytes, int]] = deque()  # (data, byte_length)
         self._bytes: int = 0
+        self._audio_bytes: int = 0
         self._max_bytes = max_bytes
+        self._max_audio_bytes = max_audio_bytes
+        self._drop_oldest_audio = drop_oldest_audio
+        self._dropped_audio_bytes: int = 0
+
+    @staticmethod
+    def _byte_length(data: str | bytes) -> int:
+        return len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+
+    def _has_room(self, byte_length: int, audio: bool) -> bool:
+        if audio and self._max_audio_bytes is not None:
+            used, limit = self._audio_bytes, self._max_audio_bytes
+        elif self._max_audio_bytes is not None:
+            used, limit = self._bytes - self._audio_bytes, self._max_bytes
+        else:
+            used, limit = self._bytes, self._max_bytes
+        return used + byte_length <= limit or (self._accepts_oversized and used == 0)
+
+    def _make_room(self, byte_length: int, audio: bool) -> bool:
+        """Return whether a message fits, evicting the oldest audio first if allowed."""
+        if self._has_room(byte_length, audio):
+            return True
+        if not (audio and self._drop_oldest_audio):
+            return False
+        kept: list[tuple[str | bytes, int]] = []
+        while self._queue and not self._has_room(byte_length, audio):
+            data, length = self._queue.popleft()
+            if _is_audio(data):
+                self._bytes -= length
+                self._audio_bytes -= length
+                self._dropped_audio_bytes += length
+            else:
+                kept.append((data, length))
+        self._queue.extendleft(reversed(kept))
+        return self._has_room(byte_length, audio)
+
+    def _append(self, data: str | bytes, byte_length: int) -> None:
+        self._queue.append((data, byte_length))
+        self._bytes += byte_length
+        if _is_audio(data):
+            self._audio_bytes += byte_length
+
+    def _discard(self, data: str | bytes, byte_length: int) -> None:
+        self._bytes -= byte_length
+        if _is_audio(data):
+            self._audio_bytes -= byte_length
+
+    def _clear(self) -> list[str | bytes]:
+        items = [data for data, _ in self._queue]
+        self._queue.clear()
+        self._bytes = 0
+        self._audio_bytes = 0
+        return items
+
+
+class SendQueue(_QueueBudget):
+    """Bounded byte-size queue for outgoing WebSocket messages.
+
+    Text messages are stored as pre-serialized strings and binary audio frames
+    as bytes, so neither is converted on the way in or out. The queue enforces a
+    maximum byte budget so that unbounded buffering cannot occur during
+    reconnection windows; see :class:`_QueueBudget` for the separate audio budget.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 1_048_576,
+        *,
+        max_audio_bytes: int | None = None,
+        drop_oldest_audio: bool = False,
+    ) -> None:
+        super().__init__(max_bytes, max_audio_bytes=max_audio_bytes, drop_oldest_audio=drop_oldest_audio)
         self._lock = threading.Lock()
 
-    def enqueue(self, data: str) -> None:
+    def enqueue(self, data: str | bytes) -> None:
         """Append *data* to the queue.
 
         Raises :class:`WebSocketQueueFullError` if the message would
         exceed the byte-size limit.
         """
-        byte_length = len(data.encode("utf-8"))
+        byte_length = self._byte_length(data)
         with self._lock:
-            if self._bytes + byte_length > self._max_bytes:
+            if not self._make_room(byte_length, _is_audio(data)):
                 raise WebSocketQueueFullError("send queue is full, message discarded")
-            self._queue.append((data, byte_length))
-            self._bytes += byte_length
+            self._append(data, byte_length)
+
+    def _take_all(self) -> list[tuple[str | bytes, int]]:
+        with self._lock:
+            pending = list(self._queue)
+            self._clear()
+            return pending
+
+    def _requeue(self, remaining: list[tuple[str | bytes, int]]) -> None:
+        # Failed messages go back in front of anything enqueued while flushing.
+        with self._lock:
+            newer = list(self._queue)
+            self._clear()
+            for data, byte_length in remaining + newer:
+                self._append(data, byte_length)
 
-    def flush_sync(self, send: typing.Callable[[str], object]) -> None:
+    def flush_sync(self, send: typing.Callable[[str | bytes], object]) -> None:
         """Send every queued message via *send*.
 
         If *send* raises, the failing message and all subsequent messages
         are re-queued and the error is re-raised.
         """
-        with self._lock:
-            pending = list(self._queue)
-            self._queue.clear()
-            self._bytes = 0
-
+        pending = self._take_all()
         for i, (data, _byte_length) in enumerate(pending):
             try:
                 send(data)
             except Exception:
-                with self._lock:
-                    remaining = pending[i:]
-                    self._queue = remaining + self._queue
-                    self._bytes = sum(bl for _, bl in self._queue)
+                self._requeue(pending[i:])
                 raise
 
-    async def flush_async(self, send: typing.Callable[[str], typing.Awaitable[object]]) -> None:
+    async def flush_async(self, send: typing.Callable[[str | bytes], typing.Awaitable[object]]) -> None:
         """Async variant of :meth:`flush_sync`."""
-        with self._lock:
-            pending = list(self._queue)
-            self._queue.clear()
-            self._bytes = 0
-
+        pending = self._take_all()
         for i, (data, _byte_length) in enumerate(pending):
             try:
                 await send(data)
             except Exception:
-                with self._lock:
-                    remaining = pending[i:]
-                    self._queue = remaining + self._queue
-                    self._bytes = sum(bl for _, bl in self._queue)
+                self._requeue(pending[i:])
                 raise
 
-    def drain(self) -> list[str]:
+    def drain(self) -> list[str | bytes]:
         """Remove and return all queued messages."""
         with self._lock:
-            items = [data for data, _ in self._queue]
-            self._queue.clear()
-            self._bytes = 0
-            return items
+            return self._clear()
+
+    @property
+    def dropped_audio_bytes(self) -> int:
+        """Total bytes of audio evicted to make room for newer audio."""
+        return self._dropped_audio_bytes
 
     def __len__(self) -> int:
         with self._lock:
@@ -88,3 +195,110 @@ class SendQueue:
     def __bool__(self) -> bool:
         with self._lock:
             return len(self._queue) > 0
+
+
+class AsyncSendQueue(_QueueBudget):
+    """Bounded byte-size queue for outgoing WebSocket messages on the asyncio path.
+
+    Unlike :class:`SendQueue`, no lock is taken: the queue is only used from the
+    event loop. When the byte budget is exhausted, :meth:`put` waits for space
+    instead of raising, so a producer streaming audio through a reconnection
+    window is slowed down rather than failed. Text and binary frames are stored
+    as given.
+    """
+
+    _accepts_oversized = True
+
+    def __init__(
+        self,
+        max_bytes: int = 1_048_576,
+        *,
+        max_audio_bytes: int | None = None,
+        drop_oldest_audio: bool = False,
+    ) -> None:
+        super().__init__(max_bytes, max_audio_bytes=max_audio_bytes, drop_oldest_audio=drop_oldest_audio)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def put(self, data: str | bytes) -> None:
+        """Append *data*, waiting until the queue has room for it."""
+        byte_length = self._byte_length(data)
+        audio = _is_audio(data)
+        while not self._make_room(byte_length, audio):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if not waiter.done():
+                    waiter.cancel()
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._append(data, byte_length)
+
+    def put_nowait(self, data: str | bytes) -> None:
+        """Append *data* without waiting.
+
+        Raises :class:`WebSocketQueueFullError` if the message would
+        exceed the byte-size limit.
+        """
+        byte_length = self._byte_length(data)
+        if not self._make_room(byte_length, _is_audio(data)):
+            raise WebSocketQueueFullError("send queue is full, message discarded")
+        self._append(data, byte_length)
+
+    async def flush(self, send: typing.Callable[[str | bytes], typing.Awaitable[object]]) -> None:
+        """Send every queued message via *send*, oldest first.
+
+        A message is only removed once *send* returns, so if *send* raises, it
+        and everything after it stay queued and the error is re-raised.
+        Messages put while flushing are sent too, including those of producers
+        that were waiting for room, so the queue is empty when this returns.
+        """
+        woken = False
+        while True:
+            while self._queue:
+                head = self._queue[0]
+                await send(head[0])
+                # A `put` with `drop_oldest_audio` may have evicted the head while it was being sent.
+                if self._queue and self._queue[0] is head:
+                    self._queue.popleft()
+                    self._discard(*head)
+                woken = self._wake() or woken
+            if not woken:
+                return
+            # Let the producers that were woken append their messages before checking again.
+            woken = False
+            await asyncio.sleep(0)
+
+    def drain(self) -> list[str | bytes]:
+        """Remove and return all queued messages."""
+        items = self._clear()
+        self._wake()
+        return items
+
+    def _wake(self) -> bool:
+        """Wake every waiting producer, returning whether there were any."""
+        # Every waiter re-checks for room itself, so waking them all is safe.
+        woken = False
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                woken = True
+        return woken
+
+    @property
+    def nbytes(self) -> int:
+        """Total size in bytes of the queued messages."""
+        return self._bytes
+
+    @property
+    def dropped_audio_bytes(self) -> int:
+        """Total bytes of audio evicted to make room for newer audio."""
+        return self._dropped_audio_bytes
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __bool__(self) -> bool:
+        return len(self._queue) > 0
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import time
 import inspect
 from types import TracebackType
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, Optional, AsyncIterator, cast
@@ -14,6 +15,7 @@ from ._utils import extract_type_var_from_base
 if TYPE_CHECKING:
     from ._client import Cartesia, AsyncCartesia
     from ._models import FinalRequestOptions
+    from ._timing import Timings
 
 
 _T = TypeVar("_T")
@@ -55,11 +57,18 @@ class Stream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        timings = self._client._timings
         iterator = self._iter_events()
 
         try:
             for sse in iterator:
-                yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+                decode_started = time.perf_counter() if timings else 0.0
+                item = process_data(data=sse.json(), cast_to=cast_to, response=response)
+                if timings:
+                    _report_event(
+                        timings, getattr(item, "step_time", None), time.perf_counter() - decode_started, response
+                    )
+                yield item
         finally:
             # Ensure the response is closed even if the consumer doesn't read all data
             response.close()
@@ -84,6 +93,14 @@ class Stream(Generic[_T]):
         self.response.close()
 
 
+def _report_event(timings: Timings, step_time: object, duration: float, response: httpx.Response) -> None:
+    path = response.request.url.path
+    timings.emit("sse.decode", duration, path=path)
+    if isinstance(step_time, (int, float)):
+        # the server reports milliseconds
+        timings.emit("sse.step_time", step_time / 1000, path=path)
+
+
 class AsyncStream(Generic[_T]):
     """Provides the core interface to iterate over an asynchronous stream response."""
 
@@ -121,11 +138,18 @@ class AsyncStream(Generic[_T]):
         cast_to = cast(Any, self._cast_to)
         response = self.response
         process_data = self._client._process_response_data
+        timings = self._client._timings
         iterator = self._iter_events()
 
         try:
             async for sse in iterator:
-                yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+                decode_started = time.perf_counter() if timings else 0.0
+                item = process_data(data=sse.json(), cast_to=cast_to, response=response)
+                if timings:
+                    _report_event(
+                        timings, getattr(item, "step_time", None), time.perf_counter() - decode_started, response
+                    )
+                yield item
         finally:
             # Ensure the response is closed even if the consumer doesn't read all data
             await response.aclose()
@@ -158,12 +182,14 @@ class ServerSentEvent:
         data: str | None = None,
         id: str | None = None,
         retry: int | None = None,
+        raw: memoryview | None = None,
     ) -> None:
-        if data is None:
+        if data is None and raw is None:
             data = ""
 
         self._id = id
         self._data = data
+        self._raw = raw
         self._event = event or None
         self._retry = retry
 
@@ -181,8 +207,17 @@ class ServerSentEvent:
 
     @property
     def data(self) -> str:
+        if self._data is None:
+            self._data = str(cast(memoryview, self._raw), "utf-8")
         return self._data
 
+    @property
+    def raw(self) -> memoryview:
+        """The undecoded UTF-8 bytes of `data`, without copying them out of the response body where possible."""
+        if self._raw is None:
+            self._raw = memoryview(self.data.encode("utf-8"))
+        return self._raw
+
     def json(self) -> Any:
         return json.loads(self.data)
 
@@ -192,7 +227,7 @@ class ServerSentEvent:
 
 
 class SSEDecoder:
-    _data: list[str]
+    _data: list[memoryview]
     _event: str | None
     _retry: int | None
     _last_event_id: str | None
@@ -202,63 +237,102 @@ class SSEDecoder:
         self._data = []
         self._last_event_id = None
         self._retry = None
+        # The start of an unterminated line, as views of the chunks it arrived in.
+        self._pending: list[memoryview] = []
+        # Whether the last chunk ended with `\r`, so a leading `\n` in the next one completes a `\r\n`.
+        self._skip_lf = False
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            yield from self._feed(chunk)
+        self._finish()
 
     async def aiter_bytes(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    async def _aiter_chunks(self, iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in self._feed(chunk):
+                yield sse
+        self._finish()
+
+    def _feed(self, chunk: bytes) -> Iterator[ServerSentEvent]:
+        """Decode every line completed by `chunk`.
+
+        Only the bytes of `chunk` are searched for line terminators, so the cost of an event is
+        linear in its size however many chunks it is split across. A line that lies within one
+        chunk is decoded in place; a line split across chunks is joined exactly once.
+        """
+        size = len(chunk)
+        pos = 0
+        if self._skip_lf and size:
+            self._skip_lf = False
+            if chunk[0] == _LF:
+                pos = 1
+
+        # the next `\r` / `\n` at or after `pos`; -1 once there are none left, -2 before searching
+        cr = lf = -2
+        while pos < size:
+            if cr != -1 and cr < pos:
+                cr = chunk.find(b"\r", pos)
+            if lf != -1 and lf < pos:
+                lf = chunk.find(b"\n", pos)
+            if cr == -1 and lf == -1:
+                break
+
+            if lf == -1 or (cr != -1 and cr < lf):
+                end = cr
+                if end + 1 == size:
+                    self._skip_lf = True
+                    next_pos = size
+                else:
+                    next_pos = end + 2 if chunk[end + 1] == _LF else end + 1
+            else:
+                end = lf
+                next_pos = lf + 1
+
+            if self._pending:
+                self._pending.append(memoryview(chunk)[pos:end])
+                line = b"".join(self._pending)
+                self._pending = []
+                sse = self._decode_line(line, 0, len(line))
+            else:
+                sse = self._decode_line(chunk, pos, end)
+            if sse is not None:
+                yield sse
+            pos = next_pos
+
+        if pos < size:
+            self._pending.append(memoryview(chunk)[pos:])
+
+    def _finish(self) -> None:
+        # A trailing line without a terminator can still set fields, but an event is only
+        # dispatched by a blank line.
+        if self._pending:
+            line = b"".join(self._pending)
+            self._pending = []
+            self._decode_line(line, 0, len(line))
+        self._skip_lf = False
 
     def decode(self, line: str) -> ServerSentEvent | None:
+        raw = line.encode("utf-8")
+        return self._decode_line(raw, 0, len(raw))
+
+    def _decode_line(self, buffer: bytes, start: int, end: int) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
 
-        if not line:
+        if start == end:
             if not self._event and not self._data and not self._last_event_id and self._retry is None:
                 return None
 
+            if len(self._data) == 1:
+                data = self._data[0]
+            else:
+                data = memoryview(b"\n".join(self._data))
             sse = ServerSentEvent(
                 event=self._event,
-                data="\n".join(self._data),
                 id=self._last_event_id,
                 retry=self._retry,
+                raw=data,
             )
 
             # NOTE: as per the SSE spec, do not reset last_event_id.
@@ -268,26 +342,32 @@ class SSEDecoder:
 
             return sse
 
-        if line.startswith(":"):
+        if buffer[start] == _COLON:
             return None
 
-        fieldname, _, value = line.partition(":")
-
-        if value.startswith(" "):
-            value = value[1:]
+        colon = buffer.find(b":", start, end)
+        if colon < 0:
+            fieldname = buffer[start:end]
+            value_start = end
+        else:
+            fieldname = buffer[start:colon]
+            value_start = colon + 1
+            if value_start < end and buffer[value_start] == _SPACE:
+                value_start += 1
+        value = memoryview(buffer)[value_start:end]
 
-        if fieldname == "event":
-            self._event = value
-        elif fieldname == "data":
+        if fieldname == b"data":
             self._data.append(value)
-        elif fieldname == "id":
-            if "\0" in value:
+        elif fieldname == b"event":
+            self._event = str(value, "utf-8")
+        elif fieldname == b"id":
+            if b"\0" in value.tobytes():
                 pass
             else:
-                self._last_event_id = value
-        elif fieldname == "retry":
+                self._last_event_id = str(value, "utf-8")
+        elif fieldname == b"retry":
             try:
-                self._retry = int(value)
+                self._retry = int(value.tobytes())
             except (TypeError, ValueError):
                 pass
         else:
@@ -296,6 +376,11 @@ class SSEDecoder:
         return None
 
 
+_LF = ord("\n")
+_COLON = ord(":")
+_SPACE = ord(" ")
+
+
 @runtime_checkable
 class SSEBytesDecoder(Protocol):
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
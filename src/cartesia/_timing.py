@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import time
+import logging
+from typing import Any, Dict, Tuple, Union, Callable, Optional, Sequence
+
+import httpx
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+class TimingEvent:
+    """A single latency measurement reported to the client's timing observers.
+
+    `name` identifies the phase that was measured, e.g. `http.connect` or `ws.first_audio`,
+    `duration` is in seconds, and `attributes` describe the request it belongs to, such as
+    the HTTP method and path or the WebSocket context ID.
+    """
+
+    __slots__ = ("name", "duration", "attributes")
+
+    def __init__(self, name: str, duration: float, attributes: Dict[str, Union[str, int, float]]) -> None:
+        self.name = name
+        self.duration = duration
+        self.attributes = attributes
+
+    def __repr__(self) -> str:
+        return f"TimingEvent(name={self.name!r}, duration={self.duration!r}, attributes={self.attributes!r})"
+
+
+TimingObserver = Callable[[TimingEvent], None]
+
+# httpcore trace events that open and close a phase we report, and the name reported for it
+_TRACE_PHASES = {
+    "connection.connect_tcp": "http.connect",
+    "connection.connect_unix_socket": "http.connect",
+    "connection.start_tls": "http.tls",
+}
+_REQUEST_SENT = ("http11.send_request_headers.started", "http2.send_request_headers.started")
+_RESPONSE_STARTED = ("http11.receive_response_headers.complete", "http2.receive_response_headers.complete")
+
+
+class Timings:
+    """Dispatches `TimingEvent`s to the observers a client was constructed with.
+
+    Instrumented code checks `bool(timings)` before taking measurements, so a client without
+    observers pays nothing beyond that check. Observers run inline on the thread (or event loop)
+    that took the measurement and should return quickly; an exception from an observer is
+    logged and otherwise ignored so that it can never fail a request.
+    """
+
+    __slots__ = ("observers",)
+
+    def __init__(self, observers: Optional[Sequence[TimingObserver]] = None) -> None:
+        self.observers: Tuple[TimingObserver, ...] = tuple(observers or ())
+
+    def __bool__(self) -> bool:
+        return bool(self.observers)
+
+    def emit(self, name: str, duration: float, **attributes: Union[str, int, float]) -> None:
+        event = TimingEvent(name, duration, attributes)
+        for observer in self.observers:
+            try:
+                observer(event)
+            except Exception:
+                log.exception("Timing observer %r raised while handling %s", observer, name)
+
+    def trace(self, request: httpx.Request) -> None:
+        """Report connection setup and time to first byte for `request` via httpcore's `trace` extension."""
+        request.extensions["trace"] = _HTTPTrace(self, request).__call__
+
+    def async_trace(self, request: httpx.Request) -> None:
+        """Like `trace()`, for requests sent by an async client, which awaits the trace callback."""
+        request.extensions["trace"] = _HTTPTrace(self, request).acall
+
+    def contexts(self, path: str) -> ContextTimings:
+        return ContextTimings(self, path)
+
+
+class _HTTPTrace:
+    def __init__(self, timings: Timings, request: httpx.Request) -> None:
+        self._timings = timings
+        self._attributes: Dict[str, Union[str, int, float]] = {
+            "method": request.method,
+            "path": request.url.path,
+        }
+        self._started: Dict[str, float] = {}
+
+    def __call__(self, name: str, info: Dict[str, Any]) -> None:  # noqa: ARG002
+        now = time.perf_counter()
+        phase, _, state = name.rpartition(".")
+        if phase in _TRACE_PHASES:
+            if state == "started":
+                self._started[phase] = now
+            elif state == "complete" and phase in self._started:
+                self._timings.emit(_TRACE_PHASES[phase], now - self._started.pop(phase), **self._attributes)
+        elif name in _REQUEST_SENT:
+            self._started["request"] = now
+        elif name in _RESPONSE_STARTED and "request" in self._started:
+            self._timings.emit("http.first_byte", now - self._started.pop("request"), **self._attributes)
+
+    async def acall(self, name: str, info: Dict[str, Any]) -> None:
+        self(name, info)
+
+
+class ContextTimings:
+    """Tracks the WebSocket contexts of a connection from their first request to their last chunk.
+
+    `sent()` marks the first message sent for a context and `received()` inspects each parsed
+    server message, reporting time to first audio, the server's `step_time` for every chunk,
+    and the total once the context is done.
+    """
+
+    def __init__(self, timings: Timings, path: str) -> None:
+        self._timings = timings
+        self._path = path
+        self._sent: Dict[str, float] = {}
+        self._first_audio: Dict[str, bool] = {}
+
+    def sent(self, context_id: Optional[str]) -> None:
+        if context_id is not None and context_id not in self._sent:
+            self._sent[context_id] = time.perf_counter()
+
+    def cancelled(self, context_id: Optional[str]) -> None:
+        if context_id is not None:
+            self._sent.pop(context_id, None)
+            self._first_audio.pop(context_id, None)
+
+    def received(self, event: Any, decode_started: float) -> None:
+        now = time.perf_counter()
+        self._timings.emit("ws.decode", now - decode_started, path=self._path)
+
+        context_id = getattr(event, "context_id", None)
+        if context_id is None or context_id not in self._sent:
+            return
+        kind = getattr(event, "type", None)
+        if kind == "chunk":
+            if not self._first_audio.get(context_id):
+                self._first_audio[context_id] = True
+                self._timings.emit(
+                    "ws.first_audio", now - self._sent[context_id], path=self._path, context_id=context_id
+                )
+            step_time = getattr(event, "step_time", None)
+            if isinstance(step_time, (int, float)):
+                # the server reports milliseconds
+                self._timings.emit("ws.step_time", step_time / 1000, path=self._path, context_id=context_id)
+        elif kind in ("done", "error"):
+            started = self._sent.pop(context_id)
+            self._first_audio.pop(context_id, None)
+            self._timings.emit("ws.total", now - started, path=self._path, context_id=context_id)
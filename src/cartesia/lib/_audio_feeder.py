@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import os
+import time
+import struct
+import asyncio
+import threading
+from types import TracebackType
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    AsyncIterable,
+    AsyncIterator,
+)
+
+from .._exceptions import CartesiaError
+from .._send_queue import audio_bytes_per_second
+from ..types.stt_encoding import STTEncoding
+
+if TYPE_CHECKING:
+    from ..resources.stt.auto_finalize import AutoFinalizeResourceConnection, AsyncAutoFinalizeResourceConnection
+    from ..resources.stt.manual_finalize import (
+        ManualFinalizeResourceConnection,
+        AsyncManualFinalizeResourceConnection,
+    )
+
+__all__ = ["AudioFeeder", "AsyncAudioFeeder"]
+
+AudioSource = Union[str, "os.PathLike[str]", Iterable[bytes]]
+
+# (WAVE format tag, bits per sample) -> encoding
+_WAV_ENCODINGS: Dict[Tuple[int, int], str] = {
+    (1, 16): "pcm_s16le",
+    (1, 32): "pcm_s32le",
+    (3, 16): "pcm_f16le",
+    (3, 32): "pcm_f32le",
+    (7, 8): "pcm_mulaw",
+    (6, 8): "pcm_alaw",
+}
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_READ_SIZE = 64 * 1024
+_UNKNOWN_DATA_SIZE = 0xFFFFFFFF
+
+
+def _wav_format(file: IO[bytes]) -> Tuple[Optional[str], int, int, Optional[int]]:
+    """Advance `file` to the start of the `data` chunk, returning `(encoding, channels, sample_rate, data_size)`.
+
+    `encoding` is `None` if the audio is in a format the STT WebSocket does not accept.
+    `data_size` is `None` if the header leaves the length open, as streaming encoders do by
+    writing `0` or `0xFFFFFFFF`, in which case the audio runs to the end of the file.
+    """
+    riff, _, wave = struct.unpack("<4sI4s", file.read(12))
+    if riff != b"RIFF" or wave != b"WAVE":
+        raise ValueError("Not a WAV file")
+
+    fmt: Optional[Tuple[int, int, int, int]] = None
+    while True:
+        header = file.read(8)
+        if len(header) < 8:
+            raise ValueError("WAV file has no data chunk")
+        chunk_id, size = struct.unpack("<4sI", header)
+        if chunk_id == b"data":
+            data_size: Optional[int] = size if size not in (0, _UNKNOWN_DATA_SIZE) else None
+            break
+        body = file.read(size + (size & 1))
+        if chunk_id == b"fmt ":
+            format_tag, channels, rate = struct.unpack("<HHI", body[:8])
+            (bits,) = struct.unpack("<H", body[14:16])
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                (format_tag,) = struct.unpack("<H", body[24:26])
+            fmt = (format_tag, channels, rate, bits)
+
+    if fmt is None:
+        raise ValueError("WAV file has no fmt chunk")
+    format_tag, channels, rate, bits = fmt
+    return _WAV_ENCODINGS.get((format_tag, bits)), channels, rate, data_size
+
+
+def _read_wav_header(file: IO[bytes], *, encoding: str, sample_rate: int) -> Optional[int]:
+    """Advance `file` to the start of the `data` chunk, checking the format on the way.
+
+    Returns the size of the `data` chunk, or `None` if the header does not give it.
+    """
+    found, channels, rate, data_size = _wav_format(file)
+    if channels != 1 or rate != sample_rate or found != encoding:
+        raise ValueError(
+            f"WAV file is {channels}-channel {found or 'unsupported audio'} at {rate} Hz, "
+            f"but the feeder is configured for mono {encoding} at {sample_rate} Hz"
+        )
+    return data_size
+
+
+def _read_file(path: Union[str, "os.PathLike[str]"], *, encoding: str, sample_rate: int) -> Iterator[bytes]:
+    """Yield the audio in a WAV file, or the whole file if it is headerless audio.
+
+    Chunks after a WAV file's `data` chunk, such as `LIST` metadata, are not audio and are
+    left out.
+    """
+    with open(path, "rb") as file:
+        remaining: Optional[int] = None
+        if file.read(4) == b"RIFF":
+            file.seek(0)
+            remaining = _read_wav_header(file, encoding=encoding, sample_rate=sample_rate)
+        else:
+            file.seek(0)
+        while remaining is None or remaining > 0:
+            data = file.read(_READ_SIZE if remaining is None else min(_READ_SIZE, remaining))
+            if not data:
+                return
+            if remaining is not None:
+                remaining -= len(data)
+            yield data
+
+
+def _rechunk(source: Iterable[bytes], chunk_bytes: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    for data in source:
+        buffer += data
+        while len(buffer) >= chunk_bytes:
+            yield bytes(buffer[:chunk_bytes])
+            del buffer[:chunk_bytes]
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _arechunk(source: AsyncIterable[bytes], chunk_bytes: int) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for data in source:
+        buffer += data
+        while len(buffer) >= chunk_bytes:
+            yield bytes(buffer[:chunk_bytes])
+            del buffer[:chunk_bytes]
+    if buffer:
+        yield bytes(buffer)
+
+
+class _Pacer:
+    """Real-time schedule and send-side lag accounting shared by both feeders."""
+
+    def __init__(self, *, encoding: str, sample_rate: int, chunk_duration: float, speed: float) -> None:
+        if chunk_duration <= 0:
+            raise ValueError("chunk_duration must be positive")
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.bytes_per_second = audio_bytes_per_second(encoding, sample_rate)
+        sample_width = audio_bytes_per_second(encoding, 1)
+        # Chunks always hold whole samples.
+        self.chunk_bytes = max(round(chunk_duration * sample_rate), 1) * sample_width
+        self.speed = speed
+        self.started: Optional[float] = None
+
+        self.chunks_sent = 0
+        self.bytes_sent = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+
+    @property
+    def audio_seconds_sent(self) -> float:
+        return self.bytes_sent / self.bytes_per_second
+
+    def due(self) -> float:
+        """Monotonic time at which the next chunk should be sent."""
+        if self.started is None:
+            self.started = time.monotonic()
+        return self.started + self.audio_seconds_sent / self.speed
+
+    def sent(self, due: float, nbytes: int) -> None:
+        lag = max(time.monotonic() - due, 0.0)
+        self.chunks_sent += 1
+        self.bytes_sent += nbytes
+        self.last_lag = lag
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+
+
+class _FeederStats:
+    _pacer: _Pacer
+
+    @property
+    def chunks_sent(self) -> int:
+        return self._pacer.chunks_sent
+
+    @property
+    def bytes_sent(self) -> int:
+        return self._pacer.bytes_sent
+
+    @property
+    def audio_seconds_sent(self) -> float:
+        """Duration of the audio sent so far."""
+        return self._pacer.audio_seconds_sent
+
+    @property
+    def lag(self) -> float:
+        """How many seconds behind schedule the most recent chunk finished sending."""
+        return self._pacer.last_lag
+
+    @property
+    def max_lag(self) -> float:
+        return self._pacer.max_lag
+
+    @property
+    def mean_lag(self) -> float:
+        sent = self._pacer.chunks_sent
+        return self._pacer.total_lag / sent if sent else 0.0
+
+
+class AudioFeeder(_FeederStats):
+    """Sends audio to an STT WebSocket connection in evenly sized chunks at real-time pace.
+
+    `source` is a path to a WAV or headerless audio file, or an iterable of audio bytes
+    (e.g. microphone buffers) of any size. The audio is re-framed into `chunk_duration`
+    second chunks of the given `encoding` and `sample_rate`, which must match the
+    connection, and each chunk is sent with `connection.send_raw()` once the previous
+    audio has "played" at `speed` times real time. Pass `speed=float("inf")` to send as
+    fast as the connection allows.
+
+    `lag`, `max_lag` and `mean_lag` report how far behind schedule chunks were sent, e.g.
+    because the source or the network could not keep up.
+
+    ```py
+    with client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16000) as ws:
+        feeder = AudioFeeder(ws, "call.wav", encoding="pcm_s16le", sample_rate=16000).start()
+        for event in ws:
+            ...
+        feeder.join()
+    ```
+    """
+
+    def __init__(
+        self,
+        connection: Union[AutoFinalizeResourceConnection, ManualFinalizeResourceConnection],
+        source: AudioSource,
+        *,
+        encoding: STTEncoding,
+        sample_rate: int,
+        chunk_duration: float = 0.1,
+        speed: float = 1.0,
+    ) -> None:
+        self._connection = connection
+        self._source = source
+        self._encoding = encoding
+        self._sample_rate = sample_rate
+        self._pacer = _Pacer(encoding=encoding, sample_rate=sample_rate, chunk_duration=chunk_duration, speed=speed)
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._errors: List[BaseException] = []
+
+    def __enter__(self) -> AudioFeeder:
+        return self.start()
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        if exc_type is not None:
+            self.stop()
+        self.join()
+
+    def _chunks(self) -> Iterator[bytes]:
+        source = self._source
+        if isinstance(source, (str, os.PathLike)):
+            source = _read_file(source, encoding=self._encoding, sample_rate=self._sample_rate)
+        return _rechunk(source, self._pacer.chunk_bytes)
+
+    def run(self) -> None:
+        """Send all of the audio from the calling thread."""
+        for chunk in self._chunks():
+            due = self._pacer.due()
+            if self._stopped.wait(max(due - time.monotonic(), 0.0)):
+                return
+            self._connection.send_raw(chunk)
+            self._pacer.sent(due, len(chunk))
+
+    def start(self) -> AudioFeeder:
+        """Send the audio from a background thread."""
+        if self._thread is not None:
+            raise CartesiaError("AudioFeeder has already been started.")
+        self._thread = threading.Thread(target=self._run_in_thread, name="cartesia-audio-feeder", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run_in_thread(self) -> None:
+        try:
+            self.run()
+        except BaseException as exc:
+            self._errors.append(exc)
+
+    def stop(self) -> None:
+        """Stop sending before the next chunk."""
+        self._stopped.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the background thread, re-raising any error it hit while sending."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._errors:
+            raise self._errors[0]
+
+    @property
+    def done(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+
+class AsyncAudioFeeder(_FeederStats):
+    """Sends audio to an async STT WebSocket connection in evenly sized chunks at real-time pace.
+
+    See `AudioFeeder`; `source` may also be an async iterable of audio bytes. `start()`
+    runs the feeder as a task on the current event loop.
+
+    ```py
+    async with AsyncAudioFeeder(ws, mic_frames(), encoding="pcm_s16le", sample_rate=16000):
+        async for event in ws:
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        connection: Union[AsyncAutoFinalizeResourceConnection, AsyncManualFinalizeResourceConnection],
+        source: Union[AudioSource, AsyncIterable[bytes]],
+        *,
+        encoding: STTEncoding,
+        sample_rate: int,
+        chunk_duration: float = 0.1,
+        speed: float = 1.0,
+    ) -> None:
+        self._connection = connection
+        self._source = source
+        self._encoding = encoding
+        self._sample_rate = sample_rate
+        self._pacer = _Pacer(encoding=encoding, sample_rate=sample_rate, chunk_duration=chunk_duration, speed=speed)
+        self._task: Optional[asyncio.Task[None]] = None
+        self._stopped = False
+
+    async def __aenter__(self) -> AsyncAudioFeeder:
+        return self.start()
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        if exc_type is not None:
+            self.stop()
+        await self.wait()
+
+    async def _chunks(self) -> AsyncIterator[bytes]:
+        source = self._source
+        if isinstance(source, (str, os.PathLike)):
+            source = _read_file(source, encoding=self._encoding, sample_rate=self._sample_rate)
+        if isinstance(source, AsyncIterable):
+            async for chunk in _arechunk(source, self._pacer.chunk_bytes):
+                yield chunk
+        else:
+            # File reads are small and buffered, so they are done on the event loop.
+            for chunk in _rechunk(source, self._pacer.chunk_bytes):
+                yield chunk
+
+    async def run(self) -> None:
+        """Send all of the audio from the current task."""
+        async for chunk in self._chunks():
+            due = self._pacer.due()
+            delay = due - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._connection.send_raw(chunk)
+            self._pacer.sent(due, len(chunk))
+
+    def start(self) -> AsyncAudioFeeder:
+        """Send the audio from a background task."""
+        if self._task is not None:
+            raise CartesiaError("AsyncAudioFeeder has already been started.")
+        self._task = asyncio.ensure_future(self.run())
+        return self
+
+    def stop(self) -> None:
+        """Cancel the background task."""
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+
+    async def wait(self) -> None:
+        """Wait for the background task, re-raising any error it hit while sending."""
+        if self._task is None:
+            return
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            if not self._stopped:
+                raise
+
+    @property
+    def done(self) -> bool:
+        return self._task is not None and self._task.done()
@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import os
+import abc
+import struct
+import threading
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, Dict, Tuple, Union, TypeVar, Iterator, Optional, AsyncIterator
+from typing_extensions import override
+
+from .._exceptions import CartesiaError
+from ..types.raw_encoding import RawEncoding
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "AudioSink",
+    "WavFileSink",
+    "NumpySink",
+    "RingBufferSink",
+    "TeeSink",
+    "write_chunk_audio",
+    "write_audio_events",
+    "async_write_audio_events",
+]
+
+_T = TypeVar("_T")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# encoding -> (WAVE format tag, bits per sample, numpy dtype)
+_ENCODINGS: Dict[str, Tuple[int, int, str]] = {
+    "pcm_s16le": (1, 16, "<i2"),
+    "pcm_f32le": (3, 32, "<f4"),
+    "pcm_mulaw": (7, 8, "u1"),
+    "pcm_alaw": (6, 8, "u1"),
+}
+
+
+def _encoding_info(encoding: str) -> Tuple[int, int, str]:
+    try:
+        return _ENCODINGS[encoding]
+    except KeyError:
+        raise ValueError(f"Unsupported encoding {encoding!r}; expected one of {', '.join(_ENCODINGS)}") from None
+
+
+class AudioSink(abc.ABC):
+    """Destination for generated audio.
+
+    Sinks can be passed as `sink=` to `WebSocketContext.receive()`, `tts.generate_sse()`
+    and `tts.generate()`, which write each piece of audio to the sink as it arrives rather
+    than collecting it in memory. Sinks expect headerless audio, i.e. a `raw` container.
+
+    The SDK never closes a sink; use it as a context manager or call `.close()` yourself.
+    """
+
+    @abc.abstractmethod
+    def write(self, data: Buffer) -> None:
+        """Append `data` to the sink."""
+
+    def close(self) -> None:  # noqa: B027
+        """Flush and release any resources held by the sink."""
+
+    def __enter__(self: _T) -> _T:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+
+class WavFileSink(AudioSink):
+    """Writes audio to a WAV file.
+
+    A header with placeholder sizes is written up front and fixed up on `.close()`. If the
+    file isn't seekable (e.g. a pipe), the placeholder sizes are left in place, which most
+    players treat as "read until EOF".
+
+    ```py
+    with WavFileSink("out.wav", sample_rate=44100, encoding="pcm_f32le") as sink:
+        for _ in ctx.receive(sink=sink):
+            pass
+    ```
+    """
+
+    def __init__(
+        self,
+        file: Union[str, "os.PathLike[str]", IO[bytes]],
+        *,
+        sample_rate: int,
+        encoding: RawEncoding = "pcm_s16le",
+        num_channels: int = 1,
+    ) -> None:
+        format_tag, bits_per_sample, _ = _encoding_info(encoding)
+
+        if isinstance(file, (str, os.PathLike)):
+            self._file: IO[bytes] = open(file, "wb")  # noqa: SIM115
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+
+        self._format_tag = format_tag
+        self._bits_per_sample = bits_per_sample
+        self._sample_rate = sample_rate
+        self._num_channels = num_channels
+        self._data_size = 0
+        self._closed = False
+
+        self._start: Optional[int]
+        try:
+            self._start = self._file.tell()
+        except (AttributeError, OSError):
+            self._start = None
+        self._file.write(self._header(0xFFFFFFFF - 36))
+
+    @property
+    def bytes_written(self) -> int:
+        """Number of audio bytes written, excluding the header."""
+        return self._data_size
+
+    def _header(self, data_size: int) -> bytes:
+        block_align = self._num_channels * self._bits_per_sample // 8
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            data_size + 36,
+            b"WAVE",
+            b"fmt ",
+            16,
+            self._format_tag,
+            self._num_channels,
+            self._sample_rate,
+            self._sample_rate * block_align,
+            block_align,
+            self._bits_per_sample,
+            b"data",
+            data_size,
+        )
+
+    @override
+    def write(self, data: Buffer) -> None:
+        if self._closed:
+            raise CartesiaError("Cannot write to a closed WavFileSink")
+        self._file.write(data)
+        self._data_size += len(data) if not isinstance(data, memoryview) else data.nbytes
+
+    @override
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._start is not None and self._data_size <= 0xFFFFFFFF - 36:
+            try:
+                end = self._file.tell()
+                self._file.seek(self._start)
+                self._file.write(self._header(self._data_size))
+                self._file.seek(end)
+            except OSError:
+                pass
+
+        self._file.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+class NumpySink(AudioSink):
+    """Writes audio into a preallocated `numpy` array.
+
+    Either pass an existing 1-D array (its dtype must match the encoding) or a number of
+    samples to allocate. Audio bytes are copied straight into the array's memory; writing
+    more than the array can hold raises a `CartesiaError`.
+
+    ```py
+    sink = NumpySink(44100 * 30, encoding="pcm_f32le")
+    for _ in client.tts.generate_sse(..., sink=sink):
+        pass
+    samples = sink.array
+    ```
+    """
+
+    def __init__(
+        self,
+        capacity: Union[int, "np.ndarray[Any, Any]"],
+        *,
+        encoding: RawEncoding = "pcm_f32le",
+    ) -> None:
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise CartesiaError("You need to install `numpy` to use `NumpySink`") from exc
+
+        _, _, dtype = _encoding_info(encoding)
+        if isinstance(capacity, int):
+            buffer = np.empty(capacity, dtype=dtype)
+        else:
+            buffer = capacity
+            if buffer.dtype != np.dtype(dtype):
+                raise ValueError(f"Expected an array of dtype {np.dtype(dtype)} for {encoding}, got {buffer.dtype}")
+            if buffer.ndim != 1 or not buffer.flags.c_contiguous:
+                raise ValueError("Expected a contiguous 1-D array")
+
+        self._buffer = buffer
+        self._bytes = buffer.data.cast("B")
+        self._offset = 0
+
+    @property
+    def array(self) -> "np.ndarray[Any, Any]":
+        """The samples written so far, as a view into the preallocated array."""
+        return self._buffer[: self._offset // self._buffer.itemsize]
+
+    @property
+    def bytes_written(self) -> int:
+        return self._offset
+
+    @override
+    def write(self, data: Buffer) -> None:
+        size = len(data) if not isinstance(data, memoryview) else data.nbytes
+        end = self._offset + size
+        if end > len(self._bytes):
+            raise CartesiaError(
+                f"NumpySink is full: cannot write {size} bytes, {len(self._bytes) - self._offset} bytes remaining"
+            )
+        self._bytes[self._offset : end] = data
+        self._offset = end
+
+
+class RingBufferSink(AudioSink):
+    """A fixed-size single-producer / single-consumer ring buffer for playback threads.
+
+    The producer (the thread receiving audio) only advances the write position and the
+    consumer (e.g. an audio device callback) only advances the read position, so neither
+    side takes a lock to move data. `.write()` blocks while the buffer is full, so
+    generation faster than real time is paced by playback.
+
+    ```py
+    ring = RingBufferSink(capacity=44100 * 4 * 2)
+
+
+    def callback(outdata, frames, time, status):
+        n = ring.readinto(outdata)
+        outdata[n:] = b"\\x00" * (len(outdata) - n)
+    ```
+    """
+
+    def __init__(self, capacity: int, *, write_timeout: Optional[float] = None) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._write_timeout = write_timeout
+        # Monotonic positions; `_write_pos - _read_pos` is the number of unread bytes.
+        self._write_pos = 0
+        self._read_pos = 0
+        self._closed = False
+        self._space_available = threading.Event()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """Number of bytes that can be read right now."""
+        return self._write_pos - self._read_pos
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @override
+    def write(self, data: Buffer) -> None:
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        view = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+        while len(view):
+            if self._closed:
+                raise CartesiaError("Cannot write to a closed RingBufferSink")
+
+            # Clear before checking so a read that lands in between still wakes us.
+            self._space_available.clear()
+            free = self._capacity - (self._write_pos - self._read_pos)
+            if not free:
+                if not self._space_available.wait(self._write_timeout):
+                    raise TimeoutError("Timed out waiting for the consumer to free space in the ring buffer")
+                continue
+
+            n = min(free, len(view))
+            start = self._write_pos % self._capacity
+            first = min(n, self._capacity - start)
+            self._view[start : start + first] = view[:first]
+            if first < n:
+                self._view[: n - first] = view[first:n]
+            self._write_pos += n
+            view = view[n:]
+
+    def readinto(self, buffer: Buffer) -> int:
+        """Copy up to `len(buffer)` unread bytes into `buffer` without blocking.
+
+        Returns the number of bytes copied, which is `0` when the buffer is empty.
+        """
+        out = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        out = out.cast("B") if out.format != "B" or out.ndim != 1 else out
+        n = min(len(out), self._write_pos - self._read_pos)
+        if not n:
+            return 0
+
+        start = self._read_pos % self._capacity
+        first = min(n, self._capacity - start)
+        out[:first] = self._view[start : start + first]
+        if first < n:
+            out[first:n] = self._view[: n - first]
+        self._read_pos += n
+        self._space_available.set()
+        return n
+
+    def read(self, size: int = -1) -> bytes:
+        """Return up to `size` unread bytes (all of them if `size` is negative) without blocking."""
+        available = self._write_pos - self._read_pos
+        out = bytearray(available if size < 0 else min(size, available))
+        self.readinto(out)
+        return bytes(out)
+
+    @override
+    def close(self) -> None:
+        """Stop accepting writes. Unread audio can still be read."""
+        self._closed = True
+        self._space_available.set()
+
+
+class TeeSink(AudioSink):
+    """Writes the same audio to several sinks, e.g. to fan one generation out to multiple formats."""
+
+    def __init__(self, *sinks: AudioSink) -> None:
+        self._sinks = sinks
+
+    @override
+    def write(self, data: Buffer) -> None:
+        for sink in self._sinks:
+            sink.write(data)
+
+    @override
+    def close(self) -> None:
+        for sink in self._sinks:
+            sink.close()
+
+
+def write_chunk_audio(sink: AudioSink, event: Any) -> None:
+    """Write the audio of a `chunk` event to `sink`; other events are ignored."""
+    if event.type == "chunk":
+        audio = event.audio
+        if audio:
+            sink.write(audio)
+
+
+def write_audio_events(events: Iterator[_T], sink: AudioSink) -> Iterator[_T]:
+    """Write the audio of every `chunk` event to `sink`, passing all events through."""
+    for event in events:
+        write_chunk_audio(sink, event)
+        yield event
+
+
+async def async_write_audio_events(events: AsyncIterator[_T], sink: AudioSink) -> AsyncIterator[_T]:
+    """Write the audio of every `chunk` event to `sink`, passing all events through."""
+    async for event in events:
+        write_chunk_audio(sink, event)
+        yield event
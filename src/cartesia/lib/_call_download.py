@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import pathlib
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Set,
+    Dict,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    Generator,
+    AsyncIterable,
+    AsyncIterator,
+    AsyncGenerator,
+)
+from typing_extensions import Literal
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import anyio
+import httpx
+
+from .._exceptions import APIStatusError, APIConnectionError
+from ..types.agents.agent_call import AgentCall
+
+if TYPE_CHECKING:
+    from .._client import Cartesia, AsyncCartesia
+    from .._response import APIResponse, AsyncAPIResponse
+
+__all__ = ["CallDownload", "BulkCallDownload", "AsyncBulkCallDownload"]
+
+CallRef = Union[str, AgentCall]
+Outcome = Literal["downloaded", "resumed", "skipped"]
+
+_PART_SUFFIX = ".part"
+
+
+class CallDownload:
+    """The recording of one call from `agents.calls.download_many()`.
+
+    `outcome` is `"skipped"` if the recording was already on disk, `"resumed"` if a partial
+    download was completed with a Range request and `"downloaded"` otherwise. Either `error`
+    is set, or `path` holds the full recording. `bytes_downloaded` counts only the bytes
+    transferred by this run and `elapsed` is the wall-clock time, in seconds, it took.
+    """
+
+    __slots__ = ("call_id", "path", "outcome", "bytes_downloaded", "size", "elapsed", "error")
+
+    def __init__(
+        self,
+        call_id: str,
+        path: pathlib.Path,
+        outcome: Outcome,
+        *,
+        bytes_downloaded: int = 0,
+        size: Optional[int] = None,
+        elapsed: float,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.call_id = call_id
+        self.path = path
+        self.outcome = outcome
+        self.bytes_downloaded = bytes_downloaded
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def throughput(self) -> float:
+        """Bytes downloaded per second."""
+        return self.bytes_downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        outcome = f"{self.outcome}, {self.bytes_downloaded} bytes" if self.error is None else repr(self.error)
+        return f"CallDownload(call_id={self.call_id!r}, {outcome})"
+
+
+class _Throughput:
+    """Totals across a run, updated as each download finishes."""
+
+    def __init__(self) -> None:
+        self._start: Optional[float] = None
+        self.files = 0
+        self.failed = 0
+        self.bytes_downloaded = 0
+
+    def begin(self) -> None:
+        self._start = time.monotonic()
+
+    def add(self, download: CallDownload) -> CallDownload:
+        self.files += 1
+        self.failed += not download.ok
+        self.bytes_downloaded += download.bytes_downloaded
+        return download
+
+    @property
+    def throughput(self) -> float:
+        elapsed = time.monotonic() - self._start if self._start is not None else 0.0
+        return self.bytes_downloaded / elapsed if elapsed > 0 else 0.0
+
+
+def _call_id(call: CallRef) -> str:
+    call_id = call.id if isinstance(call, AgentCall) else call
+    if not call_id or os.path.basename(call_id) != call_id or call_id in (".", ".."):
+        raise ValueError(f"Expected a call ID that is a valid file name but received {call_id!r}")
+    return call_id
+
+
+def _rejected(call: CallRef, dest_dir: pathlib.Path, error: ValueError) -> CallDownload:
+    """The failed result for a call whose ID cannot be used as a file name."""
+    call_id = call.id if isinstance(call, AgentCall) else call
+    return CallDownload(call_id, dest_dir / f"{call_id}.wav", "downloaded", elapsed=0.0, error=error)
+
+
+def _range_headers(offset: int) -> Dict[str, str]:
+    return {"Range": f"bytes={offset}-"} if offset else {}
+
+
+def _resumes_at(response: httpx.Response, offset: int) -> bool:
+    """Whether `response` continues a partial file of `offset` bytes rather than restarting it."""
+    return (
+        offset > 0
+        and response.status_code == 206
+        and response.headers.get("Content-Range", "").startswith(f"bytes {offset}-")
+    )
+
+
+def _size(response: httpx.Response, offset: int) -> Optional[int]:
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    if total.isdigit():
+        return int(total)
+    length = response.headers.get("Content-Length")
+    return offset + int(length) if length is not None and length.isdigit() else None
+
+
+def _is_complete_range(exc: APIStatusError, offset: int) -> bool:
+    # A 416 for `bytes={size}-` means the partial file already holds every byte.
+    return exc.status_code == 416 and exc.response.headers.get("Content-Range", "") == f"bytes */{offset}"
+
+
+class _Download:
+    """Shared bookkeeping for downloading one recording to `dest_dir/<call_id>.wav`."""
+
+    def __init__(self, call_id: str, dest_dir: pathlib.Path) -> None:
+        self.call_id = call_id
+        self.path = dest_dir / f"{call_id}.wav"
+        self.part = self.path.with_name(self.path.name + _PART_SUFFIX)
+        self.start = time.monotonic()
+        self.outcome: Outcome = "downloaded"
+        self.bytes_downloaded = 0
+        self.size: Optional[int] = None
+
+    def offset(self) -> int:
+        try:
+            return self.part.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def skip(self) -> CallDownload:
+        self.outcome = "skipped"
+        self.size = self.path.stat().st_size
+        return self.result()
+
+    def finish(self) -> CallDownload:
+        os.replace(self.part, self.path)
+        return self.result()
+
+    def result(self, error: Optional[Exception] = None) -> CallDownload:
+        return CallDownload(
+            self.call_id,
+            self.path,
+            self.outcome,
+            bytes_downloaded=self.bytes_downloaded,
+            size=self.size,
+            elapsed=time.monotonic() - self.start,
+            error=error,
+        )
+
+
+class BulkCallDownload:
+    """Results of `agents.calls.download_many()`, yielded as recordings finish.
+
+    Iterating drives the run: at most `concurrency` recordings are downloaded at once, and
+    the input is read lazily. A recording that fails is yielded with its `error` set rather
+    than raised. Closing the iterator (or leaving its `with` block) abandons downloads still
+    in flight; their partial files are resumed by the next run.
+    """
+
+    def __init__(
+        self,
+        client: Cartesia,
+        calls: Iterable[CallRef],
+        dest_dir: Union[str, "os.PathLike[str]"],
+        *,
+        concurrency: int,
+        max_resumes: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._calls = calls
+        self._dest_dir = pathlib.Path(dest_dir)
+        self._concurrency = concurrency
+        self._max_resumes = max_resumes
+        self._totals = _Throughput()
+        self._results = self._run()
+
+    @property
+    def files(self) -> int:
+        """Number of recordings finished so far, including skipped and failed ones."""
+        return self._totals.files
+
+    @property
+    def failed(self) -> int:
+        return self._totals.failed
+
+    @property
+    def bytes_downloaded(self) -> int:
+        return self._totals.bytes_downloaded
+
+    @property
+    def throughput(self) -> float:
+        """Bytes downloaded per second since the run started."""
+        return self._totals.throughput
+
+    def __iter__(self) -> Iterator[CallDownload]:
+        return self
+
+    def __next__(self) -> CallDownload:
+        return next(self._results)
+
+    def __enter__(self) -> BulkCallDownload:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the run, abandoning any downloads still in flight."""
+        self._results.close()
+
+    def _run(self) -> Generator[CallDownload, None, None]:
+        self._dest_dir.mkdir(parents=True, exist_ok=True)
+        self._totals.begin()
+        calls = iter(self._calls)
+        seen: Set[str] = set()
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix="cartesia-call-download")
+        in_flight: Set[Future[CallDownload]] = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._concurrency:
+                    call = next(calls, None)
+                    if call is None:
+                        exhausted = True
+                        break
+                    try:
+                        call_id = _call_id(call)
+                    except ValueError as exc:
+                        yield self._totals.add(_rejected(call, self._dest_dir, exc))
+                        continue
+                    if call_id not in seen:
+                        seen.add(call_id)
+                        in_flight.add(executor.submit(self._download, call_id))
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.discard(future)
+                    yield self._totals.add(future.result())
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _download(self, call_id: str) -> CallDownload:
+        download = _Download(call_id, self._dest_dir)
+        if download.path.exists():
+            return download.skip()
+
+        resumes = 0
+        try:
+            while True:
+                offset = download.offset()
+                if offset:
+                    download.outcome = "resumed"
+                try:
+                    with self._client.agents.calls.with_streaming_response.download_audio(
+                        call_id, extra_headers=_range_headers(offset)
+                    ) as response:
+                        self._write(download, response, offset)
+                    return download.finish()
+                except APIStatusError as exc:
+                    if not _is_complete_range(exc, offset):
+                        raise
+                    download.size = offset
+                    return download.finish()
+                except (httpx.TransportError, APIConnectionError):
+                    # Resume from what reached the disk, as long as the last attempt made progress.
+                    if resumes >= self._max_resumes or download.offset() <= offset:
+                        raise
+                    resumes += 1
+        except Exception as exc:
+            return download.result(exc)
+
+    @staticmethod
+    def _write(download: _Download, response: APIResponse[None], offset: int) -> None:
+        http_response = response.http_response
+        resuming = _resumes_at(http_response, offset)
+        download.size = _size(http_response, offset if resuming else 0)
+        if not resuming:
+            # the server sent the whole recording, so the partial file is restarted
+            download.outcome = "downloaded"
+        # Leaving the `with` block flushes the file even when the connection drops, so
+        # everything received so far is on disk for the next attempt to resume from.
+        with open(download.part, "ab" if resuming else "wb") as file:
+            for chunk in response.iter_bytes():
+                file.write(chunk)
+                download.bytes_downloaded += len(chunk)
+
+
+class AsyncBulkCallDownload:
+    """Results of `agents.calls.download_many()`, yielded as recordings finish.
+
+    Iterating drives the run: at most `concurrency` recordings are downloaded at once, and
+    the input is read lazily. A recording that fails is yielded with its `error` set rather
+    than raised. Closing the iterator (or leaving its `async with` block) cancels downloads
+    still in flight; their partial files are resumed by the next run.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCartesia,
+        calls: Union[Iterable[CallRef], AsyncIterable[CallRef]],
+        dest_dir: Union[str, "os.PathLike[str]"],
+        *,
+        concurrency: int,
+        max_resumes: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._calls = calls
+        self._dest_dir = pathlib.Path(dest_dir)
+        self._concurrency = concurrency
+        self._max_resumes = max_resumes
+        self._totals = _Throughput()
+        self._results = self._run()
+
+    @property
+    def files(self) -> int:
+        """Number of recordings finished so far, including skipped and failed ones."""
+        return self._totals.files
+
+    @property
+    def failed(self) -> int:
+        return self._totals.failed
+
+    @property
+    def bytes_downloaded(self) -> int:
+        return self._totals.bytes_downloaded
+
+    @property
+    def throughput(self) -> float:
+        """Bytes downloaded per second since the run started."""
+        return self._totals.throughput
+
+    def __aiter__(self) -> AsyncIterator[CallDownload]:
+        return self
+
+    async def __anext__(self) -> CallDownload:
+        return await self._results.__anext__()
+
+    async def __aenter__(self) -> AsyncBulkCallDownload:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the run, cancelling any downloads still in flight."""
+        await self._results.aclose()
+
+    async def _iter_calls(self) -> AsyncIterator[CallRef]:
+        if isinstance(self._calls, AsyncIterable):
+            async for call in self._calls:
+                yield call
+        else:
+            for call in self._calls:
+                yield call
+
+    async def _run(self) -> AsyncGenerator[CallDownload, None]:
+        await anyio.Path(self._dest_dir).mkdir(parents=True, exist_ok=True)
+        self._totals.begin()
+        calls = self._iter_calls()
+        seen: Set[str] = set()
+        in_flight: Set[asyncio.Task[CallDownload]] = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._concurrency:
+                    try:
+                        call = await calls.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    try:
+                        call_id = _call_id(call)
+                    except ValueError as exc:
+                        yield self._totals.add(_rejected(call, self._dest_dir, exc))
+                        continue
+                    if call_id not in seen:
+                        seen.add(call_id)
+                        in_flight.add(asyncio.ensure_future(self._download(call_id)))
+                if not in_flight:
+                    break
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    in_flight.discard(task)
+                    yield self._totals.add(task.result())
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _download(self, call_id: str) -> CallDownload:
+        download = _Download(call_id, self._dest_dir)
+        if await anyio.Path(download.path).exists():
+            return download.skip()
+
+        resumes = 0
+        try:
+            while True:
+                offset = download.offset()
+                if offset:
+                    download.outcome = "resumed"
+                try:
+                    async with self._client.agents.calls.with_streaming_response.download_audio(
+                        call_id, extra_headers=_range_headers(offset)
+                    ) as response:
+                        await self._write(download, response, offset)
+                    return download.finish()
+                except APIStatusError as exc:
+                    if not _is_complete_range(exc, offset):
+                        raise
+                    download.size = offset
+                    return download.finish()
+                except (httpx.TransportError, APIConnectionError):
+                    if resumes >= self._max_resumes or download.offset() <= offset:
+                        raise
+                    resumes += 1
+        except Exception as exc:
+            return download.result(exc)
+
+    @staticmethod
+    async def _write(download: _Download, response: AsyncAPIResponse[None], offset: int) -> None:
+        http_response = response.http_response
+        resuming = _resumes_at(http_response, offset)
+        download.size = _size(http_response, offset if resuming else 0)
+        if not resuming:
+            download.outcome = "downloaded"
+        async with await anyio.open_file(download.part, "ab" if resuming else "wb") as file:
+            async for chunk in response.iter_bytes():
+                await file.write(chunk)
+                download.bytes_downloaded += len(chunk)
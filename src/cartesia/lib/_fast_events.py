@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import json
+import base64
+from typing import Any, Dict, List, Tuple, Union, Generic, Mapping, TypeVar, Callable, ClassVar, Optional, cast
+from typing_extensions import Literal, override
+
+from .._models import construct_type_unchecked
+from ..types.websocket_response import WebsocketResponse
+from ..types.stt.stt_auto_finalize_websocket_response import STTAutoFinalizeWebsocketResponse
+from ..types.stt.stt_manual_finalize_websocket_response import STTManualFinalizeWebsocketResponse
+
+try:
+    import orjson  # type: ignore # optional dependency, see the `orjson` extra
+except ImportError:
+    orjson = None  # type: ignore
+
+__all__ = [
+    "EventParser",
+    "FastChunk",
+    "FastTimestamps",
+    "FastTurnUpdate",
+    "FastTranscript",
+    "FastWordTimestamps",
+    "FastWebsocketResponse",
+    "FastSTTAutoFinalizeWebsocketResponse",
+    "FastSTTManualFinalizeWebsocketResponse",
+    "loads",
+    "TTS_FAST_EVENTS",
+    "STT_AUTO_FINALIZE_FAST_EVENTS",
+    "STT_MANUAL_FINALIZE_FAST_EVENTS",
+]
+
+_T = TypeVar("_T")
+
+EventFactory = Callable[[Dict[str, Any]], Any]
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON frame, using `orjson` when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # `orjson` is stricter than the stdlib (e.g. it rejects `NaN`), so let
+            # `json` have the final say on anything it refuses.
+            pass
+    return json.loads(data)
+
+
+class _SlottedEvent:
+    __slots__: Tuple[str, ...] = ()
+
+    type: ClassVar[str]
+
+    @override
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ if not name.startswith("_"))
+        return f"{self.__class__.__name__}({fields})"
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__ if not name.startswith("_"))
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class FastWordTimestamps(_SlottedEvent):
+    """Lightweight counterpart of `WordTimestamps`."""
+
+    __slots__ = ("words", "start", "end")
+
+    words: List[str]
+    start: List[float]
+    end: List[float]
+
+    def __init__(self, *, words: List[str], start: List[float], end: List[float]) -> None:
+        self.words = words
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> FastWordTimestamps:
+        return cls(words=value.get("words", []), start=value.get("start", []), end=value.get("end", []))
+
+
+class FastChunk(_SlottedEvent):
+    """Lightweight counterpart of the TTS `Chunk` event, built without pydantic.
+
+    The base64 `data` is decoded on first access to `.audio` and cached.
+    """
+
+    __slots__ = ("context_id", "data", "done", "status_code", "step_time", "flush_id", "_audio")
+
+    type: ClassVar[Literal["chunk"]] = "chunk"
+
+    context_id: str
+    data: str
+    done: bool
+    status_code: int
+    step_time: float
+    flush_id: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        context_id: str,
+        data: str,
+        done: bool = False,
+        status_code: int = 206,
+        step_time: float = 0.0,
+        flush_id: Optional[int] = None,
+    ) -> None:
+        self.context_id = context_id
+        self.data = data
+        self.done = done
+        self.status_code = status_code
+        self.step_time = step_time
+        self.flush_id = flush_id
+        self._audio: Optional[bytes] = None
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> FastChunk:
+        return cls(
+            context_id=value.get("context_id", ""),
+            data=value.get("data") or "",
+            done=value.get("done", False),
+            status_code=value.get("status_code", 206),
+            step_time=value.get("step_time", 0.0),
+            flush_id=value.get("flush_id"),
+        )
+
+    @property
+    def audio(self) -> Optional[bytes]:
+        """Decoded audio data, or `None` if the chunk carried no audio."""
+        if not self.data:
+            return None
+        if self._audio is None:
+            self._audio = base64.b64decode(self.data)
+        return self._audio
+
+
+class FastTimestamps(_SlottedEvent):
+    """Lightweight counterpart of the TTS `Timestamps` event."""
+
+    __slots__ = ("context_id", "done", "status_code", "flush_id", "word_timestamps")
+
+    type: ClassVar[Literal["timestamps"]] = "timestamps"
+
+    context_id: str
+    done: bool
+    status_code: int
+    flush_id: Optional[int]
+    word_timestamps: Optional[FastWordTimestamps]
+
+    def __init__(
+        self,
+        *,
+        context_id: str,
+        done: bool = False,
+        status_code: int = 206,
+        flush_id: Optional[int] = None,
+        word_timestamps: Optional[FastWordTimestamps] = None,
+    ) -> None:
+        self.context_id = context_id
+        self.done = done
+        self.status_code = status_code
+        self.flush_id = flush_id
+        self.word_timestamps = word_timestamps
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> FastTimestamps:
+        word_timestamps = value.get("word_timestamps")
+        return cls(
+            context_id=value.get("context_id", ""),
+            done=value.get("done", False),
+            status_code=value.get("status_code", 206),
+            flush_id=value.get("flush_id"),
+            word_timestamps=FastWordTimestamps.from_dict(word_timestamps) if word_timestamps is not None else None,
+        )
+
+
+class FastTurnUpdate(_SlottedEvent):
+    """Lightweight counterpart of `STTAutoFinalizeTurnUpdate`."""
+
+    __slots__ = ("request_id", "transcript")
+
+    type: ClassVar[Literal["turn.update"]] = "turn.update"
+
+    request_id: str
+    transcript: str
+
+    def __init__(self, *, request_id: str, transcript: str) -> None:
+        self.request_id = request_id
+        self.transcript = transcript
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> FastTurnUpdate:
+        return cls(request_id=value.get("request_id", ""), transcript=value.get("transcript", ""))
+
+
+class FastTranscript(_SlottedEvent):
+    """Lightweight counterpart of `STTManualFinalizeTranscriptResponse`."""
+
+    __slots__ = ("is_final", "request_id", "text", "duration", "language", "words")
+
+    type: ClassVar[Literal["transcript"]] = "transcript"
+
+    is_final: bool
+    request_id: str
+    text: str
+    duration: Optional[float]
+    language: Optional[str]
+    words: Optional[List[FastWordTimestamps]]
+
+    def __init__(
+        self,
+        *,
+        is_final: bool,
+        request_id: str,
+        text: str,
+        duration: Optional[float] = None,
+        language: Optional[str] = None,
+        words: Optional[List[FastWordTimestamps]] = None,
+    ) -> None:
+        self.is_final = is_final
+        self.request_id = request_id
+        self.text = text
+        self.duration = duration
+        self.language = language
+        self.words = words
+
+    @classmethod
+    def from_dict(cls, value: Dict[str, Any]) -> FastTranscript:
+        words = value.get("words")
+        return cls(
+            is_final=value.get("is_final", False),
+            request_id=value.get("request_id", ""),
+            text=value.get("text", ""),
+            duration=value.get("duration"),
+            language=value.get("language"),
+            words=[FastWordTimestamps.from_dict(word) for word in words] if words is not None else None,
+        )
+
+
+FastWebsocketResponse = Union[FastChunk, FastTimestamps, WebsocketResponse]
+"""An event from a TTS WebSocket connection opened with `fast_parse=True`."""
+
+FastSTTAutoFinalizeWebsocketResponse = Union[FastTurnUpdate, STTAutoFinalizeWebsocketResponse]
+"""An event from an auto-finalize STT WebSocket connection opened with `fast_parse=True`."""
+
+FastSTTManualFinalizeWebsocketResponse = Union[FastTranscript, STTManualFinalizeWebsocketResponse]
+"""An event from a manual-finalize STT WebSocket connection opened with `fast_parse=True`."""
+
+TTS_FAST_EVENTS: Mapping[str, EventFactory] = {
+    "chunk": FastChunk.from_dict,
+    "timestamps": FastTimestamps.from_dict,
+}
+
+STT_AUTO_FINALIZE_FAST_EVENTS: Mapping[str, EventFactory] = {
+    "turn.update": FastTurnUpdate.from_dict,
+}
+
+STT_MANUAL_FINALIZE_FAST_EVENTS: Mapping[str, EventFactory] = {
+    "transcript": FastTranscript.from_dict,
+}
+
+
+class EventParser(Generic[_T]):
+    """Turns raw WebSocket frames into event objects by dispatching on their `type` field.
+
+    Types with a registered factory skip pydantic entirely; anything else is built from
+    the full `type_` model, exactly as `construct_type_unchecked` would.
+
+    ```py
+    connection.event_parser.register("turn.end", MyTurnEnd.from_dict)
+    ```
+    """
+
+    def __init__(self, type_: Any, factories: Optional[Mapping[str, EventFactory]] = None) -> None:
+        self._type = type_
+        self._factories: Dict[str, EventFactory] = dict(factories or {})
+
+    def register(self, event_type: str, factory: EventFactory) -> None:
+        """Build `event_type` frames with `factory`, which receives the decoded JSON object."""
+        self._factories[event_type] = factory
+
+    def unregister(self, event_type: str) -> None:
+        """Go back to building `event_type` frames from the full model."""
+        self._factories.pop(event_type, None)
+
+    def parse(self, data: Union[str, bytes]) -> _T:
+        value = loads(data)
+        if self._factories and isinstance(value, dict):
+            fields = cast(Dict[str, Any], value)
+            factory = self._factories.get(fields.get("type", ""))
+            if factory is not None:
+                result: _T = factory(fields)
+                return result
+        return cast(_T, construct_type_unchecked(value=value, type_=cast(Any, self._type)))
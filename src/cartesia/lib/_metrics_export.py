@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import csv
+import queue
+import asyncio
+import logging
+import threading
+import collections
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Set,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Counter,
+    Iterator,
+    Optional,
+    Generator,
+    AsyncIterator,
+    AsyncGenerator,
+)
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from .._client import Cartesia, AsyncCartesia
+
+__all__ = ["EXPORT_ROW_LIMIT", "MetricResultsExport", "AsyncMetricResultsExport"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+EXPORT_ROW_LIMIT = 100_000
+"""The most rows a single `agents.metrics.results.export()` call returns."""
+
+Row = Dict[str, str]
+Window = Tuple[datetime, datetime]
+RowKey = Union[str, Tuple[str, ...]]
+
+# Windows are inclusive at both ends, like the `start_date` and `end_date` filters, so
+# adjacent windows are separated by the smallest step a datetime can represent.
+_TICK = timedelta(microseconds=1)
+_MIN_WINDOW = timedelta(seconds=1)
+_QUEUE_SIZE = 1024
+
+
+class _CSVRows:
+    """Incremental CSV parser fed decoded text as it arrives.
+
+    Text is split into records at line breaks outside quoted fields, which are then parsed
+    with `csv`. The header row names the fields of every following row.
+    """
+
+    def __init__(self) -> None:
+        self.columns: Optional[List[str]] = None
+        self._pending = ""
+        self._quotes = 0
+
+    def feed(self, text: str) -> List[Row]:
+        records: List[str] = []
+        for line in text.splitlines(keepends=True):
+            # a record is complete once every quote it opened is closed; escaped quotes come in pairs
+            self._quotes += line.count('"')
+            if self._quotes % 2 == 0 and line.endswith(("\n", "\r")):
+                records.append(self._pending + line)
+                self._pending = ""
+                self._quotes = 0
+            else:
+                self._pending += line
+        return self._parse(records)
+
+    def finish(self) -> List[Row]:
+        records = [self._pending] if self._pending.strip() else []
+        self._pending = ""
+        self._quotes = 0
+        return self._parse(records)
+
+    def _parse(self, records: List[str]) -> List[Row]:
+        rows: List[Row] = []
+        for values in csv.reader(records):
+            if not values:
+                continue
+            if self.columns is None:
+                self.columns = values
+            else:
+                rows.append(dict(zip(self.columns, values)))
+        return rows
+
+
+def _to_datetime(value: Union[str, datetime]) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    # `fromisoformat` only accepts a trailing `Z` from Python 3.11
+    return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+
+
+def make_windows(start: Union[str, datetime], end: Union[str, datetime], window: timedelta) -> List[Window]:
+    """Split the inclusive range `[start, end]` into consecutive inclusive windows of at most `window`."""
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    first, last = _to_datetime(start), _to_datetime(end)
+    windows: List[Window] = []
+    while first <= last:
+        following = first + window
+        windows.append((first, min(following - _TICK, last)))
+        first = following
+    return windows
+
+
+def _halves(window: Window) -> Optional[Tuple[Window, Window]]:
+    start, end = window
+    if end - start < _MIN_WINDOW:
+        return None
+    middle = start + (end - start) / 2
+    return (start, middle - _TICK), (middle, end)
+
+
+def _row_key(row: Row) -> RowKey:
+    """Identify a row by its `id` column, or by all of its values if the export has none.
+
+    Keys are counted rather than collected in a set, so that when a window is split, each
+    copy of a repeated row is skipped only as often as the window already produced it.
+    """
+    return row.get("id") or tuple(row.values())
+
+
+class _Done:
+    pass
+
+
+class _Failed:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+_DONE = _Done()
+
+
+class MetricResultsExport:
+    """Rows of `agents.metrics.results.export_rows()`, parsed as the CSV streams in.
+
+    Each row is a dict keyed by the CSV header. Without a `window` the rows arrive in the
+    order of a single export. With one, the date range is exported as windows in parallel
+    and rows from different windows are interleaved. A window that reaches
+    `EXPORT_ROW_LIMIT` rows is exported again as two halves, skipping the rows it already
+    produced. Windows that still reach the limit at one second long are listed in
+    `truncated`.
+    """
+
+    def __init__(
+        self,
+        client: Cartesia,
+        filters: Dict[str, Any],
+        *,
+        windows: Optional[List[Window]],
+        concurrency: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._filters = filters
+        self._windows = windows
+        self._concurrency = concurrency
+        self.columns: Optional[List[str]] = None
+        """The CSV header, once the first export has started."""
+        self.rows = 0
+        """Number of rows yielded so far."""
+        self.truncated: List[Window] = []
+        self._results = self._run()
+
+    def __iter__(self) -> Iterator[Row]:
+        return self
+
+    def __next__(self) -> Row:
+        return next(self._results)
+
+    def __enter__(self) -> MetricResultsExport:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the export, abandoning any windows still in flight."""
+        self._results.close()
+
+    def batches(self, size: int = 10_000) -> Iterator[Dict[str, List[str]]]:
+        """Group the remaining rows into column-oriented batches of up to `size` rows.
+
+        Each batch maps every column name to a list of values, the layout
+        `pyarrow.RecordBatch.from_pydict()` and `pandas.DataFrame()` accept as is.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        batch: List[Row] = []
+        for row in self:
+            batch.append(row)
+            if len(batch) == size:
+                yield self._columnar(batch)
+                batch = []
+        if batch:
+            yield self._columnar(batch)
+
+    def _columnar(self, batch: List[Row]) -> Dict[str, List[str]]:
+        columns = self.columns or list(batch[0])
+        return {column: [row.get(column, "") for row in batch] for column in columns}
+
+    def _stream(self, window: Optional[Window]) -> Iterator[Row]:
+        dates: Dict[str, Any] = {} if window is None else {"start_date": window[0], "end_date": window[1]}
+        parser = _CSVRows()
+        with self._client.agents.metrics.results.with_streaming_response.export(**self._filters, **dates) as response:
+            for text in response.iter_text():
+                rows = parser.feed(text)
+                if self.columns is None:
+                    self.columns = parser.columns
+                yield from rows
+            yield from parser.finish()
+            if self.columns is None:
+                self.columns = parser.columns
+
+    def _run(self) -> Generator[Row, None, None]:
+        if self._windows is None:
+            for row in self._stream(None):
+                self.rows += 1
+                yield row
+            return
+
+        rows: queue.Queue[Union[Row, _Done, _Failed]] = queue.Queue(_QUEUE_SIZE)
+        stopped = threading.Event()
+        lock = threading.Lock()
+        # one extra unit for the initial submissions, so the run can't end while they are queued
+        pending = [len(self._windows) + 1]
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix="cartesia-metrics-export")
+
+        def put(item: Union[Row, _Done, _Failed]) -> bool:
+            while not stopped.is_set():
+                try:
+                    rows.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def task_done() -> None:
+            with lock:
+                pending[0] -= 1
+                finished = pending[0] == 0
+            if finished:
+                put(_DONE)
+
+        def export(window: Window, skip: Counter[RowKey]) -> None:
+            try:
+                # `skip` is shared with the other half of the window, so it is only read
+                remaining = skip.copy()
+                seen: Counter[RowKey] = collections.Counter()
+                count = 0
+                for row in self._stream(window):
+                    key = _row_key(row)
+                    seen[key] += 1
+                    count += 1
+                    if remaining[key] > 0:
+                        remaining[key] -= 1
+                    elif not put(row):
+                        return
+                if count >= EXPORT_ROW_LIMIT:
+                    halves = _halves(window)
+                    if halves is None:
+                        log.warning("Metric results export window %s to %s is still truncated", *window)
+                        self.truncated.append(window)
+                    else:
+                        with lock:
+                            pending[0] += 2
+                        for half in halves:
+                            # the rows produced in the window so far: the most of each that either export saw
+                            executor.submit(export, half, skip | seen)
+            except BaseException as exc:
+                put(_Failed(exc))
+            finally:
+                task_done()
+
+        try:
+            for window in self._windows:
+                executor.submit(export, window, collections.Counter())
+            task_done()
+            while True:
+                item = rows.get()
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failed):
+                    raise item.error
+                self.rows += 1
+                yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False)
+
+
+class AsyncMetricResultsExport:
+    """Rows of `agents.metrics.results.export_rows()`, parsed as the CSV streams in.
+
+    Each row is a dict keyed by the CSV header. Without a `window` the rows arrive in the
+    order of a single export. With one, the date range is exported as windows in parallel
+    and rows from different windows are interleaved. A window that reaches
+    `EXPORT_ROW_LIMIT` rows is exported again as two halves, skipping the rows it already
+    produced. Windows that still reach the limit at one second long are listed in
+    `truncated`.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCartesia,
+        filters: Dict[str, Any],
+        *,
+        windows: Optional[List[Window]],
+        concurrency: int,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._filters = filters
+        self._windows = windows
+        self._concurrency = concurrency
+        self.columns: Optional[List[str]] = None
+        """The CSV header, once the first export has started."""
+        self.rows = 0
+        """Number of rows yielded so far."""
+        self.truncated: List[Window] = []
+        self._results = self._run()
+
+    def __aiter__(self) -> AsyncIterator[Row]:
+        return self
+
+    async def __anext__(self) -> Row:
+        return await self._results.__anext__()
+
+    async def __aenter__(self) -> AsyncMetricResultsExport:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the export, cancelling any windows still in flight."""
+        await self._results.aclose()
+
+    async def batches(self, size: int = 10_000) -> AsyncIterator[Dict[str, List[str]]]:
+        """Group the remaining rows into column-oriented batches of up to `size` rows.
+
+        Each batch maps every column name to a list of values, the layout
+        `pyarrow.RecordBatch.from_pydict()` and `pandas.DataFrame()` accept as is.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        batch: List[Row] = []
+        async for row in self:
+            batch.append(row)
+            if len(batch) == size:
+                yield self._columnar(batch)
+                batch = []
+        if batch:
+            yield self._columnar(batch)
+
+    def _columnar(self, batch: List[Row]) -> Dict[str, List[str]]:
+        columns = self.columns or list(batch[0])
+        return {column: [row.get(column, "") for row in batch] for column in columns}
+
+    async def _stream(self, window: Optional[Window]) -> AsyncIterator[Row]:
+        dates: Dict[str, Any] = {} if window is None else {"start_date": window[0], "end_date": window[1]}
+        parser = _CSVRows()
+        async with self._client.agents.metrics.results.with_streaming_response.export(
+            **self._filters, **dates
+        ) as response:
+            async for text in response.iter_text():
+                rows = parser.feed(text)
+                if self.columns is None:
+                    self.columns = parser.columns
+                for row in rows:
+                    yield row
+            for row in parser.finish():
+                yield row
+            if self.columns is None:
+                self.columns = parser.columns
+
+    async def _run(self) -> AsyncGenerator[Row, None]:
+        if self._windows is None:
+            async for row in self._stream(None):
+                self.rows += 1
+                yield row
+            return
+
+        if not self._windows:
+            return
+
+        rows: asyncio.Queue[Union[Row, _Done, _Failed]] = asyncio.Queue(_QUEUE_SIZE)
+        slots = asyncio.Semaphore(self._concurrency)
+        tasks: Set[asyncio.Task[None]] = set()
+        pending = len(self._windows)
+
+        def submit(window: Window, skip: Counter[RowKey]) -> None:
+            task = asyncio.ensure_future(export(window, skip))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        async def export(window: Window, skip: Counter[RowKey]) -> None:
+            nonlocal pending
+            try:
+                async with slots:
+                    remaining = skip.copy()
+                    seen: Counter[RowKey] = collections.Counter()
+                    count = 0
+                    async for row in self._stream(window):
+                        key = _row_key(row)
+                        seen[key] += 1
+                        count += 1
+                        if remaining[key] > 0:
+                            remaining[key] -= 1
+                        else:
+                            await rows.put(row)
+                if count >= EXPORT_ROW_LIMIT:
+                    halves = _halves(window)
+                    if halves is None:
+                        log.warning("Metric results export window %s to %s is still truncated", *window)
+                        self.truncated.append(window)
+                    else:
+                        pending += 2
+                        for half in halves:
+                            submit(half, skip | seen)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:
+                await rows.put(_Failed(exc))
+            pending -= 1
+            if pending == 0:
+                await rows.put(_DONE)
+
+        try:
+            for window in self._windows:
+                submit(window, collections.Counter())
+            while True:
+                item = await rows.get()
+                if isinstance(item, _Done):
+                    return
+                if isinstance(item, _Failed):
+                    raise item.error
+                self.rows += 1
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
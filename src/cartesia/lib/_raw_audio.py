@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import json
+import time
+import base64
+import binascii
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Tuple,
+    Union,
+    TypeVar,
+    Callable,
+    ClassVar,
+    Iterator,
+    Optional,
+    AsyncIterator,
+    cast,
+)
+from typing_extensions import Literal, override
+
+import httpx
+
+from .._streaming import Stream, AsyncStream, ServerSentEvent, _report_event
+from ._audio_sink import AudioSink, write_audio_events, async_write_audio_events
+from .._exceptions import TTSGenerationError
+from ._fast_events import FastWebsocketResponse
+from ..types.tts_sse_event import TTSSSEEvent
+
+if TYPE_CHECKING:
+    from .._client import Cartesia, AsyncCartesia
+    from .._models import FinalRequestOptions
+
+__all__ = [
+    "AudioChunk",
+    "AudioStream",
+    "AsyncAudioStream",
+    "RawAudioStream",
+    "AsyncRawAudioStream",
+    "RawTTSSSEEvent",
+    "RawWebsocketResponse",
+    "decode_audio_chunk",
+]
+
+_T = TypeVar("_T")
+
+_DATA_KEY = b'"data"'
+_WHITESPACE = b" \t\r\n"
+
+
+class AudioChunk:
+    """A TTS `chunk` event whose audio has already been decoded.
+
+    Delivered in place of `Chunk` / `TTSSSEChunkEvent` when `raw_audio=True` is passed to
+    `tts.websocket_connect()` or `tts.generate_sse()`. The base64 payload is decoded exactly
+    once, while the frame is parsed, and no pydantic model is constructed.
+
+    It exposes the same attributes as `Chunk`, but none of the `BaseModel` methods.
+    """
+
+    __slots__ = ("audio", "context_id", "done", "status_code", "step_time", "flush_id")
+
+    type: ClassVar[Literal["chunk"]] = "chunk"
+
+    audio: Optional[bytes]
+    """Decoded audio data, or `None` if the chunk carried no audio."""
+
+    context_id: Optional[str]
+    done: bool
+    status_code: int
+    step_time: float
+    flush_id: Optional[int]
+
+    def __init__(
+        self,
+        *,
+        audio: Optional[bytes],
+        context_id: Optional[str] = None,
+        done: bool = False,
+        status_code: int = 206,
+        step_time: float = 0.0,
+        flush_id: Optional[int] = None,
+    ) -> None:
+        self.audio = audio
+        self.context_id = context_id
+        self.done = done
+        self.status_code = status_code
+        self.step_time = step_time
+        self.flush_id = flush_id
+
+    @property
+    def data(self) -> str:
+        """Base64-encoded audio data, re-encoded on access for compatibility with `Chunk.data`."""
+        if not self.audio:
+            return ""
+        return base64.b64encode(self.audio).decode("ascii")
+
+    @override
+    def __repr__(self) -> str:
+        size = len(self.audio) if self.audio is not None else 0
+        return (
+            f"AudioChunk(context_id={self.context_id!r}, audio=<{size} bytes>, done={self.done}, "
+            f"status_code={self.status_code}, step_time={self.step_time}, flush_id={self.flush_id})"
+        )
+
+
+RawTTSSSEEvent = Union[AudioChunk, TTSSSEEvent]
+"""An event from a `raw_audio=True` `tts.generate_sse()` stream."""
+
+RawWebsocketResponse = Union[AudioChunk, FastWebsocketResponse]
+"""An event from a TTS WebSocket connection, which may be opened with `raw_audio=True` and `fast_parse=True`."""
+
+
+def _split_data_field(raw: bytes) -> Optional[Tuple[Dict[str, Any], memoryview]]:
+    """Split a JSON object into its `data` string span and the remaining fields.
+
+    The `data` value is never materialised as a Python `str`; the rest of the object,
+    which is small, is parsed with `json.loads`. Returns `None` if the frame doesn't
+    have the expected shape so the caller can fall back to a full parse.
+    """
+    start = raw.find(_DATA_KEY)
+    if start < 0:
+        return None
+
+    size = len(raw)
+    i = start + len(_DATA_KEY)
+    while i < size and raw[i] in _WHITESPACE:
+        i += 1
+    if i >= size or raw[i] != ord(":"):
+        return None
+    i += 1
+    while i < size and raw[i] in _WHITESPACE:
+        i += 1
+    if i >= size or raw[i] != ord('"'):
+        return None
+
+    value_start = i + 1
+    value_end = raw.find(b'"', value_start)
+    # Escapes (e.g. `\/`) are legal JSON but never produced for base64 payloads in practice.
+    if value_end < 0 or raw.find(b"\\", value_start, value_end) >= 0:
+        return None
+
+    try:
+        fields = json.loads(raw[:value_start] + raw[value_end:])
+    except ValueError:
+        return None
+    if not isinstance(fields, dict):
+        return None
+
+    return cast(Dict[str, Any], fields), memoryview(raw)[value_start:value_end]
+
+
+def decode_audio_chunk(data: Union[str, bytes, memoryview]) -> Optional[AudioChunk]:
+    """Parse a raw `chunk` frame into an `AudioChunk`.
+
+    Returns `None` for any other event type, or if the frame can't be handled by the fast
+    path, in which case the caller should parse it as usual.
+    """
+    raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+    split = _split_data_field(raw)
+    if split is None:
+        return None
+
+    fields, payload = split
+    if fields.get("type") != "chunk":
+        return None
+
+    try:
+        audio = binascii.a2b_base64(payload) if payload else None
+    except binascii.Error:
+        return None
+
+    return AudioChunk(
+        audio=audio,
+        context_id=fields.get("context_id"),
+        done=fields.get("done", False),
+        status_code=fields.get("status_code", 206),
+        step_time=fields.get("step_time", 0.0),
+        flush_id=fields.get("flush_id"),
+    )
+
+
+def _decode_event(
+    sse: ServerSentEvent, process_data: Callable[..., Any], cast_to: Any, response: httpx.Response
+) -> Tuple[Optional[bytes], Any, object]:
+    """Returns the audio of a `chunk` event, or the parsed event for anything else, and its `step_time`.
+
+    `chunk` frames are handled without a full JSON parse: the base64 `data` span is decoded
+    straight out of the frame and only the small remainder goes through `json.loads`. TTS
+    chunks carry `"type": "chunk"`; voice changer chunks have no `type` at all.
+    """
+    split = _split_data_field(bytes(sse.raw))
+    if split is not None:
+        fields, payload = split
+        if fields.get("type", "chunk") == "chunk":
+            try:
+                return binascii.a2b_base64(payload), None, fields.get("step_time")
+            except binascii.Error:
+                pass
+
+    event = process_data(data=sse.json(), cast_to=cast_to, response=response)
+    data = getattr(event, "data", None)
+    if getattr(event, "type", "chunk") == "chunk" and isinstance(data, str):
+        try:
+            return binascii.a2b_base64(data), None, getattr(event, "step_time", None)
+        except binascii.Error:
+            return None, None, getattr(event, "step_time", None)
+    return None, event, None
+
+
+def _raise_for_error_event(event: Any) -> None:
+    # TTS errors have `"type": "error"`; voice changer errors are the `done` events with a message.
+    if getattr(event, "type", None) == "error" or (getattr(event, "done", False) and hasattr(event, "message")):
+        raise TTSGenerationError(
+            getattr(event, "message", None) or "Generation failed",
+            status_code=getattr(event, "status_code", None),
+            event=event,
+        )
+
+
+class AudioStream(Stream[_T]):
+    """A TTS or voice changer SSE stream whose audio can also be read directly with `iter_audio()`.
+
+    If `_sink` is set before the stream is iterated, the audio of every `chunk` event is
+    written to it.
+    """
+
+    _sink: Optional[AudioSink] = None
+
+    @override
+    def __stream__(self) -> Iterator[_T]:
+        # The sink is looked up on the first `next()`, so it may be attached after construction.
+        events = self._decode_events()
+        if self._sink is not None:
+            events = write_audio_events(events, self._sink)
+        yield from events
+
+    def _decode_events(self) -> Iterator[_T]:
+        return super().__stream__()
+
+    def iter_audio(self, *, on_event: Optional[Callable[[_T], None]] = None) -> Iterator[bytes]:
+        """Yield the decoded audio of each `chunk` event, in order.
+
+        No event model is built for `chunk` events and their audio is never parsed as JSON:
+        the base64 `data` field is decoded straight out of the SSE payload. Other events, such
+        as timestamps and `done`, are parsed as usual and passed to `on_event`. An `error`
+        event raises `TTSGenerationError`.
+
+        This consumes the stream, so it can't be combined with iterating over its events.
+        """
+        response = self.response
+        process_data = self._client._process_response_data
+        cast_to = cast(Any, self._cast_to)
+        timings = self._client._timings
+
+        try:
+            for sse in self._iter_events():
+                decode_started = time.perf_counter() if timings else 0.0
+                audio, event, step_time = _decode_event(sse, process_data, cast_to, response)
+                if timings:
+                    _report_event(timings, step_time, time.perf_counter() - decode_started, response)
+                if event is not None:
+                    _raise_for_error_event(event)
+                    if on_event is not None:
+                        on_event(event)
+                elif audio:
+                    if self._sink is not None:
+                        self._sink.write(audio)
+                    yield audio
+        finally:
+            response.close()
+
+
+class AsyncAudioStream(AsyncStream[_T]):
+    """A TTS or voice changer SSE stream whose audio can also be read directly with `iter_audio()`.
+
+    If `_sink` is set before the stream is iterated, the audio of every `chunk` event is
+    written to it.
+    """
+
+    _sink: Optional[AudioSink] = None
+
+    @override
+    async def __stream__(self) -> AsyncIterator[_T]:
+        # The sink is looked up on the first `next()`, so it may be attached after construction.
+        events = self._decode_events()
+        if self._sink is not None:
+            events = async_write_audio_events(events, self._sink)
+        async for event in events:
+            yield event
+
+    def _decode_events(self) -> AsyncIterator[_T]:
+        return super().__stream__()
+
+    async def iter_audio(self, *, on_event: Optional[Callable[[_T], None]] = None) -> AsyncIterator[bytes]:
+        """Yield the decoded audio of each `chunk` event, in order.
+
+        No event model is built for `chunk` events and their audio is never parsed as JSON:
+        the base64 `data` field is decoded straight out of the SSE payload. Other events, such
+        as timestamps and `done`, are parsed as usual and passed to `on_event`. An `error`
+        event raises `TTSGenerationError`.
+
+        This consumes the stream, so it can't be combined with iterating over its events.
+        """
+        response = self.response
+        process_data = self._client._process_response_data
+        cast_to = cast(Any, self._cast_to)
+        timings = self._client._timings
+
+        try:
+            async for sse in self._iter_events():
+                decode_started = time.perf_counter() if timings else 0.0
+                audio, event, step_time = _decode_event(sse, process_data, cast_to, response)
+                if timings:
+                    _report_event(timings, step_time, time.perf_counter() - decode_started, response)
+                if event is not None:
+                    _raise_for_error_event(event)
+                    if on_event is not None:
+                        on_event(event)
+                elif audio:
+                    if self._sink is not None:
+                        self._sink.write(audio)
+                    yield audio
+        finally:
+            await response.aclose()
+
+
+# `Stream` is listed again because the event type is read from the direct generic bases.
+class RawAudioStream(AudioStream[RawTTSSSEEvent], Stream[RawTTSSSEEvent]):
+    """A `tts.generate_sse()` stream that yields `AudioChunk` objects in place of `TTSSSEChunkEvent`."""
+
+    def __init__(
+        self,
+        *,
+        cast_to: type[RawTTSSSEEvent],  # noqa: ARG002
+        response: httpx.Response,
+        client: Cartesia,
+        options: Optional[FinalRequestOptions] = None,
+    ) -> None:
+        # `chunk` events never reach a model, so the others are validated against the plain event union.
+        super().__init__(cast_to=cast(Any, TTSSSEEvent), response=response, client=client, options=options)
+
+    @override
+    def _decode_events(self) -> Iterator[RawTTSSSEEvent]:
+        cast_to = cast(Any, self._cast_to)
+        response = self.response
+        process_data = self._client._process_response_data
+        timings = self._client._timings
+
+        try:
+            for sse in self._iter_events():
+                decode_started = time.perf_counter() if timings else 0.0
+                item: Optional[RawTTSSSEEvent] = decode_audio_chunk(sse.raw)
+                if item is None:
+                    item = process_data(data=sse.json(), cast_to=cast_to, response=response)
+                if timings:
+                    _report_event(
+                        timings, getattr(item, "step_time", None), time.perf_counter() - decode_started, response
+                    )
+                yield item
+        finally:
+            # Ensure the response is closed even if the consumer doesn't read all data
+            response.close()
+
+
+class AsyncRawAudioStream(AsyncAudioStream[RawTTSSSEEvent], AsyncStream[RawTTSSSEEvent]):
+    """A `tts.generate_sse()` stream that yields `AudioChunk` objects in place of `TTSSSEChunkEvent`."""
+
+    def __init__(
+        self,
+        *,
+        cast_to: type[RawTTSSSEEvent],  # noqa: ARG002
+        response: httpx.Response,
+        client: AsyncCartesia,
+        options: Optional[FinalRequestOptions] = None,
+    ) -> None:
+        # `chunk` events never reach a model, so the others are validated against the plain event union.
+        super().__init__(cast_to=cast(Any, TTSSSEEvent), response=response, client=client, options=options)
+
+    @override
+    async def _decode_events(self) -> AsyncIterator[RawTTSSSEEvent]:
+        cast_to = cast(Any, self._cast_to)
+        response = self.response
+        process_data = self._client._process_response_data
+        timings = self._client._timings
+
+        try:
+            async for sse in self._iter_events():
+                decode_started = time.perf_counter() if timings else 0.0
+                item: Optional[RawTTSSSEEvent] = decode_audio_chunk(sse.raw)
+                if item is None:
+                    item = process_data(data=sse.json(), cast_to=cast_to, response=response)
+                if timings:
+                    _report_event(
+                        timings, getattr(item, "step_time", None), time.perf_counter() - decode_started, response
+                    )
+                yield item
+        finally:
+            # Ensure the response is closed even if the consumer doesn't read all data
+            await response.aclose()
@@ -0,0 +1,409 @@
+from __future__ import annotations
+
+import os
+import math
+import time
+import asyncio
+import pathlib
+import threading
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Iterable,
+    Iterator,
+    Optional,
+    Generator,
+    AsyncIterator,
+    AsyncGenerator,
+    cast,
+)
+from typing_extensions import Literal
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .._types import Omit
+from .._exceptions import STTTranscriptionError
+from ._audio_feeder import AudioFeeder, AsyncAudioFeeder, _wav_format
+from ..types.stt_encoding import STTEncoding
+from ..types.stt_batch_model import STTBatchModel
+from ..types.stt_transcribe_response import Word
+
+if TYPE_CHECKING:
+    from .._client import Cartesia, AsyncCartesia
+    from ..resources.stt.manual_finalize import (
+        ManualFinalizeResourceConnection,
+        AsyncManualFinalizeResourceConnection,
+    )
+
+__all__ = ["FileTranscript", "BulkTranscription", "AsyncBulkTranscription"]
+
+AudioPath = Union[str, "os.PathLike[str]"]
+Transport = Literal["batch", "streaming"]
+
+
+class FileTranscript:
+    """The transcript of one file from `stt.transcribe_many()`.
+
+    `index` is the file's position in the input and `transport` is how it was transcribed.
+    Either `error` is set, or `text` and `words` hold the full transcript with word
+    timestamps in seconds from the start of the file. `latency` is the wall-clock time, in
+    seconds, taken to transcribe the file.
+    """
+
+    __slots__ = ("index", "file", "transport", "text", "words", "duration", "error", "latency")
+
+    def __init__(
+        self,
+        index: int,
+        file: AudioPath,
+        transport: Transport,
+        *,
+        text: str = "",
+        words: Optional[List[Word]] = None,
+        duration: Optional[float] = None,
+        error: Optional[Exception] = None,
+        latency: float,
+    ) -> None:
+        self.index = index
+        self.file = file
+        self.transport = transport
+        self.text = text
+        self.words = words if words is not None else []
+        self.duration = duration
+        self.error = error
+        self.latency = latency
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"{len(self.text)} chars" if self.error is None else repr(self.error)
+        return f"FileTranscript(index={self.index}, file={os.fspath(self.file)!r}, {self.transport}, {outcome})"
+
+
+def _streaming_format(path: AudioPath, threshold: Optional[int]) -> Optional[Tuple[STTEncoding, int]]:
+    """The `(encoding, sample_rate)` to stream `path` with, or `None` to use the batch endpoint.
+
+    Only files at least `threshold` bytes long that hold mono audio in an encoding the
+    WebSocket accepts are streamed.
+    """
+    if threshold is None or os.path.getsize(path) < threshold:
+        return None
+    with open(path, "rb") as file:
+        if file.read(4) != b"RIFF":
+            return None
+        file.seek(0)
+        try:
+            encoding, channels, sample_rate, _ = _wav_format(file)
+        except (ValueError, OSError):
+            return None
+    if encoding is None or channels != 1:
+        return None
+    return cast(STTEncoding, encoding), sample_rate
+
+
+class _Transcript:
+    """Joins the final transcript events of a streaming session."""
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.words: List[Word] = []
+        self.finished = False
+
+    def add(self, event: Any) -> bool:
+        """Record `event`, returning whether the session is over."""
+        if event.type == "transcript" and event.is_final:
+            self.parts.append(event.text)
+            for timestamps in event.words or []:
+                self.words.extend(
+                    Word(word=word, start=start, end=end)
+                    for word, start, end in zip(timestamps.words, timestamps.start, timestamps.end)
+                )
+        elif event.type == "error":
+            raise STTTranscriptionError(event.message, status_code=event.status_code, event=event)
+        self.finished = event.type == "done"
+        return self.finished
+
+    def check_finished(self) -> None:
+        if not self.finished:
+            raise STTTranscriptionError(
+                "The connection closed before the transcript was finished", status_code=None, event=None
+            )
+
+    @property
+    def text(self) -> str:
+        # Final chunks are deltas that already carry their own whitespace.
+        return "".join(self.parts)
+
+
+class BulkTranscription:
+    """Results of `stt.transcribe_many()`, yielded as files finish.
+
+    Iterating drives the run: at most `concurrency` files are transcribed at once, and the
+    input is read lazily. A file that fails is yielded with its `error` set rather than
+    raised. Closing the iterator (or leaving its `with` block) abandons files still in flight.
+    """
+
+    def __init__(
+        self,
+        client: Cartesia,
+        files: Iterable[AudioPath],
+        *,
+        model: STTBatchModel,
+        language: Union[str, Omit],
+        concurrency: int,
+        streaming_threshold: Optional[int],
+        chunk_duration: float,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._files = files
+        self._model = model
+        self._language = language
+        self._concurrency = concurrency
+        self._streaming_threshold = streaming_threshold
+        self._chunk_duration = chunk_duration
+        self._results = self._run()
+
+    def __iter__(self) -> Iterator[FileTranscript]:
+        return self
+
+    def __next__(self) -> FileTranscript:
+        return next(self._results)
+
+    def __enter__(self) -> BulkTranscription:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the run, abandoning any files still in flight."""
+        self._results.close()
+
+    def _run(self) -> Generator[FileTranscript, None, None]:
+        files = enumerate(self._files)
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix="cartesia-stt-bulk")
+        in_flight: Dict[Future[FileTranscript], int] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._concurrency:
+                    item = next(files, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, path = item
+                    in_flight[executor.submit(self._transcribe, index, path)] = index
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del in_flight[future]
+                    yield future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _transcribe(self, index: int, path: AudioPath) -> FileTranscript:
+        start = time.monotonic()
+        transport: Transport = "batch"
+        try:
+            streaming = _streaming_format(path, self._streaming_threshold)
+            if streaming is None:
+                response = self._client.stt.transcribe(
+                    file=pathlib.Path(path),
+                    model=self._model,
+                    language=self._language,
+                    timestamp_granularities=["word"],
+                )
+                text, words, duration = response.text, response.words, response.duration
+            else:
+                transport = "streaming"
+                text, words, duration = self._stream(path, *streaming)
+        except Exception as exc:
+            return FileTranscript(index, path, transport, error=exc, latency=time.monotonic() - start)
+        return FileTranscript(
+            index, path, transport, text=text, words=words, duration=duration, latency=time.monotonic() - start
+        )
+
+    def _stream(self, path: AudioPath, encoding: STTEncoding, sample_rate: int) -> Tuple[str, List[Word], float]:
+        transcript = _Transcript()
+        with self._client.stt.manual_finalize.websocket(
+            encoding=encoding, model=self._model, sample_rate=sample_rate
+        ) as ws:
+            feeder = AudioFeeder(
+                ws,
+                path,
+                encoding=encoding,
+                sample_rate=sample_rate,
+                chunk_duration=self._chunk_duration,
+                speed=math.inf,
+            )
+            # Audio is sent from a second thread so that transcripts are read while it is
+            # uploading, which keeps the server from stalling on a full send buffer.
+            errors: List[BaseException] = []
+            sender = threading.Thread(target=self._send_audio, args=(ws, feeder, errors), daemon=True)
+            sender.start()
+            try:
+                for event in ws:
+                    if transcript.add(event):
+                        break
+            except BaseException:
+                feeder.stop()
+                raise
+            finally:
+                sender.join()
+            if errors:
+                raise errors[0]
+            transcript.check_finished()
+        return transcript.text, transcript.words, feeder.audio_seconds_sent
+
+    @staticmethod
+    def _send_audio(ws: ManualFinalizeResourceConnection, feeder: AudioFeeder, errors: List[BaseException]) -> None:
+        try:
+            feeder.run()
+            ws.send("close")
+        except BaseException as exc:
+            errors.append(exc)
+            ws.close()
+
+
+class AsyncBulkTranscription:
+    """Results of `stt.transcribe_many()`, yielded as files finish.
+
+    Iterating drives the run: at most `concurrency` files are transcribed at once, and the
+    input is read lazily. A file that fails is yielded with its `error` set rather than
+    raised. Closing the iterator (or leaving its `async with` block) cancels files still in
+    flight.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCartesia,
+        files: Iterable[AudioPath],
+        *,
+        model: STTBatchModel,
+        language: Union[str, Omit],
+        concurrency: int,
+        streaming_threshold: Optional[int],
+        chunk_duration: float,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self._files = files
+        self._model = model
+        self._language = language
+        self._concurrency = concurrency
+        self._streaming_threshold = streaming_threshold
+        self._chunk_duration = chunk_duration
+        self._results = self._run()
+
+    def __aiter__(self) -> AsyncIterator[FileTranscript]:
+        return self
+
+    async def __anext__(self) -> FileTranscript:
+        return await self._results.__anext__()
+
+    async def __aenter__(self) -> AsyncBulkTranscription:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the run, cancelling any files still in flight."""
+        await self._results.aclose()
+
+    async def _run(self) -> AsyncGenerator[FileTranscript, None]:
+        files = enumerate(self._files)
+        in_flight: Dict[asyncio.Task[FileTranscript], int] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self._concurrency:
+                    item = next(files, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, path = item
+                    in_flight[asyncio.ensure_future(self._transcribe(index, path))] = index
+                if not in_flight:
+                    break
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    del in_flight[task]
+                    yield task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _transcribe(self, index: int, path: AudioPath) -> FileTranscript:
+        start = time.monotonic()
+        transport: Transport = "batch"
+        try:
+            streaming = _streaming_format(path, self._streaming_threshold)
+            if streaming is None:
+                response = await self._client.stt.transcribe(
+                    file=pathlib.Path(path),
+                    model=self._model,
+                    language=self._language,
+                    timestamp_granularities=["word"],
+                )
+                text, words, duration = response.text, response.words, response.duration
+            else:
+                transport = "streaming"
+                text, words, duration = await self._stream(path, *streaming)
+        except Exception as exc:
+            return FileTranscript(index, path, transport, error=exc, latency=time.monotonic() - start)
+        return FileTranscript(
+            index, path, transport, text=text, words=words, duration=duration, latency=time.monotonic() - start
+        )
+
+    async def _stream(self, path: AudioPath, encoding: STTEncoding, sample_rate: int) -> Tuple[str, List[Word], float]:
+        transcript = _Transcript()
+        async with self._client.stt.manual_finalize.websocket(
+            encoding=encoding, model=self._model, sample_rate=sample_rate
+        ) as ws:
+            feeder = AsyncAudioFeeder(
+                ws,
+                path,
+                encoding=encoding,
+                sample_rate=sample_rate,
+                chunk_duration=self._chunk_duration,
+                speed=math.inf,
+            )
+            sender = asyncio.ensure_future(self._send_audio(ws, feeder))
+            try:
+                async for event in ws:
+                    if transcript.add(event):
+                        break
+                await sender
+                transcript.check_finished()
+            finally:
+                sender.cancel()
+        return transcript.text, transcript.words, feeder.audio_seconds_sent
+
+    @staticmethod
+    async def _send_audio(ws: AsyncManualFinalizeResourceConnection, feeder: AsyncAudioFeeder) -> None:
+        try:
+            await feeder.run()
+            await ws.send("close")
+        except BaseException:
+            # Ends the receive loop, which would otherwise wait for a `done` that never comes.
+            await ws.close()
+            raise
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import re
+import time
+import asyncio
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, List, Tuple, Optional
+from collections import deque
+
+from .._exceptions import CartesiaError
+
+if TYPE_CHECKING:
+    from ._tts import WebSocketContext, AsyncWebSocketContext
+
+__all__ = ["TextStreamer", "AsyncTextStreamer"]
+
+# End of a sentence: terminal punctuation, optionally followed by closing quotes or brackets,
+# then whitespace. Requiring the whitespace avoids splitting "3.14" or "e.g." mid-token.
+_SENTENCE_END = re.compile(r"[.!?…。！？]+[\"')\]”’]*\s+|\n+")
+# End of a clause.
+_CLAUSE_END = re.compile(r"[,;:—、，]\s+")
+_SPACE = re.compile(r"\s")
+
+
+class _Segmenter:
+    """The buffering and boundary logic shared by `TextStreamer` and `AsyncTextStreamer`."""
+
+    def __init__(self, *, max_delay: float, min_clause_chars: int, max_chars: int) -> None:
+        if max_delay <= 0:
+            raise ValueError("max_delay must be positive")
+        if max_chars < 1:
+            raise ValueError("max_chars must be at least 1")
+        self.max_delay = max_delay
+        self.min_clause_chars = min_clause_chars
+        self.max_chars = max_chars
+        self.buffer = ""
+        # (end offset in `buffer`, monotonic write time) for every token still buffered.
+        self.pending: "deque[Tuple[int, float]]" = deque()
+
+        self.tokens_written = 0
+        self.tokens_sent = 0
+        self.frames_sent = 0
+        self.total_delay = 0.0
+        self.max_delay_observed = 0.0
+
+    def write(self, text: str) -> List[str]:
+        """Buffer `text`, returning any segments that are ready to send."""
+        self.tokens_written += 1
+        if not text:
+            return []
+        self.buffer += text
+        self.pending.append((len(self.buffer), time.monotonic()))
+
+        segments = []
+        while True:
+            cut = self._boundary()
+            if cut is None:
+                break
+            segments.append(self.take(cut))
+        return segments
+
+    def _boundary(self) -> Optional[int]:
+        buffer = self.buffer
+        sentence_end = None
+        for match in _SENTENCE_END.finditer(buffer):
+            sentence_end = match.end()
+        if sentence_end is not None:
+            return sentence_end
+
+        if len(buffer) >= self.min_clause_chars:
+            clause_end = None
+            for match in _CLAUSE_END.finditer(buffer, self.min_clause_chars - 1):
+                clause_end = match.end()
+            if clause_end is not None:
+                return clause_end
+
+        if len(buffer) >= self.max_chars:
+            return self.soft_cut()
+        return None
+
+    def soft_cut(self) -> int:
+        """Where to split the buffer when it must be sent early: after the last whitespace, if any."""
+        last_space = None
+        for match in _SPACE.finditer(self.buffer):
+            last_space = match.end()
+        return last_space if last_space else len(self.buffer)
+
+    def take(self, length: int) -> str:
+        segment, self.buffer = self.buffer[:length], self.buffer[length:]
+        now = time.monotonic()
+        sent_to = 0
+        while self.pending and self.pending[0][0] <= length:
+            sent_to, written = self.pending.popleft()
+            self.tokens_sent += 1
+            delay = now - written
+            self.total_delay += delay
+            self.max_delay_observed = max(self.max_delay_observed, delay)
+        self.pending = deque((end - length, written) for end, written in self.pending)
+        if self.pending and sent_to < length:
+            # The cut split a token. Its rest starts a new `max_delay` wait, so that an expired
+            # write time does not send the word fragment as its own frame straight away.
+            self.pending[0] = (self.pending[0][0], now)
+        self.frames_sent += 1
+        return segment
+
+    def oldest_write(self) -> Optional[float]:
+        return self.pending[0][1] if self.pending else None
+
+
+class _StreamerStats:
+    _segmenter: _Segmenter
+
+    @property
+    def tokens_written(self) -> int:
+        """Number of `write()` calls."""
+        return self._segmenter.tokens_written
+
+    @property
+    def frames_sent(self) -> int:
+        """Number of transcript frames pushed to the context."""
+        return self._segmenter.frames_sent
+
+    @property
+    def frames_saved(self) -> int:
+        """How many fewer frames were sent than pushing every token would have taken."""
+        return max(self._segmenter.tokens_written - self._segmenter.frames_sent, 0)
+
+    @property
+    def mean_added_latency(self) -> float:
+        """Mean seconds a token waited in the buffer before it was sent."""
+        sent = self._segmenter.tokens_sent
+        return self._segmenter.total_delay / sent if sent else 0.0
+
+    @property
+    def max_added_latency(self) -> float:
+        """Longest time, in seconds, that any token waited in the buffer before it was sent."""
+        return self._segmenter.max_delay_observed
+
+
+class TextStreamer(_StreamerStats):
+    """Coalesces streamed text, such as LLM tokens, into sentence-sized pushes to a `WebSocketContext`.
+
+    Pushing every token produces many tiny frames, and the model sees text in fragments
+    that can hurt prosody. `TextStreamer` buffers tokens and pushes a segment when a
+    sentence ends, when a clause ends after at least `min_clause_chars` characters, or when
+    the buffer reaches `max_chars`. A timer pushes whatever is buffered (up to the last
+    word boundary) once the oldest buffered token has waited `max_delay` seconds, which
+    bounds the latency added to the first audio.
+
+    Segments are sent verbatim, so their concatenation is exactly the text written.
+    Extra keyword arguments are passed to every `ctx.push()` call.
+
+    ```py
+    with TextStreamer(ctx) as streamer:
+        for token in llm_tokens():
+            streamer.write(token)
+    # The remaining text is pushed and `ctx.no_more_inputs()` is called on exit.
+
+    print(streamer.frames_saved, streamer.max_added_latency)
+    ```
+    """
+
+    def __init__(
+        self,
+        ctx: WebSocketContext,
+        *,
+        max_delay: float = 0.3,
+        min_clause_chars: int = 40,
+        max_chars: int = 250,
+        **push_kwargs: Any,
+    ) -> None:
+        self._ctx = ctx
+        self._push_kwargs = push_kwargs
+        self._segmenter = _Segmenter(max_delay=max_delay, min_clause_chars=min_clause_chars, max_chars=max_chars)
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._closed = False
+
+    def __enter__(self) -> TextStreamer:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.close(finish=False)
+
+    def write(self, text: str) -> None:
+        """Add the next piece of text, pushing any segments that are complete."""
+        with self._lock:
+            if self._closed:
+                raise CartesiaError("Cannot write to a closed TextStreamer.")
+            segments = self._segmenter.write(text)
+            for segment in segments:
+                self._ctx.push(segment, **self._push_kwargs)
+            # The deadline only moves when the oldest buffered token changes.
+            self._schedule(reset=bool(segments))
+
+    def flush(self) -> None:
+        """Push all buffered text now."""
+        with self._lock:
+            self._flush(len(self._segmenter.buffer))
+
+    def close(self, *, finish: bool = True) -> None:
+        """Push any buffered text and, if `finish` is true, call `ctx.no_more_inputs()`."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._cancel_timer()
+            self._flush(len(self._segmenter.buffer))
+        if finish:
+            self._ctx.no_more_inputs()
+
+    def _flush(self, length: int) -> None:
+        if length:
+            self._ctx.push(self._segmenter.take(length), **self._push_kwargs)
+        self._schedule(reset=True)
+
+    def _schedule(self, *, reset: bool) -> None:
+        if reset:
+            self._cancel_timer()
+        elif self._timer is not None:
+            return
+        oldest = self._segmenter.oldest_write()
+        if oldest is None or self._closed:
+            return
+        delay = max(oldest + self._segmenter.max_delay - time.monotonic(), 0.0)
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            if self._closed or threading.current_thread() is not self._timer:
+                return
+            self._timer = None
+            self._flush(self._segmenter.soft_cut() if self._segmenter.buffer else 0)
+
+
+class AsyncTextStreamer(_StreamerStats):
+    """Coalesces streamed text, such as LLM tokens, into sentence-sized pushes to an `AsyncWebSocketContext`.
+
+    See `TextStreamer` for how text is segmented. The `max_delay` timer runs as a task on
+    the current event loop.
+
+    ```py
+    async with AsyncTextStreamer(ctx) as streamer:
+        async for token in llm_tokens():
+            await streamer.write(token)
+    ```
+    """
+
+    def __init__(
+        self,
+        ctx: AsyncWebSocketContext,
+        *,
+        max_delay: float = 0.3,
+        min_clause_chars: int = 40,
+        max_chars: int = 250,
+        **push_kwargs: Any,
+    ) -> None:
+        self._ctx = ctx
+        self._push_kwargs = push_kwargs
+        self._segmenter = _Segmenter(max_delay=max_delay, min_clause_chars=min_clause_chars, max_chars=max_chars)
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    async def __aenter__(self) -> AsyncTextStreamer:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.close(finish=False)
+
+    async def write(self, text: str) -> None:
+        """Add the next piece of text, pushing any segments that are complete."""
+        async with self._lock:
+            if self._closed:
+                raise CartesiaError("Cannot write to a closed AsyncTextStreamer.")
+            for segment in self._segmenter.write(text):
+                await self._ctx.push(segment, **self._push_kwargs)
+            self._schedule()
+
+    async def flush(self) -> None:
+        """Push all buffered text now."""
+        async with self._lock:
+            await self._flush(len(self._segmenter.buffer))
+
+    async def close(self, *, finish: bool = True) -> None:
+        """Push any buffered text and, if `finish` is true, call `ctx.no_more_inputs()`."""
+        async with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._cancel_timer()
+            await self._flush(len(self._segmenter.buffer))
+        if finish:
+            await self._ctx.no_more_inputs()
+
+    async def _flush(self, length: int) -> None:
+        if length:
+            await self._ctx.push(self._segmenter.take(length), **self._push_kwargs)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        oldest = self._segmenter.oldest_write()
+        if oldest is None or self._closed:
+            self._cancel_timer()
+            return
+        if self._timer is None or self._timer.done():
+            self._timer = asyncio.ensure_future(self._on_timer())
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+
+    async def _on_timer(self) -> None:
+        while True:
+            oldest = self._segmenter.oldest_write()
+            if oldest is None or self._closed:
+                return
+            delay = oldest + self._segmenter.max_delay - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            # `close()` cancels this task before flushing, so only a concurrent write can
+            # have sent the oldest token while we waited for the lock.
+            async with self._lock:
+                if self._segmenter.oldest_write() == oldest:
+                    await self._ctx.push(self._segmenter.take(self._segmenter.soft_cut()), **self._push_kwargs)
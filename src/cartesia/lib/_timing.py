@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+import bisect
+import threading
+from typing import Any, Dict, List, Optional
+
+from .._timing import TimingEvent
+from .._version import __version__
+from .._exceptions import CartesiaError
+
+__all__ = ["LatencyHistogram", "OpenTelemetryObserver"]
+
+# Bucket upper bounds in seconds, growing by 25% from 50µs to about two minutes, so a
+# percentile read from the histogram is within 25% of the true value.
+_BOUNDS: List[float] = [50e-6 * 1.25**i for i in range(67)]
+
+# Event attributes that identify a single request, which are not recorded as metric attributes.
+_PER_REQUEST_ATTRIBUTES = frozenset({"context_id"})
+
+
+class _Series:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        # one bucket per bound, plus one for anything slower than the last bound
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect.bisect_left(_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = _BOUNDS[index] if index < len(_BOUNDS) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+
+class LatencyHistogram:
+    """An in-process timing observer that aggregates event durations into histograms.
+
+    Pass it to the client and read percentiles back at any time:
+
+    ```py
+    histogram = LatencyHistogram()
+    client = Cartesia(timing_observers=[histogram])
+    ...
+    print(histogram.summary()["ws.first_audio"]["p90"])
+    ```
+
+    Durations are counted in fixed, exponentially sized buckets, so memory use does not grow
+    with the number of requests and reported percentiles are accurate to within 25%.
+    `count`, `mean`, `min` and `max` are exact. It is safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._series: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: TimingEvent) -> None:
+        self.record(event.name, event.duration)
+
+    def record(self, name: str, duration: float) -> None:
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series()
+            series.add(duration)
+
+    @property
+    def names(self) -> List[str]:
+        """The names of the events recorded so far."""
+        with self._lock:
+            return sorted(self._series)
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            series = self._series.get(name)
+            return series.count if series is not None else 0
+
+    def percentile(self, name: str, q: float) -> Optional[float]:
+        """The `q`th percentile (0-100) of the durations recorded for `name`, or `None` if there are none."""
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {q}")
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                return None
+            return series.percentile(q)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, min, p50, p90, p99 and max in seconds for every recorded event name."""
+        with self._lock:
+            return {
+                name: {
+                    "count": series.count,
+                    "mean": series.total / series.count,
+                    "min": series.min,
+                    "p50": series.percentile(50),
+                    "p90": series.percentile(90),
+                    "p99": series.percentile(99),
+                    "max": series.max,
+                }
+                for name, series in sorted(self._series.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class OpenTelemetryObserver:
+    """A timing observer that records each event in an OpenTelemetry histogram instrument.
+
+    Every event name gets its own histogram, `<prefix>.<name>.duration` in seconds, and the
+    event's attributes (method, path, status code, ...) are recorded with it. Per-request IDs
+    such as the WebSocket context ID are left out, as every distinct value would start a new
+    time series in the metrics backend.
+    Without a `meter`, one is obtained from the globally configured meter provider, which
+    requires `opentelemetry-api` to be installed.
+    """
+
+    def __init__(self, meter: Optional[Any] = None, *, prefix: str = "cartesia") -> None:
+        if meter is None:
+            try:
+                from opentelemetry import metrics  # type: ignore # optional dependency, see the `opentelemetry` extra
+            except ImportError as exc:
+                raise CartesiaError(
+                    "You need to install `opentelemetry-api` to use `OpenTelemetryObserver` without a `meter`"
+                ) from exc
+            meter = metrics.get_meter("cartesia", __version__)
+        self._meter = meter
+        self._prefix = prefix
+        self._histograms: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: TimingEvent) -> None:
+        histogram = self._histograms.get(event.name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(event.name)
+                if histogram is None:
+                    histogram = self._histograms[event.name] = self._meter.create_histogram(
+                        name=f"{self._prefix}.{event.name}.duration",
+                        unit="s",
+                        description=f"Duration of the Cartesia `{event.name}` phase",
+                    )
+        attributes = event.attributes
+        if not _PER_REQUEST_ATTRIBUTES.isdisjoint(attributes):
+            attributes = {key: value for key, value in attributes.items() if key not in _PER_REQUEST_ATTRIBUTES}
+        histogram.record(event.duration, attributes=attributes)
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Iterable, Iterator, Optional
+from typing_extensions import Literal, override
+
+from ._audio_sink import Buffer, AudioSink
+from ..types.raw_encoding import RawEncoding
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = ["PCMTranscoder", "TranscodingSink"]
+
+Backend = Literal["auto", "numpy", "python"]
+
+_SAMPLE_WIDTH: Dict[str, int] = {"pcm_f32le": 4, "pcm_s16le": 2, "pcm_mulaw": 1, "pcm_alaw": 1}
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _mulaw_decode(value: int) -> int:
+    value = ~value & 0xFF
+    magnitude = (((value & 0x0F) << 3) + 0x84) << ((value & 0x70) >> 4)
+    return 0x84 - magnitude if value & 0x80 else magnitude - 0x84
+
+
+def _alaw_decode(value: int) -> int:
+    value ^= 0x55
+    exponent = (value & 0x70) >> 4
+    magnitude = (value & 0x0F) << 4
+    magnitude = magnitude + 8 if exponent == 0 else (magnitude + 0x108) << (exponent - 1)
+    return magnitude if value & 0x80 else -magnitude
+
+
+def _mulaw_encode(sample: int) -> int:
+    sign = 0x80 if sample < 0 else 0
+    magnitude = min(-sample if sign else sample, 32635) + 0x84
+    exponent = magnitude.bit_length() - 8
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+def _alaw_encode(sample: int) -> int:
+    sign = 0x80 if sample >= 0 else 0
+    magnitude = min(sample if sign else -sample - 1, 32767) >> 3
+    if magnitude < 32:
+        encoded = magnitude >> 1
+    else:
+        exponent = magnitude.bit_length() - 5
+        encoded = (exponent << 4) | ((magnitude >> exponent) & 0x0F)
+    return (sign | encoded) ^ 0x55
+
+
+_tables: Dict[str, Any] = {}
+
+
+def _decode_table(encoding: str) -> List[int]:
+    """256-entry table from an 8-bit G.711 code to a 16-bit linear sample."""
+    key = f"{encoding}:decode"
+    if key not in _tables:
+        decode = _mulaw_decode if encoding == "pcm_mulaw" else _alaw_decode
+        _tables[key] = [decode(value) for value in range(256)]
+    return _tables[key]  # type: ignore[no-any-return]
+
+
+def _encode_table(encoding: str) -> bytes:
+    """65536-entry table from an unsigned 16-bit view of a linear sample to its 8-bit G.711 code."""
+    key = f"{encoding}:encode"
+    if key not in _tables:
+        encode = _mulaw_encode if encoding == "pcm_mulaw" else _alaw_encode
+        _tables[key] = bytes(encode(value - 0x10000 if value & 0x8000 else value) for value in range(0x10000))
+    return _tables[key]  # type: ignore[no-any-return]
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class PCMTranscoder:
+    """Converts a stream of raw PCM audio between encodings and sample rates.
+
+    Chunks can be fed in as they arrive, e.g. from `WebSocketContext.receive()` or
+    `BinaryAPIResponse.iter_bytes()`, and need not be aligned to sample boundaries:
+    partial samples and resampler state are carried over to the next call. This lets a
+    single generation be fanned out to several output formats.
+
+    Resampling uses linear interpolation (the same approach as the former stdlib
+    `audioop.ratecv`), which is well suited to speech. Mono audio only.
+
+    The conversion is vectorized with NumPy when it is installed; otherwise a pure
+    Python implementation is used, which produces the same output but is much slower.
+
+    ```py
+    to_phone = PCMTranscoder(
+        from_encoding="pcm_f32le", from_sample_rate=24000, to_encoding="pcm_mulaw", to_sample_rate=8000
+    )
+    for event in ctx.receive():
+        if event.type == "chunk" and event.audio:
+            phone_socket.send(to_phone.convert(event.audio))
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        from_encoding: RawEncoding,
+        from_sample_rate: int,
+        to_encoding: RawEncoding,
+        to_sample_rate: int,
+        backend: Backend = "auto",
+    ) -> None:
+        for encoding in (from_encoding, to_encoding):
+            if encoding not in _SAMPLE_WIDTH:
+                raise ValueError(f"Unsupported encoding {encoding!r}; expected one of {', '.join(_SAMPLE_WIDTH)}")
+        if from_sample_rate < 1 or to_sample_rate < 1:
+            raise ValueError("Sample rates must be positive")
+
+        np = _numpy() if backend != "python" else None
+        if backend == "numpy" and np is None:
+            raise ImportError("You need to install `numpy` to use the numpy backend")
+
+        self._np: Any = np
+        self._from_encoding = from_encoding
+        self._to_encoding = to_encoding
+        self._from_rate = from_sample_rate
+        self._to_rate = to_sample_rate
+        self._width = _SAMPLE_WIDTH[from_encoding]
+        self._passthrough = from_encoding == to_encoding and from_sample_rate == to_sample_rate
+
+        self._remainder = b""
+        # Resampler state. Output sample positions are tracked exactly, in units of
+        # 1 / to_sample_rate input samples, relative to `_last` (the final input sample
+        # of the previous chunk), so long streams don't accumulate rounding drift.
+        self._last: Optional[float] = None
+        self._position = 0
+
+    @property
+    def backend(self) -> Literal["numpy", "python"]:
+        return "numpy" if self._np is not None else "python"
+
+    def convert(self, data: Buffer) -> bytes:
+        """Convert the next chunk of input audio, returning whatever output is ready."""
+        raw = bytes(data)
+        if self._passthrough:
+            return raw
+
+        if self._remainder:
+            raw = self._remainder + raw
+        usable = len(raw) - len(raw) % self._width
+        self._remainder = raw[usable:]
+        if not usable:
+            return b""
+        if usable != len(raw):
+            raw = raw[:usable]
+
+        if self._np is not None:
+            return self._convert_numpy(raw)
+        return self._convert_python(raw)
+
+    def flush(self) -> bytes:
+        """Finish the stream and reset state so the transcoder can be reused.
+
+        A trailing partial sample, if any, is dropped. Linear interpolation needs no
+        lookahead, so there is never buffered output to return; the method returns
+        `b""` and exists so callers don't need to special-case that.
+        """
+        self._remainder = b""
+        self._last = None
+        self._position = 0
+        return b""
+
+    def iter_convert(self, chunks: Iterable[Buffer]) -> Iterator[bytes]:
+        """Convert an iterable of input chunks, skipping empty outputs."""
+        for chunk in chunks:
+            out = self.convert(chunk)
+            if out:
+                yield out
+        self.flush()
+
+    def _plan(self, n_input: int) -> Tuple[int, int]:
+        """Returns `(start, count)`: the first output position and how many outputs fit."""
+        start = self._position
+        span = (n_input - 1) * self._to_rate
+        count = 0 if start > span else (span - start) // self._from_rate + 1
+        return start, count
+
+    def _advance(self, start: int, count: int, n_input: int) -> None:
+        self._position = start + count * self._from_rate - (n_input - 1) * self._to_rate
+
+    # -- numpy backend -----------------------------------------------------
+
+    def _convert_numpy(self, raw: bytes) -> bytes:
+        samples = self._decode_numpy(raw)
+        if self._from_rate != self._to_rate:
+            samples = self._resample_numpy(samples)
+        return self._encode_numpy(samples)
+
+    def _decode_numpy(self, raw: bytes) -> "np.ndarray[Any, Any]":
+        np = self._np
+        encoding = self._from_encoding
+        if encoding == "pcm_f32le":
+            return np.frombuffer(raw, dtype="<f4").astype(np.float32)  # type: ignore[no-any-return]
+        if encoding == "pcm_s16le":
+            return np.frombuffer(raw, dtype="<i2").astype(np.float32) / np.float32(32768)  # type: ignore[no-any-return]
+        table = self._tables_numpy(encoding)[0]
+        return table[np.frombuffer(raw, dtype=np.uint8)]  # type: ignore[no-any-return]
+
+    def _encode_numpy(self, samples: "np.ndarray[Any, Any]") -> bytes:
+        np = self._np
+        encoding = self._to_encoding
+        if encoding == "pcm_f32le":
+            return samples.astype("<f4").tobytes()  # type: ignore[no-any-return]
+        pcm16 = np.clip(np.rint(samples * 32768), -32768, 32767).astype("<i2")
+        if encoding == "pcm_s16le":
+            return pcm16.tobytes()  # type: ignore[no-any-return]
+        table = self._tables_numpy(encoding)[1]
+        return table[pcm16.view(np.uint16)].tobytes()  # type: ignore[no-any-return]
+
+    def _tables_numpy(self, encoding: str) -> Tuple[Any, Any]:
+        key = f"{encoding}:numpy"
+        if key not in _tables:
+            np = self._np
+            decode = np.array(_decode_table(encoding), dtype=np.float32) / np.float32(32768)
+            encode = np.frombuffer(_encode_table(encoding), dtype=np.uint8)
+            _tables[key] = (decode, encode)
+        return _tables[key]  # type: ignore[no-any-return]
+
+    def _resample_numpy(self, samples: "np.ndarray[Any, Any]") -> "np.ndarray[Any, Any]":
+        np = self._np
+        if self._last is not None:
+            samples = np.concatenate((np.array([self._last], dtype=np.float32), samples))
+        n_input = len(samples)
+        start, count = self._plan(n_input)
+        self._advance(start, count, n_input)
+        self._last = float(samples[-1])
+
+        positions = start + np.arange(count, dtype=np.int64) * self._from_rate
+        index, offset = np.divmod(positions, self._to_rate)
+        following = np.minimum(index + 1, n_input - 1)
+        frac = (offset / self._to_rate).astype(np.float32)
+        base = samples[index]
+        return base + frac * (samples[following] - base)  # type: ignore[no-any-return]
+
+    # -- pure Python backend -----------------------------------------------
+
+    def _convert_python(self, raw: bytes) -> bytes:
+        samples = self._decode_python(raw)
+        if self._from_rate != self._to_rate:
+            samples = self._resample_python(samples)
+        return self._encode_python(samples)
+
+    def _decode_python(self, raw: bytes) -> Union[List[float], "array[float]"]:
+        encoding = self._from_encoding
+        if encoding == "pcm_f32le":
+            floats = array("f", raw)
+            if _BIG_ENDIAN:
+                floats.byteswap()
+            return floats
+        if encoding == "pcm_s16le":
+            ints = array("h", raw)
+            if _BIG_ENDIAN:
+                ints.byteswap()
+            return [value / 32768 for value in ints]
+        table = [value / 32768 for value in _decode_table(encoding)]
+        return [table[value] for value in raw]
+
+    def _encode_python(self, samples: Union[List[float], "array[float]"]) -> bytes:
+        encoding = self._to_encoding
+        if encoding == "pcm_f32le":
+            floats = array("f", samples)
+            if _BIG_ENDIAN:
+                floats.byteswap()
+            return floats.tobytes()
+        ints = array("h", (max(-32768, min(32767, round(value * 32768))) for value in samples))
+        if encoding == "pcm_s16le":
+            if _BIG_ENDIAN:
+                ints.byteswap()
+            return ints.tobytes()
+        table = _encode_table(encoding)
+        return bytes(table[value & 0xFFFF] for value in ints)
+
+    def _resample_python(self, samples: Union[List[float], "array[float]"]) -> List[float]:
+        values = list(samples)
+        if self._last is not None:
+            values.insert(0, self._last)
+        n_input = len(values)
+        start, count = self._plan(n_input)
+        self._advance(start, count, n_input)
+        self._last = values[-1]
+
+        out: List[float] = []
+        step = self._from_rate
+        rate = self._to_rate
+        last_index = n_input - 1
+        position = start
+        for _ in range(count):
+            index, offset = divmod(position, rate)
+            base = values[index]
+            following = values[index + 1] if index < last_index else base
+            out.append(base + (offset / rate) * (following - base))
+            position += step
+        return out
+
+
+class TranscodingSink(AudioSink):
+    """An `AudioSink` that converts audio with a `PCMTranscoder` before passing it to `target`.
+
+    Combine several of these with a `TeeSink` to fan one generation out to multiple formats.
+    Closing this sink flushes the transcoder but does not close `target`.
+    """
+
+    def __init__(self, target: AudioSink, transcoder: PCMTranscoder) -> None:
+        self._target = target
+        self._transcoder = transcoder
+
+    @override
+    def write(self, data: Buffer) -> None:
+        out = self._transcoder.convert(data)
+        if out:
+            self._target.write(out)
+
+    @override
+    def close(self) -> None:
+        out = self._transcoder.flush()
+        if out:
+            self._target.write(out)
@@ -8,12 +8,28 @@
 from __future__ import annotations
 
 import json
+import time
 import uuid
 import queue
+import random
 import asyncio
 import logging
+import threading
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Union, Mapping, Iterator, Optional, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Tuple,
+    Union,
+    Mapping,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    Awaitable,
+    cast,
+)
 from typing_extensions import AsyncIterator
 
 import httpx
@@ -21,14 +37,21 @@ from pydantic import BaseModel
 
 from .._types import Omit, Query, Headers, omit
 from .._utils import maybe_transform, async_maybe_transform
-from .._models import construct_type_unchecked
-from .._exceptions import CartesiaError
+from .._timing import Timings
+from .._governor import GovernorPermit, ConcurrencyGovernor
+from ._raw_audio import RawWebsocketResponse, decode_audio_chunk
+from ._tts_cache import TTSCache
+from ._audio_sink import Buffer, AudioSink, write_chunk_audio
+from .._exceptions import CartesiaError, WebSocketConnectionClosedError
+from .._send_queue import SendQueue, AsyncSendQueue
+from ._fast_events import TTS_FAST_EVENTS, EventParser, FastWebsocketResponse, loads
 from .._base_client import _merge_mappings
 from ..types.model_speed import ModelSpeed
 from ..types.supported_language import SupportedLanguage
 from ..types.websocket_response import WebsocketResponse
 from ..types.voice_specifier_param import VoiceSpecifierParam
 from ..types.websocket_client_event import CancelContextRequest, WebsocketClientEvent
+from ..types.websocket_reconnection import ReconnectingEvent, ReconnectingOverrides, is_recoverable_close
 from ..types.generation_config_param import GenerationConfigParam
 from ..types.raw_output_format_param import RawOutputFormatParam
 from ..types.generation_request_param import GenerationRequestParam
@@ -42,22 +65,148 @@ if TYPE_CHECKING:
     from .._client import Cartesia, AsyncCartesia
 
 
+def _without_context_id(request: GenerationRequestParam) -> dict[str, Any]:
+    return {key: value for key, value in request.items() if key != "context_id"}
+
+
+def _push_template(request: GenerationRequestParam) -> str:
+    """Serialize the fields of `request` that stay the same across pushes.
+
+    The result is a JSON object left open after a trailing `"transcript": ` key, ready for
+    `_render_push()`. It is built once per context so pushing a token doesn't run
+    `maybe_transform()` and re-serialize the voice and output format every time.
+    """
+    static = dict(cast(Mapping[str, Any], maybe_transform(request, WebsocketClientEventParam)))
+    static.pop("transcript", None)
+    static.pop("continue", None)
+    return json.dumps(static)[:-1] + ', "transcript": '
+
+
+def _render_push(template: str, transcript: str, continue_: bool) -> str:
+    return f'{template}{json.dumps(transcript)}, "continue": {"true" if continue_ else "false"}}}'
+
+
+def _replay_fields(event: Union[WebsocketClientEvent, WebsocketClientEventParam]) -> Tuple[Optional[str], bool, bool]:
+    """The `context_id`, `flush` and `cancel` fields of a client event."""
+    values = cast(Mapping[str, Any], event if isinstance(event, Mapping) else event.__dict__)
+    return values.get("context_id"), bool(values.get("flush")), bool(values.get("cancel"))
+
+
+def _settle_context_permit(permits: dict[str, GovernorPermit], event: RawWebsocketResponse) -> None:
+    """Give back the governor slot of a context that `event` finishes, reporting it if it was rate limited."""
+    if event.type not in ("done", "error"):
+        return
+    permit = permits.pop(getattr(event, "context_id", None) or "", None)
+    if permit is None:
+        return
+    if event.type == "error" and getattr(event, "status_code", None) == 429:
+        permit.throttle()
+    permit.release(success=event.type == "done")
+
+
+def _close_code(exc: Exception) -> int:
+    from websockets.exceptions import ConnectionClosed
+
+    if isinstance(exc, ConnectionClosed) and exc.rcvd is not None:
+        return exc.rcvd.code
+    return 1006
+
+
+class _ReplayLog:
+    """Requests sent on each unfinished context since the context's last acknowledged flush.
+
+    When the connection drops, the server forgets its contexts. Re-sending these requests
+    on the new connection resumes every context from its last `flush_done`; audio for text
+    after that point is generated again.
+    """
+
+    def __init__(self) -> None:
+        self._requests: dict[str, List[Tuple[str, bool]]] = {}
+        self.lock = threading.Lock()
+
+    def record(self, context_id: str, data: str, flush: bool) -> None:
+        self._requests.setdefault(context_id, []).append((data, flush))
+
+    def forget(self, context_id: str) -> None:
+        with self.lock:
+            self._requests.pop(context_id, None)
+
+    def acknowledge(self, event: RawWebsocketResponse) -> None:
+        """Drop the requests that `event` shows the server has finished with."""
+        if event.type not in ("flush_done", "done", "error"):
+            return
+        context_id = getattr(event, "context_id", None)
+        with self.lock:
+            if context_id is None:
+                if event.type == "error":
+                    self._requests.clear()
+            elif event.type == "flush_done":
+                requests = self._requests.get(context_id, [])
+                for i, (_, flush) in enumerate(requests):
+                    if flush:
+                        del requests[: i + 1]
+                        break
+            else:
+                self._requests.pop(context_id, None)
+
+    def pending(self) -> List[Tuple[str, List[str]]]:
+        """The unacknowledged requests of each context. Call with `lock` held."""
+        return [(context_id, [data for data, _ in requests]) for context_id, requests in self._requests.items()]
+
+
 class AsyncTTSResourceConnection:
     """Represents a live WebSocket connection to the TTS API"""
 
     _connection: AsyncWebsocketConnection
 
     def __init__(
-        self, connection: AsyncWebsocketConnection, manager: Optional[AsyncTTSResourceConnectionManager] = None
+        self,
+        connection: AsyncWebsocketConnection,
+        manager: Optional[AsyncTTSResourceConnectionManager] = None,
+        *,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        make_ws: Optional[Callable[[Query, Headers], Awaitable[AsyncWebsocketConnection]]] = None,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        send_queue: Optional[AsyncSendQueue] = None,
+        timings: Optional[Timings] = None,
+        governor: Optional[ConcurrencyGovernor] = None,
     ) -> None:
         self._connection = connection
         self._manager = manager
-        self._context_queues: dict[str, asyncio.Queue[WebsocketResponse]] = {}
+        self._raw_audio = raw_audio
+        self._make_ws = make_ws
+        self._on_reconnecting = on_reconnecting
+        self._max_retries = max_retries
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._extra_query = extra_query
+        self._extra_headers = extra_headers
+        self._send_queue = send_queue if send_queue is not None else AsyncSendQueue()
+        self._context_timings = timings.contexts("/tts/websocket") if timings else None
+        self._governor = governor
+        # The governor slot held by each context from its first request until it is done.
+        self._context_permits: dict[str, GovernorPermit] = {}
+        self._is_reconnecting = False
+        self._intentionally_closed = False
+        # Only kept when reconnection is enabled.
+        self._replay_log: Optional[_ReplayLog] = _ReplayLog() if make_ws is not None else None
+        self.event_parser: EventParser[FastWebsocketResponse] = EventParser(
+            WebsocketResponse, TTS_FAST_EVENTS if fast_parse else None
+        )
+        self._context_queues: dict[str, asyncio.Queue[RawWebsocketResponse]] = {}
+        # Raw messages of contexts whose generation will be stored in a `TTSCache`.
+        self._recordings: dict[str, list[bytes]] = {}
         self._processing_task: Optional[asyncio.Task[None]] = None
         self._closing = False
         self._logger = logging.getLogger(__name__)
 
-    async def __aiter__(self) -> AsyncIterator[WebsocketResponse]:
+    async def __aiter__(self) -> AsyncIterator[RawWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -70,7 +219,7 @@ class AsyncTTSResourceConnection:
         except ConnectionClosedOK:
             return
 
-    async def recv(self) -> WebsocketResponse:
+    async def recv(self) -> RawWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `WebsocketResponse` object.
 
@@ -96,17 +245,79 @@ class AsyncTTSResourceConnection:
         return message
 
     async def send(self, event: Union[WebsocketClientEvent, WebsocketClientEventParam]) -> None:
-        await self._ensure_connected()
         data = (
             event.to_json(use_api_names=True, exclude_defaults=True, exclude_unset=True)
             if isinstance(event, BaseModel)
             else json.dumps(await async_maybe_transform(event, WebsocketClientEventParam))
         )
-        await self._connection.send(data)
+        context_id, flush, cancel = _replay_fields(event)
+        await self._send_json(data, context_id, flush=flush, cancel=cancel)
+
+    async def _send_json(
+        self, data: str, context_id: Optional[str] = None, *, flush: bool = False, cancel: bool = False
+    ) -> None:
+        """Send a client event that has already been transformed and serialized."""
+        from websockets.exceptions import ConnectionClosed
+
+        if self._governor is not None and context_id is not None:
+            await self._govern_context(context_id, cancel=cancel)
+        if self._context_timings is not None:
+            if cancel:
+                self._context_timings.cancelled(context_id)
+            else:
+                self._context_timings.sent(context_id)
+
+        replay_log = self._replay_log
+        if replay_log is None:
+            await self._ensure_connected()
+            await self._connection.send(data)
+            return
+
+        # Requests on a context are recorded in the replay log, which the reader task
+        # re-sends after reconnecting; anything else waits in the send queue.
+        if cancel and context_id is not None:
+            replay_log.forget(context_id)
+        tracked = context_id is not None and not cancel
+        if tracked:
+            with replay_log.lock:
+                replay_log.record(cast(str, context_id), data, flush)
+        if self._is_reconnecting:
+            if not tracked:
+                await self._send_queue.put(data)
+            return
+        try:
+            await self._connection.send(data)
+        except ConnectionClosed:
+            # Make sure the reader is running so that it notices the drop and reconnects.
+            self._dispatch_listener()
+            if not tracked:
+                await self._send_queue.put(data)
+
+    async def _govern_context(self, context_id: str, *, cancel: bool) -> None:
+        """Take a governor slot for a context's first request, or give it back when the context is cancelled."""
+        assert self._governor is not None
+        if cancel:
+            permit = self._context_permits.pop(context_id, None)
+            if permit is not None:
+                permit.release()
+        elif context_id not in self._context_permits:
+            permit = await self._governor.async_acquire()
+            if context_id in self._context_permits:
+                # another task sent on this context while we were waiting
+                permit.release()
+            else:
+                self._context_permits[context_id] = permit
+
+    def _release_context_permits(self) -> None:
+        permits = list(self._context_permits.values())
+        self._context_permits.clear()
+        for permit in permits:
+            permit.release()
 
     async def close(self, *, code: int = 1000, reason: str = "") -> None:
         import asyncio as _asyncio
 
+        self._intentionally_closed = True
         self._closing = True
         try:
             if self._processing_task is not None:
@@ -119,6 +330,7 @@ class AsyncTTSResourceConnection:
             await self._connection.close(code=code, reason=reason)
         finally:
             self._closing = False
+            self._release_context_permits()
 
     def _dispatch_listener(self) -> None:
         import asyncio as _asyncio
@@ -131,17 +343,142 @@ class AsyncTTSResourceConnection:
 
         try:
             while True:
-                raw = await self._connection.recv(decode=False)
+                try:
+                    raw = await self._connection.recv(decode=False)
+                except ConnectionClosed as exc:
+                    if self._closing or not await self._reconnect(exc):
+                        raise
+                    continue
                 self._logger.debug("Received websocket message: %s", raw)
+                decode_started = time.perf_counter()
                 event = self.parse_event(raw)
+                if self._context_timings is not None:
+                    self._context_timings.received(event, decode_started)
+                if self._replay_log is not None:
+                    self._replay_log.acknowledge(event)
                 event_ctx = event.context_id if hasattr(event, "context_id") else None
                 if event_ctx is not None and event_ctx in self._context_queues:
+                    recording = self._recordings.get(event_ctx)
+                    if recording is not None:
+                        recording.append(raw)
                     await self._context_queues[event_ctx].put(event)
                 else:
                     self._logger.debug("Received event for unregistered context %s", event_ctx)
         except ConnectionClosed:
             if not self._closing:
                 self._logger.warning("WebSocket connection closed unexpectedly")
+        finally:
+            # contexts that were still running will not get their `done` events now
+            self._release_context_permits()
+
+    async def _reconnect(self, exc: Exception) -> bool:
+        """Attempt to reconnect after a connection failure, resuming every unfinished context.
+
+        Returns ``True`` if a new connection was established, ``False`` if the
+        caller should re-raise the original exception.
+        """
+        import asyncio as _asyncio
+
+        if self._on_reconnecting is None or self._make_ws is None:
+            return False
+
+        close_code = _close_code(exc)
+        if not is_recoverable_close(close_code):
+            return False
+
+        self._is_reconnecting = True
+
+        for attempt in range(1, self._max_retries + 1):
+            base_delay = min(self._initial_delay * (2 ** (attempt - 1)), self._max_delay)
+            jitter = 0.75 + random.random() * 0.25
+            delay = base_delay * jitter
+
+            event = ReconnectingEvent(
+                attempt=attempt,
+                max_attempts=self._max_retries,
+                delay=delay,
+                close_code=close_code,
+                extra_query=self._extra_query,
+                extra_headers=self._extra_headers,
+            )
+
+            try:
+                result = self._on_reconnecting(event)
+            except Exception:
+                break
+
+            if result is not None and result.get("abort"):
+                break
+
+            if result is not None:
+                if "extra_query" in result:
+                    self._extra_query = result["extra_query"]
+                if "extra_headers" in result:
+                    self._extra_headers = result["extra_headers"]
+
+            self._logger.info(
+                "Reconnecting to WebSocket API (attempt %d/%d) after %.1fs delay",
+                attempt,
+                self._max_retries,
+                delay,
+            )
+            await _asyncio.sleep(delay)
+
+            if self._intentionally_closed:
+                break
+
+            try:
+                self._connection = await self._make_ws(self._extra_query, self._extra_headers)
+            except Exception:
+                continue
+            self._logger.info("Reconnected to WebSocket API")
+            await self._resume()
+            return True
+
+        self._is_reconnecting = False
+        return False
+
+    async def _resume(self) -> None:
+        """Re-send the unacknowledged requests of every context, then the send queue."""
+        from websockets.exceptions import ConnectionClosed
+
+        assert self._replay_log is not None
+        # Pushes made while we are sending are recorded too, so go round until the log
+        # has nothing new. This runs on the reader task, so no request is acknowledged meanwhile.
+        sent: dict[str, int] = {}
+        try:
+            while True:
+                with self._replay_log.lock:
+                    pending = self._replay_log.pending()
+                unsent = [
+                    (context_id, data)
+                    for context_id, requests in pending
+                    for data in requests[sent.get(context_id, 0) :]
+                ]
+                if not unsent:
+                    break
+                for context_id, data in unsent:
+                    # The audio is generated again, so a partial recording can't be cached.
+                    self._recordings.pop(context_id, None)
+                    await self._connection.send(data)
+                    sent[context_id] = sent.get(context_id, 0) + 1
+        except ConnectionClosed:
+            # Dropped again; the reader's next `recv()` starts another reconnect.
+            pass
+        finally:
+            self._is_reconnecting = False
+        await self._flush_send_queue()
+
+    async def _flush_send_queue(self) -> None:
+        """Send all queued messages over the current connection."""
+
+        async def _send(data: Union[str, bytes]) -> None:
+            await self._connection.send(data)
+
+        try:
+            await self._send_queue.flush(_send)
+        except Exception:
+            self._logger.warning("Failed to flush send queue after reconnect", exc_info=True)
 
     async def _ensure_connected(self) -> None:
         import asyncio as _asyncio
@@ -161,15 +498,34 @@ class AsyncTTSResourceConnection:
             self._connection = new_conn._connection
             self._context_queues.clear()
 
-    def parse_event(self, data: Union[str, bytes]) -> WebsocketResponse:
+    def _replay(self, context_id: str, frames: Sequence[Buffer]) -> None:
+        """Queue cached messages for `context_id` as though they had just arrived."""
+        context_queue = self._context_queues.get(context_id)
+        if context_queue is None:
+            return
+        for frame in frames:
+            message = loads(bytes(frame))
+            message["context_id"] = context_id
+            context_queue.put_nowait(self.parse_event(json.dumps(message)))
+
+    def parse_event(self, data: Union[str, bytes]) -> RawWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `WebsocketResponse` object.
 
+        If the connection was opened with `raw_audio=True`, `chunk` messages are returned
+        as `AudioChunk` objects instead. With `fast_parse=True`, `chunk` and `timestamps`
+        messages are returned as `FastChunk` / `FastTimestamps` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            WebsocketResponse, construct_type_unchecked(value=json.loads(data), type_=cast(Any, WebsocketResponse))
-        )
+        if self._raw_audio:
+            chunk = decode_audio_chunk(data)
+            if chunk is not None:
+                return chunk
+        event = self.event_parser.parse(data)
+        if self._context_permits:
+            _settle_context_permit(self._context_permits, event)
+        return event
 
     def context(
         self,
@@ -186,6 +542,7 @@ class AsyncTTSResourceConnection:
         max_buffer_delay_ms: Optional[int] = None,
         pronunciation_dict_id: Optional[str] = None,
         use_normalized_timestamps: Optional[bool] = None,
+        cache: Optional[TTSCache] = None,
     ) -> AsyncWebSocketContext:
         """Create a context helper for managing conversational flows.
 
@@ -202,6 +559,10 @@ class AsyncTTSResourceConnection:
             max_buffer_delay_ms: Default generation_config for push().
             pronunciation_dict_id: Default generation_config for push().
             use_normalized_timestamps: Default generation_config for push().
+            cache: Serve this context's generation from a `TTSCache` when an identical
+                one is cached, and cache it otherwise. Requests are held back until the
+                context is finished (`no_more_inputs()` or a send with `continue_=False`),
+                so this suits prompts whose full text is known up front.
 
         Returns:
             AsyncWebSocketContext helper for simplified sending and receiving
@@ -227,6 +588,7 @@ class AsyncTTSResourceConnection:
             max_buffer_delay_ms=max_buffer_delay_ms,
             pronunciation_dict_id=pronunciation_dict_id,
             use_normalized_timestamps=use_normalized_timestamps,
+            cache=cache,
         )
 
 
@@ -257,12 +619,26 @@ class AsyncTTSResourceConnectionManager:
         extra_query: Query,
         extra_headers: Headers,
         websocket_connection_options: WebsocketConnectionOptions,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_queue_size: int = 1_048_576,
     ) -> None:
         self.__client = client
+        self.__raw_audio = raw_audio
+        self.__fast_parse = fast_parse
         self.__connection: Optional[AsyncTTSResourceConnection] = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
+        self.__on_reconnecting = on_reconnecting
+        self.__max_retries = max_retries
+        self.__initial_delay = initial_delay
+        self.__max_delay = max_delay
+        self.__send_queue = AsyncSendQueue(max_bytes=max_queue_size)
         self.__lock = asyncio.Lock()
         self._logger = logging.getLogger(__name__)
 
@@ -283,38 +659,71 @@ class AsyncTTSResourceConnectionManager:
             if self.__connection is not None:
                 return self.__connection
 
-            try:
-                from websockets.asyncio.client import connect
-            except ImportError as exc:
-                raise CartesiaError("You need to install `cartesia[websockets]` to use this method") from exc
-
-            url = self._prepare_url().copy_with(
-                params=_merge_mappings(self.__client.base_url.params, self.__extra_query),
-            )
-            self._logger.debug("Connecting to %s", url)
-            if self.__websocket_connection_options:
-                self._logger.debug("Connection options: %s", self.__websocket_connection_options)
-
             self.__connection = AsyncTTSResourceConnection(
-                await connect(
-                    str(url),
-                    user_agent_header=self.__client.user_agent,
-                    additional_headers=_merge_mappings(
-                        {
-                            **self.__client.default_headers,
-                            **self.__client.auth_headers,
-                        },
-                        self.__extra_headers,
-                    ),
-                    **self.__websocket_connection_options,
-                ),
+                await self._connect_ws(self.__extra_query, self.__extra_headers),
                 manager=self,
+                raw_audio=self.__raw_audio,
+                fast_parse=self.__fast_parse,
+                make_ws=self._connect_ws if self.__on_reconnecting is not None else None,
+                on_reconnecting=self.__on_reconnecting,
+                max_retries=self.__max_retries,
+                initial_delay=self.__initial_delay,
+                max_delay=self.__max_delay,
+                extra_query=self.__extra_query,
+                extra_headers=self.__extra_headers,
+                send_queue=self.__send_queue,
+                timings=self.__client._timings,
+                governor=self.__client._governor,
             )
 
             return self.__connection
 
     enter = __aenter__
 
+    async def warmup(self) -> AsyncTTSResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.tts.websocket_connect()
+        await manager.warmup()  # e.g. while the worker starts up
+        ...
+        async with manager as connection:  # already connected
+            ...
+        ```
+        """
+        await self.enter()
+        return self
+
+    async def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> AsyncWebsocketConnection:
+        try:
+            from websockets.asyncio.client import connect
+        except ImportError as exc:
+            raise CartesiaError("You need to install `cartesia[websockets]` to use this method") from exc
+
+        url = self._prepare_url().copy_with(
+            params=_merge_mappings(self.__client.base_url.params, extra_query),
+        )
+        self._logger.debug("Connecting to %s", url)
+        if self.__websocket_connection_options:
+            self._logger.debug("Connection options: %s", self.__websocket_connection_options)
+
+        started = time.perf_counter()
+        connection = await connect(
+            str(url),
+            user_agent_header=self.__client.user_agent,
+            additional_headers=_merge_mappings(
+                {
+                    **self.__client.default_headers,
+                    **self.__client.auth_headers,
+                },
+                extra_headers,
+            ),
+            **self.__websocket_connection_options,
+        )
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
+
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
             base_url = httpx.URL(self.__client.websocket_base_url)
@@ -336,13 +745,57 @@ class TTSResourceConnection:
 
     _connection: WebsocketConnection
 
-    def __init__(self, connection: WebsocketConnection, manager: Optional[TTSResourceConnectionManager] = None) -> None:
+    def __init__(
+        self,
+        connection: WebsocketConnection,
+        manager: Optional[TTSResourceConnectionManager] = None,
+        *,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        make_ws: Optional[Callable[[Query, Headers], WebsocketConnection]] = None,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        send_queue: Optional[SendQueue] = None,
+        timings: Optional[Timings] = None,
+        governor: Optional[ConcurrencyGovernor] = None,
+    ) -> None:
         self._connection = connection
         self._manager = manager
-        self._context_queues: dict[str, queue.Queue[WebsocketResponse]] = {}
+        self._raw_audio = raw_audio
+        self._make_ws = make_ws
+        self._on_reconnecting = on_reconnecting
+        self._max_retries = max_retries
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._extra_query = extra_query
+        self._extra_headers = extra_headers
+        self._send_queue = send_queue if send_queue is not None else SendQueue()
+        self._context_timings = timings.contexts("/tts/websocket") if timings else None
+        self._governor = governor
+        # The governor slot held by each context from its first request until it is done.
+        self._context_permits: dict[str, GovernorPermit] = {}
+        self._is_reconnecting = False
+        self._intentionally_closed = threading.Event()
+        # Only kept when reconnection is enabled.
+        self._replay_log: Optional[_ReplayLog] = _ReplayLog() if make_ws is not None else None
+        self.event_parser: EventParser[FastWebsocketResponse] = EventParser(
+            WebsocketResponse, TTS_FAST_EVENTS if fast_parse else None
+        )
+        # Each queue receives parsed events for its context, or the exception that
+        # stopped the reader thread so that blocked consumers are woken up.
+        self._context_queues: dict[str, queue.SimpleQueue[Union[RawWebsocketResponse, BaseException]]] = {}
+        # Raw messages of contexts whose generation will be stored in a `TTSCache`.
+        self._recordings: dict[str, list[bytes]] = {}
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_lock = threading.Lock()
+        self._closing = False
         self._logger = logging.getLogger(__name__)
 
-    def __iter__(self) -> Iterator[WebsocketResponse]:
+    def __iter__(self) -> Iterator[RawWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -355,7 +808,7 @@ class TTSResourceConnection:
         except ConnectionClosedOK:
             return
 
-    def recv(self) -> WebsocketResponse:
+    def recv(self) -> RawWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `WebsocketResponse` object.
 
@@ -376,35 +829,284 @@ class TTSResourceConnection:
         return message
 
     def send(self, event: Union[WebsocketClientEvent, WebsocketClientEventParam]) -> None:
-        self._ensure_connected()
         data = (
             event.to_json(use_api_names=True, exclude_defaults=True, exclude_unset=True)
             if isinstance(event, BaseModel)
             else json.dumps(maybe_transform(event, WebsocketClientEventParam))
         )
-        self._connection.send(data)
+        context_id, flush, cancel = _replay_fields(event)
+        self._send_json(data, context_id, flush=flush, cancel=cancel)
+
+    def _send_json(
+        self, data: str, context_id: Optional[str] = None, *, flush: bool = False, cancel: bool = False
+    ) -> None:
+        """Send a client event that has already been transformed and serialized."""
+        from websockets.exceptions import ConnectionClosed
+
+        if self._governor is not None and context_id is not None:
+            self._govern_context(context_id, cancel=cancel)
+        if self._context_timings is not None:
+            if cancel:
+                self._context_timings.cancelled(context_id)
+            else:
+                self._context_timings.sent(context_id)
+
+        replay_log = self._replay_log
+        if replay_log is None:
+            self._ensure_connected()
+            self._connection.send(data)
+            return
+
+        # Requests on a context are recorded in the replay log, which the reader thread
+        # re-sends after reconnecting; anything else waits in the send queue.
+        if cancel and context_id is not None:
+            replay_log.forget(context_id)
+        tracked = context_id is not None and not cancel
+        with replay_log.lock:
+            if tracked:
+                replay_log.record(cast(str, context_id), data, flush)
+            if self._is_reconnecting:
+                if not tracked:
+                    self._send_queue.enqueue(data)
+                return
+            # If the connection is replaced after this, sending on the old one fails and
+            # the request goes out with the replayed ones instead.
+            connection = self._connection
+        try:
+            connection.send(data)
+        except ConnectionClosed:
+            if not tracked:
+                self._send_queue.enqueue(data)
+            # Make sure the reader is running so that it notices the drop and reconnects.
+            self._dispatch_listener()
+
+    def _govern_context(self, context_id: str, *, cancel: bool) -> None:
+        """Take a governor slot for a context's first request, or give it back when the context is cancelled."""
+        assert self._governor is not None
+        if cancel:
+            permit = self._context_permits.pop(context_id, None)
+            if permit is not None:
+                permit.release()
+        elif context_id not in self._context_permits:
+            permit = self._governor.acquire()
+            # another thread may have sent on this context while we were waiting
+            if self._context_permits.setdefault(context_id, permit) is not permit:
+                permit.release()
+
+    def _release_context_permits(self) -> None:
+        permits = list(self._context_permits.values())
+        self._context_permits.clear()
+        for permit in permits:
+            permit.release()
 
     def close(self, *, code: int = 1000, reason: str = "") -> None:
-        self._connection.close(code=code, reason=reason)
+        self._intentionally_closed.set()
+        self._closing = True
+        try:
+            self._connection.close(code=code, reason=reason)
+            self._join_reader()
+        finally:
+            self._closing = False
+            self._release_context_permits()
+
+    def _dispatch_listener(self) -> None:
+        """Start the background reader thread if it isn't already running."""
+        with self._reader_lock:
+            if self._reader_thread is None or not self._reader_thread.is_alive():
+                self._reader_thread = threading.Thread(
+                    target=self._process_responses, name="cartesia-tts-reader", daemon=True
+                )
+                self._reader_thread.start()
+
+    def _join_reader(self) -> None:
+        reader = self._reader_thread
+        if reader is not None and reader is not threading.current_thread():
+            reader.join()
+
+    def _process_responses(self) -> None:
+        """Read frames off the wire, parse each one once and route it to its context's queue."""
+        from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+        try:
+            while True:
+                try:
+                    raw = self._connection.recv(decode=False)
+                except ConnectionClosed as exc:
+                    if self._closing or not self._reconnect(exc):
+                        raise
+                    continue
+                self._logger.debug("Received websocket message: %s", raw)
+                decode_started = time.perf_counter()
+                event = self.parse_event(raw)
+                if self._context_timings is not None:
+                    self._context_timings.received(event, decode_started)
+                if self._replay_log is not None:
+                    self._replay_log.acknowledge(event)
+                event_ctx = event.context_id if hasattr(event, "context_id") else None
+                if event_ctx is not None:
+                    context_queue = self._context_queues.get(event_ctx)
+                    if context_queue is not None:
+                        recording = self._recordings.get(event_ctx)
+                        if recording is not None:
+                            recording.append(raw)
+                        context_queue.put(event)
+                    else:
+                        self._logger.debug("Received event for unregistered context %s", event_ctx)
+                elif event.type == "error":
+                    # Errors without a context ID concern every context on the connection.
+                    for context_queue in list(self._context_queues.values()):
+                        context_queue.put(event)
+                else:
+                    self._logger.debug("Received event without a context ID: %s", event.type)
+        except ConnectionClosed as exc:
+            if not self._closing and not isinstance(exc, ConnectionClosedOK):
+                self._logger.warning("WebSocket connection closed unexpectedly")
+            error: BaseException = exc
+            unsent = self._send_queue.drain()
+            if unsent:
+                error = WebSocketConnectionClosedError(
+                    "WebSocket connection closed with unsent messages", unsent_messages=unsent
+                )
+                error.__cause__ = exc
+            for context_queue in list(self._context_queues.values()):
+                context_queue.put(error)
+        except Exception as exc:
+            self._logger.warning("WebSocket reader stopped", exc_info=True)
+            for context_queue in list(self._context_queues.values()):
+                context_queue.put(exc)
+        finally:
+            # contexts that were still running will not get their `done` events now
+            self._release_context_permits()
+
+    def _reconnect(self, exc: Exception) -> bool:
+        """Attempt to reconnect after a connection failure, resuming every unfinished context.
+
+        Returns ``True`` if a new connection was established, ``False`` if the
+        caller should re-raise the original exception.
+        """
+        if self._on_reconnecting is None or self._make_ws is None or self._replay_log is None:
+            return False
+
+        close_code = _close_code(exc)
+        if not is_recoverable_close(close_code):
+            return False
+
+        with self._replay_log.lock:
+            self._is_reconnecting = True
+
+        for attempt in range(1, self._max_retries + 1):
+            base_delay = min(self._initial_delay * (2 ** (attempt - 1)), self._max_delay)
+            jitter = 0.75 + random.random() * 0.25
+            delay = base_delay * jitter
+
+            event = ReconnectingEvent(
+                attempt=attempt,
+                max_attempts=self._max_retries,
+                delay=delay,
+                close_code=close_code,
+                extra_query=self._extra_query,
+                extra_headers=self._extra_headers,
+            )
+
+            try:
+                result = self._on_reconnecting(event)
+            except Exception:
+                break
+
+            if result is not None and result.get("abort"):
+                break
+
+            if result is not None:
+                if "extra_query" in result:
+                    self._extra_query = result["extra_query"]
+                if "extra_headers" in result:
+                    self._extra_headers = result["extra_headers"]
+
+            self._logger.info(
+                "Reconnecting to WebSocket API (attempt %d/%d) after %.1fs delay",
+                attempt,
+                self._max_retries,
+                delay,
+            )
+            if self._intentionally_closed.wait(delay):
+                break
+
+            try:
+                self._connection = self._make_ws(self._extra_query, self._extra_headers)
+            except Exception:
+                continue
+            self._logger.info("Reconnected to WebSocket API")
+            self._resume()
+            return True
+
+        with self._replay_log.lock:
+            self._is_reconnecting = False
+        return False
+
+    def _resume(self) -> None:
+        """Re-send the unacknowledged requests of every context, then the send queue."""
+        from websockets.exceptions import ConnectionClosed
+
+        assert self._replay_log is not None
+        with self._replay_log.lock:
+            try:
+                for context_id, requests in self._replay_log.pending():
+                    # The audio is generated again, so a partial recording can't be cached.
+                    self._recordings.pop(context_id, None)
+                    for data in requests:
+                        self._connection.send(data)
+            except ConnectionClosed:
+                # Dropped again; the reader's next `recv()` starts another reconnect.
+                pass
+            finally:
+                self._is_reconnecting = False
+        self._flush_send_queue()
+
+    def _flush_send_queue(self) -> None:
+        """Send all queued messages over the current connection."""
+        try:
+            self._send_queue.flush_sync(lambda data: self._connection.send(data))
+        except Exception:
+            self._logger.warning("Failed to flush send queue after reconnect", exc_info=True)
 
     def _ensure_connected(self) -> None:
         from websockets.protocol import State
 
         if self._manager is not None and self._connection.state in (State.CLOSED, State.CLOSING):
             self._logger.debug("Connection is not open (state=%s), reconnecting...", self._connection.state)
+            self._join_reader()
             new_conn = self._manager.__enter__()
             self._connection = new_conn._connection
             self._context_queues.clear()
 
-    def parse_event(self, data: Union[str, bytes]) -> WebsocketResponse:
+    def _replay(self, context_id: str, frames: Sequence[Buffer]) -> None:
+        """Queue cached messages for `context_id` as though they had just arrived."""
+        context_queue = self._context_queues.get(context_id)
+        if context_queue is None:
+            return
+        for frame in frames:
+            message = loads(bytes(frame))
+            message["context_id"] = context_id
+            context_queue.put(self.parse_event(json.dumps(message)))
+
+    def parse_event(self, data: Union[str, bytes]) -> RawWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `WebsocketResponse` object.
 
+        If the connection was opened with `raw_audio=True`, `chunk` messages are returned
+        as `AudioChunk` objects instead. With `fast_parse=True`, `chunk` and `timestamps`
+        messages are returned as `FastChunk` / `FastTimestamps` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            WebsocketResponse, construct_type_unchecked(value=json.loads(data), type_=cast(Any, WebsocketResponse))
-        )
+        if self._raw_audio:
+            chunk = decode_audio_chunk(data)
+            if chunk is not None:
+                return chunk
+        event = self.event_parser.parse(data)
+        if self._context_permits:
+            _settle_context_permit(self._context_permits, event)
+        return event
 
     def context(
         self,
@@ -421,6 +1123,7 @@ class TTSResourceConnection:
         max_buffer_delay_ms: Optional[int] = None,
         pronunciation_dict_id: Optional[str] = None,
         use_normalized_timestamps: Optional[bool] = None,
+        cache: Optional[TTSCache] = None,
     ) -> WebSocketContext:
         """Create a context helper for managing conversational flows.
 
@@ -437,6 +1140,10 @@ class TTSResourceConnection:
             max_buffer_delay_ms: Default generation_config for push().
             pronunciation_dict_id: Default generation_config for push().
             use_normalized_timestamps: Default generation_config for push().
+            cache: Serve this context's generation from a `TTSCache` when an identical
+                one is cached, and cache it otherwise. Requests are held back until the
+                context is finished (`no_more_inputs()` or a send with `continue_=False`),
+                so this suits prompts whose full text is known up front.
 
         Returns:
             WebSocketContext helper for simplified sending and receiving
@@ -445,7 +1152,7 @@ class TTSResourceConnection:
             raise ValueError(f"Context for context ID {context_id} already exists.")
         if context_id is None:
             context_id = str(uuid.uuid4())
-        self._context_queues[context_id] = queue.Queue()
+        self._context_queues[context_id] = queue.SimpleQueue()
         return WebSocketContext(
             self,
             context_id,
@@ -460,6 +1167,7 @@ class TTSResourceConnection:
             max_buffer_delay_ms=max_buffer_delay_ms,
             pronunciation_dict_id=pronunciation_dict_id,
             use_normalized_timestamps=use_normalized_timestamps,
+            cache=cache,
         )
 
 
@@ -490,12 +1198,26 @@ class TTSResourceConnectionManager:
         extra_query: Query,
         extra_headers: Headers,
         websocket_connection_options: WebsocketConnectionOptions,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_queue_size: int = 1_048_576,
     ) -> None:
         self.__client = client
+        self.__raw_audio = raw_audio
+        self.__fast_parse = fast_parse
         self.__connection: Optional[TTSResourceConnection] = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
+        self.__on_reconnecting = on_reconnecting
+        self.__max_retries = max_retries
+        self.__initial_delay = initial_delay
+        self.__max_delay = max_delay
+        self.__send_queue = SendQueue(max_bytes=max_queue_size)
         self._logger = logging.getLogger(__name__)
 
     def __enter__(self) -> TTSResourceConnection:
@@ -514,37 +1236,70 @@ class TTSResourceConnectionManager:
         if self.__connection is not None:
             return self.__connection
 
+        self.__connection = TTSResourceConnection(
+            self._connect_ws(self.__extra_query, self.__extra_headers),
+            manager=self,
+            raw_audio=self.__raw_audio,
+            fast_parse=self.__fast_parse,
+            make_ws=self._connect_ws if self.__on_reconnecting is not None else None,
+            on_reconnecting=self.__on_reconnecting,
+            max_retries=self.__max_retries,
+            initial_delay=self.__initial_delay,
+            max_delay=self.__max_delay,
+            extra_query=self.__extra_query,
+            extra_headers=self.__extra_headers,
+            send_queue=self.__send_queue,
+            timings=self.__client._timings,
+            governor=self.__client._governor,
+        )
+
+        return self.__connection
+
+    enter = __enter__
+
+    def warmup(self) -> TTSResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.tts.websocket_connect()
+        manager.warmup()  # e.g. while the worker starts up
+        ...
+        with manager as connection:  # already connected
+            ...
+        ```
+        """
+        self.enter()
+        return self
+
+    def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> WebsocketConnection:
         try:
             from websockets.sync.client import connect
         except ImportError as exc:
             raise CartesiaError("You need to install `cartesia[websockets]` to use this method") from exc
 
         url = self._prepare_url().copy_with(
-            params=_merge_mappings(self.__client.base_url.params, self.__extra_query),
+            params=_merge_mappings(self.__client.base_url.params, extra_query),
         )
         self._logger.debug("Connecting to %s", url)
         if self.__websocket_connection_options:
             self._logger.debug("Connection options: %s", self.__websocket_connection_options)
 
-        self.__connection = TTSResourceConnection(
-            connect(
-                str(url),
-                user_agent_header=self.__client.user_agent,
-                additional_headers=_merge_mappings(
-                    {
-                        **self.__client.default_headers,
-                        **self.__client.auth_headers,
-                    },
-                    self.__extra_headers,
-                ),
-                **self.__websocket_connection_options,
+        started = time.perf_counter()
+        connection = connect(
+            str(url),
+            user_agent_header=self.__client.user_agent,
+            additional_headers=_merge_mappings(
+                {
+                    **self.__client.default_headers,
+                    **self.__client.auth_headers,
+                },
+                extra_headers,
             ),
-            manager=self,
+            **self.__websocket_connection_options,
         )
-
-        return self.__connection
-
-    enter = __enter__
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
 
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
@@ -582,6 +1337,7 @@ class WebSocketContext:
         max_buffer_delay_ms: Optional[int] = None,
         pronunciation_dict_id: Optional[str] = None,
         use_normalized_timestamps: Optional[bool] = None,
+        cache: Optional[TTSCache] = None,
     ):
         self._connection = connection
         self._context_id = context_id
@@ -597,6 +1353,12 @@ class WebSocketContext:
         self._max_buffer_delay_ms = max_buffer_delay_ms
         self._pronunciation_dict_id = pronunciation_dict_id
         self._use_normalized_timestamps = use_normalized_timestamps
+        self._cache = cache
+        # Requests held back until the context is finished; `None` once they have been looked up.
+        self._cache_pending: Optional[list[GenerationRequestParam]] = [] if cache is not None else None
+        self._cache_key: Optional[str] = None
+        # `push()` requests that only set `transcript` and `continue` are spliced into this.
+        self._push_template = _push_template(self._request_params(transcript="", voice=voice)) if voice else None
 
     def send(
         self,
@@ -618,6 +1380,44 @@ class WebSocketContext:
         if self._completed:
             raise ValueError("Cannot send to completed context. Call no_more_inputs() only once per context.")
 
+        request_params = self._request_params(
+            transcript=transcript,
+            voice=voice,
+            model_id=model_id,
+            output_format=output_format,
+            continue_=continue_,
+            language=language,
+            speed=speed,
+            add_timestamps=add_timestamps,
+            add_phoneme_timestamps=add_phoneme_timestamps,
+            flush=flush,
+            generation_config=generation_config,
+            **kwargs,
+        )
+
+        if self._cache_pending is not None:
+            self._send_cached(request_params)
+            return
+        self._connection.send(request_params)
+        self._connection._dispatch_listener()
+
+    def _request_params(
+        self,
+        *,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        model_id: Optional[str] = None,
+        output_format: Union[RawOutputFormatParam, Mapping[str, Any], None] = None,
+        continue_: bool = True,
+        language: Union[SupportedLanguage, None, Omit] = omit,
+        speed: Optional[ModelSpeed] = None,
+        add_timestamps: Union[bool, None, Omit] = omit,
+        add_phoneme_timestamps: Union[bool, None, Omit] = omit,
+        flush: Union[bool, None, Omit] = omit,
+        generation_config: Union[GenerationConfigParam, None, Omit] = omit,
+        **kwargs: Any,
+    ) -> GenerationRequestParam:
+        """Build the request `send()` makes, filling in the context defaults."""
         # Default output format
         if output_format is not None:
             pass
@@ -693,8 +1493,26 @@ class WebSocketContext:
 
         # Add any additional kwargs
         request_params.update(cast(GenerationRequestParam, kwargs))
+        return request_params
 
-        self._connection.send(request_params)
+    def _send_cached(self, request_params: GenerationRequestParam) -> None:
+        assert self._cache is not None and self._cache_pending is not None
+        self._cache_pending.append(request_params)
+        if request_params.get("continue", True):
+            return
+
+        pending, self._cache_pending = self._cache_pending, None
+        key = self._cache.key("/tts/websocket", [_without_context_id(request) for request in pending])
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._connection._replay(self._context_id, entry.frames)
+            return
+
+        self._cache_key = key
+        self._connection._recordings[self._context_id] = []
+        for request in pending:
+            self._connection.send(request)
+        self._connection._dispatch_listener()
 
     def push(
         self,
@@ -705,6 +1523,12 @@ class WebSocketContext:
         **kwargs: Any,
     ) -> None:
         """Send a generation request with continue_=True using context defaults."""
+        if self._push_template is not None and isinstance(voice, Omit) and not kwargs and self._cache_pending is None:
+            if self._completed:
+                raise ValueError("Cannot send to completed context. Call no_more_inputs() only once per context.")
+            self._connection._send_json(_render_push(self._push_template, transcript, continue_), self._context_id)
+            self._connection._dispatch_listener()
+            return
 
         if not isinstance(voice, Omit):
             pass
@@ -725,9 +1549,7 @@ class WebSocketContext:
         if self._completed:
             return  # Already completed, ignore
 
-        voice: VoiceSpecifierParam = self._voice or cast(
-            VoiceSpecifierParam, "6ccbfb76-1fc6-48f7-b71d-91ac6298247b"
-        )
+        voice: VoiceSpecifierParam = self._voice or cast(VoiceSpecifierParam, "6ccbfb76-1fc6-48f7-b71d-91ac6298247b")
 
         self.send(
             transcript="",
@@ -739,74 +1561,64 @@ class WebSocketContext:
     def cancel(self) -> None:
         """Cancel this context, stopping any in-progress generation."""
         self._connection.send(CancelContextRequest(cancel=True, context_id=self._context_id))
-        self._connection._context_queues.pop(self._context_id, None)
+        self._unregister()
 
-    def receive(self) -> Iterator[WebsocketResponse]:
+    def receive(self, *, sink: Optional[AudioSink] = None) -> Iterator[RawWebsocketResponse]:
         """Receive responses filtered to this context only.
 
-        When multiple contexts share a connection, the context that reads from
-        the websocket acts as a router: non-matching events are placed onto the
-        correct context's queue so they are never lost.
+        A background thread on the connection continuously reads from the wire
+        and routes events into per-context queues.  This method simply drains
+        the queue for this context.
+
+        If a `sink` is given, the audio of each `chunk` event is written to it
+        before the event is yielded.
         """
         from websockets.exceptions import ConnectionClosedOK
 
         my_queue = self._connection._context_queues.get(self._context_id)
-        done = False
+        if my_queue is None:
+            return
+
+        self._connection._dispatch_listener()
 
         try:
             while True:
-                # 1. Drain our own queue first (events routed here by another context).
-                if my_queue is not None:
-                    try:
-                        event = my_queue.get_nowait()
-                        yield event
-                        if event.type in ("done", "error"):
-                            done = True
-                            return
-                        continue
-                    except queue.Empty:
-                        pass
-
-                # 2. Read the next event from the connection.
                 try:
-                    raw = self._connection.recv_bytes(timeout=self._timeout)
-                    event = self._connection.parse_event(raw)
-                except ConnectionClosedOK:
-                    done = True
-                    return
-                except TimeoutError:
-                    done = True
-                    raise
-
-                # 3. Route the event.
-                event_ctx = event.context_id if hasattr(event, "context_id") else None
+                    event = my_queue.get(timeout=self._timeout)
+                except queue.Empty:
+                    raise TimeoutError(f"Timed out waiting for a response for context {self._context_id}") from None
 
-                if event_ctx == self._context_id:
-                    yield event
-                    if event.type in ("done", "error"):
-                        done = True
-                        return
-                elif event_ctx is not None and event_ctx in self._connection._context_queues:
-                    self._connection._context_queues[event_ctx].put(event)
-                elif not hasattr(event, "context_id") and event.type in ("done", "error"):
-                    # Global events without context_id
-                    yield event
-                    if event.type in ("done", "error"):
-                        done = True
-                        return
-                else:
-                    # Unregistered context — yield for backwards compat
-                    yield event
-                    if event.type == "done":
-                        done = True
+                if isinstance(event, BaseException):
+                    # The reader thread stopped; the connection is no longer usable.
+                    if isinstance(event, ConnectionClosedOK):
                         return
+                    raise event
+
+                done = event.type in ("done", "error")
+                if done:
+                    self._store_in_cache(event)
+                if sink is not None:
+                    write_chunk_audio(sink, event)
+                yield event
+                if done:
+                    return
         finally:
-            # Only unregister the queue if the context completed.  If the
-            # consumer exited early (break / cancel), keep the queue so
-            # future events for this context_id are absorbed rather than
-            # leaking into other contexts via the fallback path.
-            if done:
-                self._connection._context_queues.pop(self._context_id, None)
+            # Unregister however the consumer stops, including a `break` or an exception
+            # part way through, so that the connection does not keep queueing events for
+            # a context nobody is reading.
+            self._unregister()
+
+    def _unregister(self) -> None:
+        self._connection._context_queues.pop(self._context_id, None)
+        self._connection._recordings.pop(self._context_id, None)
+
+    def _store_in_cache(self, event: RawWebsocketResponse) -> None:
+        recording = self._connection._recordings.pop(self._context_id, None)
+        if self._cache is None or self._cache_key is None or recording is None:
+            return
+        if event.type == "done":
+            self._cache.put(self._cache_key, recording)
+        self._cache_key = None
 
 
 class AsyncWebSocketContext:
@@ -828,6 +1640,7 @@ class AsyncWebSocketContext:
         max_buffer_delay_ms: Optional[int] = None,
         pronunciation_dict_id: Optional[str] = None,
         use_normalized_timestamps: Optional[bool] = None,
+        cache: Optional[TTSCache] = None,
     ):
         self._connection = connection
         self._context_id = context_id
@@ -843,6 +1656,12 @@ class AsyncWebSocketContext:
         self._max_buffer_delay_ms = max_buffer_delay_ms
         self._pronunciation_dict_id = pronunciation_dict_id
         self._use_normalized_timestamps = use_normalized_timestamps
+        self._cache = cache
+        # Requests held back until the context is finished; `None` once they have been looked up.
+        self._cache_pending: Optional[list[GenerationRequestParam]] = [] if cache is not None else None
+        self._cache_key: Optional[str] = None
+        # `push()` requests that only set `transcript` and `continue` are spliced into this.
+        self._push_template = _push_template(self._request_params(transcript="", voice=voice)) if voice else None
 
     async def send(
         self,
@@ -864,6 +1683,44 @@ class AsyncWebSocketContext:
         if self._completed:
             raise ValueError("Cannot send to completed context. Call no_more_inputs() only once per context.")
 
+        request_params = self._request_params(
+            transcript=transcript,
+            voice=voice,
+            model_id=model_id,
+            output_format=output_format,
+            continue_=continue_,
+            language=language,
+            speed=speed,
+            add_timestamps=add_timestamps,
+            add_phoneme_timestamps=add_phoneme_timestamps,
+            flush=flush,
+            generation_config=generation_config,
+            **kwargs,
+        )
+
+        if self._cache_pending is not None:
+            await self._send_cached(request_params)
+            return
+        await self._connection.send(request_params)
+        self._connection._dispatch_listener()
+
+    def _request_params(
+        self,
+        *,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        model_id: Optional[str] = None,
+        output_format: Union[RawOutputFormatParam, Mapping[str, Any], None] = None,
+        continue_: bool = True,
+        language: Union[SupportedLanguage, None, Omit] = omit,
+        speed: Optional[ModelSpeed] = None,
+        add_timestamps: Union[bool, None, Omit] = omit,
+        add_phoneme_timestamps: Union[bool, None, Omit] = omit,
+        flush: Union[bool, None, Omit] = omit,
+        generation_config: Union[GenerationConfigParam, None, Omit] = omit,
+        **kwargs: Any,
+    ) -> GenerationRequestParam:
+        """Build the request `send()` makes, filling in the context defaults."""
         # Default output format
         if output_format is not None:
             pass
@@ -939,8 +1796,25 @@ class AsyncWebSocketContext:
 
         # Add any additional kwargs
         request_params.update(cast(GenerationRequestParam, kwargs))
+        return request_params
 
-        await self._connection.send(request_params)
+    async def _send_cached(self, request_params: GenerationRequestParam) -> None:
+        assert self._cache is not None and self._cache_pending is not None
+        self._cache_pending.append(request_params)
+        if request_params.get("continue", True):
+            return
+
+        pending, self._cache_pending = self._cache_pending, None
+        key = self._cache.key("/tts/websocket", [_without_context_id(request) for request in pending])
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._connection._replay(self._context_id, entry.frames)
+            return
+
+        self._cache_key = key
+        self._connection._recordings[self._context_id] = []
+        for request in pending:
+            await self._connection.send(request)
         self._connection._dispatch_listener()
 
     async def push(
@@ -952,6 +1826,14 @@ class AsyncWebSocketContext:
         **kwargs: Any,
     ) -> None:
         """Send a generation request with continue_=True using context defaults."""
+        if self._push_template is not None and isinstance(voice, Omit) and not kwargs and self._cache_pending is None:
+            if self._completed:
+                raise ValueError("Cannot send to completed context. Call no_more_inputs() only once per context.")
+            await self._connection._send_json(
+                _render_push(self._push_template, transcript, continue_), self._context_id
+            )
+            self._connection._dispatch_listener()
+            return
 
         if not isinstance(voice, Omit):
             pass
@@ -972,9 +1854,7 @@ class AsyncWebSocketContext:
         if self._completed:
             return  # Already completed, ignore
 
-        voice: VoiceSpecifierParam = self._voice or cast(
-            VoiceSpecifierParam, "6ccbfb76-1fc6-48f7-b71d-91ac6298247b"
-        )
+        voice: VoiceSpecifierParam = self._voice or cast(VoiceSpecifierParam, "6ccbfb76-1fc6-48f7-b71d-91ac6298247b")
 
         await self.send(
             transcript="",
@@ -986,14 +1866,17 @@ class AsyncWebSocketContext:
     async def cancel(self) -> None:
         """Cancel this context, stopping any in-progress generation."""
         await self._connection.send(CancelContextRequest(cancel=True, context_id=self._context_id))
-        self._connection._context_queues.pop(self._context_id, None)
+        self._unregister()
 
-    async def receive(self) -> AsyncIterator[WebsocketResponse]:
+    async def receive(self, *, sink: Optional[AudioSink] = None) -> AsyncIterator[RawWebsocketResponse]:
         """Receive responses filtered to this context only.
 
         A background task on the connection continuously reads from the wire
         and routes events into per-context queues.  This method simply drains
         the queue for this context.
+
+        If a `sink` is given, the audio of each `chunk` event is written to it
+        before the event is yielded.
         """
         import asyncio as _asyncio
 
@@ -1001,29 +1884,37 @@ class AsyncWebSocketContext:
         if my_queue is None:
             return
 
-        done = False
-
         try:
             while True:
-                try:
-                    if self._timeout is not None:
-                        event = await _asyncio.wait_for(my_queue.get(), timeout=self._timeout)
-                    else:
-                        event = await my_queue.get()
-                except (TimeoutError, _asyncio.TimeoutError):
-                    # Before Python 3.11, asyncio.wait_for raises asyncio.TimeoutError,
-                    # which is not the builtin TimeoutError; catch both so the context
-                    # queue is always cleaned up on timeout.
-                    done = True
-                    raise
+                if self._timeout is not None:
+                    event = await _asyncio.wait_for(my_queue.get(), timeout=self._timeout)
+                else:
+                    event = await my_queue.get()
 
+                done = event.type in ("done", "error")
+                if done:
+                    self._store_in_cache(event)
+                if sink is not None:
+                    write_chunk_audio(sink, event)
                 yield event
-                if event.type in ("done", "error"):
-                    done = True
+                if done:
                     return
         finally:
-            if done:
-                self._connection._context_queues.pop(self._context_id, None)
+            # Unregister however the consumer stops, including a timeout, a `break` or an
+            # exception part way through.
+            self._unregister()
+
+    def _unregister(self) -> None:
+        self._connection._context_queues.pop(self._context_id, None)
+        self._connection._recordings.pop(self._context_id, None)
+
+    def _store_in_cache(self, event: RawWebsocketResponse) -> None:
+        recording = self._connection._recordings.pop(self._context_id, None)
+        if self._cache is None or self._cache_key is None or recording is None:
+            return
+        if event.type == "done":
+            self._cache.put(self._cache_key, recording)
+        self._cache_key = None
 
 
 class BackcompatWebSocketTtsOutput(BaseModel):
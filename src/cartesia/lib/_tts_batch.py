@@ -0,0 +1,557 @@
+from __future__ import annotations
+
+import math
+import time
+import asyncio
+import logging
+import threading
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Awaitable,
+    Generator,
+    AsyncIterator,
+    AsyncGenerator,
+)
+from typing_extensions import Literal
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .._types import not_given
+from .._models import FinalRequestOptions
+from .._exceptions import APIStatusError, APIConnectionError, TTSGenerationError
+from ..types.tts_generate_params import TTSGenerateParams
+
+if TYPE_CHECKING:
+    from ._tts import WebSocketContext, AsyncWebSocketContext
+    from .._client import Cartesia, AsyncCartesia
+    from ._tts_pool import TTSConnectionPool, AsyncTTSConnectionPool
+
+__all__ = ["BatchResult", "BatchStats", "BatchGeneration", "AsyncBatchGeneration"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+Transport = Literal["http", "websocket"]
+
+
+class BatchResult:
+    """The outcome of one request in a `tts.batch_generate()` run.
+
+    `index` is the request's position in the input. Exactly one of `audio` and `error` is
+    set. `latency` is the time in seconds from the first attempt until the request
+    finished, including any retries.
+    """
+
+    __slots__ = ("index", "request", "audio", "error", "latency", "attempts")
+
+    def __init__(
+        self,
+        index: int,
+        request: TTSGenerateParams,
+        *,
+        audio: Optional[bytes] = None,
+        error: Optional[Exception] = None,
+        latency: float,
+        attempts: int,
+    ) -> None:
+        self.index = index
+        self.request = request
+        self.audio = audio
+        self.error = error
+        self.latency = latency
+        self.attempts = attempts
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"{len(self.audio)} bytes" if self.audio is not None else repr(self.error)
+        return f"BatchResult(index={self.index}, {outcome}, latency={self.latency:.3f}s, attempts={self.attempts})"
+
+
+class BatchStats:
+    """Running totals for a `tts.batch_generate()` run, updated as each result is yielded."""
+
+    def __init__(self) -> None:
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+        self.audio_bytes = 0
+        self.latencies: List[float] = []
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started, or its total duration once it has finished."""
+        if self._started is None:
+            return 0.0
+        end = self._finished if self._finished is not None else time.monotonic()
+        return end - self._started
+
+    @property
+    def requests_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def audio_bytes_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.audio_bytes / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Per-request latency at `percentile` (0-100), in seconds, using the nearest-rank method."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def _start(self) -> None:
+        if self._started is None:
+            self._started = time.monotonic()
+
+    def _finish(self) -> None:
+        if self._finished is None and self._started is not None:
+            self._finished = time.monotonic()
+
+    def _record(self, result: BatchResult) -> None:
+        if result.error is None:
+            self.succeeded += 1
+            self.audio_bytes += len(result.audio or b"")
+        else:
+            self.failed += 1
+        self.retries += result.attempts - 1
+        self.latencies.append(result.latency)
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchStats(completed={self.completed}, failed={self.failed}, retries={self.retries}, "
+            f"requests_per_second={self.requests_per_second:.1f}, "
+            f"p50={self.latency_percentile(50):.3f}s, p95={self.latency_percentile(95):.3f}s)"
+        )
+
+
+class _RetryGate:
+    """A pause shared by every worker in a run.
+
+    A 429 means the account as a whole is over its limit, so rather than have each worker
+    keep hammering the API, the whole batch waits out the `Retry-After` period.
+    """
+
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(self._resume_at - time.monotonic(), 0.0)
+
+
+def _retry_delay(
+    client: Union[Cartesia, AsyncCartesia], error: Exception, *, path: str, remaining: int, max_retries: int
+) -> Optional[float]:
+    """Seconds to wait before retrying after `error`, or `None` if the request should not be retried.
+
+    Follows the same rules as the client's own retries: `x-should-retry`, 408/409/429/5xx and
+    connection errors are retried, honouring `Retry-After` with exponential backoff otherwise.
+    """
+    if remaining <= 0:
+        return None
+    headers = None
+    if isinstance(error, APIStatusError):
+        if not client._should_retry(error.response):
+            return None
+        headers = error.response.headers
+    elif isinstance(error, TTSGenerationError):
+        if error.status_code is None or not (error.status_code == 429 or error.status_code >= 500):
+            return None
+    elif not isinstance(error, APIConnectionError):
+        return None
+    options = FinalRequestOptions.construct(method="post", url=path, max_retries=max_retries)
+    return client._calculate_retry_timeout(remaining, options, headers)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429
+    return isinstance(error, TTSGenerationError) and error.status_code == 429
+
+
+# `tts.generate()` parameters that the WebSocket API does not accept.
+_HTTP_ONLY_PARAMS = ("save", "locale", "normalization")
+
+
+def _split_websocket_request(request: TTSGenerateParams) -> Tuple[str, Any, Dict[str, Any]]:
+    params: Dict[str, Any] = {key: value for key, value in request.items() if key not in _HTTP_ONLY_PARAMS}
+    return params.pop("transcript"), params.pop("voice"), params
+
+
+def _raise_for_error_event(event: Any) -> None:
+    """Raise the `error` event a context ended with, if it ended with one."""
+    if event is not None:
+        raise TTSGenerationError(
+            getattr(event, "message", None) or "Generation failed",
+            status_code=getattr(event, "status_code", None),
+            event=event,
+        )
+
+
+class BatchGeneration:
+    """Results of `tts.batch_generate()`, yielded as requests finish.
+
+    Iterating drives the run: at most `concurrency` requests are in flight and requests are
+    read from the input lazily, so very large batches don't need to fit in memory. `stats`
+    is updated as each result is yielded. Closing the iterator (or leaving its `with` block)
+    abandons any requests still in flight.
+    """
+
+    def __init__(
+        self,
+        client: Cartesia,
+        requests: Iterable[TTSGenerateParams],
+        *,
+        concurrency: int,
+        transport: Transport,
+        ordered: bool,
+        max_retries: int,
+        connections: int,
+        timeout: Optional[float],
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if transport not in ("http", "websocket"):
+            raise ValueError(f"Unknown transport {transport!r}; expected 'http' or 'websocket'")
+        self._client = client
+        self._requests = requests
+        self._concurrency = concurrency
+        self._transport = transport
+        self._ordered = ordered
+        self._max_retries = max_retries
+        self._connections = connections
+        self._timeout = timeout
+        self._gate = _RetryGate()
+        self.stats = BatchStats()
+        self._results = self._run()
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        return self
+
+    def __next__(self) -> BatchResult:
+        return next(self._results)
+
+    def __enter__(self) -> BatchGeneration:
+        return self
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the run, abandoning any requests still in flight."""
+        self._results.close()
+
+    def _run(self) -> Generator[BatchResult, None, None]:
+        pool: Optional[TTSConnectionPool] = None
+        if self._transport == "websocket":
+            pool = self._client.tts.websocket_pool(
+                size=self._connections,
+                max_contexts_per_connection=math.ceil(self._concurrency / self._connections),
+            ).enter()
+            execute: Callable[[TTSGenerateParams], bytes] = lambda request: self._generate_websocket(pool, request)  # noqa: E731
+            path = "/tts/websocket"
+        else:
+            # Retries are handled per request below, so they can be coordinated across the batch.
+            http = self._client.with_options(max_retries=0)
+            timeout = self._timeout if self._timeout is not None else not_given
+            execute = lambda request: http.tts.generate(**request, timeout=timeout).read()  # noqa: E731
+            path = "/tts/bytes"
+
+        # Cap the number of requests that have been read from the input but not yet yielded,
+        # so that a slow request at the head of an ordered run can't make the buffer grow without bound.
+        window = self._concurrency * 2
+        requests = enumerate(self._requests)
+        executor = ThreadPoolExecutor(self._concurrency, thread_name_prefix="cartesia-tts-batch")
+        in_flight: Dict[Future[BatchResult], int] = {}
+        buffered: Dict[int, BatchResult] = {}
+        next_index = 0
+        exhausted = False
+        self.stats._start()
+        try:
+            while True:
+                while not exhausted and len(in_flight) + len(buffered) < window:
+                    item = next(requests, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, request = item
+                    future = executor.submit(self._run_one, execute, path, index, request)
+                    in_flight[future] = index
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                ready: List[BatchResult] = []
+                for future in done:
+                    del in_flight[future]
+                    result = future.result()
+                    if self._ordered:
+                        buffered[result.index] = result
+                    else:
+                        ready.append(result)
+                while next_index in buffered:
+                    ready.append(buffered.pop(next_index))
+                    next_index += 1
+                for result in ready:
+                    self.stats._record(result)
+                    yield result
+        finally:
+            self.stats._finish()
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            if pool is not None:
+                pool.close()
+
+    def _run_one(
+        self, execute: Callable[[TTSGenerateParams], bytes], path: str, index: int, request: TTSGenerateParams
+    ) -> BatchResult:
+        start = time.monotonic()
+        attempts = 0
+        while True:
+            pause = self._gate.remaining()
+            if pause:
+                time.sleep(pause)
+            attempts += 1
+            try:
+                audio = execute(request)
+            except Exception as exc:
+                delay = _retry_delay(
+                    self._client,
+                    exc,
+                    path=path,
+                    remaining=self._max_retries - attempts + 1,
+                    max_retries=self._max_retries,
+                )
+                if delay is None:
+                    return BatchResult(index, request, error=exc, latency=time.monotonic() - start, attempts=attempts)
+                log.info("Retrying batch request %d in %f seconds", index, delay)
+                if _is_rate_limited(exc):
+                    self._gate.pause(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            return BatchResult(index, request, audio=audio, latency=time.monotonic() - start, attempts=attempts)
+
+    def _generate_websocket(self, pool: TTSConnectionPool, request: TTSGenerateParams) -> bytes:
+        transcript, voice, params = _split_websocket_request(request)
+        ctx: WebSocketContext = pool.context(timeout=self._timeout)
+        ctx.send(transcript=transcript, voice=voice, continue_=False, **params)
+        audio = bytearray()
+        error: Any = None
+        # `receive()` ends after the `error` event and unregisters the context, so the error is
+        # raised only once the loop has finished rather than leaving the context on the connection.
+        for event in ctx.receive():
+            if event.type == "error":
+                error = event
+            elif event.type == "chunk" and event.audio:
+                audio += event.audio
+        _raise_for_error_event(error)
+        return bytes(audio)
+
+
+class AsyncBatchGeneration:
+    """Results of `tts.batch_generate()`, yielded as requests finish.
+
+    Iterating drives the run: at most `concurrency` requests are in flight and requests are
+    read from the input lazily, so very large batches don't need to fit in memory. `stats`
+    is updated as each result is yielded. Closing the iterator (or leaving its `async with`
+    block) cancels any requests still in flight.
+    """
+
+    def __init__(
+        self,
+        client: AsyncCartesia,
+        requests: Iterable[TTSGenerateParams],
+        *,
+        concurrency: int,
+        transport: Transport,
+        ordered: bool,
+        max_retries: int,
+        connections: int,
+        timeout: Optional[float],
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if transport not in ("http", "websocket"):
+            raise ValueError(f"Unknown transport {transport!r}; expected 'http' or 'websocket'")
+        self._client = client
+        self._requests = requests
+        self._concurrency = concurrency
+        self._transport = transport
+        self._ordered = ordered
+        self._max_retries = max_retries
+        self._connections = connections
+        self._timeout = timeout
+        self._gate = _RetryGate()
+        self.stats = BatchStats()
+        self._results = self._run()
+
+    def __aiter__(self) -> AsyncIterator[BatchResult]:
+        return self
+
+    async def __anext__(self) -> BatchResult:
+        return await self._results.__anext__()
+
+    async def __aenter__(self) -> AsyncBatchGeneration:
+        return self
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the run, cancelling any requests still in flight."""
+        await self._results.aclose()
+
+    async def _run(self) -> AsyncGenerator[BatchResult, None]:
+        pool: Optional[AsyncTTSConnectionPool] = None
+        execute: Callable[[TTSGenerateParams], Awaitable[bytes]]
+        if self._transport == "websocket":
+            pool = await self._client.tts.websocket_pool(
+                size=self._connections,
+                max_contexts_per_connection=math.ceil(self._concurrency / self._connections),
+            ).enter()
+            websocket_pool = pool
+
+            async def execute(request: TTSGenerateParams) -> bytes:
+                return await self._generate_websocket(websocket_pool, request)
+
+            path = "/tts/websocket"
+        else:
+            # Retries are handled per request below, so they can be coordinated across the batch.
+            http = self._client.with_options(max_retries=0)
+            timeout = self._timeout if self._timeout is not None else not_given
+
+            async def execute(request: TTSGenerateParams) -> bytes:
+                response = await http.tts.generate(**request, timeout=timeout)
+                return await response.read()
+
+            path = "/tts/bytes"
+
+        window = self._concurrency * 2
+        requests = enumerate(self._requests)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        in_flight: Dict[asyncio.Task[BatchResult], int] = {}
+        buffered: Dict[int, BatchResult] = {}
+        next_index = 0
+        exhausted = False
+        self.stats._start()
+        try:
+            while True:
+                while not exhausted and len(in_flight) + len(buffered) < window:
+                    item = next(requests, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, request = item
+                    task = asyncio.ensure_future(self._run_one(semaphore, execute, path, index, request))
+                    in_flight[task] = index
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                ready: List[BatchResult] = []
+                for task in done:
+                    del in_flight[task]
+                    result = task.result()
+                    if self._ordered:
+                        buffered[result.index] = result
+                    else:
+                        ready.append(result)
+                while next_index in buffered:
+                    ready.append(buffered.pop(next_index))
+                    next_index += 1
+                for result in ready:
+                    self.stats._record(result)
+                    yield result
+        finally:
+            self.stats._finish()
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            if pool is not None:
+                await pool.close()
+
+    async def _run_one(
+        self,
+        semaphore: asyncio.Semaphore,
+        execute: Callable[[TTSGenerateParams], Awaitable[bytes]],
+        path: str,
+        index: int,
+        request: TTSGenerateParams,
+    ) -> BatchResult:
+        async with semaphore:
+            start = time.monotonic()
+            attempts = 0
+            while True:
+                pause = self._gate.remaining()
+                if pause:
+                    await asyncio.sleep(pause)
+                attempts += 1
+                try:
+                    audio = await execute(request)
+                except Exception as exc:
+                    delay = _retry_delay(
+                        self._client,
+                        exc,
+                        path=path,
+                        remaining=self._max_retries - attempts + 1,
+                        max_retries=self._max_retries,
+                    )
+                    if delay is None:
+                        return BatchResult(
+                            index, request, error=exc, latency=time.monotonic() - start, attempts=attempts
+                        )
+                    log.info("Retrying batch request %d in %f seconds", index, delay)
+                    if _is_rate_limited(exc):
+                        self._gate.pause(delay)
+                    else:
+                        await asyncio.sleep(delay)
+                    continue
+                return BatchResult(index, request, audio=audio, latency=time.monotonic() - start, attempts=attempts)
+
+    async def _generate_websocket(self, pool: AsyncTTSConnectionPool, request: TTSGenerateParams) -> bytes:
+        transcript, voice, params = _split_websocket_request(request)
+        ctx: AsyncWebSocketContext = pool.context(timeout=self._timeout)
+        await ctx.send(transcript=transcript, voice=voice, continue_=False, **params)
+        audio = bytearray()
+        error: Any = None
+        # `receive()` ends after the `error` event and unregisters the context, so the error is
+        # raised only once the loop has finished rather than leaving the context on the connection.
+        async for event in ctx.receive():
+            if event.type == "error":
+                error = event
+            elif event.type == "chunk" and event.audio:
+                audio += event.audio
+        _raise_for_error_event(error)
+        return bytes(audio)
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import os
+import json
+import mmap
+import time
+import struct
+import hashlib
+import tempfile
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Mapping,
+    TypeVar,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    AsyncIterator,
+)
+from collections import OrderedDict
+
+import httpx
+
+from .._models import FinalRequestOptions
+from ._audio_sink import Buffer
+
+if TYPE_CHECKING:
+    from .._response import BaseAPIResponse
+    from .._base_client import BaseClient
+
+__all__ = ["TTSCache", "CacheEntry"]
+
+_R = TypeVar("_R", bound="BaseAPIResponse[Any]")
+
+_MAGIC = b"CTC1"
+_U32 = struct.Struct("<I")
+_SUFFIX = ".tts"
+
+
+class CacheEntry:
+    """A cached generation: the response frames in the order they arrived, plus response headers.
+
+    For `tts.generate()` the frames are chunks of the response body, for `tts.generate_sse()`
+    chunks of the event stream and for WebSocket contexts the raw WebSocket messages.
+    """
+
+    __slots__ = ("frames", "headers", "size")
+
+    def __init__(self, frames: Sequence[Buffer], headers: Optional[Mapping[str, str]] = None) -> None:
+        self.frames = frames
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.size = sum(len(frame) for frame in frames)
+
+
+class TTSCache:
+    """Content-addressed cache of TTS generations.
+
+    Entries are keyed on a hash of the request body, so identical requests for the same
+    transcript, voice, model and output format are served without calling the API. Hits
+    are replayed frame by frame, so a cached generation streams like a live one.
+
+    Entries are kept in memory, evicting the least recently used once `max_bytes` is
+    exceeded. Pass `directory` to also keep entries on disk, where they survive restarts
+    and are read back through a memory map; `max_disk_bytes` bounds the directory by
+    deleting the oldest entries. Entries older than `ttl` seconds are treated as misses
+    in both tiers.
+
+    A cache can be shared between threads and between `tts.generate()`, `tts.generate_sse()`
+    and WebSocket contexts.
+
+    ```py
+    cache = TTSCache(max_bytes=256 * 1024 * 1024, ttl=24 * 60 * 60, directory=".tts-cache")
+    response = client.tts.generate(..., cache=cache)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        directory: Union[str, "os.PathLike[str]", None] = None,
+        max_disk_bytes: Optional[int] = None,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._directory = os.fspath(directory) if directory is not None else None
+        self._max_disk_bytes = max_disk_bytes
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+
+        # key -> (entry, monotonic expiry time or None)
+        self._entries: OrderedDict[str, Tuple[CacheEntry, Optional[float]]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path: str, body: Any, extra_body: Any = None) -> str:
+        """The cache key of a request to `path` with JSON `body`, plus any `extra_body` merged into it."""
+        if extra_body:
+            body = {**body, **extra_body}
+        canonical = json.dumps(
+            {"path": path, "body": body}, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the in-memory tier."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up `key`, returning `None` on a miss."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                if self._expired(item[1]):
+                    self._remove(key)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return item[0]
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store(key, entry)
+        return entry
+
+    def put(self, key: str, frames: Sequence[Buffer], headers: Optional[Mapping[str, str]] = None) -> None:
+        """Store a completed generation under `key`."""
+        entry = CacheEntry([bytes(frame) for frame in frames], headers)
+        with self._lock:
+            self._store(key, entry)
+        if self._directory is not None:
+            self._write_disk(key, entry)
+
+    def discard(self, key: str) -> None:
+        """Remove `key` from both tiers."""
+        with self._lock:
+            self._remove(key)
+        path = self._disk_path(key)
+        if path is not None:
+            _unlink(path)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        for path, _size, _mtime in self._disk_files():
+            _unlink(path)
+
+    # -- memory tier -------------------------------------------------------
+
+    def _expired(self, expires: Optional[float]) -> bool:
+        return expires is not None and time.monotonic() >= expires
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._remove(key)
+        if entry.size > self._max_bytes:
+            return
+        expires = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._entries[key] = (entry, expires)
+        self._size += entry.size
+        while self._size > self._max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+    def _remove(self, key: str) -> None:
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self._size -= item[0].size
+
+    # -- disk tier ---------------------------------------------------------
+    #
+    # Each entry is one file: magic, u32 header length, JSON headers, u32 frame count,
+    # then a u32 length prefix before each frame. Files are written to a temporary name
+    # and renamed into place, so readers never see a partial entry.
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if self._directory is None:
+            return None
+        return os.path.join(self._directory, key + _SUFFIX)
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as file:
+                if self._ttl is not None and time.time() - os.fstat(file.fileno()).st_mtime >= self._ttl:
+                    _unlink(path)
+                    return None
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            return _decode_entry(memoryview(mapped))
+        except (ValueError, struct.error):
+            _unlink(path)
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        assert self._directory is not None
+        header = json.dumps(entry.headers).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_MAGIC + _U32.pack(len(header)) + header + _U32.pack(len(entry.frames)))
+                for frame in entry.frames:
+                    file.write(_U32.pack(len(frame)))
+                    file.write(frame)
+            os.replace(tmp, os.path.join(self._directory, key + _SUFFIX))
+        except BaseException:
+            _unlink(tmp)
+            raise
+        if self._max_disk_bytes is not None:
+            self._evict_disk(self._max_disk_bytes)
+
+    def _disk_files(self) -> List[Tuple[str, int, float]]:
+        if self._directory is None:
+            return []
+        files = []
+        with os.scandir(self._directory) as it:
+            for item in it:
+                if item.name.endswith(_SUFFIX):
+                    try:
+                        stat = item.stat()
+                    except OSError:
+                        continue
+                    files.append((item.path, stat.st_size, stat.st_mtime))
+        return files
+
+    def _evict_disk(self, budget: int) -> None:
+        files = sorted(self._disk_files(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        for path, size, _ in files:
+            if total <= budget:
+                break
+            _unlink(path)
+            total -= size
+
+
+def _decode_entry(data: memoryview) -> CacheEntry:
+    if bytes(data[:4]) != _MAGIC:
+        raise ValueError("Not a cache entry")
+    offset = 4
+    (header_len,) = _U32.unpack_from(data, offset)
+    offset += 4
+    headers = json.loads(bytes(data[offset : offset + header_len]))
+    offset += header_len
+    (count,) = _U32.unpack_from(data, offset)
+    offset += 4
+    frames: List[Buffer] = []
+    for _ in range(count):
+        (length,) = _U32.unpack_from(data, offset)
+        offset += 4
+        if offset + length > len(data):
+            raise ValueError("Truncated cache entry")
+        # Views into the memory map; the mapping stays open as long as the entry is referenced.
+        frames.append(data[offset : offset + length])
+        offset += length
+    return CacheEntry(frames, headers)
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Serves a cached entry's frames as an httpx response body."""
+
+    def __init__(self, frames: Sequence[Buffer]) -> None:
+        self._frames = frames
+
+    def __iter__(self) -> Iterator[bytes]:
+        for frame in self._frames:
+            yield bytes(frame)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for frame in self._frames:
+            yield bytes(frame)
+
+
+class _RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Passes a response body through, calling `on_complete` with its chunks if it is read to the end."""
+
+    def __init__(self, stream: Any, on_complete: Callable[[List[bytes]], None]) -> None:
+        self._stream = stream
+        self._on_complete = on_complete
+
+    def __iter__(self) -> Iterator[bytes]:
+        frames: List[bytes] = []
+        for chunk in self._stream:
+            frames.append(chunk)
+            yield chunk
+        self._on_complete(frames)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        frames: List[bytes] = []
+        async for chunk in self._stream:
+            frames.append(chunk)
+            yield chunk
+        self._on_complete(frames)
+
+    def close(self) -> None:
+        self._stream.close()
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+def replay_response(client: "BaseClient[Any, Any]", path: str, entry: CacheEntry) -> httpx.Response:
+    """An `httpx.Response` whose body streams a cached entry's frames."""
+    return httpx.Response(
+        200,
+        headers=entry.headers,
+        stream=_ReplayStream(entry.frames),
+        request=httpx.Request("POST", client._prepare_url(path)),
+    )
+
+
+def record_response(
+    cache: TTSCache,
+    key: str,
+    response: httpx.Response,
+    *,
+    validate: Optional[Callable[[List[bytes]], bool]] = None,
+) -> None:
+    """Store `response`'s body under `key` once it has been read to the end, if `validate` accepts it."""
+    headers = cacheable_headers(response.headers)
+
+    def on_complete(frames: List[bytes]) -> None:
+        if validate is None or validate(frames):
+            cache.put(key, frames, headers)
+
+    response.stream = _RecordingStream(response.stream, on_complete)
+
+
+def cacheable_headers(headers: httpx.Headers) -> Dict[str, str]:
+    content_type = headers.get("content-type")
+    return {"content-type": content_type} if content_type else {}
+
+
+def sse_succeeded(frames: Sequence[Buffer]) -> bool:
+    """Whether a recorded event stream is free of `error` events and so worth caching."""
+    for line in b"".join(frames).splitlines():
+        if line.startswith(b"data:") and b'"error"' in line:
+            try:
+                if json.loads(line[5:]).get("type") == "error":
+                    return False
+            except ValueError:
+                return False
+    return True
+
+
+def replay_binary_response(client: "BaseClient[Any, Any]", path: str, entry: CacheEntry, response_cls: Type[_R]) -> _R:
+    """A `BinaryAPIResponse` (or async variant) that streams a cached entry as if it came from `path`."""
+    return response_cls(
+        raw=replay_response(client, path, entry),
+        cast_to=bytes,
+        client=client,
+        stream=False,
+        stream_cls=None,
+        options=FinalRequestOptions.construct(method="post", url=path),
+    )
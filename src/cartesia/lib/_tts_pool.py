@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, List, Union, Mapping, Optional, cast
+
+from ._tts import (
+    WebSocketContext,
+    AsyncWebSocketContext,
+    TTSResourceConnection,
+    AsyncTTSResourceConnection,
+    TTSResourceConnectionManager,
+    AsyncTTSResourceConnectionManager,
+)
+from .._types import Query, Headers
+from .._exceptions import CartesiaError
+from ..types.supported_language import SupportedLanguage
+from ..types.voice_specifier_param import VoiceSpecifierParam
+from ..types.generation_config_param import GenerationConfigParam
+from ..types.raw_output_format_param import RawOutputFormatParam
+from ..types.websocket_connection_options import WebsocketConnectionOptions
+
+if TYPE_CHECKING:
+    from .._client import Cartesia, AsyncCartesia
+
+__all__ = ["TTSConnectionPool", "AsyncTTSConnectionPool"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+
+def _is_open(connection: Union[TTSResourceConnection, AsyncTTSResourceConnection]) -> bool:
+    from websockets.protocol import State
+
+    return connection._connection.state not in (State.CLOSED, State.CLOSING)
+
+
+def _load(connection: Union[TTSResourceConnection, AsyncTTSResourceConnection]) -> int:
+    return len(connection._context_queues)
+
+
+def _close_quietly(connection: TTSResourceConnection) -> None:
+    try:
+        connection.close()
+    except Exception:
+        log.debug("Failed to close pooled connection", exc_info=True)
+
+
+async def _aclose_quietly(connection: AsyncTTSResourceConnection) -> None:
+    try:
+        await connection.close()
+    except Exception:
+        log.debug("Failed to close pooled connection", exc_info=True)
+
+
+class TTSConnectionPool:
+    """
+    A fixed-size pool of TTS WebSocket connections that is returned by `tts.websocket_pool()`.
+
+    Every call to `.context()` is placed on the open connection with the fewest active
+    contexts, up to `max_contexts_per_connection` per socket. A background thread
+    replaces sockets that have closed so the pool stays warm.
+
+    ```py
+    with client.tts.websocket_pool(size=4) as pool:
+        ctx = pool.context(model_id="sonic-latest", voice="6ccbfb76-1fc6-48f7-b71d-91ac6298247b")
+        ctx.push("Hello, world!")
+        ctx.no_more_inputs()
+        for event in ctx.receive():
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Cartesia,
+        size: int,
+        max_contexts_per_connection: int,
+        health_check_interval: Optional[float],
+        extra_query: Query,
+        extra_headers: Headers,
+        websocket_connection_options: WebsocketConnectionOptions,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_contexts_per_connection < 1:
+            raise ValueError("max_contexts_per_connection must be at least 1")
+
+        self._client = client
+        self._size = size
+        self._max_contexts_per_connection = max_contexts_per_connection
+        self._health_check_interval = health_check_interval
+        self._extra_query = extra_query
+        self._extra_headers = extra_headers
+        self._websocket_connection_options = websocket_connection_options
+        self._raw_audio = raw_audio
+        self._fast_parse = fast_parse
+        self._connections: List[TTSResourceConnection] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> TTSConnectionPool:
+        """
+        Open every connection in the pool.
+
+        **Warning**: You must remember to close the pool with `.close()` if you call this directly.
+        """
+        with self._lock:
+            if self._connections:
+                return self
+            self._stop.clear()
+            connections: List[TTSResourceConnection] = []
+            try:
+                for _ in range(self._size):
+                    connections.append(self._connect())
+            except BaseException:
+                # the pool was never entered, so `close()` would not close these
+                for connection in connections:
+                    _close_quietly(connection)
+                raise
+            self._connections = connections
+
+        if self._health_check_interval is not None:
+            self._health_thread = threading.Thread(
+                target=self._health_loop, name="cartesia-tts-pool-health", daemon=True
+            )
+            self._health_thread.start()
+
+        return self
+
+    enter = __enter__
+
+    def __exit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    @property
+    def connections(self) -> List[TTSResourceConnection]:
+        """A snapshot of the pooled connections."""
+        with self._lock:
+            return list(self._connections)
+
+    def context(
+        self,
+        context_id: Optional[str] = None,
+        *,
+        timeout: Optional[float] = None,
+        model_id: Optional[str] = None,
+        voice: Optional[VoiceSpecifierParam] = None,
+        output_format: Union[RawOutputFormatParam, Mapping[str, Any], None] = None,
+        language: Optional[SupportedLanguage] = None,
+        add_timestamps: Optional[bool] = None,
+        add_phoneme_timestamps: Optional[bool] = None,
+        generation_config: Optional[GenerationConfigParam] = None,
+        max_buffer_delay_ms: Optional[int] = None,
+        pronunciation_dict_id: Optional[str] = None,
+        use_normalized_timestamps: Optional[bool] = None,
+    ) -> WebSocketContext:
+        """Create a context on the least-loaded open connection.
+
+        Accepts the same arguments as `TTSResourceConnection.context()`.
+
+        Raises `CartesiaError` if the pool has not been entered, if no connection is
+        currently open, or if every open connection is at `max_contexts_per_connection`.
+        """
+        with self._lock:
+            connection = self._pick_connection()
+            return connection.context(
+                context_id,
+                timeout=timeout,
+                model_id=model_id,
+                voice=voice,
+                output_format=output_format,
+                language=language,
+                add_timestamps=add_timestamps,
+                add_phoneme_timestamps=add_phoneme_timestamps,
+                generation_config=generation_config,
+                max_buffer_delay_ms=max_buffer_delay_ms,
+                pronunciation_dict_id=pronunciation_dict_id,
+                use_normalized_timestamps=use_normalized_timestamps,
+            )
+
+    def close(self) -> None:
+        """Stop the background health check and close every pooled connection."""
+        self._stop.set()
+        if self._health_thread is not None:
+            self._health_thread.join()
+            self._health_thread = None
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            _close_quietly(connection)
+
+    def _pick_connection(self) -> TTSResourceConnection:
+        if not self._connections:
+            raise CartesiaError("The connection pool is not open. Call `.enter()` or use it as a context manager.")
+
+        candidates = [connection for connection in self._connections if _is_open(connection)]
+        if not candidates:
+            raise CartesiaError("No pooled connection is currently open.")
+
+        connection = min(candidates, key=_load)
+        if _load(connection) >= self._max_contexts_per_connection:
+            raise CartesiaError(
+                f"All {len(candidates)} open connections are at max_contexts_per_connection="
+                f"{self._max_contexts_per_connection}."
+            )
+        return connection
+
+    def _connect(self) -> TTSResourceConnection:
+        return TTSResourceConnectionManager(
+            client=self._client,
+            extra_query=self._extra_query,
+            extra_headers=self._extra_headers,
+            websocket_connection_options=self._websocket_connection_options,
+            raw_audio=self._raw_audio,
+            fast_parse=self._fast_parse,
+        ).enter()
+
+    def _replace_closed(self) -> None:
+        """Open a new socket for every pooled connection that has closed."""
+        with self._lock:
+            closed = [connection for connection in self._connections if not _is_open(connection)]
+
+        for old in closed:
+            if self._stop.is_set():
+                return
+            try:
+                new = self._connect()
+            except Exception:
+                log.warning("Failed to replace closed pooled connection", exc_info=True)
+                continue
+
+            with self._lock:
+                if self._stop.is_set() or old not in self._connections:
+                    new.close()
+                    continue
+                self._connections[self._connections.index(old)] = new
+            log.debug("Replaced closed pooled connection")
+
+    def _health_loop(self) -> None:
+        assert self._health_check_interval is not None
+        while not self._stop.wait(self._health_check_interval):
+            self._replace_closed()
+
+
+class AsyncTTSConnectionPool:
+    """
+    A fixed-size pool of TTS WebSocket connections that is returned by `tts.websocket_pool()`.
+
+    Every call to `.context()` is placed on the open connection with the fewest active
+    contexts, up to `max_contexts_per_connection` per socket. A background task
+    replaces sockets that have closed so the pool stays warm.
+
+    ```py
+    async with client.tts.websocket_pool(size=4) as pool:
+        ctx = pool.context(model_id="sonic-latest", voice="6ccbfb76-1fc6-48f7-b71d-91ac6298247b")
+        await ctx.push("Hello, world!")
+        await ctx.no_more_inputs()
+        async for event in ctx.receive():
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AsyncCartesia,
+        size: int,
+        max_contexts_per_connection: int,
+        health_check_interval: Optional[float],
+        extra_query: Query,
+        extra_headers: Headers,
+        websocket_connection_options: WebsocketConnectionOptions,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_contexts_per_connection < 1:
+            raise ValueError("max_contexts_per_connection must be at least 1")
+
+        self._client = client
+        self._size = size
+        self._max_contexts_per_connection = max_contexts_per_connection
+        self._health_check_interval = health_check_interval
+        self._extra_query = extra_query
+        self._extra_headers = extra_headers
+        self._websocket_connection_options = websocket_connection_options
+        self._raw_audio = raw_audio
+        self._fast_parse = fast_parse
+        self._connections: List[AsyncTTSResourceConnection] = []
+        self._lock = asyncio.Lock()
+        self._closing = False
+        self._health_task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> AsyncTTSConnectionPool:
+        """
+        Open every connection in the pool.
+
+        **Warning**: You must remember to close the pool with `.close()` if you call this directly.
+        """
+        async with self._lock:
+            if self._connections:
+                return self
+            self._closing = False
+            results = await asyncio.gather(*(self._connect() for _ in range(self._size)), return_exceptions=True)
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                # the pool was never entered, so `close()` would not close the ones that opened
+                for result in results:
+                    if isinstance(result, AsyncTTSResourceConnection):
+                        await _aclose_quietly(result)
+                raise errors[0]
+            self._connections = cast(List[AsyncTTSResourceConnection], results)
+
+        if self._health_check_interval is not None:
+            self._health_task = asyncio.create_task(self._health_loop())
+
+        return self
+
+    enter = __aenter__
+
+    async def __aexit__(
+        self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException], exc_tb: Optional[TracebackType]
+    ) -> None:
+        await self.close()
+
+    @property
+    def connections(self) -> List[AsyncTTSResourceConnection]:
+        """A snapshot of the pooled connections."""
+        return list(self._connections)
+
+    def context(
+        self,
+        context_id: Optional[str] = None,
+        *,
+        timeout: Optional[float] = None,
+        model_id: Optional[str] = None,
+        voice: Optional[VoiceSpecifierParam] = None,
+        output_format: Union[RawOutputFormatParam, Mapping[str, Any], None] = None,
+        language: Optional[SupportedLanguage] = None,
+        add_timestamps: Optional[bool] = None,
+        add_phoneme_timestamps: Optional[bool] = None,
+        generation_config: Optional[GenerationConfigParam] = None,
+        max_buffer_delay_ms: Optional[int] = None,
+        pronunciation_dict_id: Optional[str] = None,
+        use_normalized_timestamps: Optional[bool] = None,
+    ) -> AsyncWebSocketContext:
+        """Create a context on the least-loaded open connection.
+
+        Accepts the same arguments as `AsyncTTSResourceConnection.context()`.
+
+        Raises `CartesiaError` if the pool has not been entered, if no connection is
+        currently open, or if every open connection is at `max_contexts_per_connection`.
+        """
+        connection = self._pick_connection()
+        return connection.context(
+            context_id,
+            timeout=timeout,
+            model_id=model_id,
+            voice=voice,
+            output_format=output_format,
+            language=language,
+            add_timestamps=add_timestamps,
+            add_phoneme_timestamps=add_phoneme_timestamps,
+            generation_config=generation_config,
+            max_buffer_delay_ms=max_buffer_delay_ms,
+            pronunciation_dict_id=pronunciation_dict_id,
+            use_normalized_timestamps=use_normalized_timestamps,
+        )
+
+    async def close(self) -> None:
+        """Stop the background health check and close every pooled connection."""
+        self._closing = True
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+
+        async with self._lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            await _aclose_quietly(connection)
+
+    def _pick_connection(self) -> AsyncTTSResourceConnection:
+        if not self._connections:
+            raise CartesiaError("The connection pool is not open. Call `.enter()` or use it as a context manager.")
+
+        candidates = [connection for connection in self._connections if _is_open(connection)]
+        if not candidates:
+            raise CartesiaError("No pooled connection is currently open.")
+
+        connection = min(candidates, key=_load)
+        if _load(connection) >= self._max_contexts_per_connection:
+            raise CartesiaError(
+                f"All {len(candidates)} open connections are at max_contexts_per_connection="
+                f"{self._max_contexts_per_connection}."
+            )
+        return connection
+
+    async def _connect(self) -> AsyncTTSResourceConnection:
+        return await AsyncTTSResourceConnectionManager(
+            client=self._client,
+            extra_query=self._extra_query,
+            extra_headers=self._extra_headers,
+            websocket_connection_options=self._websocket_connection_options,
+            raw_audio=self._raw_audio,
+            fast_parse=self._fast_parse,
+        ).enter()
+
+    async def _replace_closed(self) -> None:
+        """Open a new socket for every pooled connection that has closed."""
+        closed = [connection for connection in self._connections if not _is_open(connection)]
+
+        for old in closed:
+            if self._closing:
+                return
+            try:
+                new = await self._connect()
+            except Exception:
+                log.warning("Failed to replace closed pooled connection", exc_info=True)
+                continue
+
+            async with self._lock:
+                if self._closing or old not in self._connections:
+                    await new.close()
+                    continue
+                self._connections[self._connections.index(old)] = new
+            log.debug("Replaced closed pooled connection")
+
+    async def _health_loop(self) -> None:
+        assert self._health_check_interval is not None
+        while True:
+            await asyncio.sleep(self._health_check_interval)
+            await self._replace_closed()
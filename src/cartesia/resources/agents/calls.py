@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+from typing import Union, Iterable, Optional, AsyncIterable
 
 import httpx
 
@@ -19,6 +20,11 @@ from ..._response import (
 from ...pagination import SyncCursorIDPage, AsyncCursorIDPage
 from ..._base_client import AsyncPaginator, make_request_options
 from ...types.agents import call_list_params
+from ...lib._call_download import (
+    CallDownload as CallDownload,
+    BulkCallDownload as BulkCallDownload,
+    AsyncBulkCallDownload as AsyncBulkCallDownload,
+)
 from ...types.agents.agent_call import AgentCall
 
 __all__ = ["CallsResource", "AsyncCallsResource"]
@@ -176,6 +182,42 @@ class CallsResource(SyncAPIResource):
             cast_to=NoneType,
         )
 
+    def download_many(
+        self,
+        calls: Iterable[Union[str, AgentCall]],
+        dest_dir: Union[str, "os.PathLike[str]"],
+        *,
+        concurrency: int = 4,
+        max_resumes: int = 2,
+    ) -> BulkCallDownload:
+        """Download many call recordings to `dest_dir` with bounded concurrency.
+
+        Each recording is streamed to `dest_dir/<call_id>.wav` through a `.part` file that is
+        renamed once complete. Recordings already on disk are skipped, and partial files left
+        by an interrupted run are resumed with a Range request. Results are yielded as
+        recordings finish; one that fails is yielded with its `error` set rather than raised.
+
+        ```py
+        calls = client.agents.calls.list(agent_id="agent_id")
+        with client.agents.calls.download_many(calls, "recordings", concurrency=8) as run:
+            for download in run:
+                print(download.call_id, download.outcome, download.error)
+        print(f"{run.bytes_downloaded} bytes at {run.throughput / 1e6:.1f} MB/s")
+        ```
+
+        Args:
+          calls: Call IDs or `AgentCall`s, such as the result of `list()`. Read lazily, so
+              pages are fetched as downloads free up.
+
+          dest_dir: Directory to write recordings to. Created if it doesn't exist.
+
+          concurrency: Maximum number of recordings downloaded at once.
+
+          max_resumes: How many times a download that drops mid-transfer is resumed from the
+              bytes already written before it is reported as failed.
+        """
+        return BulkCallDownload(self._client, calls, dest_dir, concurrency=concurrency, max_resumes=max_resumes)
+
 
 class AsyncCallsResource(AsyncAPIResource):
     @cached_property
@@ -329,6 +371,42 @@ class AsyncCallsResource(AsyncAPIResource):
             cast_to=NoneType,
         )
 
+    def download_many(
+        self,
+        calls: Union[Iterable[Union[str, AgentCall]], AsyncIterable[Union[str, AgentCall]]],
+        dest_dir: Union[str, "os.PathLike[str]"],
+        *,
+        concurrency: int = 4,
+        max_resumes: int = 2,
+    ) -> AsyncBulkCallDownload:
+        """Download many call recordings to `dest_dir` with bounded concurrency.
+
+        Each recording is streamed to `dest_dir/<call_id>.wav` through a `.part` file that is
+        renamed once complete. Recordings already on disk are skipped, and partial files left
+        by an interrupted run are resumed with a Range request. Results are yielded as
+        recordings finish; one that fails is yielded with its `error` set rather than raised.
+
+        ```py
+        calls = client.agents.calls.list(agent_id="agent_id")
+        async with client.agents.calls.download_many(calls, "recordings", concurrency=8) as run:
+            async for download in run:
+                print(download.call_id, download.outcome, download.error)
+        print(f"{run.bytes_downloaded} bytes at {run.throughput / 1e6:.1f} MB/s")
+        ```
+
+        Args:
+          calls: Call IDs or `AgentCall`s, such as the result of `list()`. Read lazily, so
+              pages are fetched as downloads free up.
+
+          dest_dir: Directory to write recordings to. Created if it doesn't exist.
+
+          concurrency: Maximum number of recordings downloaded at once.
+
+          max_resumes: How many times a download that drops mid-transfer is resumed from the
+              bytes already written before it is reported as failed.
+        """
+        return AsyncBulkCallDownload(self._client, calls, dest_dir, concurrency=concurrency, max_resumes=max_resumes)
+
 
 class CallsResourceWithRawResponse:
     def __init__(self, calls: CallsResource) -> None:
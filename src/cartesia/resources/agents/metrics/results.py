@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Union, Optional
-from datetime import datetime
+from typing import Any, Dict, Union, Optional
+from datetime import datetime, timedelta
 
 import httpx
 
@@ -19,6 +19,12 @@ from ...._response import (
 )
 from ....pagination import SyncCursorIDPage, AsyncCursorIDPage
 from ...._base_client import AsyncPaginator, make_request_options
+from ....lib._metrics_export import (
+    EXPORT_ROW_LIMIT as EXPORT_ROW_LIMIT,
+    MetricResultsExport as MetricResultsExport,
+    AsyncMetricResultsExport as AsyncMetricResultsExport,
+    make_windows,
+)
 from ....types.agents.metrics import result_list_params, result_export_params
 from ....types.agents.metrics.result_list_response import ResultListResponse
 
@@ -199,6 +205,64 @@ class ResultsResource(SyncAPIResource):
             cast_to=str,
         )
 
+    def export_rows(
+        self,
+        *,
+        agent_id: Optional[str] | Omit = omit,
+        call_id: Optional[str] | Omit = omit,
+        deployment_id: Optional[str] | Omit = omit,
+        end_date: Union[str, datetime, None] | Omit = omit,
+        metric_id: Optional[str] | Omit = omit,
+        start_date: Union[str, datetime, None] | Omit = omit,
+        window: Optional[timedelta] = None,
+        concurrency: int = 4,
+    ) -> MetricResultsExport:
+        """Stream metric results from `export()` as parsed CSV rows.
+
+        Rows are parsed as the response arrives, so memory use doesn't grow with the size of
+        the export. Each row is a dict keyed by the CSV header; `batches()` groups them into
+        columns for Arrow, Parquet or pandas.
+
+        A single export returns at most `EXPORT_ROW_LIMIT` rows. With `window`, the range
+        from `start_date` to `end_date` is split into windows of that length that are
+        exported `concurrency` at a time, and any window that reaches the limit is exported
+        again in halves.
+
+        ```py
+        rows = client.agents.metrics.results.export_rows(
+            start_date="2024-04-01T00:00:00Z", end_date="2024-04-30T23:59:59Z", window=timedelta(days=1)
+        )
+        with rows:
+            for batch in rows.batches(50_000):
+                writer.write_batch(pyarrow.RecordBatch.from_pydict(batch))
+        ```
+
+        Args:
+          window: Length of each exported window. Requires `start_date` and `end_date`.
+
+          concurrency: Maximum number of windows exported at once.
+
+          The other arguments filter the results as in `export()`.
+        """
+        filters: Dict[str, Any] = {
+            "agent_id": agent_id,
+            "call_id": call_id,
+            "deployment_id": deployment_id,
+            "metric_id": metric_id,
+        }
+        if window is None:
+            return MetricResultsExport(
+                self._client,
+                {**filters, "start_date": start_date, "end_date": end_date},
+                windows=None,
+                concurrency=concurrency,
+            )
+        if not isinstance(start_date, (str, datetime)) or not isinstance(end_date, (str, datetime)):
+            raise ValueError("`start_date` and `end_date` are required to export in windows")
+        return MetricResultsExport(
+            self._client, filters, windows=make_windows(start_date, end_date, window), concurrency=concurrency
+        )
+
 
 class AsyncResultsResource(AsyncAPIResource):
     @cached_property
@@ -374,6 +438,64 @@ class AsyncResultsResource(AsyncAPIResource):
             cast_to=str,
         )
 
+    def export_rows(
+        self,
+        *,
+        agent_id: Optional[str] | Omit = omit,
+        call_id: Optional[str] | Omit = omit,
+        deployment_id: Optional[str] | Omit = omit,
+        end_date: Union[str, datetime, None] | Omit = omit,
+        metric_id: Optional[str] | Omit = omit,
+        start_date: Union[str, datetime, None] | Omit = omit,
+        window: Optional[timedelta] = None,
+        concurrency: int = 4,
+    ) -> AsyncMetricResultsExport:
+        """Stream metric results from `export()` as parsed CSV rows.
+
+        Rows are parsed as the response arrives, so memory use doesn't grow with the size of
+        the export. Each row is a dict keyed by the CSV header; `batches()` groups them into
+        columns for Arrow, Parquet or pandas.
+
+        A single export returns at most `EXPORT_ROW_LIMIT` rows. With `window`, the range
+        from `start_date` to `end_date` is split into windows of that length that are
+        exported `concurrency` at a time, and any window that reaches the limit is exported
+        again in halves.
+
+        ```py
+        rows = client.agents.metrics.results.export_rows(
+            start_date="2024-04-01T00:00:00Z", end_date="2024-04-30T23:59:59Z", window=timedelta(days=1)
+        )
+        async with rows:
+            async for batch in rows.batches(50_000):
+                writer.write_batch(pyarrow.RecordBatch.from_pydict(batch))
+        ```
+
+        Args:
+          window: Length of each exported window. Requires `start_date` and `end_date`.
+
+          concurrency: Maximum number of windows exported at once.
+
+          The other arguments filter the results as in `export()`.
+        """
+        filters: Dict[str, Any] = {
+            "agent_id": agent_id,
+            "call_id": call_id,
+            "deployment_id": deployment_id,
+            "metric_id": metric_id,
+        }
+        if window is None:
+            return AsyncMetricResultsExport(
+                self._client,
+                {**filters, "start_date": start_date, "end_date": end_date},
+                windows=None,
+                concurrency=concurrency,
+            )
+        if not isinstance(start_date, (str, datetime)) or not isinstance(end_date, (str, datetime)):
+            raise ValueError("`start_date` and `end_date` are required to export in windows")
+        return AsyncMetricResultsExport(
+            self._client, filters, windows=make_windows(start_date, end_date, window), concurrency=concurrency
+        )
+
 
 class ResultsResourceWithRawResponse:
     def __init__(self, results: ResultsResource) -> None:
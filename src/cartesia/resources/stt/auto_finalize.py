@@ -7,7 +7,7 @@ import time
 import random
 import logging
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Union, Callable, Iterator, Awaitable, cast
+from typing import TYPE_CHECKING, Any, Union, Callable, Iterator, Awaitable
 from typing_extensions import AsyncIterator
 
 import httpx
@@ -16,13 +16,13 @@ from pydantic import BaseModel
 from ...types import STTEncoding
 from ..._types import Omit, Query, Headers, SequenceNotStr, omit
 from ..._utils import maybe_transform, async_maybe_transform
-from ..._models import construct_type_unchecked
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ...types.stt import STTAutoFinalizeModel
 from ..._exceptions import CartesiaError, WebSocketConnectionClosedError
-from ..._send_queue import SendQueue
+from ..._send_queue import SendQueue, AsyncSendQueue, audio_bytes_per_second
 from ..._base_client import _merge_mappings
 from ..._event_handler import EventHandlerRegistry
+from ...lib._fast_events import STT_AUTO_FINALIZE_FAST_EVENTS, EventParser, FastSTTAutoFinalizeWebsocketResponse
 from ...types.stt_encoding import STTEncoding
 from ...types.stt_error_response import STTErrorResponse
 from ...types.websocket_reconnection import ReconnectingEvent, ReconnectingOverrides, is_recoverable_close
@@ -43,6 +43,12 @@ __all__ = ["AutoFinalizeResource", "AsyncAutoFinalizeResource"]
 log: logging.Logger = logging.getLogger(__name__)
 
 
+def _is_open(ws: Union[WebSocketConnection, AsyncWebSocketConnection]) -> bool:
+    from websockets.protocol import State
+
+    return ws.state is State.OPEN
+
+
 class AutoFinalizeResource(SyncAPIResource):
     def websocket(
         self,
@@ -63,6 +69,9 @@ class AutoFinalizeResource(SyncAPIResource):
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> AutoFinalizeResourceConnectionManager:
         """Realtime Speech-to-Text with user turn detection.
 
@@ -96,6 +105,9 @@ class AutoFinalizeResource(SyncAPIResource):
             initial_delay=initial_delay,
             max_delay=max_delay,
             max_queue_size=max_queue_size,
+            max_buffered_audio=max_buffered_audio,
+            drop_oldest_audio=drop_oldest_audio,
+            fast_parse=fast_parse,
             encoding=encoding,
             model=model,
             sample_rate=sample_rate,
@@ -127,6 +139,9 @@ class AsyncAutoFinalizeResource(AsyncAPIResource):
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> AsyncAutoFinalizeResourceConnectionManager:
         """Realtime Speech-to-Text with user turn detection.
 
@@ -160,6 +175,9 @@ class AsyncAutoFinalizeResource(AsyncAPIResource):
             initial_delay=initial_delay,
             max_delay=max_delay,
             max_queue_size=max_queue_size,
+            max_buffered_audio=max_buffered_audio,
+            drop_oldest_audio=drop_oldest_audio,
+            fast_parse=fast_parse,
             encoding=encoding,
             model=model,
             sample_rate=sample_rate,
@@ -187,7 +205,8 @@ class AsyncAutoFinalizeResourceConnection:
         max_delay: float = 8.0,
         extra_query: Query = {},
         extra_headers: Headers = {},
-        send_queue: SendQueue | None = None,
+        send_queue: AsyncSendQueue | None = None,
+        fast_parse: bool = False,
     ) -> None:
         self._connection = connection
         self._make_ws = make_ws
@@ -199,10 +218,13 @@ class AsyncAutoFinalizeResourceConnection:
         self._extra_headers = extra_headers
         self._intentionally_closed = False
         self._is_reconnecting = False
-        self._send_queue = send_queue or SendQueue()
+        self._send_queue = send_queue if send_queue is not None else AsyncSendQueue()
         self._event_handler_registry = EventHandlerRegistry(use_lock=False)
+        self.event_parser: EventParser[FastSTTAutoFinalizeWebsocketResponse] = EventParser(
+            STTAutoFinalizeWebsocketResponse, STT_AUTO_FINALIZE_FAST_EVENTS if fast_parse else None
+        )
 
-    async def __aiter__(self) -> AsyncIterator[STTAutoFinalizeWebsocketResponse]:
+    async def __aiter__(self) -> AsyncIterator[FastSTTAutoFinalizeWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -224,7 +246,7 @@ class AsyncAutoFinalizeResourceConnection:
                         ) from exc
                     raise
 
-    async def recv(self) -> STTAutoFinalizeWebsocketResponse:
+    async def recv(self) -> FastSTTAutoFinalizeWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `STTAutoFinalizeWebsocketResponse` object.
 
@@ -251,18 +273,17 @@ class AsyncAutoFinalizeResourceConnection:
             else json.dumps(await async_maybe_transform(event, STTAutoFinalizeWebsocketRequestParam))
         )
         if self._is_reconnecting:
-            self._send_queue.enqueue(data)
+            await self._send_queue.put(data)
             return
         try:
             await self._connection.send(data)
         except Exception:
-            self._send_queue.enqueue(data)
+            self._send_queue.put_nowait(data)
             raise
 
     async def send_raw(self, data: bytes | str) -> None:
         if self._is_reconnecting:
-            raw = data if isinstance(data, str) else data.decode("utf-8")
-            self._send_queue.enqueue(raw)
+            await self._send_queue.put(data)
             return
         await self._connection.send(data)
 
@@ -270,16 +291,16 @@ class AsyncAutoFinalizeResourceConnection:
         self._intentionally_closed = True
         await self._connection.close(code=code, reason=reason)
 
-    def parse_event(self, data: str | bytes) -> STTAutoFinalizeWebsocketResponse:
+    def parse_event(self, data: str | bytes) -> FastSTTAutoFinalizeWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `STTAutoFinalizeWebsocketResponse` object.
 
+        If the connection was opened with `fast_parse=True`, `turn.update` messages are returned
+        as lightweight `FastTurnUpdate` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            STTAutoFinalizeWebsocketResponse,
-            construct_type_unchecked(value=json.loads(data), type_=cast(Any, STTAutoFinalizeWebsocketResponse)),
-        )
+        return self.event_parser.parse(data)
 
     async def _reconnect(self, exc: Exception) -> bool:
         """Attempt to reconnect after a connection failure.
@@ -360,11 +381,11 @@ class AsyncAutoFinalizeResourceConnection:
     async def _flush_send_queue(self) -> None:
         """Send all queued messages over the current connection."""
 
-        async def _send(data: str) -> None:
+        async def _send(data: str | bytes) -> None:
             await self._connection.send(data)
 
         try:
-            await self._send_queue.flush_async(_send)
+            await self._send_queue.flush(_send)
         except Exception:
             log.warning("Failed to flush send queue after reconnect", exc_info=True)
 
@@ -489,6 +510,9 @@ class AsyncAutoFinalizeResourceConnectionManager:
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> None:
         self.__client = client
         self.__encoding = encoding
@@ -500,6 +524,7 @@ class AsyncAutoFinalizeResourceConnectionManager:
         self.__turn_end_timeout_ms = turn_end_timeout_ms
         self.__turn_start_threshold = turn_start_threshold
         self.__connection: AsyncAutoFinalizeResourceConnection | None = None
+        self.__warm_ws: AsyncWebSocketConnection | None = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
@@ -507,7 +532,14 @@ class AsyncAutoFinalizeResourceConnectionManager:
         self.__max_retries = max_retries
         self.__initial_delay = initial_delay
         self.__max_delay = max_delay
-        self.__send_queue = SendQueue(max_bytes=max_queue_size)
+        self.__send_queue = AsyncSendQueue(
+            max_bytes=max_queue_size,
+            max_audio_bytes=None
+            if max_buffered_audio is None
+            else int(max_buffered_audio * audio_bytes_per_second(encoding, sample_rate)),
+            drop_oldest_audio=drop_oldest_audio,
+        )
+        self.__fast_parse = fast_parse
         self.__event_handler_registry = EventHandlerRegistry(use_lock=False)
 
     def send(self, event: STTAutoFinalizeWebsocketRequest | STTAutoFinalizeWebsocketRequestParam) -> None:
@@ -521,7 +553,7 @@ class AsyncAutoFinalizeResourceConnectionManager:
             if isinstance(event, BaseModel)
             else json.dumps(event)
         )
-        self.__send_queue.enqueue(data)
+        self.__send_queue.put_nowait(data)
 
     def on(
         self, event_type: str, handler: Callable[..., Any] | None = None
@@ -573,7 +605,13 @@ class AsyncAutoFinalizeResourceConnectionManager:
         await connection.close()
         ```
         """
-        ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
+        ws, self.__warm_ws = self.__warm_ws, None
+        if ws is not None and not _is_open(ws):
+            # the warm socket went stale while waiting; close it rather than leaving it to the GC
+            await ws.close()
+            ws = None
+        if ws is None:
+            ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
 
         self.__connection = AsyncAutoFinalizeResourceConnection(
             ws,
@@ -585,6 +623,7 @@ class AsyncAutoFinalizeResourceConnectionManager:
             extra_query=self.__extra_query,
             extra_headers=self.__extra_headers,
             send_queue=self.__send_queue,
+            fast_parse=self.__fast_parse,
         )
 
         self.__event_handler_registry.merge_into(self.__connection._event_handler_registry)
@@ -594,6 +633,21 @@ class AsyncAutoFinalizeResourceConnectionManager:
 
     enter = __aenter__
 
+    async def warmup(self) -> AsyncAutoFinalizeResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.stt.auto_finalize.websocket(...)
+        await manager.warmup()  # e.g. while the worker starts up
+        ...
+        async with manager as connection:  # already connected
+            ...
+        ```
+        """
+        if self.__warm_ws is None:
+            self.__warm_ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
+        return self
+
     async def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> AsyncWebSocketConnection:
         try:
             from websockets.asyncio.client import connect
@@ -620,7 +674,8 @@ class AsyncAutoFinalizeResourceConnectionManager:
         if self.__websocket_connection_options:
             log.debug("Connection options: %s", self.__websocket_connection_options)
 
-        return await connect(
+        started = time.perf_counter()
+        connection = await connect(
             str(url),
             user_agent_header=self.__client.user_agent,
             additional_headers=_merge_mappings(
@@ -632,6 +687,9 @@ class AsyncAutoFinalizeResourceConnectionManager:
             ),
             **self.__websocket_connection_options,
         )
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
 
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
@@ -668,6 +726,7 @@ class AutoFinalizeResourceConnection:
         extra_query: Query = {},
         extra_headers: Headers = {},
         send_queue: SendQueue | None = None,
+        fast_parse: bool = False,
     ) -> None:
         self._connection = connection
         self._make_ws = make_ws
@@ -679,10 +738,13 @@ class AutoFinalizeResourceConnection:
         self._extra_headers = extra_headers
         self._intentionally_closed = False
         self._is_reconnecting = False
-        self._send_queue = send_queue or SendQueue()
+        self._send_queue = send_queue if send_queue is not None else SendQueue()
         self._event_handler_registry = EventHandlerRegistry(use_lock=True)
+        self.event_parser: EventParser[FastSTTAutoFinalizeWebsocketResponse] = EventParser(
+            STTAutoFinalizeWebsocketResponse, STT_AUTO_FINALIZE_FAST_EVENTS if fast_parse else None
+        )
 
-    def __iter__(self) -> Iterator[STTAutoFinalizeWebsocketResponse]:
+    def __iter__(self) -> Iterator[FastSTTAutoFinalizeWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -704,7 +766,7 @@ class AutoFinalizeResourceConnection:
                         ) from exc
                     raise
 
-    def recv(self) -> STTAutoFinalizeWebsocketResponse:
+    def recv(self) -> FastSTTAutoFinalizeWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `STTAutoFinalizeWebsocketResponse` object.
 
@@ -741,8 +803,7 @@ class AutoFinalizeResourceConnection:
 
     def send_raw(self, data: bytes | str) -> None:
         if self._is_reconnecting:
-            raw = data if isinstance(data, str) else data.decode("utf-8")
-            self._send_queue.enqueue(raw)
+            self._send_queue.enqueue(data)
             return
         self._connection.send(data)
 
@@ -750,16 +811,16 @@ class AutoFinalizeResourceConnection:
         self._intentionally_closed = True
         self._connection.close(code=code, reason=reason)
 
-    def parse_event(self, data: str | bytes) -> STTAutoFinalizeWebsocketResponse:
+    def parse_event(self, data: str | bytes) -> FastSTTAutoFinalizeWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `STTAutoFinalizeWebsocketResponse` object.
 
+        If the connection was opened with `fast_parse=True`, `turn.update` messages are returned
+        as lightweight `FastTurnUpdate` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            STTAutoFinalizeWebsocketResponse,
-            construct_type_unchecked(value=json.loads(data), type_=cast(Any, STTAutoFinalizeWebsocketResponse)),
-        )
+        return self.event_parser.parse(data)
 
     def _reconnect(self, exc: Exception) -> bool:
         """Attempt to reconnect after a connection failure.
@@ -957,6 +1018,9 @@ class AutoFinalizeResourceConnectionManager:
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> None:
         self.__client = client
         self.__encoding = encoding
@@ -968,6 +1032,7 @@ class AutoFinalizeResourceConnectionManager:
         self.__turn_end_timeout_ms = turn_end_timeout_ms
         self.__turn_start_threshold = turn_start_threshold
         self.__connection: AutoFinalizeResourceConnection | None = None
+        self.__warm_ws: WebSocketConnection | None = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
@@ -975,7 +1040,14 @@ class AutoFinalizeResourceConnectionManager:
         self.__max_retries = max_retries
         self.__initial_delay = initial_delay
         self.__max_delay = max_delay
-        self.__send_queue = SendQueue(max_bytes=max_queue_size)
+        self.__send_queue = SendQueue(
+            max_bytes=max_queue_size,
+            max_audio_bytes=None
+            if max_buffered_audio is None
+            else int(max_buffered_audio * audio_bytes_per_second(encoding, sample_rate)),
+            drop_oldest_audio=drop_oldest_audio,
+        )
+        self.__fast_parse = fast_parse
         self.__event_handler_registry = EventHandlerRegistry(use_lock=True)
 
     def send(self, event: STTAutoFinalizeWebsocketRequest | STTAutoFinalizeWebsocketRequestParam) -> None:
@@ -1041,7 +1113,13 @@ class AutoFinalizeResourceConnectionManager:
         connection.close()
         ```
         """
-        ws = self._connect_ws(self.__extra_query, self.__extra_headers)
+        ws, self.__warm_ws = self.__warm_ws, None
+        if ws is not None and not _is_open(ws):
+            # the warm socket went stale while waiting; close it rather than leaving it to the GC
+            ws.close()
+            ws = None
+        if ws is None:
+            ws = self._connect_ws(self.__extra_query, self.__extra_headers)
 
         self.__connection = AutoFinalizeResourceConnection(
             ws,
@@ -1053,6 +1131,7 @@ class AutoFinalizeResourceConnectionManager:
             extra_query=self.__extra_query,
             extra_headers=self.__extra_headers,
             send_queue=self.__send_queue,
+            fast_parse=self.__fast_parse,
         )
 
         self.__event_handler_registry.merge_into(self.__connection._event_handler_registry)
@@ -1062,6 +1141,21 @@ class AutoFinalizeResourceConnectionManager:
 
     enter = __enter__
 
+    def warmup(self) -> AutoFinalizeResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.stt.auto_finalize.websocket(...)
+        manager.warmup()  # e.g. while the worker starts up
+        ...
+        with manager as connection:  # already connected
+            ...
+        ```
+        """
+        if self.__warm_ws is None:
+            self.__warm_ws = self._connect_ws(self.__extra_query, self.__extra_headers)
+        return self
+
     def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> WebSocketConnection:
         try:
             from websockets.sync.client import connect
@@ -1088,7 +1182,8 @@ class AutoFinalizeResourceConnectionManager:
         if self.__websocket_connection_options:
             log.debug("Connection options: %s", self.__websocket_connection_options)
 
-        return connect(
+        started = time.perf_counter()
+        connection = connect(
             str(url),
             user_agent_header=self.__client.user_agent,
             additional_headers=_merge_mappings(
@@ -1100,6 +1195,9 @@ class AutoFinalizeResourceConnectionManager:
             ),
             **self.__websocket_connection_options,
         )
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
 
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
@@ -2,25 +2,24 @@
 
 from __future__ import annotations
 
-import json
 import time
 import random
 import logging
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Union, Callable, Iterator, Awaitable, cast
+from typing import TYPE_CHECKING, Any, Union, Callable, Iterator, Awaitable
 from typing_extensions import Literal, AsyncIterator
 
 import httpx
 
 from ...types import STTEncoding
 from ..._types import Omit, Query, Headers, SequenceNotStr, omit
-from ..._models import construct_type_unchecked
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ...types.stt import STTManualFinalizeModel
 from ..._exceptions import CartesiaError, WebSocketConnectionClosedError
-from ..._send_queue import SendQueue
+from ..._send_queue import SendQueue, AsyncSendQueue, audio_bytes_per_second
 from ..._base_client import _merge_mappings
 from ..._event_handler import EventHandlerRegistry
+from ...lib._fast_events import STT_MANUAL_FINALIZE_FAST_EVENTS, EventParser, FastSTTManualFinalizeWebsocketResponse
 from ...types.stt_encoding import STTEncoding
 from ...types.stt_error_response import STTErrorResponse
 from ...types.websocket_reconnection import ReconnectingEvent, ReconnectingOverrides, is_recoverable_close
@@ -40,6 +39,12 @@ __all__ = ["ManualFinalizeResource", "AsyncManualFinalizeResource"]
 log: logging.Logger = logging.getLogger(__name__)
 
 
+def _is_open(ws: Union[WebSocketConnection, AsyncWebSocketConnection]) -> bool:
+    from websockets.protocol import State
+
+    return ws.state is State.OPEN
+
+
 class ManualFinalizeResource(SyncAPIResource):
     def websocket(
         self,
@@ -59,6 +64,9 @@ class ManualFinalizeResource(SyncAPIResource):
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> ManualFinalizeResourceConnectionManager:
         """Realtime speech-to-text without turn detection.
 
@@ -88,6 +96,9 @@ class ManualFinalizeResource(SyncAPIResource):
             initial_delay=initial_delay,
             max_delay=max_delay,
             max_queue_size=max_queue_size,
+            max_buffered_audio=max_buffered_audio,
+            drop_oldest_audio=drop_oldest_audio,
+            fast_parse=fast_parse,
             encoding=encoding,
             model=model,
             sample_rate=sample_rate,
@@ -117,6 +128,9 @@ class AsyncManualFinalizeResource(AsyncAPIResource):
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> AsyncManualFinalizeResourceConnectionManager:
         """Realtime speech-to-text without turn detection.
 
@@ -146,6 +160,9 @@ class AsyncManualFinalizeResource(AsyncAPIResource):
             initial_delay=initial_delay,
             max_delay=max_delay,
             max_queue_size=max_queue_size,
+            max_buffered_audio=max_buffered_audio,
+            drop_oldest_audio=drop_oldest_audio,
+            fast_parse=fast_parse,
             encoding=encoding,
             model=model,
             sample_rate=sample_rate,
@@ -172,7 +189,8 @@ class AsyncManualFinalizeResourceConnection:
         max_delay: float = 8.0,
         extra_query: Query = {},
         extra_headers: Headers = {},
-        send_queue: SendQueue | None = None,
+        send_queue: AsyncSendQueue | None = None,
+        fast_parse: bool = False,
     ) -> None:
         self._connection = connection
         self._make_ws = make_ws
@@ -184,10 +202,13 @@ class AsyncManualFinalizeResourceConnection:
         self._extra_headers = extra_headers
         self._intentionally_closed = False
         self._is_reconnecting = False
-        self._send_queue = send_queue or SendQueue()
+        self._send_queue = send_queue if send_queue is not None else AsyncSendQueue()
         self._event_handler_registry = EventHandlerRegistry(use_lock=False)
+        self.event_parser: EventParser[FastSTTManualFinalizeWebsocketResponse] = EventParser(
+            STTManualFinalizeWebsocketResponse, STT_MANUAL_FINALIZE_FAST_EVENTS if fast_parse else None
+        )
 
-    async def __aiter__(self) -> AsyncIterator[STTManualFinalizeWebsocketResponse]:
+    async def __aiter__(self) -> AsyncIterator[FastSTTManualFinalizeWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -209,7 +230,7 @@ class AsyncManualFinalizeResourceConnection:
                         ) from exc
                     raise
 
-    async def recv(self) -> STTManualFinalizeWebsocketResponse:
+    async def recv(self) -> FastSTTManualFinalizeWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `STTManualFinalizeWebsocketResponse` object.
 
@@ -232,18 +253,17 @@ class AsyncManualFinalizeResourceConnection:
     async def send(self, event: STTManualFinalizeWebsocketRequest | STTManualFinalizeWebsocketRequest) -> None:
         data = event
         if self._is_reconnecting:
-            self._send_queue.enqueue(data)
+            await self._send_queue.put(data)
             return
         try:
             await self._connection.send(data)
         except Exception:
-            self._send_queue.enqueue(data)
+            self._send_queue.put_nowait(data)
             raise
 
     async def send_raw(self, data: bytes | str) -> None:
         if self._is_reconnecting:
-            raw = data if isinstance(data, str) else data.decode("utf-8")
-            self._send_queue.enqueue(raw)
+            await self._send_queue.put(data)
             return
         await self._connection.send(data)
 
@@ -251,16 +271,16 @@ class AsyncManualFinalizeResourceConnection:
         self._intentionally_closed = True
         await self._connection.close(code=code, reason=reason)
 
-    def parse_event(self, data: str | bytes) -> STTManualFinalizeWebsocketResponse:
+    def parse_event(self, data: str | bytes) -> FastSTTManualFinalizeWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `STTManualFinalizeWebsocketResponse` object.
 
+        If the connection was opened with `fast_parse=True`, `transcript` messages are returned
+        as lightweight `FastTranscript` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            STTManualFinalizeWebsocketResponse,
-            construct_type_unchecked(value=json.loads(data), type_=cast(Any, STTManualFinalizeWebsocketResponse)),
-        )
+        return self.event_parser.parse(data)
 
     async def _reconnect(self, exc: Exception) -> bool:
         """Attempt to reconnect after a connection failure.
@@ -341,11 +361,11 @@ class AsyncManualFinalizeResourceConnection:
     async def _flush_send_queue(self) -> None:
         """Send all queued messages over the current connection."""
 
-        async def _send(data: str) -> None:
+        async def _send(data: str | bytes) -> None:
             await self._connection.send(data)
 
         try:
-            await self._send_queue.flush_async(_send)
+            await self._send_queue.flush(_send)
         except Exception:
             log.warning("Failed to flush send queue after reconnect", exc_info=True)
 
@@ -469,6 +489,9 @@ class AsyncManualFinalizeResourceConnectionManager:
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> None:
         self.__client = client
         self.__encoding = encoding
@@ -479,6 +502,7 @@ class AsyncManualFinalizeResourceConnectionManager:
         self.__max_silence_duration_secs = max_silence_duration_secs
         self.__min_volume = min_volume
         self.__connection: AsyncManualFinalizeResourceConnection | None = None
+        self.__warm_ws: AsyncWebSocketConnection | None = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
@@ -486,7 +510,14 @@ class AsyncManualFinalizeResourceConnectionManager:
         self.__max_retries = max_retries
         self.__initial_delay = initial_delay
         self.__max_delay = max_delay
-        self.__send_queue = SendQueue(max_bytes=max_queue_size)
+        self.__send_queue = AsyncSendQueue(
+            max_bytes=max_queue_size,
+            max_audio_bytes=None
+            if max_buffered_audio is None
+            else int(max_buffered_audio * audio_bytes_per_second(encoding, sample_rate)),
+            drop_oldest_audio=drop_oldest_audio,
+        )
+        self.__fast_parse = fast_parse
         self.__event_handler_registry = EventHandlerRegistry(use_lock=False)
 
     def send(self, event: STTManualFinalizeWebsocketRequest | STTManualFinalizeWebsocketRequest) -> None:
@@ -496,7 +527,7 @@ class AsyncManualFinalizeResourceConnectionManager:
         are automatically sent once the WebSocket connection opens.
         """
         data = event
-        self.__send_queue.enqueue(data)
+        self.__send_queue.put_nowait(data)
 
     def on(
         self, event_type: str, handler: Callable[..., Any] | None = None
@@ -548,7 +579,13 @@ class AsyncManualFinalizeResourceConnectionManager:
         await connection.close()
         ```
         """
-        ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
+        ws, self.__warm_ws = self.__warm_ws, None
+        if ws is not None and not _is_open(ws):
+            # the warm socket went stale while waiting; close it rather than leaving it to the GC
+            await ws.close()
+            ws = None
+        if ws is None:
+            ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
 
         self.__connection = AsyncManualFinalizeResourceConnection(
             ws,
@@ -560,6 +597,7 @@ class AsyncManualFinalizeResourceConnectionManager:
             extra_query=self.__extra_query,
             extra_headers=self.__extra_headers,
             send_queue=self.__send_queue,
+            fast_parse=self.__fast_parse,
         )
 
         self.__event_handler_registry.merge_into(self.__connection._event_handler_registry)
@@ -569,6 +607,21 @@ class AsyncManualFinalizeResourceConnectionManager:
 
     enter = __aenter__
 
+    async def warmup(self) -> AsyncManualFinalizeResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.stt.manual_finalize.websocket(...)
+        await manager.warmup()  # e.g. while the worker starts up
+        ...
+        async with manager as connection:  # already connected
+            ...
+        ```
+        """
+        if self.__warm_ws is None:
+            self.__warm_ws = await self._connect_ws(self.__extra_query, self.__extra_headers)
+        return self
+
     async def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> AsyncWebSocketConnection:
         try:
             from websockets.asyncio.client import connect
@@ -594,7 +647,8 @@ class AsyncManualFinalizeResourceConnectionManager:
         if self.__websocket_connection_options:
             log.debug("Connection options: %s", self.__websocket_connection_options)
 
-        return await connect(
+        started = time.perf_counter()
+        connection = await connect(
             str(url),
             user_agent_header=self.__client.user_agent,
             additional_headers=_merge_mappings(
@@ -606,6 +660,9 @@ class AsyncManualFinalizeResourceConnectionManager:
             ),
             **self.__websocket_connection_options,
         )
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
 
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
@@ -642,6 +699,7 @@ class ManualFinalizeResourceConnection:
         extra_query: Query = {},
         extra_headers: Headers = {},
         send_queue: SendQueue | None = None,
+        fast_parse: bool = False,
     ) -> None:
         self._connection = connection
         self._make_ws = make_ws
@@ -653,10 +711,13 @@ class ManualFinalizeResourceConnection:
         self._extra_headers = extra_headers
         self._intentionally_closed = False
         self._is_reconnecting = False
-        self._send_queue = send_queue or SendQueue()
+        self._send_queue = send_queue if send_queue is not None else SendQueue()
         self._event_handler_registry = EventHandlerRegistry(use_lock=True)
+        self.event_parser: EventParser[FastSTTManualFinalizeWebsocketResponse] = EventParser(
+            STTManualFinalizeWebsocketResponse, STT_MANUAL_FINALIZE_FAST_EVENTS if fast_parse else None
+        )
 
-    def __iter__(self) -> Iterator[STTManualFinalizeWebsocketResponse]:
+    def __iter__(self) -> Iterator[FastSTTManualFinalizeWebsocketResponse]:
         """
         An infinite-iterator that will continue to yield events until
         the connection is closed.
@@ -678,7 +739,7 @@ class ManualFinalizeResourceConnection:
                         ) from exc
                     raise
 
-    def recv(self) -> STTManualFinalizeWebsocketResponse:
+    def recv(self) -> FastSTTManualFinalizeWebsocketResponse:
         """
         Receive the next message from the connection and parses it into a `STTManualFinalizeWebsocketResponse` object.
 
@@ -711,8 +772,7 @@ class ManualFinalizeResourceConnection:
 
     def send_raw(self, data: bytes | str) -> None:
         if self._is_reconnecting:
-            raw = data if isinstance(data, str) else data.decode("utf-8")
-            self._send_queue.enqueue(raw)
+            self._send_queue.enqueue(data)
             return
         self._connection.send(data)
 
@@ -720,16 +780,16 @@ class ManualFinalizeResourceConnection:
         self._intentionally_closed = True
         self._connection.close(code=code, reason=reason)
 
-    def parse_event(self, data: str | bytes) -> STTManualFinalizeWebsocketResponse:
+    def parse_event(self, data: str | bytes) -> FastSTTManualFinalizeWebsocketResponse:
         """
         Converts a raw `str` or `bytes` message into a `STTManualFinalizeWebsocketResponse` object.
 
+        If the connection was opened with `fast_parse=True`, `transcript` messages are returned
+        as lightweight `FastTranscript` objects; see `.event_parser`.
+
         This is helpful if you're using `.recv_bytes()`.
         """
-        return cast(
-            STTManualFinalizeWebsocketResponse,
-            construct_type_unchecked(value=json.loads(data), type_=cast(Any, STTManualFinalizeWebsocketResponse)),
-        )
+        return self.event_parser.parse(data)
 
     def _reconnect(self, exc: Exception) -> bool:
         """Attempt to reconnect after a connection failure.
@@ -926,6 +986,9 @@ class ManualFinalizeResourceConnectionManager:
         initial_delay: float = 0.5,
         max_delay: float = 8.0,
         max_queue_size: int = 1_048_576,
+        max_buffered_audio: float | None = None,
+        drop_oldest_audio: bool = False,
+        fast_parse: bool = False,
     ) -> None:
         self.__client = client
         self.__encoding = encoding
@@ -936,6 +999,7 @@ class ManualFinalizeResourceConnectionManager:
         self.__max_silence_duration_secs = max_silence_duration_secs
         self.__min_volume = min_volume
         self.__connection: ManualFinalizeResourceConnection | None = None
+        self.__warm_ws: WebSocketConnection | None = None
         self.__extra_query = extra_query
         self.__extra_headers = extra_headers
         self.__websocket_connection_options = websocket_connection_options
@@ -943,7 +1007,14 @@ class ManualFinalizeResourceConnectionManager:
         self.__max_retries = max_retries
         self.__initial_delay = initial_delay
         self.__max_delay = max_delay
-        self.__send_queue = SendQueue(max_bytes=max_queue_size)
+        self.__send_queue = SendQueue(
+            max_bytes=max_queue_size,
+            max_audio_bytes=None
+            if max_buffered_audio is None
+            else int(max_buffered_audio * audio_bytes_per_second(encoding, sample_rate)),
+            drop_oldest_audio=drop_oldest_audio,
+        )
+        self.__fast_parse = fast_parse
         self.__event_handler_registry = EventHandlerRegistry(use_lock=True)
 
     def send(self, event: STTManualFinalizeWebsocketRequest | STTManualFinalizeWebsocketRequest) -> None:
@@ -1005,7 +1076,13 @@ class ManualFinalizeResourceConnectionManager:
         connection.close()
         ```
         """
-        ws = self._connect_ws(self.__extra_query, self.__extra_headers)
+        ws, self.__warm_ws = self.__warm_ws, None
+        if ws is not None and not _is_open(ws):
+            # the warm socket went stale while waiting; close it rather than leaving it to the GC
+            ws.close()
+            ws = None
+        if ws is None:
+            ws = self._connect_ws(self.__extra_query, self.__extra_headers)
 
         self.__connection = ManualFinalizeResourceConnection(
             ws,
@@ -1017,6 +1094,7 @@ class ManualFinalizeResourceConnectionManager:
             extra_query=self.__extra_query,
             extra_headers=self.__extra_headers,
             send_queue=self.__send_queue,
+            fast_parse=self.__fast_parse,
         )
 
         self.__event_handler_registry.merge_into(self.__connection._event_handler_registry)
@@ -1026,6 +1104,21 @@ class ManualFinalizeResourceConnectionManager:
 
     enter = __enter__
 
+    def warmup(self) -> ManualFinalizeResourceConnectionManager:
+        """Open the WebSocket now, so that entering the manager later does not wait for the handshake.
+
+        ```py
+        manager = client.stt.manual_finalize.websocket(...)
+        manager.warmup()  # e.g. while the worker starts up
+        ...
+        with manager as connection:  # already connected
+            ...
+        ```
+        """
+        if self.__warm_ws is None:
+            self.__warm_ws = self._connect_ws(self.__extra_query, self.__extra_headers)
+        return self
+
     def _connect_ws(self, extra_query: Query, extra_headers: Headers) -> WebSocketConnection:
         try:
             from websockets.sync.client import connect
@@ -1051,7 +1144,8 @@ class ManualFinalizeResourceConnectionManager:
         if self.__websocket_connection_options:
             log.debug("Connection options: %s", self.__websocket_connection_options)
 
-        return connect(
+        started = time.perf_counter()
+        connection = connect(
             str(url),
             user_agent_header=self.__client.user_agent,
             additional_headers=_merge_mappings(
@@ -1063,6 +1157,9 @@ class ManualFinalizeResourceConnectionManager:
             ),
             **self.__websocket_connection_options,
         )
+        if self.__client._timings:
+            self.__client._timings.emit("ws.handshake", time.perf_counter() - started, path=url.path)
+        return connection
 
     def _prepare_url(self) -> httpx.URL:
         if self.__client.websocket_base_url is not None:
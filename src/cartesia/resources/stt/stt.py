@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List, Mapping, Optional, cast
+import os
+from typing import List, Union, Mapping, Iterable, Optional, cast
 from typing_extensions import Literal
 
 import httpx
@@ -21,7 +22,13 @@ from ..._response import (
 )
 from .auto_finalize import AutoFinalizeResource, AsyncAutoFinalizeResource
 from ..._base_client import make_request_options
+from ...lib._stt_bulk import (
+    FileTranscript as FileTranscript,
+    BulkTranscription as BulkTranscription,
+    AsyncBulkTranscription as AsyncBulkTranscription,
+)
 from .manual_finalize import ManualFinalizeResource, AsyncManualFinalizeResource
+from ...lib._audio_feeder import AudioFeeder as AudioFeeder, AsyncAudioFeeder as AsyncAudioFeeder
 from ...types.stt_encoding import STTEncoding
 from ...types.stt_batch_model import STTBatchModel
 from ...types.stt_transcribe_response import STTTranscribeResponse
@@ -241,6 +248,56 @@ class STTResource(SyncAPIResource):
             cast_to=STTTranscribeResponse,
         )
 
+    def transcribe_many(
+        self,
+        files: Iterable[Union[str, "os.PathLike[str]"]],
+        *,
+        model: STTBatchModel,
+        language: str | Omit = omit,
+        concurrency: int = 4,
+        streaming_threshold: Optional[int] = 8 * 1024 * 1024,
+        chunk_duration: float = 0.1,
+    ) -> BulkTranscription:
+        """Transcribe many audio files with bounded concurrency.
+
+        Each file is transcribed with word timestamps, either by `transcribe()` or, for WAV
+        files of at least `streaming_threshold` bytes in an encoding the WebSocket accepts,
+        by streaming it from disk over a `manual_finalize` WebSocket as fast as the
+        connection allows. Streaming avoids reading large files into memory. Results are
+        yielded as files finish; a file that fails is yielded with its `error` set rather
+        than raised.
+
+        ```py
+        with client.stt.transcribe_many(paths, model="ink-whisper", concurrency=8) as run:
+            for result in run:
+                print(result.file, result.transport, result.text)
+        ```
+
+        Args:
+          files: Paths of the audio files. Read lazily, so this can be a generator.
+
+          model: The model to transcribe with. It must support both batch and streaming
+              transcription if any file is streamed.
+
+          language: The language of the audio, for files sent to `transcribe()`.
+
+          concurrency: Maximum number of files transcribed at once.
+
+          streaming_threshold: Minimum file size, in bytes, for streaming a WAV file. `None`
+              sends every file to `transcribe()`.
+
+          chunk_duration: Seconds of audio per WebSocket message when streaming.
+        """
+        return BulkTranscription(
+            self._client,
+            files,
+            model=model,
+            language=language,
+            concurrency=concurrency,
+            streaming_threshold=streaming_threshold,
+            chunk_duration=chunk_duration,
+        )
+
 
 class AsyncSTTResource(AsyncAPIResource):
     @cached_property
@@ -454,6 +511,56 @@ class AsyncSTTResource(AsyncAPIResource):
             cast_to=STTTranscribeResponse,
         )
 
+    def transcribe_many(
+        self,
+        files: Iterable[Union[str, "os.PathLike[str]"]],
+        *,
+        model: STTBatchModel,
+        language: str | Omit = omit,
+        concurrency: int = 4,
+        streaming_threshold: Optional[int] = 8 * 1024 * 1024,
+        chunk_duration: float = 0.1,
+    ) -> AsyncBulkTranscription:
+        """Transcribe many audio files with bounded concurrency.
+
+        Each file is transcribed with word timestamps, either by `transcribe()` or, for WAV
+        files of at least `streaming_threshold` bytes in an encoding the WebSocket accepts,
+        by streaming it from disk over a `manual_finalize` WebSocket as fast as the
+        connection allows. Streaming avoids reading large files into memory. Results are
+        yielded as files finish; a file that fails is yielded with its `error` set rather
+        than raised.
+
+        ```py
+        with client.stt.transcribe_many(paths, model="ink-whisper", concurrency=8) as run:
+            for result in run:
+                print(result.file, result.transport, result.text)
+        ```
+
+        Args:
+          files: Paths of the audio files. Read lazily, so this can be a generator.
+
+          model: The model to transcribe with. It must support both batch and streaming
+              transcription if any file is streamed.
+
+          language: The language of the audio, for files sent to `transcribe()`.
+
+          concurrency: Maximum number of files transcribed at once.
+
+          streaming_threshold: Minimum file size, in bytes, for streaming a WAV file. `None`
+              sends every file to `transcribe()`.
+
+          chunk_duration: Seconds of audio per WebSocket message when streaming.
+        """
+        return AsyncBulkTranscription(
+            self._client,
+            files,
+            model=model,
+            language=language,
+            concurrency=concurrency,
+            streaming_threshold=streaming_threshold,
+            chunk_duration=chunk_duration,
+        )
+
 
 class STTResourceWithRawResponse:
     def __init__(self, stt: STTResource) -> None:
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Iterator, Optional, AsyncIterator, cast
-from typing_extensions import deprecated
+from typing import Any, Mapping, Callable, Iterable, Iterator, Optional, AsyncIterator, cast, overload
+from typing_extensions import Literal, deprecated
 
 import httpx
 
@@ -46,14 +46,49 @@ from .._response import (
     async_to_custom_raw_response_wrapper,
     async_to_custom_streamed_response_wrapper,
 )
-from .._streaming import Stream, AsyncStream
+from .._constants import RAW_RESPONSE_HEADER
 from .._base_client import make_request_options
+from ..lib._tts_pool import TTSConnectionPool as TTSConnectionPool, AsyncTTSConnectionPool as AsyncTTSConnectionPool
+from ..lib._raw_audio import (
+    AudioChunk as AudioChunk,
+    AudioStream as AudioStream,
+    RawAudioStream as RawAudioStream,
+    RawTTSSSEEvent as RawTTSSSEEvent,
+    AsyncAudioStream as AsyncAudioStream,
+    AsyncRawAudioStream as AsyncRawAudioStream,
+    RawWebsocketResponse as RawWebsocketResponse,
+)
+from ..lib._transcode import PCMTranscoder as PCMTranscoder, TranscodingSink as TranscodingSink
+from ..lib._tts_batch import (
+    BatchStats as BatchStats,
+    BatchResult as BatchResult,
+    BatchGeneration as BatchGeneration,
+    AsyncBatchGeneration as AsyncBatchGeneration,
+)
+from ..lib._tts_cache import (
+    TTSCache as TTSCache,
+    CacheEntry,
+    sse_succeeded,
+    record_response,
+    replay_response,
+    cacheable_headers,
+    replay_binary_response,
+)
+from ..lib._audio_sink import (
+    TeeSink as TeeSink,
+    AudioSink as AudioSink,
+    NumpySink as NumpySink,
+    WavFileSink as WavFileSink,
+    RingBufferSink as RingBufferSink,
+)
 from ..types.tts_model import TTSModel
 from ..types.model_speed import ModelSpeed
+from ..lib._text_streamer import TextStreamer as TextStreamer, AsyncTextStreamer as AsyncTextStreamer
 from ..types.infill_model import InfillModel
 from ..types.tts_sse_event import TTSSSEEvent
 from ..types.supported_language import SupportedLanguage
 from ..types.voice_specifier_param import VoiceSpecifierParam
+from ..types.websocket_reconnection import ReconnectingEvent, ReconnectingOverrides
 from ..types.generation_config_param import GenerationConfigParam
 from ..types.websocket_connection_options import WebsocketConnectionOptions
 
@@ -94,6 +129,8 @@ class TTSResource(SyncAPIResource):
         pronunciation_dict_id: Optional[str] | Omit = omit,
         save: Optional[bool] | Omit = omit,
         speed: ModelSpeed | Omit = omit,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
         extra_headers: Headers | None = None,
@@ -146,6 +183,13 @@ class TTSResource(SyncAPIResource):
               and may not work for all voices. Influences the speed of the generated speech.
               Faster speeds may reduce hallucination rate.
 
+          sink: Stream the response body into this `AudioSink` instead of buffering it in memory.
+              Use a `raw` container. The returned response's headers remain available, but its
+              content has already been consumed.
+
+          cache: Serve identical requests from this `TTSCache` instead of the API, and store the
+              audio of successful requests in it. Requests with `save=True` are not cached.
+
           extra_headers: Send extra headers
 
           extra_query: Add additional query parameters to the request
@@ -155,29 +199,144 @@ class TTSResource(SyncAPIResource):
           timeout: Override the client-level default timeout for this request, in seconds
         """
         extra_headers = {"Accept": "audio/wav", **(extra_headers or {})}
-        return self._post(
+        body = maybe_transform(
+            {
+                "model_id": model_id,
+                "output_format": output_format,
+                "transcript": transcript,
+                "voice": voice,
+                "generation_config": generation_config,
+                "language": language,
+                "locale": locale,
+                "normalization": normalization,
+                "pronunciation_dict_id": pronunciation_dict_id,
+                "save": save,
+                "speed": speed,
+            },
+            tts_generate_params.TTSGenerateParams,
+        )
+        # Requests wrapped by `.with_raw_response` / `.with_streaming_response` and saved generations bypass the cache.
+        cache_key: Optional[str] = None
+        if cache is not None and RAW_RESPONSE_HEADER not in extra_headers and save is not True:
+            cache_key = cache.key("/tts/bytes", body, extra_body)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                response = replay_binary_response(self._client, "/tts/bytes", entry, BinaryAPIResponse)
+                if sink is not None:
+                    for data in response.iter_bytes():
+                        sink.write(data)
+                return response
+
+        if sink is not None:
+            extra_headers[RAW_RESPONSE_HEADER] = "stream"
+        response = self._post(
             "/tts/bytes",
-            body=maybe_transform(
-                {
-                    "model_id": model_id,
-                    "output_format": output_format,
-                    "transcript": transcript,
-                    "voice": voice,
-                    "generation_config": generation_config,
-                    "language": language,
-                    "locale": locale,
-                    "normalization": normalization,
-                    "pronunciation_dict_id": pronunciation_dict_id,
-                    "save": save,
-                    "speed": speed,
-                },
-                tts_generate_params.TTSGenerateParams,
-            ),
+            body=body,
             options=make_request_options(
                 extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
             ),
             cast_to=BinaryAPIResponse,
+            stream=sink is not None,
         )
+        if cache is not None and cache_key is not None:
+            if sink is None:
+                cache.put(cache_key, [response.read()], cacheable_headers(response.headers))
+            else:
+                record_response(cache, cache_key, response.http_response)
+        if sink is not None:
+            try:
+                for data in response.iter_bytes():
+                    sink.write(data)
+            finally:
+                response.close()
+        return response
+
+    @overload
+    def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: Literal[False] = False,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AudioStream[TTSSSEEvent]: ...
+
+    @overload
+    def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: Literal[True],
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> RawAudioStream: ...
+
+    @overload
+    def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: bool,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AudioStream[TTSSSEEvent] | RawAudioStream: ...
 
     def generate_sse(
         self,
@@ -196,13 +355,16 @@ class TTSResource(SyncAPIResource):
         pronunciation_dict_id: Optional[str] | Omit = omit,
         speed: ModelSpeed | Omit = omit,
         use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: bool = False,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
         extra_headers: Headers | None = None,
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = not_given,
-    ) -> Stream[TTSSSEEvent]:
+    ) -> AudioStream[TTSSSEEvent] | RawAudioStream:
         """
         Text-to-Speech (SSE).
 
@@ -261,6 +423,14 @@ class TTSResource(SyncAPIResource):
 
           use_normalized_timestamps: Whether to use normalized timestamps (True) or original timestamps (False).
 
+          raw_audio: Yield `chunk` events as `AudioChunk` objects, whose audio is decoded once while
+              the event is parsed, instead of `TTSSSEChunkEvent` models.
+
+          sink: Write the audio of each `chunk` event to this `AudioSink` as the stream is iterated.
+
+          cache: Serve identical requests from this `TTSCache` instead of the API. A stream is
+              stored once it has been iterated to the end without an `error` event.
+
           extra_headers: Send extra headers
 
           extra_query: Add additional query parameters to the request
@@ -270,34 +440,57 @@ class TTSResource(SyncAPIResource):
           timeout: Override the client-level default timeout for this request, in seconds
         """
         extra_headers = {"Accept": "text/event-stream", **(extra_headers or {})}
-        return self._post(
-            "/tts/sse",
-            body=maybe_transform(
-                {
-                    "model_id": model_id,
-                    "output_format": output_format,
-                    "transcript": transcript,
-                    "voice": voice,
-                    "add_phoneme_timestamps": add_phoneme_timestamps,
-                    "add_timestamps": add_timestamps,
-                    "context_id": context_id,
-                    "generation_config": generation_config,
-                    "language": language,
-                    "locale": locale,
-                    "normalization": normalization,
-                    "pronunciation_dict_id": pronunciation_dict_id,
-                    "speed": speed,
-                    "use_normalized_timestamps": use_normalized_timestamps,
-                },
-                tts_generate_sse_params.TTSGenerateSSEParams,
-            ),
-            options=make_request_options(
-                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
-            ),
-            cast_to=cast(Any, TTSSSEEvent),  # Union types cannot be passed in as arguments in the type system
-            stream=True,
-            stream_cls=Stream[TTSSSEEvent],
+        body = maybe_transform(
+            {
+                "model_id": model_id,
+                "output_format": output_format,
+                "transcript": transcript,
+                "voice": voice,
+                "add_phoneme_timestamps": add_phoneme_timestamps,
+                "add_timestamps": add_timestamps,
+                "context_id": context_id,
+                "generation_config": generation_config,
+                "language": language,
+                "locale": locale,
+                "normalization": normalization,
+                "pronunciation_dict_id": pronunciation_dict_id,
+                "speed": speed,
+                "use_normalized_timestamps": use_normalized_timestamps,
+            },
+            tts_generate_sse_params.TTSGenerateSSEParams,
+        )
+        stream_cls: type[AudioStream[TTSSSEEvent]] | type[RawAudioStream] = (
+            RawAudioStream if raw_audio else AudioStream[TTSSSEEvent]
         )
+        stream: AudioStream[TTSSSEEvent] | RawAudioStream
+        cache_key: Optional[str] = None
+        entry: Optional[CacheEntry] = None
+        if cache is not None and RAW_RESPONSE_HEADER not in extra_headers:
+            cache_key = cache.key("/tts/sse", body, extra_body)
+            entry = cache.get(cache_key)
+
+        if entry is not None:
+            stream = stream_cls(
+                cast_to=cast(Any, TTSSSEEvent),
+                response=replay_response(self._client, "/tts/sse", entry),
+                client=self._client,
+            )
+        else:
+            stream = self._post(
+                "/tts/sse",
+                body=body,
+                options=make_request_options(
+                    extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+                ),
+                cast_to=cast(Any, TTSSSEEvent),  # Union types cannot be passed in as arguments in the type system
+                stream=True,
+                stream_cls=stream_cls,
+            )
+            if cache is not None and cache_key is not None:
+                record_response(cache, cache_key, stream.response, validate=sse_succeeded)
+        if sink is not None:
+            stream._sink = sink
+        return stream
 
     def infill(
         self,
@@ -436,6 +629,14 @@ class TTSResource(SyncAPIResource):
         extra_query: Query = {},
         extra_headers: Headers = {},
         websocket_connection_options: WebsocketConnectionOptions = {},
+        *,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_queue_size: int = 1_048_576,
     ) -> TTSResourceConnectionManager:
         """Text-to-Speech (WebSocket).
 
@@ -446,6 +647,20 @@ class TTSResource(SyncAPIResource):
           - Multiple TTS [contexts](https://docs.cartesia.ai/use-the-api/tts-websocket/contexts) over the same connection
           - [Context flushing](https://docs.cartesia.ai/use-the-api/tts-websocket/context-flushing-and-flush-i-ds)
           - [Transcript buffering](https://docs.cartesia.ai/use-the-api/tts-websocket/buffering)
+
+        Pass `raw_audio=True` to receive `chunk` messages as `AudioChunk` objects, whose audio
+        is decoded once while the message is parsed, instead of `Chunk` models.
+
+        Pass `fast_parse=True` to receive `chunk` and `timestamps` messages as lightweight
+        `FastChunk` / `FastTimestamps` objects, built without pydantic.
+
+        Pass `on_reconnecting` to reconnect automatically, with exponential backoff between
+        `initial_delay` and `max_delay` seconds, when the connection drops with a recoverable
+        close code. The handler is called before each of up to `max_retries` attempts and
+        may return overrides or `{"abort": True}`. Every unfinished context is then resumed
+        on the new connection by re-sending its requests since the last acknowledged
+        `flush_id`, so audio after that flush may be received twice. Messages that are not
+        tied to a context are queued, up to `max_queue_size` bytes, while reconnecting.
         """
 
         return TTSResourceConnectionManager(
@@ -453,6 +668,111 @@ class TTSResource(SyncAPIResource):
             extra_query=extra_query,
             extra_headers=extra_headers,
             websocket_connection_options=websocket_connection_options,
+            raw_audio=raw_audio,
+            fast_parse=fast_parse,
+            on_reconnecting=on_reconnecting,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+            max_queue_size=max_queue_size,
+        )
+
+    def websocket_pool(
+        self,
+        *,
+        size: int = 4,
+        max_contexts_per_connection: int = 64,
+        health_check_interval: Optional[float] = 5.0,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        websocket_connection_options: WebsocketConnectionOptions = {},
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+    ) -> TTSConnectionPool:
+        """Text-to-Speech (WebSocket) over a pool of warm connections.
+
+        Keeps `size` sockets open and places each new context on the least-loaded one,
+        so concurrent callers don't serialize on a single connection or pay for a new
+        handshake per request.
+
+        Args:
+          size: Number of WebSocket connections to keep open.
+
+          max_contexts_per_connection: Maximum number of active contexts per connection.
+
+          health_check_interval: Seconds between checks that replace closed connections.
+              Pass `None` to disable the background check.
+
+          raw_audio: Receive `chunk` messages as `AudioChunk` objects instead of `Chunk` models.
+
+          fast_parse: Receive `chunk` and `timestamps` messages as `FastChunk` / `FastTimestamps`
+              objects instead of pydantic models.
+        """
+
+        return TTSConnectionPool(
+            client=self._client,
+            size=size,
+            max_contexts_per_connection=max_contexts_per_connection,
+            health_check_interval=health_check_interval,
+            extra_query=extra_query,
+            extra_headers=extra_headers,
+            websocket_connection_options=websocket_connection_options,
+            raw_audio=raw_audio,
+            fast_parse=fast_parse,
+        )
+
+    def batch_generate(
+        self,
+        requests: Iterable[tts_generate_params.TTSGenerateParams],
+        *,
+        concurrency: int = 8,
+        transport: Literal["http", "websocket"] = "http",
+        ordered: bool = False,
+        max_retries: Optional[int] = None,
+        connections: int = 2,
+        timeout: Optional[float] = None,
+    ) -> BatchGeneration:
+        """Generate many utterances with bounded concurrency.
+
+        Each request takes the same parameters as `generate()`. Results are yielded as they
+        finish, or in input order with `ordered=True`; a failed request is yielded with its
+        `error` set rather than raised. The returned iterator's `stats` reports throughput and
+        latency percentiles for the run so far.
+
+        ```py
+        with client.tts.batch_generate(requests, concurrency=16) as batch:
+            for result in batch:
+                ...
+        print(batch.stats)
+        ```
+
+        Args:
+          requests: `generate()` parameters for each utterance. Read lazily, so this can be a generator.
+
+          concurrency: Maximum number of requests in flight at once.
+
+          transport: `http` issues `generate()` requests over the client's connection pool.
+              `websocket` multiplexes contexts over `connections` WebSockets and needs a
+              `raw` output container.
+
+          ordered: Yield results in input order instead of completion order.
+
+          max_retries: Retries per request, defaulting to the client's `max_retries`. A 429
+              pauses the whole batch for its `Retry-After` period.
+
+          connections: Number of WebSockets to open for the `websocket` transport.
+
+          timeout: Per-request timeout, in seconds.
+        """
+        return BatchGeneration(
+            self._client,
+            requests,
+            concurrency=concurrency,
+            transport=transport,
+            ordered=ordered,
+            max_retries=max_retries if max_retries is not None else self._client.max_retries,
+            connections=connections,
+            timeout=timeout,
         )
 
     def websocket(
@@ -517,6 +837,8 @@ class AsyncTTSResource(AsyncAPIResource):
         pronunciation_dict_id: Optional[str] | Omit = omit,
         save: Optional[bool] | Omit = omit,
         speed: ModelSpeed | Omit = omit,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
         extra_headers: Headers | None = None,
@@ -569,6 +891,13 @@ class AsyncTTSResource(AsyncAPIResource):
               and may not work for all voices. Influences the speed of the generated speech.
               Faster speeds may reduce hallucination rate.
 
+          sink: Stream the response body into this `AudioSink` instead of buffering it in memory.
+              Use a `raw` container. The returned response's headers remain available, but its
+              content has already been consumed.
+
+          cache: Serve identical requests from this `TTSCache` instead of the API, and store the
+              audio of successful requests in it. Requests with `save=True` are not cached.
+
           extra_headers: Send extra headers
 
           extra_query: Add additional query parameters to the request
@@ -578,29 +907,144 @@ class AsyncTTSResource(AsyncAPIResource):
           timeout: Override the client-level default timeout for this request, in seconds
         """
         extra_headers = {"Accept": "audio/wav", **(extra_headers or {})}
-        return await self._post(
+        body = await async_maybe_transform(
+            {
+                "model_id": model_id,
+                "output_format": output_format,
+                "transcript": transcript,
+                "voice": voice,
+                "generation_config": generation_config,
+                "language": language,
+                "locale": locale,
+                "normalization": normalization,
+                "pronunciation_dict_id": pronunciation_dict_id,
+                "save": save,
+                "speed": speed,
+            },
+            tts_generate_params.TTSGenerateParams,
+        )
+        # Requests wrapped by `.with_raw_response` / `.with_streaming_response` and saved generations bypass the cache.
+        cache_key: Optional[str] = None
+        if cache is not None and RAW_RESPONSE_HEADER not in extra_headers and save is not True:
+            cache_key = cache.key("/tts/bytes", body, extra_body)
+            entry = cache.get(cache_key)
+            if entry is not None:
+                response = replay_binary_response(self._client, "/tts/bytes", entry, AsyncBinaryAPIResponse)
+                if sink is not None:
+                    async for data in response.iter_bytes():
+                        sink.write(data)
+                return response
+
+        if sink is not None:
+            extra_headers[RAW_RESPONSE_HEADER] = "stream"
+        response = await self._post(
             "/tts/bytes",
-            body=await async_maybe_transform(
-                {
-                    "model_id": model_id,
-                    "output_format": output_format,
-                    "transcript": transcript,
-                    "voice": voice,
-                    "generation_config": generation_config,
-                    "language": language,
-                    "locale": locale,
-                    "normalization": normalization,
-                    "pronunciation_dict_id": pronunciation_dict_id,
-                    "save": save,
-                    "speed": speed,
-                },
-                tts_generate_params.TTSGenerateParams,
-            ),
+            body=body,
             options=make_request_options(
                 extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
             ),
             cast_to=AsyncBinaryAPIResponse,
+            stream=sink is not None,
         )
+        if cache is not None and cache_key is not None:
+            if sink is None:
+                cache.put(cache_key, [await response.read()], cacheable_headers(response.headers))
+            else:
+                record_response(cache, cache_key, response.http_response)
+        if sink is not None:
+            try:
+                async for data in response.iter_bytes():
+                    sink.write(data)
+            finally:
+                await response.close()
+        return response
+
+    @overload
+    async def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: Literal[False] = False,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncAudioStream[TTSSSEEvent]: ...
+
+    @overload
+    async def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: Literal[True],
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncRawAudioStream: ...
+
+    @overload
+    async def generate_sse(
+        self,
+        *,
+        model_id: TTSModel,
+        output_format: tts_generate_sse_params.OutputFormat,
+        transcript: str,
+        voice: VoiceSpecifierParam,
+        add_phoneme_timestamps: Optional[bool] | Omit = omit,
+        add_timestamps: Optional[bool] | Omit = omit,
+        context_id: Optional[str] | Omit = omit,
+        generation_config: GenerationConfigParam | Omit = omit,
+        language: Optional[SupportedLanguage] | Omit = omit,
+        locale: Optional[str] | Omit = omit,
+        normalization: Optional[str] | Omit = omit,
+        pronunciation_dict_id: Optional[str] | Omit = omit,
+        speed: ModelSpeed | Omit = omit,
+        use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: bool,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = not_given,
+    ) -> AsyncAudioStream[TTSSSEEvent] | AsyncRawAudioStream: ...
 
     async def generate_sse(
         self,
@@ -619,13 +1063,16 @@ class AsyncTTSResource(AsyncAPIResource):
         pronunciation_dict_id: Optional[str] | Omit = omit,
         speed: ModelSpeed | Omit = omit,
         use_normalized_timestamps: Optional[bool] | Omit = omit,
+        raw_audio: bool = False,
+        sink: Optional[AudioSink] = None,
+        cache: Optional[TTSCache] = None,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
         extra_headers: Headers | None = None,
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = not_given,
-    ) -> AsyncStream[TTSSSEEvent]:
+    ) -> AsyncAudioStream[TTSSSEEvent] | AsyncRawAudioStream:
         """
         Text-to-Speech (SSE).
 
@@ -684,6 +1131,14 @@ class AsyncTTSResource(AsyncAPIResource):
 
           use_normalized_timestamps: Whether to use normalized timestamps (True) or original timestamps (False).
 
+          raw_audio: Yield `chunk` events as `AudioChunk` objects, whose audio is decoded once while
+              the event is parsed, instead of `TTSSSEChunkEvent` models.
+
+          sink: Write the audio of each `chunk` event to this `AudioSink` as the stream is iterated.
+
+          cache: Serve identical requests from this `TTSCache` instead of the API. A stream is
+              stored once it has been iterated to the end without an `error` event.
+
           extra_headers: Send extra headers
 
           extra_query: Add additional query parameters to the request
@@ -693,34 +1148,57 @@ class AsyncTTSResource(AsyncAPIResource):
           timeout: Override the client-level default timeout for this request, in seconds
         """
         extra_headers = {"Accept": "text/event-stream", **(extra_headers or {})}
-        return await self._post(
-            "/tts/sse",
-            body=await async_maybe_transform(
-                {
-                    "model_id": model_id,
-                    "output_format": output_format,
-                    "transcript": transcript,
-                    "voice": voice,
-                    "add_phoneme_timestamps": add_phoneme_timestamps,
-                    "add_timestamps": add_timestamps,
-                    "context_id": context_id,
-                    "generation_config": generation_config,
-                    "language": language,
-                    "locale": locale,
-                    "normalization": normalization,
-                    "pronunciation_dict_id": pronunciation_dict_id,
-                    "speed": speed,
-                    "use_normalized_timestamps": use_normalized_timestamps,
-                },
-                tts_generate_sse_params.TTSGenerateSSEParams,
-            ),
-            options=make_request_options(
-                extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
-            ),
-            cast_to=cast(Any, TTSSSEEvent),  # Union types cannot be passed in as arguments in the type system
-            stream=True,
-            stream_cls=AsyncStream[TTSSSEEvent],
+        body = await async_maybe_transform(
+            {
+                "model_id": model_id,
+                "output_format": output_format,
+                "transcript": transcript,
+                "voice": voice,
+                "add_phoneme_timestamps": add_phoneme_timestamps,
+                "add_timestamps": add_timestamps,
+                "context_id": context_id,
+                "generation_config": generation_config,
+                "language": language,
+                "locale": locale,
+                "normalization": normalization,
+                "pronunciation_dict_id": pronunciation_dict_id,
+                "speed": speed,
+                "use_normalized_timestamps": use_normalized_timestamps,
+            },
+            tts_generate_sse_params.TTSGenerateSSEParams,
+        )
+        stream_cls: type[AsyncAudioStream[TTSSSEEvent]] | type[AsyncRawAudioStream] = (
+            AsyncRawAudioStream if raw_audio else AsyncAudioStream[TTSSSEEvent]
         )
+        stream: AsyncAudioStream[TTSSSEEvent] | AsyncRawAudioStream
+        cache_key: Optional[str] = None
+        entry: Optional[CacheEntry] = None
+        if cache is not None and RAW_RESPONSE_HEADER not in extra_headers:
+            cache_key = cache.key("/tts/sse", body, extra_body)
+            entry = cache.get(cache_key)
+
+        if entry is not None:
+            stream = stream_cls(
+                cast_to=cast(Any, TTSSSEEvent),
+                response=replay_response(self._client, "/tts/sse", entry),
+                client=self._client,
+            )
+        else:
+            stream = await self._post(
+                "/tts/sse",
+                body=body,
+                options=make_request_options(
+                    extra_headers=extra_headers, extra_query=extra_query, extra_body=extra_body, timeout=timeout
+                ),
+                cast_to=cast(Any, TTSSSEEvent),  # Union types cannot be passed in as arguments in the type system
+                stream=True,
+                stream_cls=stream_cls,
+            )
+            if cache is not None and cache_key is not None:
+                record_response(cache, cache_key, stream.response, validate=sse_succeeded)
+        if sink is not None:
+            stream._sink = sink
+        return stream
 
     async def infill(
         self,
@@ -859,6 +1337,14 @@ class AsyncTTSResource(AsyncAPIResource):
         extra_query: Query = {},
         extra_headers: Headers = {},
         websocket_connection_options: WebsocketConnectionOptions = {},
+        *,
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+        on_reconnecting: Optional[Callable[[ReconnectingEvent], Optional[ReconnectingOverrides]]] = None,
+        max_retries: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+        max_queue_size: int = 1_048_576,
     ) -> AsyncTTSResourceConnectionManager:
         """Text-to-Speech (WebSocket).
 
@@ -869,6 +1355,21 @@ class AsyncTTSResource(AsyncAPIResource):
           - Multiple TTS [contexts](https://docs.cartesia.ai/use-the-api/tts-websocket/contexts) over the same connection
           - [Context flushing](https://docs.cartesia.ai/use-the-api/tts-websocket/context-flushing-and-flush-i-ds)
           - [Transcript buffering](https://docs.cartesia.ai/use-the-api/tts-websocket/buffering)
+
+        Pass `raw_audio=True` to receive `chunk` messages as `AudioChunk` objects, whose audio
+        is decoded once while the message is parsed, instead of `Chunk` models.
+
+        Pass `fast_parse=True` to receive `chunk` and `timestamps` messages as lightweight
+        `FastChunk` / `FastTimestamps` objects, built without pydantic.
+
+        Pass `on_reconnecting` to reconnect automatically, with exponential backoff between
+        `initial_delay` and `max_delay` seconds, when the connection drops with a recoverable
+        close code. The handler is called before each of up to `max_retries` attempts and
+        may return overrides or `{"abort": True}`. Every unfinished context is then resumed
+        on the new connection by re-sending its requests since the last acknowledged
+        `flush_id`, so audio after that flush may be received twice. Messages that are not
+        tied to a context are queued, up to `max_queue_size` bytes, while reconnecting;
+        once the queue is full, sends wait for it to drain instead of failing.
         """
 
         return AsyncTTSResourceConnectionManager(
@@ -876,6 +1377,111 @@ class AsyncTTSResource(AsyncAPIResource):
             extra_query=extra_query,
             extra_headers=extra_headers,
             websocket_connection_options=websocket_connection_options,
+            raw_audio=raw_audio,
+            fast_parse=fast_parse,
+            on_reconnecting=on_reconnecting,
+            max_retries=max_retries,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+            max_queue_size=max_queue_size,
+        )
+
+    def websocket_pool(
+        self,
+        *,
+        size: int = 4,
+        max_contexts_per_connection: int = 64,
+        health_check_interval: Optional[float] = 5.0,
+        extra_query: Query = {},
+        extra_headers: Headers = {},
+        websocket_connection_options: WebsocketConnectionOptions = {},
+        raw_audio: bool = False,
+        fast_parse: bool = False,
+    ) -> AsyncTTSConnectionPool:
+        """Text-to-Speech (WebSocket) over a pool of warm connections.
+
+        Keeps `size` sockets open and places each new context on the least-loaded one,
+        so concurrent callers don't serialize on a single connection or pay for a new
+        handshake per request.
+
+        Args:
+          size: Number of WebSocket connections to keep open.
+
+          max_contexts_per_connection: Maximum number of active contexts per connection.
+
+          health_check_interval: Seconds between checks that replace closed connections.
+              Pass `None` to disable the background check.
+
+          raw_audio: Receive `chunk` messages as `AudioChunk` objects instead of `Chunk` models.
+
+          fast_parse: Receive `chunk` and `timestamps` messages as `FastChunk` / `FastTimestamps`
+              objects instead of pydantic models.
+        """
+
+        return AsyncTTSConnectionPool(
+            client=self._client,
+            size=size,
+            max_contexts_per_connection=max_contexts_per_connection,
+            health_check_interval=health_check_interval,
+            extra_query=extra_query,
+            extra_headers=extra_headers,
+            websocket_connection_options=websocket_connection_options,
+            raw_audio=raw_audio,
+            fast_parse=fast_parse,
+        )
+
+    def batch_generate(
+        self,
+        requests: Iterable[tts_generate_params.TTSGenerateParams],
+        *,
+        concurrency: int = 8,
+        transport: Literal["http", "websocket"] = "http",
+        ordered: bool = False,
+        max_retries: Optional[int] = None,
+        connections: int = 2,
+        timeout: Optional[float] = None,
+    ) -> AsyncBatchGeneration:
+        """Generate many utterances with bounded concurrency.
+
+        Each request takes the same parameters as `generate()`. Results are yielded as they
+        finish, or in input order with `ordered=True`; a failed request is yielded with its
+        `error` set rather than raised. The returned iterator's `stats` reports throughput and
+        latency percentiles for the run so far.
+
+        ```py
+        async with client.tts.batch_generate(requests, concurrency=16) as batch:
+            async for result in batch:
+                ...
+        print(batch.stats)
+        ```
+
+        Args:
+          requests: `generate()` parameters for each utterance. Read lazily, so this can be a generator.
+
+          concurrency: Maximum number of requests in flight at once.
+
+          transport: `http` issues `generate()` requests over the client's connection pool.
+              `websocket` multiplexes contexts over `connections` WebSockets and needs a
+              `raw` output container.
+
+          ordered: Yield results in input order instead of completion order.
+
+          max_retries: Retries per request, defaulting to the client's `max_retries`. A 429
+              pauses the whole batch for its `Retry-After` period.
+
+          connections: Number of WebSockets to open for the `websocket` transport.
+
+          timeout: Per-request timeout, in seconds.
+        """
+        return AsyncBatchGeneration(
+            self._client,
+            requests,
+            concurrency=concurrency,
+            transport=transport,
+            ordered=ordered,
+            max_retries=max_retries if max_retries is not None else self._client.max_retries,
+            connections=connections,
+            timeout=timeout,
         )
 
     async def websocket(
@@ -27,8 +27,8 @@ from .._response import (
     async_to_custom_raw_response_wrapper,
     async_to_custom_streamed_response_wrapper,
 )
-from .._streaming import Stream, AsyncStream
 from .._base_client import make_request_options
+from ..lib._raw_audio import AudioStream as AudioStream, AsyncAudioStream as AsyncAudioStream
 from ..types.raw_encoding import RawEncoding
 from ..types.output_format_container import OutputFormatContainer
 from ..types.voice_changer_sse_event import VoiceChangerSSEEvent
@@ -135,7 +135,7 @@ class VoiceChangerResource(SyncAPIResource):
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = not_given,
-    ) -> Stream[VoiceChangerSSEEvent]:
+    ) -> AudioStream[VoiceChangerSSEEvent]:
         """
         Voice Changer (SSE)
 
@@ -178,7 +178,7 @@ class VoiceChangerResource(SyncAPIResource):
             ),
             cast_to=cast(Any, VoiceChangerSSEEvent),  # Union types cannot be passed in as arguments in the type system
             stream=True,
-            stream_cls=Stream[VoiceChangerSSEEvent],
+            stream_cls=AudioStream[VoiceChangerSSEEvent],
         )
 
     change_voice_bytes = generate  # Alias for backward compatibility
@@ -347,7 +347,7 @@ class AsyncVoiceChangerResource(AsyncAPIResource):
         extra_query: Query | None = None,
         extra_body: Body | None = None,
         timeout: float | httpx.Timeout | None | NotGiven = not_given,
-    ) -> AsyncStream[VoiceChangerSSEEvent]:
+    ) -> AsyncAudioStream[VoiceChangerSSEEvent]:
         """
         Voice Changer (SSE)
 
@@ -390,7 +390,7 @@ class AsyncVoiceChangerResource(AsyncAPIResource):
             ),
             cast_to=cast(Any, VoiceChangerSSEEvent),  # Union types cannot be passed in as arguments in the type system
             stream=True,
-            stream_cls=AsyncStream[VoiceChangerSSEEvent],
+            stream_cls=AsyncAudioStream[VoiceChangerSSEEvent],
         )
 
     change_voice_bytes = generate  # Alias for backward compatibility
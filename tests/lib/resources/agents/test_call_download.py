@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import Dict, List, Iterator, Optional
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+RECORDINGS = {
+    "call_a": b"RIFF" + bytes(range(256)) * 400,
+    "call_b": b"RIFF" + b"\x01" * 70_000,
+    "call_c": b"RIFF" + b"\x02" * 10,
+}
+
+
+class _DroppedStream(httpx.SyncByteStream):
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._data
+        raise httpx.ReadError("connection reset")
+
+
+class _Server:
+    """Serves `RECORDINGS` with Range support, optionally dropping the first transfer of a call."""
+
+    def __init__(self, drop: Optional[str] = None, *, honour_range: bool = True) -> None:
+        self.drop = drop
+        self.honour_range = honour_range
+        self.ranges: List[Optional[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        call_id = request.url.path.split("/")[-2]
+        data = RECORDINGS[call_id]
+        range_header = request.headers.get("Range")
+        self.ranges.append(range_header)
+        if call_id == self.drop:
+            self.drop = None
+            return httpx.Response(200, headers={"Content-Length": str(len(data))}, stream=_DroppedStream(data[:1000]))
+        match = re.fullmatch(r"bytes=(\d+)-", range_header or "")
+        if match is None or not self.honour_range:
+            return httpx.Response(200, content=data)
+        start = int(match.group(1))
+        if start >= len(data):
+            return httpx.Response(416, headers={"Content-Range": f"bytes */{len(data)}"})
+        return httpx.Response(
+            206, content=data[start:], headers={"Content-Range": f"bytes {start}-{len(data) - 1}/{len(data)}"}
+        )
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_downloads_skips_and_resumes(client: Cartesia, respx_mock: MockRouter, tmp_path: Path) -> None:
+    server = _Server()
+    respx_mock.get(url__regex=r".*/agents/calls/\w+/audio").mock(side_effect=server)
+    (tmp_path / "call_a.wav").write_bytes(RECORDINGS["call_a"])
+    (tmp_path / "call_b.wav.part").write_bytes(RECORDINGS["call_b"][:5000])
+    (tmp_path / "call_c.wav.part").write_bytes(RECORDINGS["call_c"])
+
+    with client.agents.calls.download_many(["call_a", "call_b", "call_c", "call_b"], tmp_path, concurrency=2) as run:
+        results = {download.call_id: download for download in run}
+
+    assert {call_id: download.outcome for call_id, download in results.items()} == {
+        "call_a": "skipped",
+        "call_b": "resumed",
+        "call_c": "resumed",
+    }
+    assert all(download.ok for download in results.values())
+    # `call_b` was requested once despite being listed twice, and `call_c` was already complete.
+    assert sorted(server.ranges, key=str) == ["bytes=14-", "bytes=5000-"]
+    for call_id, data in RECORDINGS.items():
+        assert (tmp_path / f"{call_id}.wav").read_bytes() == data
+    assert not list(tmp_path.glob("*.part"))
+
+    assert results["call_b"].bytes_downloaded == len(RECORDINGS["call_b"]) - 5000
+    assert results["call_b"].size == len(RECORDINGS["call_b"])
+    assert (run.files, run.failed, run.bytes_downloaded) == (3, 0, len(RECORDINGS["call_b"]) - 5000)
+    assert run.throughput > 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_dropped_transfer_is_resumed(client: Cartesia, respx_mock: MockRouter, tmp_path: Path) -> None:
+    server = _Server(drop="call_a")
+    respx_mock.get(url__regex=r".*/agents/calls/\w+/audio").mock(side_effect=server)
+
+    [download] = client.agents.calls.download_many(["call_a"], tmp_path)
+
+    assert download.ok and download.outcome == "resumed"
+    assert server.ranges == [None, "bytes=1000-"]
+    assert (tmp_path / "call_a.wav").read_bytes() == RECORDINGS["call_a"]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_ignored_range_restarts_and_errors_are_reported(
+    client: Cartesia, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    respx_mock.get(url__regex=r".*/agents/calls/call_a/audio").mock(side_effect=_Server(honour_range=False))
+    respx_mock.get(url__regex=r".*/agents/calls/missing/audio").mock(return_value=httpx.Response(404, json={}))
+    (tmp_path / "call_a.wav.part").write_bytes(b"stale")
+
+    downloads = list(client.agents.calls.download_many(["call_a", "missing"], tmp_path))
+    results: Dict[str, object] = {download.call_id: download.error for download in downloads}
+    outcomes = {download.call_id: download.outcome for download in downloads}
+
+    assert results["call_a"] is None
+    assert (tmp_path / "call_a.wav").read_bytes() == RECORDINGS["call_a"]
+    assert outcomes["call_a"] == "downloaded"
+    assert results["missing"] is not None
+    assert not (tmp_path / "missing.wav").exists()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_invalid_call_ids_fail_alone(client: Cartesia, respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.get(url__regex=r".*/agents/calls/\w+/audio").mock(side_effect=_Server())
+
+    with client.agents.calls.download_many(["../escape", "call_c"], tmp_path) as run:
+        results = {download.call_id: download for download in run}
+
+    assert isinstance(results["../escape"].error, ValueError)
+    assert results["call_c"].ok
+    assert (run.files, run.failed) == (2, 1)
+    assert not (tmp_path.parent / "escape.wav").exists()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_download_many(async_client: AsyncCartesia, respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.get(url__regex=r".*/agents/calls/\w+/audio").mock(side_effect=_Server())
+    (tmp_path / "call_b.wav.part").write_bytes(RECORDINGS["call_b"][:100])
+
+    async with async_client.agents.calls.download_many(list(RECORDINGS), tmp_path / "out") as run:
+        outcomes = {download.call_id: download.outcome async for download in run}
+
+    assert outcomes == {"call_a": "downloaded", "call_b": "downloaded", "call_c": "downloaded"}
+    for call_id, data in RECORDINGS.items():
+        assert (tmp_path / "out" / f"{call_id}.wav").read_bytes() == data
+
+    [rejected] = [download async for download in async_client.agents.calls.download_many([""], tmp_path)]
+    assert isinstance(rejected.error, ValueError)
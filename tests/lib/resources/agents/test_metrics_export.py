@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import io
+import os
+import csv
+from typing import List
+from datetime import datetime, timezone, timedelta
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.lib import _metrics_export
+from cartesia.lib._metrics_export import _CSVRows, make_windows
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+START = datetime(2024, 4, 1, tzinfo=timezone.utc)
+COLUMNS = ["id", "createdAt", "summary"]
+# one result every 90 minutes for two days
+RESULTS = [
+    [f"mr_{i}", (START + timedelta(minutes=90 * i)).isoformat(), f'line one\nline "two", {i}'] for i in range(32)
+]
+
+
+def _csv(rows: List[List[str]], columns: List[str] = COLUMNS) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def _export(request: httpx.Request, results: List[List[str]] = RESULTS, columns: List[str] = COLUMNS) -> httpx.Response:
+    """Serves `results` filtered by date, capped at `EXPORT_ROW_LIMIT` rows like the API."""
+    params = request.url.params
+    start = datetime.fromisoformat(params["start_date"]) if "start_date" in params else None
+    end = datetime.fromisoformat(params["end_date"]) if "end_date" in params else None
+    created_at = columns.index("createdAt")
+    rows = [
+        row
+        for row in results
+        if (start is None or datetime.fromisoformat(row[created_at]) >= start)
+        and (end is None or datetime.fromisoformat(row[created_at]) <= end)
+    ]
+    body = _csv(rows[: _metrics_export.EXPORT_ROW_LIMIT], columns).encode()
+    # arrive in small pieces, splitting records and quoted fields
+    chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+    return httpx.Response(200, headers={"Content-Type": "text/csv"}, stream=httpx.ByteStream(b"".join(chunks)))
+
+
+def test_parser_handles_records_split_across_chunks() -> None:
+    text = _csv(RESULTS[:5]).replace("\r\n", "\n")
+    parser = _CSVRows()
+    rows = [row for char in text for row in parser.feed(char)] + parser.finish()
+
+    assert parser.columns == COLUMNS
+    assert rows == list(csv.DictReader(io.StringIO(text)))
+    assert rows[0]["summary"] == 'line one\nline "two", 0'
+
+
+def test_make_windows_are_inclusive_and_adjacent() -> None:
+    windows = make_windows("2024-04-01T00:00:00Z", "2024-04-02T12:00:00Z", timedelta(days=1))
+
+    assert windows == [
+        (START, START + timedelta(days=1, microseconds=-1)),
+        (START + timedelta(days=1), START + timedelta(days=1, hours=12)),
+    ]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_export_rows_streams_parsed_rows(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.get("/agents/metrics/results/export").mock(side_effect=_export)
+
+    with client.agents.metrics.results.export_rows(agent_id="agent_id") as rows:
+        batches = list(rows.batches(size=10))
+
+    assert [len(batch["id"]) for batch in batches] == [10, 10, 10, 2]
+    assert sum((batch["id"] for batch in batches), []) == [row[0] for row in RESULTS]
+    assert batches[0]["summary"][3] == RESULTS[3][2]
+    assert rows.columns == COLUMNS and rows.rows == len(RESULTS)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_windows_that_reach_the_limit_are_split(
+    client: Cartesia, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_metrics_export, "EXPORT_ROW_LIMIT", 5)
+    route = respx_mock.get("/agents/metrics/results/export").mock(side_effect=_export)
+
+    rows = client.agents.metrics.results.export_rows(
+        start_date=START,
+        end_date=START + timedelta(days=2, microseconds=-1),
+        window=timedelta(hours=12),
+        concurrency=3,
+    )
+    ids = [row["id"] for row in rows]
+
+    # each 12 hour window holds 8 results, so all four are exported again in halves
+    assert sorted(ids) == sorted(row[0] for row in RESULTS)
+    assert route.call_count == 4 + 8
+    assert rows.truncated == []
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_identical_rows_without_an_id_survive_splitting(
+    client: Cartesia, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_metrics_export, "EXPORT_ROW_LIMIT", 5)
+    columns = ["createdAt", "result"]
+    # every result is reported twice, with nothing to tell the copies apart
+    results = [[row[1], "pass"] for row in RESULTS[:16] for _ in range(2)]
+    respx_mock.get("/agents/metrics/results/export").mock(
+        side_effect=lambda request: _export(request, results, columns)
+    )
+
+    rows = client.agents.metrics.results.export_rows(
+        start_date=START, end_date=START + timedelta(days=1, microseconds=-1), window=timedelta(days=1)
+    )
+
+    assert sorted(row["createdAt"] for row in rows) == sorted(result[0] for result in results)
+
+
+def test_window_requires_a_date_range(client: Cartesia) -> None:
+    with pytest.raises(ValueError, match="start_date"):
+        client.agents.metrics.results.export_rows(start_date=START, window=timedelta(days=1))
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_export_rows_in_windows(
+    async_client: AsyncCartesia, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_metrics_export, "EXPORT_ROW_LIMIT", 5)
+    respx_mock.get("/agents/metrics/results/export").mock(side_effect=_export)
+
+    rows = async_client.agents.metrics.results.export_rows(
+        start_date=START, end_date=START + timedelta(days=2), window=timedelta(days=1), concurrency=2
+    )
+    ids = [batch_id async for batch in rows.batches(size=4) for batch_id in batch["id"]]
+
+    assert sorted(ids) == sorted(row[0] for row in RESULTS)
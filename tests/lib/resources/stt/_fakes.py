@@ -5,6 +5,7 @@ from collections import deque
 
 import httpx
 import pytest
+from websockets.protocol import State
 from websockets.exceptions import ConnectionClosedOK
 
 RecvItem = Union[bytes, str, BaseException]
@@ -19,6 +20,10 @@ class FakeSyncWS:
         self.close_calls: List[Tuple[int, str]] = []
         self._script: "deque[RecvItem]" = deque()
 
+    @property
+    def state(self) -> State:
+        return State.CLOSED if self.closed else State.OPEN
+
     def queue(self, *items: RecvItem) -> "FakeSyncWS":
         self._script.extend(items)
         return self
@@ -50,6 +55,10 @@ class FakeAsyncWS:
         self.close_calls: List[Tuple[int, str]] = []
         self._script: "deque[RecvItem]" = deque()
 
+    @property
+    def state(self) -> State:
+        return State.CLOSED if self.closed else State.OPEN
+
     def queue(self, *items: RecvItem) -> "FakeAsyncWS":
         self._script.extend(items)
         return self
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+import wave
+import struct
+from typing import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.resources.stt.stt import AudioFeeder, AsyncAudioFeeder
+
+from ._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+
+def _write_wav(path: Path, frames: bytes, *, sample_rate: int = 8000) -> None:
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(sample_rate)
+        file.writeframes(frames)
+
+
+def test_wav_file_is_framed_into_whole_sample_chunks(
+    client: Cartesia, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    audio = bytes(range(256)) * 13  # 3328 bytes, 0.208 s of 8 kHz pcm_s16le
+    _write_wav(tmp_path / "in.wav", audio)
+
+    conn = client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=8000).enter()
+    feeder = AudioFeeder(conn, tmp_path / "in.wav", encoding="pcm_s16le", sample_rate=8000, speed=float("inf"))
+    feeder.run()
+
+    ws: FakeSyncWS = conn._connection  # type: ignore[assignment]
+    assert [len(chunk) for chunk in ws.sent] == [1600, 1600, 128]
+    assert b"".join(ws.sent) == audio
+    assert (feeder.chunks_sent, feeder.bytes_sent) == (3, len(audio))
+    assert feeder.audio_seconds_sent == pytest.approx(0.208)
+
+
+def test_chunks_after_the_wav_data_are_not_sent(
+    client: Cartesia, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    audio = bytes(range(200))
+    _write_wav(tmp_path / "in.wav", audio)
+    with open(tmp_path / "in.wav", "ab") as file:
+        file.write(b"LIST" + struct.pack("<I", 4) + b"INFO")
+
+    conn = client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=8000).enter()
+    feeder = AudioFeeder(conn, tmp_path / "in.wav", encoding="pcm_s16le", sample_rate=8000, speed=float("inf"))
+    feeder.run()
+
+    ws: FakeSyncWS = conn._connection  # type: ignore[assignment]
+    assert b"".join(ws.sent) == audio
+    assert feeder.audio_seconds_sent == pytest.approx(len(audio) / 16000)
+
+
+def test_wav_format_must_match_configuration(client: Cartesia, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    _write_wav(tmp_path / "in.wav", b"\x00" * 320, sample_rate=16000)
+
+    conn = client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=8000).enter()
+    # Errors from the feeder thread are re-raised by `join()`, which runs on exit.
+    with pytest.raises(ValueError, match="16000 Hz"):
+        with AudioFeeder(conn, tmp_path / "in.wav", encoding="pcm_s16le", sample_rate=8000):
+            pass
+
+
+def test_sends_are_paced_and_can_be_stopped(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    conn = client.stt.manual_finalize.websocket(encoding="pcm_mulaw", model="ink-2", sample_rate=8000).enter()
+    ws: FakeSyncWS = conn._connection  # type: ignore[assignment]
+
+    # One second of audio at 20x is sent over ~50 ms, in ten 100 ms chunks.
+    feeder = AudioFeeder(conn, [b"\xff" * 8000], encoding="pcm_mulaw", sample_rate=8000, speed=20)
+    start = time.monotonic()
+    feeder.run()
+    assert time.monotonic() - start >= 0.04  # the last chunk is due 0.9 s / 20 after the first
+    assert len(ws.sent) == 10
+    assert 0 <= feeder.mean_lag <= feeder.max_lag < 0.5
+
+    slow = AudioFeeder(conn, [b"\xff" * 8000], encoding="pcm_mulaw", sample_rate=8000).start()
+    time.sleep(0.15)
+    slow.stop()
+    slow.join(timeout=1)
+    assert slow.done
+    assert 1 <= slow.chunks_sent < 10
+
+
+async def test_async_feeder_reframes_async_iterables(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    install_async_connect(monkeypatch, FakeAsyncWS)
+    conn = await async_client.stt.auto_finalize.websocket(encoding="pcm_f32le", model="ink-2", sample_rate=1000).enter()
+
+    async def mic() -> AsyncIterator[bytes]:
+        for _ in range(5):
+            yield b"\x01" * 100  # 25 samples per buffer
+
+    async with AsyncAudioFeeder(
+        conn, mic(), encoding="pcm_f32le", sample_rate=1000, chunk_duration=0.05, speed=100
+    ) as feeder:
+        pass
+
+    ws: FakeAsyncWS = conn._connection  # type: ignore[assignment]
+    assert [len(chunk) for chunk in ws.sent] == [200, 200, 100]
+    assert feeder.done and feeder.audio_seconds_sent == pytest.approx(0.125)
@@ -163,6 +163,47 @@ def test_manager_once_decorator_form_returns_fn(client: Cartesia) -> None:
     assert callable(handler)
 
 
+def test_manager_warmup_connects_before_enter(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    manager = client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000)
+
+    assert manager.warmup().warmup() is manager
+    assert len(captured["calls"]) == 1
+    warm_ws = captured["last_ws"]
+
+    with manager as connection:
+        assert connection._connection is warm_ws
+    assert len(captured["calls"]) == 1
+
+    # a warm socket that closed while waiting is replaced on enter
+    manager.warmup()
+    stale: FakeSyncWS = captured["last_ws"]
+    stale.closed = True
+    connection = manager.enter()
+    assert len(captured["calls"]) == 3
+    assert connection._connection is captured["last_ws"]
+    assert stale.close_calls
+
+
+async def test_async_manager_warmup_connects_before_enter(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured = install_async_connect(monkeypatch, FakeAsyncWS)
+    manager = async_client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000)
+
+    await manager.warmup()
+    async with manager as connection:
+        assert connection._connection is captured["last_ws"]
+    assert len(captured["calls"]) == 1
+
+    await manager.warmup()
+    stale: FakeAsyncWS = captured["last_ws"]
+    stale.closed = True
+    await manager.enter()
+    assert len(captured["calls"]) == 3
+    assert stale.close_calls
+
+
 async def test_async_manager_send_queued_pre_enter_is_flushed_on_enter(
     async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -281,14 +322,14 @@ def test_send_raw_passes_through_when_connected(client: Cartesia, monkeypatch: p
     assert ws.sent == [b"raw-bytes", "raw-str"]
 
 
-def test_send_raw_queues_string_form_when_reconnecting(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_send_raw_queues_bytes_when_reconnecting(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
     install_sync_connect(monkeypatch, FakeSyncWS)
     conn = client.stt.auto_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000).enter()
     conn._is_reconnecting = True
     conn.send_raw(b"raw-bytes")
     assert len(conn._send_queue) == 1
-    # drained items are strings even when raw bytes were enqueued
-    assert conn._send_queue.drain() == ["raw-bytes"]
+    # audio frames are queued as bytes, without a UTF-8 round trip
+    assert conn._send_queue.drain() == [b"raw-bytes"]
 
 
 async def test_async_send_queues_during_reconnect_and_flushes_on_reconnect_success(
@@ -320,6 +361,34 @@ async def test_async_send_queues_during_reconnect_and_flushes_on_reconnect_succe
     assert second.sent == [json.dumps({"type": "close"})]
 
 
+async def test_async_send_raw_keeps_audio_bytes_when_reconnecting(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = FakeAsyncWS().queue(_err_close())
+    second = FakeAsyncWS().queue(_TURN_END_PAYLOAD)
+    factories = iter([first, second])
+    install_async_connect(monkeypatch, lambda: next(factories))
+
+    conn = await async_client.stt.auto_finalize.websocket(
+        encoding="pcm_s16le",
+        model="ink-2",
+        sample_rate=16_000,
+        on_reconnecting=lambda _evt: None,
+        initial_delay=0,
+        max_delay=0,
+        max_retries=1,
+    ).enter()
+
+    # PCM is not valid UTF-8, so it must be queued and re-sent as a binary frame.
+    conn._is_reconnecting = True
+    await conn.send_raw(b"\x00\xff\x80")
+    assert conn._send_queue.nbytes == 3
+
+    events = [event async for event in conn]
+    assert [e.type for e in events] == ["turn.end"]
+    assert second.sent == [b"\x00\xff\x80"]
+
+
 # ---------------------------------------------------------------------------
 # close
 # ---------------------------------------------------------------------------
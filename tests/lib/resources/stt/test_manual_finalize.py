@@ -164,6 +164,18 @@ def test_manager_send_queued_pre_enter_is_flushed_on_enter(client: Cartesia, mon
     assert ws.sent == ["finalize", "close"]
 
 
+def test_manager_closes_a_stale_warm_socket_on_enter(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    manager = client.stt.manual_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000)
+    manager.warmup()
+    stale: FakeSyncWS = captured["last_ws"]
+    stale.closed = True
+
+    connection = manager.enter()
+    assert connection._connection is captured["last_ws"] is not stale
+    assert stale.close_calls
+
+
 def test_manager_on_handlers_transfer_to_connection_on_enter(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
     install_sync_connect(monkeypatch, FakeSyncWS)
     manager = client.stt.manual_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000)
@@ -299,12 +311,25 @@ def test_send_raw_passes_through_when_connected(client: Cartesia, monkeypatch: p
     assert ws.sent == [b"\x00\x01\x02", "finalize"]
 
 
-def test_send_raw_queues_string_form_when_reconnecting(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_send_raw_queues_bytes_when_reconnecting(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
     install_sync_connect(monkeypatch, FakeSyncWS)
     conn = client.stt.manual_finalize.websocket(encoding="pcm_s16le", model="ink-2", sample_rate=16_000).enter()
     conn._is_reconnecting = True
     conn.send_raw(b"raw-bytes")
-    assert conn._send_queue.drain() == ["raw-bytes"]
+    assert conn._send_queue.drain() == [b"raw-bytes"]
+
+
+def test_max_buffered_audio_drops_oldest_audio(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    # 0.1 s of 8 kHz mu-law is 800 bytes.
+    conn = client.stt.manual_finalize.websocket(
+        encoding="pcm_mulaw", model="ink-2", sample_rate=8_000, max_buffered_audio=0.1, drop_oldest_audio=True
+    ).enter()
+    conn._is_reconnecting = True
+    for chunk in (b"\x01" * 400, b"\x02" * 400, b"\x03" * 400):
+        conn.send_raw(chunk)
+    conn.send_raw("finalize")
+    assert conn._send_queue.drain() == [b"\x02" * 400, b"\x03" * 400, "finalize"]
 
 
 async def test_async_send_queues_during_reconnect_and_flushes_on_reconnect_success(
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import os
+import json
+import wave
+from typing import Any, Dict, List
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia, STTTranscriptionError
+
+from ._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+def _write_wav(path: Path, seconds: float, *, channels: int = 1) -> Path:
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(channels)
+        file.setsampwidth(2)
+        file.setframerate(8000)
+        file.writeframes(b"\x01\x00" * int(8000 * seconds) * channels)
+    return path
+
+
+def _transcript(text: str, words: List[str], start: float) -> str:
+    return json.dumps(
+        {
+            "type": "transcript",
+            "request_id": "r",
+            "is_final": True,
+            "text": text,
+            "words": [
+                {
+                    "words": words,
+                    "start": [start + i for i in range(len(words))],
+                    "end": [start + i + 0.5 for i in range(len(words))],
+                }
+            ],
+        }
+    )
+
+
+_SESSION = [
+    json.dumps({"type": "transcript", "request_id": "r", "is_final": False, "text": "Hel"}),
+    _transcript("Hello there.", ["Hello", "there."], 0.0),
+    _transcript(" Bye.", ["Bye."], 2.0),
+    json.dumps({"type": "done", "request_id": "r"}),
+]
+
+
+def _batch_reply(request: httpx.Request) -> httpx.Response:
+    assert b'name="timestamp_granularities[]"' in request.content
+    return httpx.Response(
+        200,
+        json={
+            "type": "transcript",
+            "text": "Batch.",
+            "duration": 0.5,
+            "words": [{"word": "Batch.", "start": 0.0, "end": 0.4}],
+        },
+    )
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_files_are_routed_by_size_and_format(
+    client: Cartesia, monkeypatch: pytest.MonkeyPatch, respx_mock: MockRouter, tmp_path: Path
+) -> None:
+    route = respx_mock.post("/stt").mock(side_effect=_batch_reply)
+    captured = install_sync_connect(monkeypatch, lambda: FakeSyncWS().queue(*_SESSION))
+    large = _write_wav(tmp_path / "large.wav", 1.0)
+    small = _write_wav(tmp_path / "small.wav", 0.01)
+    stereo = _write_wav(tmp_path / "stereo.wav", 1.0, channels=2)
+    compressed = tmp_path / "large.mp3"
+    compressed.write_bytes(b"ID3" + b"\x00" * 20_000)
+
+    with client.stt.transcribe_many(
+        [large, small, stereo, compressed], model="ink-whisper", streaming_threshold=10_000
+    ) as run:
+        results = sorted(run, key=lambda result: result.index)
+
+    assert [result.transport for result in results] == ["streaming", "batch", "batch", "batch"]
+    assert all(result.ok for result in results)
+    assert route.call_count == 3
+
+    streamed = results[0]
+    assert streamed.text == "Hello there. Bye."
+    assert [(word.word, word.start, word.end) for word in streamed.words] == [
+        ("Hello", 0.0, 0.5),
+        ("there.", 1.0, 1.5),
+        ("Bye.", 2.0, 2.5),
+    ]
+    assert streamed.duration == pytest.approx(1.0)
+    ws: FakeSyncWS = captured["last_ws"]
+    assert dict(captured["calls"][0]["url"].params)["encoding"] == "pcm_s16le"
+    # The file is sent without its header, followed by the `close` command.
+    assert b"".join(ws.sent[:-1]) == b"\x01\x00" * 8000
+    assert ws.sent[-1] == "close"
+
+    assert results[1].text == "Batch." and results[1].words[0].word == "Batch."
+
+
+def test_streaming_errors_are_reported_per_file(
+    client: Cartesia, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    error = {"type": "error", "message": "bad audio", "status_code": 400, "title": "Bad Request"}
+    sessions = iter([[json.dumps(error)], _SESSION[:2]])
+    install_sync_connect(monkeypatch, lambda: FakeSyncWS().queue(*next(sessions)))
+    files = [_write_wav(tmp_path / "a.wav", 0.2), _write_wav(tmp_path / "b.wav", 0.2)]
+
+    results = sorted(
+        client.stt.transcribe_many(files, model="ink-whisper", streaming_threshold=0, concurrency=1),
+        key=lambda result: result.index,
+    )
+
+    assert isinstance(results[0].error, STTTranscriptionError)
+    assert results[0].error.status_code == 400
+    # A session that closes before `done` is incomplete, not silently truncated.
+    assert isinstance(results[1].error, STTTranscriptionError)
+
+
+async def test_async_streaming(async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    connections: List[FakeAsyncWS] = []
+
+    def connect() -> FakeAsyncWS:
+        connections.append(FakeAsyncWS().queue(*_SESSION))
+        return connections[-1]
+
+    install_async_connect(monkeypatch, connect)
+    files = [_write_wav(tmp_path / f"{i}.wav", 0.3) for i in range(3)]
+
+    results: Dict[int, Any] = {}
+    async with async_client.stt.transcribe_many(
+        files, model="ink-whisper", streaming_threshold=0, concurrency=2
+    ) as run:
+        async for result in run:
+            results[result.index] = result
+
+    assert sorted(results) == [0, 1, 2]
+    assert {result.text for result in results.values()} == {"Hello there. Bye."}
+    assert len(connections) == 3
+    assert all(ws.sent[-1] == "close" for ws in connections)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import queue
+import base64
+import asyncio
+from typing import Any, Dict, List, Union
+
+from websockets.frames import Close
+from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
+
+from cartesia.lib._audio_sink import AudioSink
+
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS
+
+Frame = Union[Dict[str, Any], bytes, str, BaseException]
+
+
+def _encode(frame: Frame) -> Union[bytes, str, BaseException]:
+    return json.dumps(frame).encode() if isinstance(frame, dict) else frame
+
+
+class BlockingSyncWS(FakeSyncWS):
+    """`recv` blocks until a frame is fed, so the test decides when frames arrive and the connection drops.
+
+    Dict frames are JSON-encoded; exceptions are raised from `recv`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._frames: "queue.Queue[Union[bytes, str, BaseException]]" = queue.Queue()
+
+    def feed(self, *frames: Frame) -> None:
+        for frame in frames:
+            self._frames.put(_encode(frame))
+
+    def recv(self, decode: bool = True, timeout: Union[float, None] = None) -> Any:  # noqa: ARG002
+        frame = self._frames.get()
+        if isinstance(frame, BaseException):
+            raise frame
+        return frame
+
+    def close(self, *, code: int = 1000, reason: str = "") -> None:
+        super().close(code=code, reason=reason)
+        self._frames.put(ConnectionClosedOK(rcvd=None, sent=None))
+
+
+class BlockingAsyncWS(FakeAsyncWS):
+    def __init__(self) -> None:
+        super().__init__()
+        self._frames: "asyncio.Queue[Union[bytes, str, BaseException]]" = asyncio.Queue()
+
+    def feed(self, *frames: Frame) -> None:
+        for frame in frames:
+            self._frames.put_nowait(_encode(frame))
+
+    async def recv(self, decode: bool = True) -> Any:  # noqa: ARG002
+        frame = await self._frames.get()
+        if isinstance(frame, BaseException):
+            raise frame
+        return frame
+
+    async def close(self, *, code: int = 1000, reason: str = "") -> None:
+        await super().close(code=code, reason=reason)
+        self._frames.put_nowait(ConnectionClosedOK(rcvd=None, sent=None))
+
+
+def chunk_frame(context_id: str = "ctx", step_time: float = 1.0, *, data: bytes = b"\x00\x00\x00") -> Dict[str, Any]:
+    return {
+        "type": "chunk",
+        "context_id": context_id,
+        "data": base64.b64encode(data).decode(),
+        "done": False,
+        "status_code": 206,
+        "step_time": step_time,
+    }
+
+
+def done_frame(context_id: str = "ctx") -> Dict[str, Any]:
+    return {"type": "done", "context_id": context_id, "done": True, "status_code": 200}
+
+
+def flush_done_frame(context_id: str, flush_id: int) -> Dict[str, Any]:
+    return {
+        "type": "flush_done",
+        "context_id": context_id,
+        "done": False,
+        "flush_done": True,
+        "flush_id": flush_id,
+        "status_code": 206,
+    }
+
+
+def dropped(code: int = 1006) -> ConnectionClosedError:
+    return ConnectionClosedError(rcvd=Close(code=code, reason="boom"), sent=None)
+
+
+def sse_body(*events: Dict[str, Any]) -> bytes:
+    return b"".join(f"data: {json.dumps(event)}\n\n".encode() for event in events)
+
+
+class CollectingSink(AudioSink):
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+        self.closed = False
+
+    @property
+    def data(self) -> bytes:
+        return b"".join(self.parts)
+
+    def write(self, data: Any) -> None:
+        self.parts.append(bytes(data))
+
+    def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import io
+import os
+import json
+import wave
+import struct
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.lib._tts import TTSResourceConnection, AsyncTTSResourceConnection
+from cartesia._exceptions import CartesiaError
+from cartesia.lib._audio_sink import NumpySink, WavFileSink, RingBufferSink
+
+from ._fakes import CollectingSink, sse_body, done_frame, chunk_frame
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+PCM = struct.pack("<8h", 0, 1, -1, 100, -100, 32767, -32768, 7)
+
+
+def test_wav_file_sink_fixes_header_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "out.wav"
+    with WavFileSink(path, sample_rate=16_000) as sink:
+        sink.write(PCM[:6])
+        sink.write(memoryview(PCM)[6:])
+
+    assert sink.bytes_written == len(PCM)
+    with wave.open(str(path), "rb") as wav:
+        assert wav.getframerate() == 16_000
+        assert wav.getsampwidth() == 2
+        assert wav.getnchannels() == 1
+        assert wav.readframes(wav.getnframes()) == PCM
+
+
+def test_wav_file_sink_float_header_and_borrowed_file() -> None:
+    buffer = io.BytesIO(b"prefix")
+    buffer.seek(0, io.SEEK_END)
+    sink = WavFileSink(buffer, sample_rate=44_100, encoding="pcm_f32le")
+    sink.write(b"\x00" * 16)
+    sink.close()
+
+    data = buffer.getvalue()[len(b"prefix") :]
+    riff, riff_size, fmt_tag, bits, data_size = struct.unpack_from("<4sI12xH12xH4xI", data)
+    assert (riff, riff_size, fmt_tag, bits, data_size) == (b"RIFF", 36 + 16, 3, 32, 16)
+    assert not buffer.closed
+    with pytest.raises(CartesiaError):
+        sink.write(b"\x00")
+
+
+def test_numpy_sink_writes_into_preallocated_array() -> None:
+    np = pytest.importorskip("numpy")
+
+    sink = NumpySink(8, encoding="pcm_s16le")
+    sink.write(PCM[:3])
+    sink.write(PCM[3:10])
+    assert sink.bytes_written == 10
+    assert sink.array.tolist() == [0, 1, -1, 100, -100]
+
+    with pytest.raises(CartesiaError):
+        sink.write(PCM)
+
+    target = np.zeros(4, dtype="<f4")
+    NumpySink(target).write(struct.pack("<2f", 0.5, -0.25))
+    assert target.tolist() == [0.5, -0.25, 0.0, 0.0]
+
+    with pytest.raises(ValueError):
+        NumpySink(np.zeros(4, dtype="<i2"), encoding="pcm_f32le")
+
+
+def test_ring_buffer_sink_wraps_around() -> None:
+    ring = RingBufferSink(capacity=8)
+    ring.write(b"abcdef")
+    assert ring.read(4) == b"abcd"
+    ring.write(b"ghijkl")
+    assert ring.available == 8
+
+    out = bytearray(5)
+    assert ring.readinto(out) == 5
+    assert bytes(out) == b"efghi"
+    assert ring.read() == b"jkl"
+    assert ring.readinto(out) == 0
+
+
+def test_ring_buffer_sink_blocks_writer_until_consumer_reads() -> None:
+    ring = RingBufferSink(capacity=4, write_timeout=5)
+    payload = bytes(range(64))
+    received = bytearray()
+
+    def consume() -> None:
+        while len(received) < len(payload):
+            received.extend(ring.read(3))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    ring.write(payload)
+    consumer.join(timeout=5)
+
+    assert bytes(received) == payload
+
+
+def test_ring_buffer_sink_write_times_out_and_close_unblocks() -> None:
+    ring = RingBufferSink(capacity=2, write_timeout=0.01)
+    with pytest.raises(TimeoutError):
+        ring.write(b"abc")
+
+    ring.close()
+    assert ring.read() == b"ab"
+    with pytest.raises(CartesiaError):
+        ring.write(b"x")
+
+
+def test_receive_writes_chunks_to_sink() -> None:
+    ws = FakeSyncWS().queue(
+        json.dumps(chunk_frame(data=PCM[:8])),
+        json.dumps(chunk_frame("other", data=b"")),
+        json.dumps(chunk_frame(data=PCM[8:])),
+        json.dumps(done_frame()),
+    )
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("ctx", voice="v")
+    ctx.push("hi")
+
+    sink = CollectingSink()
+    events = list(ctx.receive(sink=sink))
+
+    assert [event.type for event in events] == ["chunk", "chunk", "done"]
+    assert b"".join(sink.parts) == PCM
+    connection.close()
+
+
+async def test_async_receive_writes_chunks_to_sink() -> None:
+    ws = FakeAsyncWS().queue(
+        json.dumps(chunk_frame(data=PCM[:8])), json.dumps(chunk_frame(data=PCM[8:])), json.dumps(done_frame())
+    )
+    connection = AsyncTTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("ctx", voice="v")
+    await ctx.push("hi")
+
+    sink = CollectingSink()
+    events = [event async for event in ctx.receive(sink=sink)]
+
+    assert [event.type for event in events] == ["chunk", "chunk", "done"]
+    assert b"".join(sink.parts) == PCM
+    await connection.close()
+
+
+def _pcm_sse_body() -> bytes:
+    return sse_body(
+        chunk_frame(data=PCM[:8]), chunk_frame(data=PCM[8:]), {"type": "done", "done": True, "status_code": 200}
+    )
+
+
+@pytest.mark.parametrize("raw_audio", [False, True])
+@pytest.mark.respx(base_url=base_url)
+def test_generate_sse_writes_to_sink(client: Cartesia, respx_mock: MockRouter, raw_audio: bool) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=_pcm_sse_body())
+    )
+
+    sink = CollectingSink()
+    stream = client.tts.generate_sse(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        transcript="Hello",
+        voice="voice-id",
+        raw_audio=raw_audio,
+        sink=sink,
+    )
+
+    assert [event.type for event in stream] == ["chunk", "chunk", "done"]
+    assert b"".join(sink.parts) == PCM
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_generate_sse_writes_to_sink(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=_pcm_sse_body())
+    )
+
+    sink = CollectingSink()
+    stream = await async_client.tts.generate_sse(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        transcript="Hello",
+        voice="voice-id",
+        sink=sink,
+    )
+
+    assert [event.type async for event in stream] == ["chunk", "chunk", "done"]
+    assert b"".join(sink.parts) == PCM
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_streams_body_to_sink(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/bytes").mock(return_value=httpx.Response(200, headers={"Cartesia-File-ID": "f"}, content=PCM))
+
+    sink = CollectingSink()
+    response = client.tts.generate(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        transcript="Hello",
+        voice="voice-id",
+        sink=sink,
+    )
+
+    assert b"".join(sink.parts) == PCM
+    assert response.headers["Cartesia-File-ID"] == "f"
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_generate_streams_body_to_sink(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/bytes").mock(return_value=httpx.Response(200, content=PCM))
+
+    sink = CollectingSink()
+    await async_client.tts.generate(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        transcript="Hello",
+        voice="voice-id",
+        sink=sink,
+    )
+
+    assert b"".join(sink.parts) == PCM
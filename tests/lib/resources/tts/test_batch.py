@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import queue
+import base64
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+from respx import MockRouter
+from websockets.exceptions import ConnectionClosedOK
+
+from cartesia import Cartesia, AsyncCartesia, BadRequestError, TTSGenerationError
+from cartesia.types import TTSGenerateParams
+
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+def _request(transcript: str) -> TTSGenerateParams:
+    return {
+        "model_id": "sonic-3",
+        "output_format": {"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        "transcript": transcript,
+        "voice": "voice-id",
+    }
+
+
+def _replies(message: Dict[str, Any]) -> List[str]:
+    """Server side of the fake WebSocket: echo the transcript back as audio, or fail on request."""
+    ctx = message["context_id"]
+    transcript = message["transcript"]
+    if transcript == "bad":
+        return [json.dumps({"type": "error", "context_id": ctx, "done": True, "status_code": 400, "message": "no"})]
+    chunk = {
+        "type": "chunk",
+        "context_id": ctx,
+        "data": base64.b64encode(transcript.encode()).decode(),
+        "done": False,
+        "status_code": 206,
+        "step_time": 1.0,
+    }
+    return [json.dumps(chunk), json.dumps({"type": "done", "context_id": ctx, "done": True, "status_code": 200})]
+
+
+class RespondingSyncWS(FakeSyncWS):
+    def __init__(self) -> None:
+        super().__init__()
+        self._inbox: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def send(self, data: Any) -> None:
+        super().send(data)
+        message = json.loads(data)
+        if not message.get("continue", True):
+            for reply in _replies(message):
+                self._inbox.put(reply)
+
+    def recv(self, decode: bool = True) -> Any:  # noqa: ARG002
+        item = self._inbox.get()
+        if item is None:
+            raise ConnectionClosedOK(rcvd=None, sent=None)
+        return item.encode()
+
+    def close(self, *, code: int = 1000, reason: str = "") -> None:
+        super().close(code=code, reason=reason)
+        self._inbox.put(None)
+
+
+class RespondingAsyncWS(FakeAsyncWS):
+    def __init__(self) -> None:
+        super().__init__()
+        self._inbox: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+    async def send(self, data: Any) -> None:
+        await super().send(data)
+        message = json.loads(data)
+        if not message.get("continue", True):
+            for reply in _replies(message):
+                self._inbox.put_nowait(reply)
+
+    async def recv(self, decode: bool = True) -> Any:  # noqa: ARG002
+        item = await self._inbox.get()
+        if item is None:
+            raise ConnectionClosedOK(rcvd=None, sent=None)
+        return item.encode()
+
+    async def close(self, *, code: int = 1000, reason: str = "") -> None:
+        await super().close(code=code, reason=reason)
+        self._inbox.put_nowait(None)
+
+
+def _echo(request: httpx.Request) -> httpx.Response:
+    transcript = json.loads(request.content)["transcript"]
+    if transcript == "slow":
+        time.sleep(0.05)
+    if transcript == "bad":
+        return httpx.Response(400, json={"message": "no"})
+    return httpx.Response(200, content=transcript.encode())
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_http_batch_yields_every_result_and_stats(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/bytes").mock(side_effect=_echo)
+    transcripts = [f"line {i}" for i in range(10)] + ["bad"]
+
+    with client.tts.batch_generate((_request(t) for t in transcripts), concurrency=3) as batch:
+        results = list(batch)
+
+    assert sorted(result.index for result in results) == list(range(11))
+    by_index = {result.index: result for result in results}
+    assert by_index[4].audio == b"line 4"
+    assert isinstance(by_index[10].error, BadRequestError)
+    assert by_index[10].attempts == 1
+
+    stats = batch.stats
+    assert (stats.succeeded, stats.failed, stats.completed) == (10, 1, 11)
+    assert stats.audio_bytes == sum(len(t) for t in transcripts[:10])
+    assert stats.requests_per_second > 0
+    assert 0 < stats.latency_percentile(50) <= stats.latency_percentile(100)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_http_batch_ordered(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/bytes").mock(side_effect=_echo)
+    transcripts = ["slow", "a", "b", "c", "d"]
+
+    results = list(client.tts.batch_generate([_request(t) for t in transcripts], concurrency=4, ordered=True))
+
+    assert [result.audio for result in results] == [t.encode() for t in transcripts]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_http_batch_waits_out_rate_limits(client: Cartesia, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/tts/bytes").mock(
+        side_effect=[
+            httpx.Response(429, headers={"retry-after-ms": "50"}),
+            httpx.Response(200, content=b"ok"),
+        ]
+    )
+
+    start = time.monotonic()
+    batch = client.tts.batch_generate([_request("hi")], max_retries=2)
+    (result,) = list(batch)
+
+    assert result.audio == b"ok"
+    assert result.attempts == 2
+    assert batch.stats.retries == 1
+    assert time.monotonic() - start >= 0.05
+    assert route.call_count == 2
+
+
+def test_websocket_batch(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, RespondingSyncWS)
+    transcripts = [f"line {i}" for i in range(8)] + ["bad"]
+
+    batch = client.tts.batch_generate(
+        [_request(t) for t in transcripts], concurrency=4, transport="websocket", connections=2, ordered=True
+    )
+    results = list(batch)
+
+    assert len(captured["calls"]) == 2
+    assert [result.audio for result in results[:8]] == [t.encode() for t in transcripts[:8]]
+    assert isinstance(results[8].error, TTSGenerationError)
+    assert results[8].error.status_code == 400
+    assert captured["last_ws"].closed
+
+
+def test_websocket_batch_failures_free_their_contexts(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, RespondingSyncWS)
+    # more failures than the single connection has room for contexts
+    transcripts = ["bad"] * 4 + ["a", "b", "c"]
+
+    batch = client.tts.batch_generate(
+        [_request(t) for t in transcripts], concurrency=2, transport="websocket", connections=1, ordered=True
+    )
+    results = list(batch)
+
+    assert all(isinstance(result.error, TTSGenerationError) for result in results[:4])
+    assert [result.audio for result in results[4:]] == [b"a", b"b", b"c"]
+    assert batch.stats.succeeded == 3
+
+
+def test_websocket_batch_drops_http_only_params(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, RespondingSyncWS)
+    request: TTSGenerateParams = {**_request("a"), "save": True, "locale": "en-US", "normalization": "none"}
+
+    results = list(client.tts.batch_generate([request], transport="websocket", connections=1))
+
+    assert results[0].audio == b"a"
+    sent = json.loads(captured["last_ws"].sent[0])
+    assert not {"save", "locale", "normalization"} & set(sent)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_http_batch(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/bytes").mock(side_effect=_echo)
+    transcripts = [f"line {i}" for i in range(6)] + ["bad"]
+
+    async with async_client.tts.batch_generate(
+        [_request(t) for t in transcripts], concurrency=2, ordered=True
+    ) as batch:
+        results = [result async for result in batch]
+
+    assert [result.audio for result in results[:6]] == [t.encode() for t in transcripts[:6]]
+    assert isinstance(results[6].error, BadRequestError)
+    assert batch.stats.completed == 7
+
+
+async def test_async_websocket_batch(async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_async_connect(monkeypatch, RespondingAsyncWS)
+    transcripts = [f"line {i}" for i in range(8)]
+
+    batch = async_client.tts.batch_generate([_request(t) for t in transcripts], concurrency=4, transport="websocket")
+    results = [result async for result in batch]
+
+    assert sorted(result.audio or b"" for result in results) == sorted(t.encode() for t in transcripts)
+    assert batch.stats.succeeded == 8
+
+
+async def test_async_websocket_batch_failures_free_their_contexts(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    install_async_connect(monkeypatch, RespondingAsyncWS)
+    transcripts = ["bad"] * 4 + ["a", "b", "c"]
+
+    batch = async_client.tts.batch_generate(
+        [_request(t) for t in transcripts], concurrency=2, transport="websocket", connections=1, ordered=True
+    )
+    results = [result async for result in batch]
+
+    assert all(isinstance(result.error, TTSGenerationError) for result in results[:4])
+    assert [result.audio for result in results[4:]] == [b"a", b"b", b"c"]
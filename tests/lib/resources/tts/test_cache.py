@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+from typing import Any, Dict
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.lib._tts import TTSResourceConnection, AsyncTTSResourceConnection
+from cartesia.lib._tts_cache import TTSCache
+
+from ._fakes import CollectingSink, sse_body, done_frame, chunk_frame
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+PARAMS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+    "transcript": "Your call is important to us.",
+    "voice": "voice-id",
+}
+
+
+def test_memory_tier_lru_and_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = TTSCache(max_bytes=10, ttl=60)
+    cache.put("a", [b"aaaa"])
+    cache.put("b", [b"bb", b"bb"])
+    assert cache.get("a") is not None  # "a" is now the most recently used entry
+    cache.put("c", [b"cccc"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.size == 8
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    cache.put("huge", [b"x" * 11])
+    assert cache.get("huge") is None
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_key_is_canonical() -> None:
+    assert TTSCache.key("/tts/bytes", {"a": 1, "b": [1, 2]}) == TTSCache.key("/tts/bytes", {"b": [1, 2], "a": 1})
+    assert TTSCache.key("/tts/bytes", {"a": 1}) != TTSCache.key("/tts/sse", {"a": 1})
+    assert TTSCache.key("/tts/bytes", {"a": 1}, {"b": 2}) == TTSCache.key("/tts/bytes", {"a": 1, "b": 2})
+
+
+def test_disk_tier_survives_restart_and_is_bounded(tmp_path: Path) -> None:
+    cache = TTSCache(directory=tmp_path, max_disk_bytes=100)
+    cache.put("first", [b"abc", b"", b"defg"], {"content-type": "audio/raw"})
+
+    reopened = TTSCache(directory=tmp_path)
+    entry = reopened.get("first")
+    assert entry is not None
+    assert [bytes(frame) for frame in entry.frames] == [b"abc", b"", b"defg"]
+    assert entry.headers == {"content-type": "audio/raw"}
+
+    old = time.time() - 10
+    os.utime(tmp_path / "first.tts", (old, old))
+    cache.put("second", [b"x" * 60])
+    assert not (tmp_path / "first.tts").exists()
+    assert (tmp_path / "second.tts").exists()
+
+    (tmp_path / "corrupt.tts").write_bytes(b"nope")
+    assert TTSCache(directory=tmp_path).get("corrupt") is None
+
+    cache.clear()
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_replays_cached_body(client: Cartesia, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/tts/bytes").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "audio/raw"}, content=b"\x01\x02\x03\x04")
+    )
+    cache = TTSCache()
+
+    first = client.tts.generate(**PARAMS, cache=cache)
+    sink = CollectingSink()
+    second = client.tts.generate(**PARAMS, cache=cache, sink=sink)
+    third = client.tts.generate(**PARAMS, cache=cache)
+
+    assert route.call_count == 1
+    assert first.read() == third.read() == b"\x01\x02\x03\x04"
+    assert b"".join(sink.parts) == b"\x01\x02\x03\x04"
+    assert second.headers["content-type"] == "audio/raw"
+
+    client.tts.generate(**{**PARAMS, "transcript": "Goodbye."}, cache=cache)
+    client.tts.generate(**PARAMS, save=True, cache=cache)
+    assert route.call_count == 3
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_with_sink_caches_streamed_body(client: Cartesia, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/tts/bytes").mock(return_value=httpx.Response(200, content=b"\x01\x02\x03\x04"))
+    cache = TTSCache()
+
+    client.tts.generate(**PARAMS, cache=cache, sink=CollectingSink())
+    assert client.tts.generate(**PARAMS, cache=cache).read() == b"\x01\x02\x03\x04"
+    assert route.call_count == 1
+
+
+CHUNK_EVENT = chunk_frame(data=b"\x01\x02")
+DONE_EVENT = done_frame()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_sse_caches_completed_streams(client: Cartesia, respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200, headers={"Content-Type": "text/event-stream"}, content=sse_body(CHUNK_EVENT, DONE_EVENT)
+        )
+    )
+    cache = TTSCache()
+
+    # An abandoned stream is not cached.
+    next(iter(client.tts.generate_sse(**PARAMS, cache=cache)))
+    assert len(cache) == 0
+
+    live = [event.type for event in client.tts.generate_sse(**PARAMS, cache=cache)]
+    sink = CollectingSink()
+    replayed = list(client.tts.generate_sse(**PARAMS, cache=cache, sink=sink))
+
+    assert route.call_count == 2
+    assert [event.type for event in replayed] == live == ["chunk", "done"]
+    assert b"".join(sink.parts) == b"\x01\x02"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_sse_does_not_cache_errors(client: Cartesia, respx_mock: MockRouter) -> None:
+    error = {"type": "error", "title": "Error", "message": "boom", "request_id": "r", "done": True, "status_code": 500}
+    route = respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=sse_body(error))
+    )
+    cache = TTSCache()
+
+    for _ in range(2):
+        list(client.tts.generate_sse(**PARAMS, cache=cache))
+    assert route.call_count == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_generate_and_sse_replay(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    bytes_route = respx_mock.post("/tts/bytes").mock(return_value=httpx.Response(200, content=b"\x01\x02"))
+    sse_route = respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200, headers={"Content-Type": "text/event-stream"}, content=sse_body(CHUNK_EVENT, DONE_EVENT)
+        )
+    )
+    cache = TTSCache()
+
+    for _ in range(2):
+        response = await async_client.tts.generate(**PARAMS, cache=cache)
+        assert await response.read() == b"\x01\x02"
+        stream = await async_client.tts.generate_sse(**PARAMS, cache=cache)
+        assert [event.type async for event in stream] == ["chunk", "done"]
+
+    assert (bytes_route.call_count, sse_route.call_count) == (1, 1)
+
+
+def test_websocket_context_replays_cached_generation() -> None:
+    ws = FakeSyncWS().queue(
+        json.dumps(chunk_frame("first", data=b"\x01\x02")),
+        json.dumps(chunk_frame("first", data=b"\x03")),
+        json.dumps(done_frame("first")),
+    )
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    cache = TTSCache()
+
+    first = connection.context("first", voice="v", cache=cache)
+    first.push("Hello, ")
+    assert ws.sent == []  # held back until the context is finished
+    first.push("world.")
+    first.no_more_inputs()
+    assert len(ws.sent) == 3
+    live = [event for event in first.receive()]
+    assert len(cache) == 1
+
+    second = connection.context("second", voice="v", cache=cache)
+    second.push("Hello, ")
+    second.push("world.")
+    second.no_more_inputs()
+    sink = CollectingSink()
+    replayed = list(second.receive(sink=sink))
+
+    assert len(ws.sent) == 3
+    assert [(event.type, event.context_id) for event in replayed] == [
+        ("chunk", "second"),
+        ("chunk", "second"),
+        ("done", "second"),
+    ]
+    assert [event.type for event in live] == ["chunk", "chunk", "done"]
+    assert b"".join(sink.parts) == b"\x01\x02\x03"
+    connection.close()
+
+
+async def test_async_websocket_context_replays_cached_generation() -> None:
+    ws = FakeAsyncWS().queue(json.dumps(chunk_frame("first", data=b"\x01\x02")), json.dumps(done_frame("first")))
+    connection = AsyncTTSResourceConnection(ws)  # type: ignore[arg-type]
+    cache = TTSCache()
+
+    for context_id in ("first", "second"):
+        ctx = connection.context(context_id, voice="v", cache=cache)
+        await ctx.send(transcript="Hello.", voice="v", continue_=False)
+        events = [event async for event in ctx.receive()]
+        assert [(event.type, event.context_id) for event in events] == [("chunk", context_id), ("done", context_id)]
+
+    assert len(ws.sent) == 1
+    await connection.close()
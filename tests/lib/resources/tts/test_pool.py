@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+import pytest
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia._exceptions import CartesiaError
+
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+
+def test_pool_opens_size_connections(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    with client.tts.websocket_pool(size=3, health_check_interval=None) as pool:
+        assert len(captured["calls"]) == 3
+        assert len(pool.connections) == 3
+        assert all(call["url"].path.endswith("/tts/websocket") for call in captured["calls"])
+
+
+def test_pool_places_contexts_on_least_loaded_connection(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    with client.tts.websocket_pool(size=2, health_check_interval=None) as pool:
+        first = pool.connections[0]
+        second = pool.connections[1]
+
+        pool.context("a")
+        pool.context("b")
+        pool.context("c")
+
+        assert len(first._context_queues) == 2
+        assert len(second._context_queues) == 1
+
+        first._context_queues.clear()
+        pool.context("d")
+        assert "d" in first._context_queues
+
+
+def test_pool_enforces_max_contexts_per_connection(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    with client.tts.websocket_pool(size=2, max_contexts_per_connection=1, health_check_interval=None) as pool:
+        pool.context()
+        pool.context()
+        with pytest.raises(CartesiaError, match="max_contexts_per_connection=1"):
+            pool.context()
+
+
+def test_pool_skips_closed_connections(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    install_sync_connect(monkeypatch, FakeSyncWS)
+    with client.tts.websocket_pool(size=2, health_check_interval=None) as pool:
+        dead = pool.connections[0]
+        dead.close()
+
+        pool.context("a")
+        pool.context("b")
+        assert not dead._context_queues
+
+        pool.connections[1].close()
+        with pytest.raises(CartesiaError, match="No pooled connection"):
+            pool.context()
+
+
+def test_pool_replaces_closed_connections(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    with client.tts.websocket_pool(size=2, health_check_interval=None) as pool:
+        dead = pool.connections[0]
+        alive = pool.connections[1]
+        dead.close()
+
+        pool._replace_closed()
+
+        assert len(captured["calls"]) == 3
+        assert dead not in pool.connections
+        assert alive in pool.connections
+        assert pool.connections[0]._connection is captured["last_ws"]
+
+
+def test_pool_close_closes_every_connection(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    pool = client.tts.websocket_pool(size=2).enter()
+    connections = pool.connections
+    pool.close()
+
+    assert all(connection._connection.closed for connection in connections)
+    assert pool.connections == []
+    assert len(captured["calls"]) == 2
+    with pytest.raises(CartesiaError, match="not open"):
+        pool.context()
+
+
+def _failing_on(n: int, factory: Any, opened: List[Any]) -> Any:
+    """A WebSocket factory whose `n`th connection attempt fails."""
+
+    attempts = 0
+
+    def connect() -> Any:
+        nonlocal attempts
+        attempts += 1
+        if attempts == n:
+            raise ConnectionRefusedError("refused")
+        ws = factory()
+        opened.append(ws)
+        return ws
+
+    return connect
+
+
+def test_pool_closes_opened_connections_when_one_fails(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    opened: List[FakeSyncWS] = []
+    install_sync_connect(monkeypatch, _failing_on(3, FakeSyncWS, opened))
+    pool = client.tts.websocket_pool(size=4)
+
+    with pytest.raises(ConnectionRefusedError):
+        pool.enter()
+    assert len(opened) == 2
+    assert all(ws.closed for ws in opened)
+    assert pool.connections == []
+
+
+def test_connection_manager_warmup_connects_before_enter(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = install_sync_connect(monkeypatch, FakeSyncWS)
+    manager = client.tts.websocket_connect()
+
+    assert manager.warmup() is manager
+    assert len(captured["calls"]) == 1
+    with manager as connection:
+        assert connection._connection is captured["last_ws"]
+    assert len(captured["calls"]) == 1
+
+
+def test_pool_rejects_invalid_size(client: Cartesia) -> None:
+    with pytest.raises(ValueError, match="size"):
+        client.tts.websocket_pool(size=0)
+
+
+async def test_async_pool_places_contexts_on_least_loaded_connection(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured = install_async_connect(monkeypatch, FakeAsyncWS)
+    async with async_client.tts.websocket_pool(size=2, health_check_interval=None) as pool:
+        assert len(captured["calls"]) == 2
+        first, second = pool.connections
+
+        pool.context("a")
+        pool.context("b")
+        assert len(first._context_queues) == 1
+        assert len(second._context_queues) == 1
+
+
+async def test_async_pool_replaces_closed_connections(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    captured = install_async_connect(monkeypatch, FakeAsyncWS)
+    async with async_client.tts.websocket_pool(size=2, health_check_interval=None) as pool:
+        dead = pool.connections[0]
+        await dead.close()
+
+        await pool._replace_closed()
+
+        assert len(captured["calls"]) == 3
+        assert dead not in pool.connections
+        assert pool.connections[0]._connection is captured["last_ws"]
+
+    assert all(ws.closed for ws in [captured["last_ws"]])
+
+
+async def test_async_pool_closes_opened_connections_when_one_fails(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    opened: List[FakeAsyncWS] = []
+    install_async_connect(monkeypatch, _failing_on(3, FakeAsyncWS, opened))
+    pool = async_client.tts.websocket_pool(size=4)
+
+    with pytest.raises(ConnectionRefusedError):
+        await pool.enter()
+    assert len(opened) == 3
+    assert all(ws.closed for ws in opened)
+    assert pool.connections == []
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import os
+import json
+import base64
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia, TTSGenerationError
+from cartesia.lib._tts import TTSResourceConnection
+from cartesia.lib._raw_audio import AudioChunk, decode_audio_chunk
+from cartesia.types.tts_sse_event import TTSSSEDoneEvent, TTSSSETimestampsEvent
+from cartesia.types.websocket_response import Chunk
+from cartesia.types.voice_changer_sse_event import VoiceChangerSSEDone
+
+from ._fakes import CollectingSink, sse_body
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+AUDIO = bytes(range(256)) * 4
+
+
+def _chunk_frame(**overrides: Any) -> Dict[str, Any]:
+    return {
+        "type": "chunk",
+        "context_id": "ctx",
+        "data": base64.b64encode(AUDIO).decode(),
+        "done": False,
+        "status_code": 206,
+        "step_time": 12.5,
+        "flush_id": 2,
+        **overrides,
+    }
+
+
+def test_decode_audio_chunk() -> None:
+    chunk = decode_audio_chunk(json.dumps(_chunk_frame()).encode())
+
+    assert isinstance(chunk, AudioChunk)
+    assert chunk.type == "chunk"
+    assert chunk.audio == AUDIO
+    assert chunk.context_id == "ctx"
+    assert chunk.step_time == 12.5
+    assert chunk.flush_id == 2
+    assert chunk.done is False
+    assert chunk.data == base64.b64encode(AUDIO).decode()
+
+
+def test_decode_audio_chunk_accepts_str_and_whitespace() -> None:
+    raw = json.dumps(_chunk_frame(), indent=2, separators=(", ", " : "))
+    chunk = decode_audio_chunk(raw)
+    assert chunk is not None
+    assert chunk.audio == AUDIO
+
+
+def test_decode_audio_chunk_empty_data() -> None:
+    chunk = decode_audio_chunk(json.dumps(_chunk_frame(data="")))
+    assert chunk is not None
+    assert chunk.audio is None
+    assert chunk.data == ""
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        {"type": "done", "context_id": "ctx", "done": True, "status_code": 200},
+        {"type": "flush_done", "context_id": "ctx", "data": "AAAA", "done": False, "status_code": 200},
+        _chunk_frame(data="AA\\/A"),
+        _chunk_frame(data="not base64!"),
+    ],
+)
+def test_decode_audio_chunk_falls_back(frame: Dict[str, Any]) -> None:
+    assert decode_audio_chunk(json.dumps(frame).encode()) is None
+
+
+def test_connection_parse_event_raw_audio() -> None:
+    raw = json.dumps(_chunk_frame()).encode()
+
+    assert isinstance(TTSResourceConnection(object(), raw_audio=False).parse_event(raw), Chunk)  # type: ignore[arg-type]
+
+    event = TTSResourceConnection(object(), raw_audio=True).parse_event(raw)  # type: ignore[arg-type]
+    assert isinstance(event, AudioChunk)
+    assert event.audio == AUDIO
+
+    done = TTSResourceConnection(object(), raw_audio=True).parse_event(  # type: ignore[arg-type]
+        b'{"type": "done", "context_id": "ctx", "done": true, "status_code": 200}'
+    )
+    assert done.type == "done"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_generate_sse_raw_audio(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=sse_body(
+                _chunk_frame(),
+                {"type": "done", "done": True, "status_code": 200},
+            ),
+        )
+    )
+
+    stream = client.tts.generate_sse(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+        transcript="Hello",
+        voice="voice-id",
+        raw_audio=True,
+    )
+    events: List[Any] = list(stream)
+
+    assert isinstance(events[0], AudioChunk)
+    assert events[0].audio == AUDIO
+    assert isinstance(events[1], TTSSSEDoneEvent)
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_generate_sse_raw_audio(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=sse_body(
+                _chunk_frame(),
+                {"type": "done", "done": True, "status_code": 200},
+            ),
+        )
+    )
+
+    stream = await async_client.tts.generate_sse(
+        model_id="sonic-3",
+        output_format={"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+        transcript="Hello",
+        voice="voice-id",
+        raw_audio=True,
+    )
+    events: List[Any] = [event async for event in stream]
+
+    assert isinstance(events[0], AudioChunk)
+    assert events[0].audio == AUDIO
+    assert isinstance(events[1], TTSSSEDoneEvent)
+
+
+GENERATE_SSE_ARGS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+    "transcript": "Hello",
+    "voice": "voice-id",
+}
+
+TIMESTAMPS_FRAME = {
+    "type": "timestamps",
+    "context_id": "ctx",
+    "done": False,
+    "status_code": 206,
+    "word_timestamps": {"words": ["Hello"], "start": [0.0], "end": [0.4]},
+}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_audio_yields_pcm_and_side_channel_events(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=sse_body(
+                _chunk_frame(),
+                TIMESTAMPS_FRAME,
+                # escaped payloads fall back to the model
+                _chunk_frame(data=base64.b64encode(b"\x01\x02").decode().replace("/", "\\/")),
+                _chunk_frame(data=""),
+                {"type": "done", "context_id": "ctx", "done": True, "status_code": 200},
+            ),
+        )
+    )
+    events: List[Any] = []
+    sink = CollectingSink()
+
+    stream = client.tts.generate_sse(**GENERATE_SSE_ARGS, sink=sink)
+    audio = list(stream.iter_audio(on_event=events.append))
+
+    assert audio == [AUDIO, b"\x01\x02"]
+    assert sink.parts == audio
+    assert [type(event) for event in events] == [TTSSSETimestampsEvent, TTSSSEDoneEvent]
+    assert stream.response.is_closed
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_iter_audio_raises_error_events(client: Cartesia, respx_mock: MockRouter) -> None:
+    error = {
+        "type": "error",
+        "done": True,
+        "message": "Voice not found",
+        "request_id": "req",
+        "status_code": 404,
+        "title": "Not found",
+    }
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200, headers={"Content-Type": "text/event-stream"}, content=sse_body(_chunk_frame(), error)
+        )
+    )
+
+    audio = client.tts.generate_sse(**GENERATE_SSE_ARGS, raw_audio=True).iter_audio()
+    assert next(audio) == AUDIO
+    with pytest.raises(TTSGenerationError, match="Voice not found") as exc_info:
+        next(audio)
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_voice_changer_iter_audio(client: Cartesia, respx_mock: MockRouter) -> None:
+    chunk = {"data": base64.b64encode(AUDIO).decode(), "done": False, "sample_rate": 44100, "status_code": 206}
+    respx_mock.post("/voice-changer/sse").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=sse_body({**chunk, "step_time": 3.0}, {"done": True, "status_code": 200}),
+        )
+    )
+    events: List[Any] = []
+
+    stream = client.voice_changer.generate_sse(clip=b"RIFF", voice_id="voice-id")
+    audio = list(stream.iter_audio(on_event=events.append))
+
+    assert audio == [AUDIO]
+    assert [type(event) for event in events] == [VoiceChangerSSEDone]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_iter_audio(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=sse_body(_chunk_frame(), _chunk_frame(), {"type": "done", "done": True, "status_code": 200}),
+        )
+    )
+
+    stream = await async_client.tts.generate_sse(**GENERATE_SSE_ARGS)
+    audio = [chunk async for chunk in stream.iter_audio()]
+
+    assert audio == [AUDIO, AUDIO]
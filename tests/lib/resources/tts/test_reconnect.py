@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from typing import List, Iterator
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.resources.tts import RawWebsocketResponse
+from cartesia.types.websocket_reconnection import ReconnectingEvent
+
+from ._fakes import BlockingSyncWS, BlockingAsyncWS, dropped, done_frame, chunk_frame, flush_done_frame
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+
+def _transcripts(ws: FakeSyncWS | FakeAsyncWS) -> List[str]:
+    return [json.loads(data).get("transcript", "<cancel>") for data in ws.sent]
+
+
+def test_reconnect_resumes_contexts_from_last_flush(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second = BlockingSyncWS(), BlockingSyncWS()
+    factories = iter([first, second])
+    captured = install_sync_connect(monkeypatch, lambda: next(factories))
+    attempts: List[ReconnectingEvent] = []
+
+    with client.tts.websocket_connect(on_reconnecting=attempts.append, initial_delay=0, max_delay=0) as connection:
+        resumed = connection.context("resumed", voice="v")
+        finished = connection.context("finished", voice="v")
+        resumed.push("Acknowledged. ", flush=True)
+        resumed.push("In flight. ")
+        finished.push("Short.", continue_=False)
+
+        events: Iterator[RawWebsocketResponse] = resumed.receive()
+        first.feed(done_frame("finished"), flush_done_frame("resumed", 1))
+        assert next(events).type == "flush_done"
+        first.feed(dropped(1011))
+        resumed.no_more_inputs()
+        second.feed(chunk_frame("resumed"), done_frame("resumed"))
+        assert [event.type for event in events] == ["chunk", "done"]
+
+    assert len(captured["calls"]) == 2
+    assert [(event.attempt, event.close_code) for event in attempts] == [(1, 1011)]
+    # Only the text after the acknowledged flush is sent again, and only for unfinished contexts.
+    assert _transcripts(second)[:1] == ["In flight. "]
+    assert _transcripts(second).count("") == 1
+    assert "Short." not in _transcripts(second)
+
+
+def test_reconnect_gives_up_when_aborted(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = BlockingSyncWS()
+    captured = install_sync_connect(monkeypatch, lambda: first)
+
+    with client.tts.websocket_connect(on_reconnecting=lambda _: {"abort": True}) as connection:
+        ctx = connection.context("ctx", voice="v")
+        ctx.push("Hello.")
+        first.feed(dropped())
+        with pytest.raises(ConnectionClosedError):
+            list(ctx.receive())
+
+    assert len(captured["calls"]) == 1
+
+
+def test_no_replay_log_without_on_reconnecting(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    ws = BlockingSyncWS()
+    install_sync_connect(monkeypatch, lambda: ws)
+
+    with client.tts.websocket_connect() as connection:
+        connection.context("ctx", voice="v").push("Hello.")
+        assert connection._replay_log is None
+    assert _transcripts(ws) == ["Hello."]
+
+
+def test_cancelled_context_is_not_resumed(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second = BlockingSyncWS(), BlockingSyncWS()
+    factories = iter([first, second])
+    install_sync_connect(monkeypatch, lambda: next(factories))
+
+    with client.tts.websocket_connect(on_reconnecting=lambda _: None, initial_delay=0, max_delay=0) as connection:
+        cancelled = connection.context("cancelled", voice="v")
+        kept = connection.context("kept", voice="v")
+        cancelled.push("Never mind.")
+        kept.push("Keep going.")
+        cancelled.cancel()
+        events = kept.receive()
+        first.feed(dropped())
+        second.feed(done_frame("kept"))
+        assert [event.type for event in events] == ["done"]
+
+    assert _transcripts(second) == ["Keep going."]
+
+
+async def test_async_reconnect_resumes_contexts(async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second = BlockingAsyncWS(), BlockingAsyncWS()
+    factories = iter([first, second])
+    install_async_connect(monkeypatch, lambda: next(factories))
+
+    async with async_client.tts.websocket_connect(
+        on_reconnecting=lambda _: None, initial_delay=0, max_delay=0
+    ) as connection:
+        ctx = connection.context("ctx", voice="v")
+        await ctx.push("Acknowledged. ", flush=True)
+        await ctx.push("In flight. ")
+        first.feed(flush_done_frame("ctx", 1), dropped(1012))
+        second.feed(chunk_frame("ctx"), done_frame("ctx"))
+        events = [event.type async for event in ctx.receive()]
+
+    assert events == ["flush_done", "chunk", "done"]
+    assert _transcripts(second) == ["In flight. "]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import time
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from cartesia import CartesiaError
+from cartesia.lib._tts import TTSResourceConnection, AsyncTTSResourceConnection
+from cartesia.resources.tts import TextStreamer, AsyncTextStreamer
+
+from ..stt._fakes import FakeSyncWS, FakeAsyncWS
+
+
+def _pushes(ws: FakeSyncWS | FakeAsyncWS) -> List[Tuple[str, bool]]:
+    messages = [json.loads(data) for data in ws.sent]
+    return [(message["transcript"], message["continue"]) for message in messages]
+
+
+def _connect() -> Tuple[FakeSyncWS, TTSResourceConnection]:
+    ws = FakeSyncWS()
+    return ws, TTSResourceConnection(ws)  # type: ignore[arg-type]
+
+
+def test_tokens_are_coalesced_into_sentences() -> None:
+    ws, connection = _connect()
+    ctx = connection.context("ctx", voice="v")
+    tokens = ["Hello", " there", ".", " How", " are", " you", "?", " Fine"]
+
+    with TextStreamer(ctx, max_delay=10) as streamer:
+        for token in tokens[:4]:
+            streamer.write(token)
+        assert [transcript for transcript, _ in _pushes(ws)] == ["Hello there. "]
+        for token in tokens[4:]:
+            streamer.write(token)
+
+    assert _pushes(ws) == [("Hello there. ", True), ("How are you? ", True), ("Fine", True), ("", False)]
+    assert "".join(transcript for transcript, _ in _pushes(ws)) == "".join(tokens)
+    assert (streamer.tokens_written, streamer.frames_sent, streamer.frames_saved) == (8, 3, 5)
+    assert streamer.mean_added_latency <= streamer.max_added_latency
+    connection.close()
+
+
+def test_decimal_points_do_not_end_sentences() -> None:
+    ws, connection = _connect()
+    streamer = TextStreamer(connection.context("ctx", voice="v"), max_delay=10)
+
+    for token in ["Pi is 3", ".", "14", " roughly", ".\n", "Next"]:
+        streamer.write(token)
+
+    assert [transcript for transcript, _ in _pushes(ws)] == ["Pi is 3.14 roughly.\n"]
+    connection.close()
+
+
+def test_long_clauses_and_max_chars_split() -> None:
+    ws, connection = _connect()
+    streamer = TextStreamer(connection.context("ctx", voice="v"), max_delay=10, min_clause_chars=10, max_chars=20)
+
+    streamer.write("Short, ")  # too short to split on the clause
+    streamer.write("then a longer clause, ")
+    streamer.write("and an endless run of words")
+
+    assert [transcript for transcript, _ in _pushes(ws)] == [
+        "Short, then a longer clause, ",
+        "and an endless run of ",
+    ]
+    streamer.close(finish=False)
+    assert _pushes(ws)[-1] == ("words", True)
+    connection.close()
+
+
+def test_timer_flushes_stalled_text() -> None:
+    ws, connection = _connect()
+    streamer = TextStreamer(connection.context("ctx", voice="v"), max_delay=0.05)
+
+    streamer.write("Thinking about ")
+    streamer.write("it")
+    assert ws.sent == []
+    deadline = time.monotonic() + 2
+    while len(ws.sent) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The timer pushes up to the last word boundary first, then the rest.
+    assert [transcript for transcript, _ in _pushes(ws)] == ["Thinking about ", "it"]
+    assert 0.05 <= streamer.max_added_latency < 1
+    streamer.close()
+    assert _pushes(ws)[-1] == ("", False)
+    with pytest.raises(CartesiaError):
+        streamer.write("more")
+    connection.close()
+
+
+def test_timer_cut_restarts_the_wait_for_a_split_word() -> None:
+    ws, connection = _connect()
+    streamer = TextStreamer(connection.context("ctx", voice="v"), max_delay=0.2)
+
+    for token in ["Hello", " world", " how", " are"]:
+        streamer.write(token)
+    deadline = time.monotonic() + 2
+    while not ws.sent and time.monotonic() < deadline:
+        time.sleep(0.005)
+    cut_at = time.monotonic()
+    assert [transcript for transcript, _ in _pushes(ws)] == ["Hello world how "]
+
+    # "are" was part of a token written before the cut, but waits a full `max_delay` from it
+    time.sleep(0.1)
+    assert len(ws.sent) == 1
+    while len(ws.sent) < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert [transcript for transcript, _ in _pushes(ws)] == ["Hello world how ", "are"]
+    assert time.monotonic() - cut_at >= 0.19
+    streamer.close()
+    connection.close()
+
+
+async def test_async_timer_cut_restarts_the_wait_for_a_split_word() -> None:
+    ws = FakeAsyncWS()
+    connection = AsyncTTSResourceConnection(ws)  # type: ignore[arg-type]
+
+    async with AsyncTextStreamer(connection.context("ctx", voice="v"), max_delay=0.2) as streamer:
+        for token in ["Hello", " world", " how", " are"]:
+            await streamer.write(token)
+        await asyncio.sleep(0.3)
+        assert [transcript for transcript, _ in _pushes(ws)] == ["Hello world how "]
+        await streamer.write(" you")
+
+    assert [transcript for transcript, _ in _pushes(ws)] == ["Hello world how ", "are you", ""]
+    await connection.close()
+
+
+async def test_async_streamer() -> None:
+    ws = FakeAsyncWS()
+    connection = AsyncTTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("ctx", voice="v")
+
+    async with AsyncTextStreamer(ctx, max_delay=0.05) as streamer:
+        for token in ["One", " sentence", ".", " And", " a", " pause"]:
+            await streamer.write(token)
+        assert [transcript for transcript, _ in _pushes(ws)] == ["One sentence. "]
+        await asyncio.sleep(0.3)
+        assert [transcript for transcript, _ in _pushes(ws)] == ["One sentence. ", "And a ", "pause"]
+        await streamer.write(" again.")
+
+    assert _pushes(ws)[-2:] == [(" again.", True), ("", False)]
+    assert streamer.frames_saved == 3
+    await connection.close()
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Dict, List, Union
+
+import pytest
+from websockets.exceptions import ConnectionClosedError
+
+from cartesia import ConcurrencyGovernor
+from cartesia.lib._tts import TTSResourceConnection, AsyncTTSResourceConnection
+
+from ._fakes import BlockingSyncWS, dropped, done_frame, chunk_frame
+from ..stt._fakes import FakeAsyncWS
+
+
+def test_receive_routes_interleaved_events_to_each_context() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    contexts = [connection.context(f"ctx-{i}", voice="v") for i in range(8)]
+    for ctx in contexts:
+        ctx.push("hello")
+
+    results: Dict[str, List[Any]] = {}
+
+    def consume(ctx: Any) -> None:
+        results[ctx._context_id] = list(ctx.receive())
+
+    threads = [threading.Thread(target=consume, args=(ctx,)) for ctx in contexts]
+    for thread in threads:
+        thread.start()
+
+    for n in range(3):
+        ws.feed(*(chunk_frame(ctx._context_id, n) for ctx in contexts))
+    ws.feed(*(done_frame(ctx._context_id) for ctx in contexts))
+
+    for thread in threads:
+        thread.join(timeout=5)
+
+    for ctx in contexts:
+        events = results[ctx._context_id]
+        assert [event.type for event in events] == ["chunk", "chunk", "chunk", "done"]
+        assert all(event.context_id == ctx._context_id for event in events)
+        assert [event.step_time for event in events[:3]] == [0.0, 1.0, 2.0]
+
+    assert connection._context_queues == {}
+    connection.close()
+
+
+def test_events_are_parsed_once_per_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    calls: List[Any] = []
+    original = connection.parse_event
+
+    def counting_parse(data: Union[str, bytes]) -> Any:
+        calls.append(data)
+        return original(data)
+
+    monkeypatch.setattr(connection, "parse_event", counting_parse)
+
+    first = connection.context("a", voice="v")
+    second = connection.context("b", voice="v")
+    first.push("hi")
+    second.push("hi")
+    ws.feed(chunk_frame("b", 0), chunk_frame("a", 0), done_frame("b"), done_frame("a"))
+
+    assert [event.type for event in first.receive()] == ["chunk", "done"]
+    assert [event.type for event in second.receive()] == ["chunk", "done"]
+    assert len(calls) == 4
+    connection.close()
+
+
+def test_receive_returns_when_connection_closes_cleanly() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("a", voice="v")
+    ctx.push("hi")
+    ws.feed(chunk_frame("a", 0))
+    ws.close()
+
+    assert [event.type for event in ctx.receive()] == ["chunk"]
+    assert "a" not in connection._context_queues
+
+
+def test_receive_raises_when_connection_drops() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("a", voice="v")
+    ctx.push("hi")
+    ws.feed(dropped())
+
+    with pytest.raises(ConnectionClosedError):
+        list(ctx.receive())
+    assert "a" not in connection._context_queues
+
+
+def test_error_without_context_id_is_delivered_to_every_context() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    first = connection.context("a", voice="v")
+    second = connection.context("b", voice="v")
+    first.push("hi")
+    ws.feed({"type": "error", "done": True, "title": "Bad", "message": "request"})
+
+    assert [event.type for event in first.receive()] == ["error"]
+    assert [event.type for event in second.receive()] == ["error"]
+    connection.close()
+
+
+def test_receive_times_out_and_unregisters_context() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("a", voice="v", timeout=0.01)
+    ctx.push("hi")
+
+    with pytest.raises(TimeoutError):
+        list(ctx.receive())
+    assert "a" not in connection._context_queues
+    connection.close()
+
+
+def test_receive_unregisters_context_when_consumer_stops_early() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    first = connection.context("a", voice="v")
+    second = connection.context("b", voice="v")
+    first.push("hi")
+    second.push("hi")
+    ws.feed(chunk_frame("a", 0), chunk_frame("b", 0), done_frame("a"), done_frame("b"))
+
+    for _ in first.receive():
+        break
+    assert "a" not in connection._context_queues
+
+    with pytest.raises(RuntimeError):
+        for _ in second.receive():
+            raise RuntimeError("consumer failed")
+    assert connection._context_queues == {}
+    connection.close()
+
+
+async def test_async_receive_unregisters_context_when_consumer_stops_early() -> None:
+    ws = FakeAsyncWS().queue(
+        json.dumps(chunk_frame("a", 0)), json.dumps(chunk_frame("a", 1)), json.dumps(done_frame("a"))
+    )
+    connection = AsyncTTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("a", voice="v")
+    await ctx.push("hi")
+
+    events = ctx.receive()
+    async for _ in events:
+        break
+    await events.aclose()  # type: ignore[attr-defined]
+    assert connection._context_queues == {}
+    await connection.close()
+
+
+def test_push_template_matches_full_request() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    options: Dict[str, Any] = {
+        "model_id": "sonic-3",
+        "voice": {"mode": "id", "id": "voice-id"},
+        "output_format": {"container": "raw", "encoding": "pcm_s16le", "sample_rate": 16000},
+        "language": "en",
+        "add_timestamps": True,
+        "generation_config": {"speed": 1.1},
+        "max_buffer_delay_ms": 200,
+    }
+    ctx = connection.context("a", **options)
+
+    for transcript, continue_ in [('Say "hi" ', True), ("naïve\n", True), ("", False)]:
+        ctx.push(transcript, continue_=continue_)
+        ctx.send(transcript=transcript, voice=options["voice"], continue_=continue_)
+    ctx.push("slow path", speed="fast")
+
+    sent = [json.loads(data) for data in ws.sent]
+    assert sent[0::2][:3] == sent[1::2][:3]
+    assert sent[0]["transcript"] == 'Say "hi" ' and sent[0]["continue"] is True
+    assert sent[4]["continue"] is False
+    assert sent[6]["speed"] == "fast"
+    connection.close()
+
+
+def test_push_without_context_voice_uses_full_request() -> None:
+    ws = BlockingSyncWS()
+    connection = TTSResourceConnection(ws)  # type: ignore[arg-type]
+    ctx = connection.context("a")
+
+    with pytest.raises(ValueError):
+        ctx.push("hi")
+    ctx.push("hi", voice="v")
+    assert json.loads(ws.sent[0])["voice"] == "v"
+    connection.close()
+
+
+def test_contexts_hold_a_governor_slot_until_finished() -> None:
+    ws = BlockingSyncWS()
+    governor = ConcurrencyGovernor(initial_limit=2)
+    connection = TTSResourceConnection(ws, governor=governor)  # type: ignore[arg-type]
+    first = connection.context("a", voice="v")
+    second = connection.context("b", voice="v")
+    first.push("hi")
+    first.push("there")
+    second.push("hi")
+    assert governor.in_flight == 2
+
+    second.cancel()
+    assert governor.in_flight == 1
+
+    ws.feed({"type": "error", "context_id": "a", "done": True, "status_code": 429, "title": "Rate limited"})
+    assert [event.type for event in first.receive()] == ["error"]
+    assert (governor.in_flight, governor.throttled, governor.limit) == (0, 1, 1)
+
+    third = connection.context("c", voice="v")
+    third.push("hi")
+    connection.close()
+    assert governor.in_flight == 0
+
+
+def test_done_and_error_events_return_the_contexts_slot() -> None:
+    ws = BlockingSyncWS()
+    governor = ConcurrencyGovernor(initial_limit=4)
+    connection = TTSResourceConnection(ws, governor=governor)  # type: ignore[arg-type]
+    done = connection.context("a", voice="v")
+    failed = connection.context("b", voice="v")
+    done.push("hi")
+    failed.push("hi")
+    assert governor.in_flight == 2
+
+    ws.feed(chunk_frame("a", 0), done_frame("a"))
+    assert [event.type for event in done.receive()] == ["chunk", "done"]
+    assert governor.in_flight == 1
+
+    ws.feed({"type": "error", "context_id": "b", "done": True, "status_code": 500, "title": "Oops"})
+    assert [event.type for event in failed.receive()] == ["error"]
+    assert (governor.in_flight, governor.throttled, governor.limit) == (0, 0, 4)
+    connection.close()
+
+
+def test_racing_first_sends_on_a_context_take_one_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    ws = BlockingSyncWS()
+    governor = ConcurrencyGovernor(initial_limit=4)
+    connection = TTSResourceConnection(ws, governor=governor)  # type: ignore[arg-type]
+    acquire = governor.acquire
+
+    def acquire_after_another_thread() -> Any:
+        # another thread sends the context's first request while this one waits for its slot
+        monkeypatch.setattr(governor, "acquire", acquire)
+        connection._govern_context("a", cancel=False)
+        return acquire()
+
+    monkeypatch.setattr(governor, "acquire", acquire_after_another_thread)
+    ctx = connection.context("a", voice="v")
+    ctx.push("hi")
+    assert governor.in_flight == 1
+
+    ws.feed(done_frame("a"))
+    list(ctx.receive())
+    assert governor.in_flight == 0
+    connection.close()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import base64
+from typing import Any, Dict, Union
+
+import pytest
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia.lib import _fast_events
+from cartesia.lib._tts import TTSResourceConnection
+from cartesia.lib._fast_events import (
+    TTS_FAST_EVENTS,
+    FastChunk,
+    EventParser,
+    FastTimestamps,
+    FastTranscript,
+    FastTurnUpdate,
+    FastWordTimestamps,
+    FastWebsocketResponse,
+    loads,
+)
+from cartesia.types.websocket_response import Done, Chunk, WebsocketResponse
+
+from .resources.stt._fakes import FakeSyncWS, FakeAsyncWS, install_sync_connect, install_async_connect
+
+_CHUNK: Dict[str, Any] = {
+    "type": "chunk",
+    "context_id": "ctx",
+    "data": base64.b64encode(b"\x00\x01\x02").decode(),
+    "done": False,
+    "status_code": 206,
+    "step_time": 3.5,
+    "flush_id": 1,
+}
+_TIMESTAMPS: Dict[str, Any] = {
+    "type": "timestamps",
+    "context_id": "ctx",
+    "done": False,
+    "status_code": 206,
+    "word_timestamps": {"words": ["hi"], "start": [0.0], "end": [0.25]},
+}
+_DONE: Dict[str, Any] = {"type": "done", "context_id": "ctx", "done": True, "status_code": 200}
+
+
+def test_event_parser_dispatches_registered_types() -> None:
+    parser: EventParser[FastWebsocketResponse] = EventParser(WebsocketResponse, TTS_FAST_EVENTS)
+
+    chunk = parser.parse(json.dumps(_CHUNK))
+    assert isinstance(chunk, FastChunk)
+    assert chunk.type == "chunk"
+    assert chunk.context_id == "ctx"
+    assert chunk.step_time == 3.5
+    assert chunk.flush_id == 1
+    assert chunk.audio == b"\x00\x01\x02"
+    assert chunk.audio is chunk.audio
+
+    timestamps = parser.parse(json.dumps(_TIMESTAMPS).encode())
+    assert isinstance(timestamps, FastTimestamps)
+    assert timestamps.word_timestamps == FastWordTimestamps(words=["hi"], start=[0.0], end=[0.25])
+
+    assert isinstance(parser.parse(json.dumps(_DONE)), Done)
+
+
+def test_event_parser_without_factories_builds_models() -> None:
+    parser: EventParser[WebsocketResponse] = EventParser(WebsocketResponse)
+    assert isinstance(parser.parse(json.dumps(_CHUNK)), Chunk)
+
+
+def test_event_parser_register_and_unregister() -> None:
+    # a registered factory may build any type, so the parser is declared as returning anything
+    parser: EventParser[Any] = EventParser(WebsocketResponse)
+    parser.register("done", lambda value: ("custom", value["context_id"]))
+    assert parser.parse(json.dumps(_DONE)) == ("custom", "ctx")
+
+    parser.unregister("done")
+    assert isinstance(parser.parse(json.dumps(_DONE)), Done)
+
+
+def test_loads_falls_back_to_json_when_orjson_refuses(monkeypatch: pytest.MonkeyPatch) -> None:
+    class StrictOrjson:
+        JSONDecodeError = json.JSONDecodeError
+
+        @staticmethod
+        def loads(data: Union[str, bytes]) -> Any:
+            if b"NaN" in (data.encode() if isinstance(data, str) else data):
+                raise json.JSONDecodeError("NaN", "", 0)
+            return json.loads(data)
+
+    monkeypatch.setattr(_fast_events, "orjson", StrictOrjson)
+    assert loads(b'{"a": 1}') == {"a": 1}
+    value = loads('{"a": NaN}')
+    assert value["a"] != value["a"]
+
+
+def test_tts_connection_fast_parse() -> None:
+    raw = json.dumps(_CHUNK).encode()
+
+    assert isinstance(TTSResourceConnection(object()).parse_event(raw), Chunk)  # type: ignore[arg-type]
+    assert isinstance(TTSResourceConnection(object(), fast_parse=True).parse_event(raw), FastChunk)  # type: ignore[arg-type]
+
+
+def test_stt_auto_finalize_fast_parse(client: Cartesia, monkeypatch: pytest.MonkeyPatch) -> None:
+    update = json.dumps({"type": "turn.update", "request_id": "r1", "transcript": "hello"})
+    install_sync_connect(monkeypatch, lambda: FakeSyncWS().queue(update))
+    conn = client.stt.auto_finalize.websocket(
+        encoding="pcm_s16le", model="ink-2", sample_rate=16_000, fast_parse=True
+    ).enter()
+
+    event = conn.recv()
+    assert isinstance(event, FastTurnUpdate)
+    assert (event.type, event.request_id, event.transcript) == ("turn.update", "r1", "hello")
+    assert conn.parse_event(json.dumps({"type": "turn.start", "request_id": "r1"})).type == "turn.start"
+
+
+async def test_async_stt_manual_finalize_fast_parse(
+    async_client: AsyncCartesia, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    transcript = json.dumps(
+        {
+            "type": "transcript",
+            "request_id": "r1",
+            "text": "hi ",
+            "is_final": True,
+            "words": [{"words": ["hi"], "start": [0.0], "end": [0.3]}],
+        }
+    )
+    install_async_connect(monkeypatch, lambda: FakeAsyncWS().queue(transcript))
+    conn = await async_client.stt.manual_finalize.websocket(
+        encoding="pcm_s16le", model="ink-2", sample_rate=16_000, fast_parse=True
+    ).enter()
+
+    event = await conn.recv()
+    assert isinstance(event, FastTranscript)
+    assert event.text == "hi "
+    assert event.is_final is True
+    assert event.words == [FastWordTimestamps(words=["hi"], start=[0.0], end=[0.3])]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from cartesia import TimingEvent, LatencyHistogram, OpenTelemetryObserver
+from cartesia._timing import Timings
+from cartesia.lib._tts import TTSResourceConnection
+
+from .resources.stt._fakes import FakeSyncWS
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram(TimingEvent("ws.first_audio", ms / 1000, {}))
+    histogram.record("http.total", 0.25)
+
+    summary = histogram.summary()
+    assert histogram.names == ["http.total", "ws.first_audio"]
+    assert summary["http.total"] == {
+        "count": 1,
+        "mean": 0.25,
+        "min": 0.25,
+        "p50": 0.25,
+        "p90": 0.25,
+        "p99": 0.25,
+        "max": 0.25,
+    }
+    first_audio = summary["ws.first_audio"]
+    assert first_audio["count"] == 100
+    assert first_audio["mean"] == pytest.approx(0.0505)
+    assert (first_audio["min"], first_audio["max"]) == (0.001, 0.1)
+    for q in (50, 90, 99):
+        assert first_audio[f"p{q}"] == pytest.approx(q / 1000, rel=0.25)
+
+    assert histogram.percentile("missing", 50) is None
+    with pytest.raises(ValueError):
+        histogram.percentile("http.total", 101)
+    histogram.reset()
+    assert histogram.count("http.total") == 0
+
+
+class _FakeHistogram:
+    def __init__(self) -> None:
+        self.records: List[Tuple[float, Dict[str, Any]]] = []
+
+    def record(self, amount: float, attributes: Dict[str, Any]) -> None:
+        self.records.append((amount, attributes))
+
+
+class _FakeMeter:
+    def __init__(self) -> None:
+        self.histograms: Dict[str, _FakeHistogram] = {}
+
+    def create_histogram(self, name: str, unit: str, description: str) -> _FakeHistogram:  # noqa: ARG002
+        assert unit == "s"
+        return self.histograms.setdefault(name, _FakeHistogram())
+
+
+def test_opentelemetry_observer_records_one_instrument_per_event() -> None:
+    meter = _FakeMeter()
+    observer = OpenTelemetryObserver(meter)
+
+    observer(TimingEvent("http.total", 0.5, {"path": "/tts/bytes"}))
+    observer(TimingEvent("http.total", 0.25, {"path": "/voices"}))
+    observer(TimingEvent("ws.handshake", 0.1, {}))
+    observer(TimingEvent("ws.total", 0.2, {"path": "/tts/websocket", "context_id": "ctx"}))
+
+    assert sorted(meter.histograms) == [
+        "cartesia.http.total.duration",
+        "cartesia.ws.handshake.duration",
+        "cartesia.ws.total.duration",
+    ]
+    # context IDs are unique per context, so they are not recorded
+    assert meter.histograms["cartesia.ws.total.duration"].records == [(0.2, {"path": "/tts/websocket"})]
+    assert meter.histograms["cartesia.http.total.duration"].records == [
+        (0.5, {"path": "/tts/bytes"}),
+        (0.25, {"path": "/voices"}),
+    ]
+
+
+def test_websocket_contexts_are_timed() -> None:
+    events: List[TimingEvent] = []
+    chunk = {"type": "chunk", "context_id": "ctx", "data": "AAAA", "done": False, "status_code": 206}
+    ws = FakeSyncWS().queue(
+        json.dumps({**chunk, "step_time": 20.0}),
+        json.dumps({**chunk, "step_time": 5.0}),
+        json.dumps({"type": "done", "context_id": "ctx", "done": True, "status_code": 200}),
+    )
+    connection = TTSResourceConnection(ws, timings=Timings([events.append]))  # type: ignore[arg-type]
+    ctx = connection.context("ctx", voice="v")
+    ctx.push("hello")
+    list(ctx.receive())
+
+    assert [event.name for event in events if event.name != "ws.decode"] == [
+        "ws.first_audio",
+        "ws.step_time",
+        "ws.step_time",
+        "ws.total",
+    ]
+    assert [event.duration for event in events if event.name == "ws.step_time"] == [0.02, 0.005]
+    assert [event.name for event in events].count("ws.decode") == 3
+    assert events[1].attributes == {"path": "/tts/websocket", "context_id": "ctx"}
+
+
+def test_cancelled_contexts_are_forgotten() -> None:
+    ws = FakeSyncWS()
+    connection = TTSResourceConnection(ws, timings=Timings([lambda _event: None]))  # type: ignore[arg-type]
+    ctx = connection.context("ctx", voice="v")
+    ctx.push("hello")
+    assert connection._context_timings is not None
+    assert "ctx" in connection._context_timings._sent
+
+    ctx.cancel()
+    assert connection._context_timings._sent == {}
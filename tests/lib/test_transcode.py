@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import math
+import struct
+from typing import Any, List
+
+import pytest
+
+from cartesia.lib._transcode import PCMTranscoder, TranscodingSink
+from cartesia.lib._audio_sink import TeeSink
+
+from .resources.tts._fakes import CollectingSink
+
+try:
+    import numpy  # noqa: F401
+
+    BACKENDS = ["python", "numpy"]
+except ImportError:
+    BACKENDS = ["python"]
+
+
+def _s16(*samples: int) -> bytes:
+    return struct.pack(f"<{len(samples)}h", *samples)
+
+
+def _unpack_s16(data: bytes) -> List[int]:
+    return list(struct.unpack(f"<{len(data) // 2}h", data))
+
+
+def _sine(n: int, rate: int, freq: float = 440.0) -> bytes:
+    return _s16(*(int(12000 * math.sin(2 * math.pi * freq * i / rate)) for i in range(n)))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_g711_encoding(backend: Any) -> None:
+    to_mulaw = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=8000, to_encoding="pcm_mulaw", to_sample_rate=8000, backend=backend
+    )
+    to_alaw = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=8000, to_encoding="pcm_alaw", to_sample_rate=8000, backend=backend
+    )
+    assert to_mulaw.backend == backend
+    assert to_mulaw.convert(_s16(0, 32767, -32768)) == bytes([0xFF, 0x80, 0x00])
+    assert to_alaw.convert(_s16(0, 32767, -32768)) == bytes([0xD5, 0xAA, 0x2A])
+
+    from_mulaw = PCMTranscoder(
+        from_encoding="pcm_mulaw", from_sample_rate=8000, to_encoding="pcm_s16le", to_sample_rate=8000, backend=backend
+    )
+    assert _unpack_s16(from_mulaw.convert(bytes([0xFF, 0x80, 0x00]))) == [0, 32124, -32124]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_s16_f32_round_trip(backend: Any) -> None:
+    pcm = _s16(0, 1, -1, 12345, -12345, 32767, -32768)
+    to_f32 = PCMTranscoder(
+        from_encoding="pcm_s16le",
+        from_sample_rate=16000,
+        to_encoding="pcm_f32le",
+        to_sample_rate=16000,
+        backend=backend,
+    )
+    to_s16 = PCMTranscoder(
+        from_encoding="pcm_f32le",
+        from_sample_rate=16000,
+        to_encoding="pcm_s16le",
+        to_sample_rate=16000,
+        backend=backend,
+    )
+    floats = to_f32.convert(pcm)
+    assert struct.unpack("<7f", floats)[5] == pytest.approx(32767 / 32768)
+    assert to_s16.convert(floats) == pcm
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_resample_down_and_up(backend: Any) -> None:
+    ramp = _s16(*range(0, 1200, 100))
+    down = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=24000, to_encoding="pcm_s16le", to_sample_rate=8000, backend=backend
+    )
+    assert _unpack_s16(down.convert(ramp)) == [0, 300, 600, 900]
+
+    up = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=8000, to_encoding="pcm_s16le", to_sample_rate=16000, backend=backend
+    )
+    assert _unpack_s16(up.convert(_s16(0, 100, 200))) == [0, 50, 100, 150, 200]
+    # The next chunk continues the interpolation from the previous chunk's last sample.
+    assert _unpack_s16(up.convert(_s16(300))) == [250, 300]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize(("from_rate", "to_rate"), [(24000, 8000), (44100, 16000), (16000, 22050)])
+def test_chunked_conversion_matches_whole(backend: Any, from_rate: int, to_rate: int) -> None:
+    audio = _sine(2000, from_rate)
+
+    def make() -> PCMTranscoder:
+        return PCMTranscoder(
+            from_encoding="pcm_s16le",
+            from_sample_rate=from_rate,
+            to_encoding="pcm_mulaw",
+            to_sample_rate=to_rate,
+            backend=backend,
+        )
+
+    whole = make().convert(audio)
+    # Odd chunk sizes split samples across chunks.
+    chunks = [audio[i : i + 333] for i in range(0, len(audio), 333)]
+    assert b"".join(make().iter_convert(chunks)) == whole
+    assert len(whole) == (2000 - 1) * to_rate // from_rate + 1
+
+
+def test_backends_agree() -> None:
+    pytest.importorskip("numpy")
+    audio = _sine(3000, 44100, freq=1234.5)
+    outputs = [
+        _unpack_s16(
+            PCMTranscoder(
+                from_encoding="pcm_s16le",
+                from_sample_rate=44100,
+                to_encoding="pcm_s16le",
+                to_sample_rate=16000,
+                backend=backend,
+            ).convert(audio)
+        )
+        for backend in ("python", "numpy")
+    ]
+    assert len(outputs[0]) == len(outputs[1])
+    assert max(abs(a - b) for a, b in zip(*outputs)) <= 1
+
+
+def test_passthrough_and_flush() -> None:
+    transcoder = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=16000, to_encoding="pcm_s16le", to_sample_rate=16000
+    )
+    assert transcoder.convert(b"\x01\x02\x03") == b"\x01\x02\x03"
+
+    transcoder = PCMTranscoder(
+        from_encoding="pcm_s16le", from_sample_rate=16000, to_encoding="pcm_f32le", to_sample_rate=16000
+    )
+    assert transcoder.convert(b"\x00") == b""
+    assert transcoder.flush() == b""
+    assert transcoder.convert(b"\x00\x00") == b"\x00\x00\x00\x00"
+
+
+def test_transcoding_sinks_fan_out() -> None:
+    phone, analytics = CollectingSink(), CollectingSink()
+    tee = TeeSink(
+        TranscodingSink(
+            phone,
+            PCMTranscoder(
+                from_encoding="pcm_f32le", from_sample_rate=24000, to_encoding="pcm_mulaw", to_sample_rate=8000
+            ),
+        ),
+        TranscodingSink(
+            analytics,
+            PCMTranscoder(
+                from_encoding="pcm_f32le", from_sample_rate=24000, to_encoding="pcm_s16le", to_sample_rate=16000
+            ),
+        ),
+    )
+    audio = struct.pack("<240f", *([0.0] * 240))
+    with tee:
+        tee.write(audio[:500])
+        tee.write(audio[500:])
+
+    assert bytes(phone.data) == b"\xff" * 80
+    assert bytes(analytics.data) == b"\x00" * 2 * 160
+    assert not phone.closed
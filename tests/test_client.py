@@ -10,6 +10,7 @@ import asyncio
 import inspect
 import dataclasses
 import tracemalloc
+import importlib.util
 from typing import Any, Union, TypeVar, Callable, Iterable, Iterator, Optional, Coroutine, cast
 from unittest import mock
 from typing_extensions import Literal, AsyncIterator, override
@@ -23,7 +24,8 @@ from cartesia import Cartesia, AsyncCartesia, APIResponseValidationError
 from cartesia._types import Omit
 from cartesia._utils import asyncify
 from cartesia._models import BaseModel, FinalRequestOptions
-from cartesia._exceptions import APIStatusError, APIResponseValidationError
+from cartesia._constants import HTTP2_CONNECTION_LIMITS
+from cartesia._exceptions import CartesiaError, APIStatusError, APIResponseValidationError
 from cartesia._base_client import (
     DEFAULT_TIMEOUT,
     HTTPX_DEFAULT_TIMEOUT,
@@ -968,6 +970,38 @@ class TestCartesia:
             limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
         )
 
+    def test_http2_option(self) -> None:
+        pytest.importorskip("h2")
+        client = Cartesia(base_url=base_url, token=token, _strict_response_validation=True, http2=True)
+
+        pool = cast(Any, client._client)._transport._pool
+        assert pool._http2
+        assert pool._keepalive_expiry == HTTP2_CONNECTION_LIMITS.keepalive_expiry
+        # copies share the HTTP/2 client unless they choose a protocol
+        assert client.copy()._client is client._client
+        http1_client = client.copy(http2=False)
+        assert not cast(Any, http1_client._client)._transport._pool._http2
+        http1_client.close()
+        client.close()
+
+        with httpx.Client() as http_client:
+            with pytest.raises(ValueError, match="mutually exclusive"):
+                Cartesia(
+                    base_url=base_url,
+                    token=token,
+                    _strict_response_validation=True,
+                    http2=True,
+                    http_client=http_client,
+                )
+
+    def test_http2_option_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(
+            importlib.util, "find_spec", lambda name, *args: None if name == "h2" else find_spec(name, *args)
+        )
+        with pytest.raises(CartesiaError, match=r"cartesia\[http2\]"):
+            Cartesia(base_url=base_url, token=token, _strict_response_validation=True, http2=True)
+
     @pytest.mark.respx(base_url=base_url)
     def test_follow_redirects(self, respx_mock: MockRouter, client: Cartesia) -> None:
         # Test that the default follow_redirects=True allows following redirects
@@ -1878,6 +1912,15 @@ class TestAsyncCartesia:
             limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
         )
 
+    async def test_http2_option(self) -> None:
+        pytest.importorskip("h2")
+        client = AsyncCartesia(base_url=base_url, token=token, _strict_response_validation=True, http2=True)
+
+        pool = cast(Any, client._client)._transport._pool
+        assert pool._http2
+        assert pool._keepalive_expiry == HTTP2_CONNECTION_LIMITS.keepalive_expiry
+        await client.close()
+
     @pytest.mark.respx(base_url=base_url)
     async def test_follow_redirects(self, respx_mock: MockRouter, async_client: AsyncCartesia) -> None:
         # Test that the default follow_redirects=True allows following redirects
@@ -1,8 +1,11 @@
+import io
+from typing import Any, Dict, Tuple, cast
 from pathlib import Path
 
 import anyio
+import httpx
 import pytest
-from dirty_equals import IsDict, IsList, IsBytes, IsTuple
+from dirty_equals import IsDict, IsList, IsTuple, IsInstance
 
 from cartesia._files import to_httpx_files, deepcopy_with_paths, async_to_httpx_files
 from cartesia._utils import extract_files
@@ -13,34 +16,59 @@ readme_path = Path(__file__).parent.parent.joinpath("README.md")
 def test_pathlib_includes_file_name() -> None:
     result = to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.IOBase))})
 
 
 def test_tuple_input() -> None:
     result = to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(io.IOBase))))
 
 
 @pytest.mark.asyncio
 async def test_async_pathlib_includes_file_name() -> None:
     result = await async_to_httpx_files({"file": readme_path})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.IOBase))})
 
 
 @pytest.mark.asyncio
 async def test_async_supports_anyio_path() -> None:
     result = await async_to_httpx_files({"file": anyio.Path(readme_path)})
     print(result)
-    assert result == IsDict({"file": IsTuple("README.md", IsBytes())})
+    assert result == IsDict({"file": IsTuple("README.md", IsInstance(io.IOBase))})
 
 
 @pytest.mark.asyncio
 async def test_async_tuple_input() -> None:
     result = await async_to_httpx_files([("file", readme_path)])
     print(result)
-    assert result == IsList(IsTuple("file", IsTuple("README.md", IsBytes())))
+    assert result == IsList(IsTuple("file", IsTuple("README.md", IsInstance(io.IOBase))))
+
+
+def test_path_is_streamed_in_chunks(tmp_path: Path) -> None:
+    path = tmp_path / "audio.wav"
+    path.write_bytes(bytes(range(256)) * 1024)  # four 64 KiB multipart chunks
+
+    files = to_httpx_files({"file": path})
+    assert files == IsDict({"file": IsTuple("audio.wav", IsInstance(io.IOBase))})
+    request = httpx.Request("POST", "https://example.com", files=files)
+    assert isinstance(request.stream, httpx.SyncByteStream)
+
+    chunks = [chunk for chunk in request.stream if len(chunk) == 64 * 1024]
+    assert len(chunks) == 4
+    # httpx rewinds the file for every attempt, so retried requests send it in full again.
+    body = b"".join(request.stream)
+    assert path.read_bytes() in body
+    assert int(request.headers["Content-Length"]) == len(body)
+
+    reader = cast(Dict[str, Tuple[str, Any]], files)["file"][1]
+    assert reader._file is None  # closed once fully read
+
+
+def test_missing_path_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        to_httpx_files({"file": Path("missing.wav")})
 
 
 def test_string_not_allowed() -> None:
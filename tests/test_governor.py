@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia, ConcurrencyGovernor
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+STATUS = {"ok": True, "version": "test"}
+
+SSE_BODY = b"".join(
+    f"data: {json.dumps(event)}\n\n".encode()
+    for event in [
+        {"type": "chunk", "context_id": "ctx", "data": "AAAA", "done": False, "status_code": 206, "step_time": 1.0},
+        {"type": "done", "context_id": "ctx", "done": True, "status_code": 200},
+    ]
+)
+
+GENERATE_SSE_ARGS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+    "transcript": "Hello",
+    "voice": "voice-id",
+}
+
+
+def _wait_for(condition: Any) -> None:
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_queued_requests_are_granted_in_order() -> None:
+    governor = ConcurrencyGovernor(initial_limit=1)
+    held = governor.acquire()
+    order: List[int] = []
+
+    def worker(n: int) -> None:
+        permit = governor.acquire()
+        order.append(n)
+        permit.release()
+
+    threads = []
+    for n in range(3):
+        thread = threading.Thread(target=worker, args=(n,))
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda n=n: governor.queue_depth == n + 1)
+
+    held.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == [0, 1, 2]
+    assert (governor.in_flight, governor.queue_depth, governor.acquired) == (0, 0, 4)
+    assert 0 < governor.mean_wait <= governor.max_wait
+
+
+def test_limit_halves_once_per_burst_and_grows_on_success() -> None:
+    governor = ConcurrencyGovernor(initial_limit=8, max_limit=12)
+    permits = [governor.acquire() for _ in range(8)]
+    for permit in permits:
+        permit.throttle()
+        permit.release()
+    # every request was sent before the first rate limit, so they count once
+    assert (governor.limit, governor.throttled) == (4, 8)
+
+    permit = governor.acquire()
+    permit.throttle()
+    permit.release()
+    assert governor.limit == 2
+
+    for _ in range(10):
+        governor.acquire().release(success=True)
+    assert governor.limit == 4
+
+    for _ in range(1000):
+        governor.acquire().release(success=True)
+    assert governor.limit == 12
+
+
+def test_retry_after_pauses_the_queue() -> None:
+    governor = ConcurrencyGovernor(initial_limit=4, min_limit=4)
+    permit = governor.acquire()
+    permit.throttle(0.1)
+    permit.release()
+    assert governor.paused_for > 0
+
+    started = time.monotonic()
+    governor.acquire().release()
+    assert time.monotonic() - started >= 0.09
+    assert governor.paused_for == 0
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        ConcurrencyGovernor(min_limit=0)
+    with pytest.raises(ValueError):
+        ConcurrencyGovernor(initial_limit=10, max_limit=5)
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    governor = ConcurrencyGovernor(initial_limit=1)
+    held = await governor.async_acquire()
+    task = asyncio.ensure_future(governor.async_acquire())
+    await asyncio.sleep(0)
+    assert governor.queue_depth == 1
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert governor.queue_depth == 0
+
+    held.release()
+    assert governor.in_flight == 0
+
+
+async def test_async_waiters_are_woken_from_other_threads() -> None:
+    governor = ConcurrencyGovernor(initial_limit=1)
+    held = governor.acquire()
+    waiter = asyncio.ensure_future(governor.async_acquire())
+    await asyncio.sleep(0)
+
+    threading.Thread(target=held.release).start()
+    permit = await asyncio.wait_for(waiter, timeout=5)
+    permit.release()
+    assert governor.in_flight == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_rate_limited_retry_waits_for_the_governor(
+    client: Cartesia, respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    respx_mock.get("/").mock(
+        side_effect=[httpx.Response(429, headers={"retry-after-ms": "50"}), httpx.Response(200, json=STATUS)]
+    )
+    governor = ConcurrencyGovernor(initial_limit=4)
+    governed = client.copy(governor=governor)
+    assert governed.copy()._governor is governor
+
+    def no_sleep(**_kwargs: Any) -> None:
+        raise AssertionError("the governor should hold the retry back instead")
+
+    monkeypatch.setattr(governed, "_sleep_for_retry", no_sleep)
+    started = time.monotonic()
+    governed.get_status()
+
+    assert time.monotonic() - started >= 0.04
+    assert (governor.throttled, governor.limit, governor.in_flight) == (1, 2, 0)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_streamed_response_holds_its_slot_until_closed(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=SSE_BODY)
+    )
+    governor = ConcurrencyGovernor()
+    stream = client.copy(governor=governor).tts.generate_sse(**GENERATE_SSE_ARGS)
+    assert governor.in_flight == 1
+
+    assert [event.type for event in stream] == ["chunk", "done"]
+    assert governor.in_flight == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_rate_limited_retry_waits_for_the_governor(
+    async_client: AsyncCartesia, respx_mock: MockRouter
+) -> None:
+    respx_mock.get("/").mock(
+        side_effect=[httpx.Response(429, headers={"retry-after-ms": "50"}), httpx.Response(200, json=STATUS)]
+    )
+    governor = ConcurrencyGovernor(initial_limit=4)
+    await async_client.copy(governor=governor).get_status()
+
+    assert (governor.throttled, governor.limit, governor.in_flight) == (1, 2, 0)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import List, Optional
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, AsyncCartesia
+from cartesia._prefetch import prefetch_pages, async_prefetch_pages
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+def _voices_page(request: httpx.Request) -> httpx.Response:
+    # three pages of two voices, then an empty one, keyed by the `starting_after` cursor
+    start = {None: 0, "v1": 2, "v3": 4, "v5": 6}[request.url.params.get("starting_after")]
+    ids = [f"v{i}" for i in range(start, min(start + 2, 6))]
+    return httpx.Response(200, json={"data": [{"id": id} for id in ids]})
+
+
+class TestPrefetchPages:
+    def test_look_ahead_is_bounded_by_depth(self) -> None:
+        fetched: List[int] = []
+
+        def fetch_next(page: int) -> Optional[int]:
+            fetched.append(page + 1)
+            return page + 1 if page < 9 else None
+
+        pages = prefetch_pages(0, fetch_next, 2)
+        assert next(pages) == 0
+        time.sleep(0.05)
+        # the fetcher waits for the consumer once two pages are buffered
+        assert fetched == [1, 2]
+        assert list(pages) == list(range(1, 10))
+
+    def test_errors_are_raised_in_page_order(self) -> None:
+        def fetch_next(page: int) -> Optional[int]:
+            if page == 2:
+                raise httpx.ConnectError("boom")
+            return page + 1
+
+        pages = prefetch_pages(0, fetch_next, 3)
+        assert [next(pages), next(pages), next(pages)] == [0, 1, 2]
+        with pytest.raises(httpx.ConnectError):
+            next(pages)
+
+    def test_closing_stops_the_fetcher(self) -> None:
+        fetches = threading.Semaphore(0)
+
+        def fetch_next(page: int) -> Optional[int]:
+            fetches.release()
+            return page + 1
+
+        pages = prefetch_pages(0, fetch_next, 1)
+        next(pages)
+        assert fetches.acquire(timeout=1)
+        pages.close()
+        assert not fetches.acquire(timeout=0.05)
+
+    def test_depth_must_be_positive(self) -> None:
+        with pytest.raises(ValueError):
+            next(prefetch_pages(0, lambda _: None, 0))
+
+    async def test_async_look_ahead(self) -> None:
+        fetched: List[int] = []
+
+        async def fetch_next(page: int) -> Optional[int]:
+            fetched.append(page + 1)
+            await asyncio.sleep(0)
+            return page + 1 if page < 4 else None
+
+        pages = async_prefetch_pages(0, fetch_next, 1)
+        assert await pages.__anext__() == 0
+        await asyncio.sleep(0.01)
+        assert fetched == [1]
+        assert [page async for page in pages] == [1, 2, 3, 4]
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("client", [False], indirect=True)
+def test_iter_items_prefetches_cursor_pages(client: Cartesia, respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/voices").mock(side_effect=_voices_page)
+
+    ids = [voice.id for voice in client.voices.list().iter_items(prefetch=2)]
+
+    assert ids == ["v0", "v1", "v2", "v3", "v4", "v5"]
+    assert [call.request.url.params.get("starting_after") for call in route.calls] == [None, "v1", "v3", "v5"]
+
+
+@pytest.mark.respx(base_url=base_url)
+@pytest.mark.parametrize("async_client", [False], indirect=True)
+async def test_async_iter_items_prefetches_cursor_pages(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.get("/voices").mock(side_effect=_voices_page)
+
+    ids = [voice.id async for voice in async_client.voices.list().iter_items(prefetch=2)]
+
+    assert ids == ["v0", "v1", "v2", "v3", "v4", "v5"]
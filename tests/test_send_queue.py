@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from cartesia._exceptions import WebSocketQueueFullError
-from cartesia._send_queue import SendQueue
+from cartesia._send_queue import SendQueue, AsyncSendQueue, audio_bytes_per_second
 
 
 class TestSendQueue:
@@ -45,7 +47,7 @@ class TestSendQueue:
         q.enqueue("b")
         q.enqueue("c")
 
-        sent: list[str] = []
+        sent: list[str | bytes] = []
         q.flush_sync(sent.append)
         assert sent == ["a", "b", "c"]
         assert len(q) == 0
@@ -56,9 +58,9 @@ class TestSendQueue:
         q.enqueue("b")
         q.enqueue("c")
 
-        sent: list[str] = []
+        sent: list[str | bytes] = []
 
-        def failing_send(data: str) -> None:
+        def failing_send(data: str | bytes) -> None:
             if data == "b":
                 raise RuntimeError("send failed")
             sent.append(data)
@@ -77,9 +79,9 @@ class TestSendQueue:
         q.enqueue("a")
         q.enqueue("b")
 
-        sent: list[str] = []
+        sent: list[str | bytes] = []
 
-        async def async_send(data: str) -> None:
+        async def async_send(data: str | bytes) -> None:
             sent.append(data)
 
         await q.flush_async(async_send)
@@ -93,9 +95,9 @@ class TestSendQueue:
         q.enqueue("b")
         q.enqueue("c")
 
-        sent: list[str] = []
+        sent: list[str | bytes] = []
 
-        async def failing_send(data: str) -> None:
+        async def failing_send(data: str | bytes) -> None:
             if data == "b":
                 raise RuntimeError("send failed")
             sent.append(data)
@@ -114,7 +116,7 @@ class TestSendQueue:
         q.enqueue("a")
         q.enqueue("b")
 
-        def failing_send(data: str) -> None:
+        def failing_send(data: str | bytes) -> None:
             if data == "b":
                 # Simulate another thread enqueuing during flush
                 q.enqueue("new")
@@ -126,3 +128,129 @@ class TestSendQueue:
         # "b" (failed) should come before "new" (added during flush)
         remaining = q.drain()
         assert remaining == ["b", "new"]
+
+    def test_audio_is_queued_as_bytes_against_its_own_budget(self) -> None:
+        q = SendQueue(max_bytes=4, max_audio_bytes=6)
+        q.enqueue(b"\x00\x01\x02\x03\x04\x05")
+        q.enqueue("text")
+        with pytest.raises(WebSocketQueueFullError):
+            q.enqueue(b"\x06")
+        with pytest.raises(WebSocketQueueFullError):
+            q.enqueue("x")
+        assert q.drain() == [b"\x00\x01\x02\x03\x04\x05", "text"]
+
+    def test_drop_oldest_audio_keeps_text(self) -> None:
+        q = SendQueue(max_audio_bytes=4, drop_oldest_audio=True)
+        q.enqueue(b"aa")
+        q.enqueue('{"type": "finalize"}')
+        q.enqueue(b"bb")
+        q.enqueue(b"ccc")
+        assert q.dropped_audio_bytes == 4
+        assert q.drain() == ['{"type": "finalize"}', b"ccc"]
+
+    def test_requeue_restores_audio_budget(self) -> None:
+        q = SendQueue(max_audio_bytes=4)
+        q.enqueue(b"aa")
+        q.enqueue(b"bb")
+
+        def failing_send(data: str | bytes) -> None:
+            raise RuntimeError(f"send failed: {data!r}")
+
+        with pytest.raises(RuntimeError):
+            q.flush_sync(failing_send)
+        with pytest.raises(WebSocketQueueFullError):
+            q.enqueue(b"c")
+        assert q.drain() == [b"aa", b"bb"]
+
+    def test_audio_bytes_per_second(self) -> None:
+        assert audio_bytes_per_second("pcm_s16le", 16_000) == 32_000
+        assert audio_bytes_per_second("pcm_mulaw", 8_000) == 8_000
+        with pytest.raises(ValueError):
+            audio_bytes_per_second("mp3", 16_000)
+
+
+class TestAsyncSendQueue:
+    async def test_put_keeps_bytes_as_given(self) -> None:
+        q = AsyncSendQueue()
+        await q.put(b"\x00\xff")
+        await q.put("finalize")
+        assert q.nbytes == 10
+        assert q.drain() == [b"\x00\xff", "finalize"]
+        assert q.nbytes == 0
+
+    async def test_put_waits_for_room(self) -> None:
+        q = AsyncSendQueue(max_bytes=10)
+        await q.put(b"12345678")
+        blocked = asyncio.ensure_future(q.put(b"abcd"))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        assert len(q) == 1
+
+        sent: list[str | bytes] = []
+
+        async def send(data: str | bytes) -> None:
+            sent.append(data)
+
+        await q.flush(send)
+        assert blocked.done()
+        assert sent == [b"12345678", b"abcd"]
+        assert len(q) == 0
+
+    async def test_flush_sends_every_waiting_producers_frame(self) -> None:
+        q = AsyncSendQueue(max_bytes=4)
+        await q.put(b"aaaa")
+        producers = [asyncio.ensure_future(q.put(data)) for data in (b"bbbb", b"cccc", b"dddd")]
+        await asyncio.sleep(0)
+
+        sent: list[str | bytes] = []
+
+        async def send(data: str | bytes) -> None:
+            sent.append(data)
+
+        await q.flush(send)
+        assert all(producer.done() for producer in producers)
+        assert sent == [b"aaaa", b"bbbb", b"cccc", b"dddd"]
+        assert len(q) == 0
+
+    async def test_drain_releases_waiters(self) -> None:
+        q = AsyncSendQueue(max_bytes=4)
+        await q.put("abcd")
+        blocked = asyncio.ensure_future(q.put("efgh"))
+        await asyncio.sleep(0)
+        assert q.drain() == ["abcd"]
+        await asyncio.wait_for(blocked, timeout=1)
+        assert len(q) == 1
+
+    async def test_oversized_message_fits_empty_queue(self) -> None:
+        q = AsyncSendQueue(max_bytes=2)
+        await q.put("too long")
+        with pytest.raises(WebSocketQueueFullError):
+            q.put_nowait("x")
+        assert len(q) == 1
+
+    async def test_flush_keeps_message_on_failure(self) -> None:
+        q = AsyncSendQueue()
+        q.put_nowait("a")
+        q.put_nowait(b"b")
+        q.put_nowait("c")
+
+        sent: list[str | bytes] = []
+
+        async def failing_send(data: str | bytes) -> None:
+            if data == b"b":
+                q.put_nowait("new")
+                raise RuntimeError("send failed")
+            sent.append(data)
+
+        with pytest.raises(RuntimeError, match="send failed"):
+            await q.flush(failing_send)
+
+        assert sent == ["a"]
+        assert q.drain() == [b"b", "c", "new"]
+
+    async def test_drop_oldest_audio_instead_of_waiting(self) -> None:
+        q = AsyncSendQueue(max_audio_bytes=4, drop_oldest_audio=True)
+        await q.put(b"aaaa")
+        await asyncio.wait_for(q.put(b"bb"), timeout=1)
+        assert q.dropped_audio_bytes == 4
+        assert q.drain() == [b"bb"]
@@ -216,6 +216,52 @@ async def test_multi_byte_character_multiple_chunks(
     assert sse.json() == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_line_terminators_split_across_chunks(
+    sync: bool,
+    client: Cartesia,
+    async_client: AsyncCartesia,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b"event: a\r"
+        yield b"\ndata: 1\r"
+        yield b"\n\r"
+        yield b"\n"
+        yield b"event: b\rdata: 2\r\r"
+        yield b"data: 3\n"
+        yield b"\n"
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    events = [await iter_next(iterator) for _ in range(3)]
+    assert [(sse.event, sse.data) for sse in events] == [("a", "1"), ("b", "2"), (None, "3")]
+
+    await assert_empty_iter(iterator)
+
+
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_large_event_split_across_chunks(
+    sync: bool,
+    client: Cartesia,
+    async_client: AsyncCartesia,
+) -> None:
+    payload = b'{"data":"' + b"QUJD" * 250_000 + b'"}'
+    frame = b"data: " + payload + b"\n\n"
+
+    def body() -> Iterator[bytes]:
+        for i in range(0, len(frame), 4096):
+            yield frame[i : i + 4096]
+
+    iterator = make_event_iterator(content=body(), sync=sync, client=client, async_client=async_client)
+
+    sse = await iter_next(iterator)
+    assert isinstance(sse.raw, memoryview)
+    assert sse.raw == payload
+    assert sse.json() == {"data": "QUJD" * 250_000}
+
+    await assert_empty_iter(iterator)
+
+
 async def to_aiter(iter: Iterator[bytes]) -> AsyncIterator[bytes]:
     for chunk in iter:
         yield chunk
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from cartesia import Cartesia, TimingEvent, AsyncCartesia
+from cartesia._timing import Timings
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+SSE_BODY = b"".join(
+    f"data: {json.dumps(event)}\n\n".encode()
+    for event in [
+        {"type": "chunk", "context_id": "ctx", "data": "AAAA", "done": False, "status_code": 206, "step_time": 12.5},
+        {"type": "chunk", "context_id": "ctx", "data": "AAAA", "done": False, "status_code": 206, "step_time": 30.0},
+        {"type": "done", "context_id": "ctx", "done": True, "status_code": 200},
+    ]
+)
+
+GENERATE_SSE_ARGS: Dict[str, Any] = {
+    "model_id": "sonic-3",
+    "output_format": {"container": "raw", "encoding": "pcm_f32le", "sample_rate": 44100},
+    "transcript": "Hello",
+    "voice": "voice-id",
+}
+
+
+def _names(events: List[TimingEvent]) -> List[str]:
+    return [event.name for event in events]
+
+
+def test_trace_reports_connection_phases() -> None:
+    events: List[TimingEvent] = []
+    request = httpx.Request("POST", "https://api.cartesia.ai/tts/bytes")
+    Timings([events.append]).trace(request)
+
+    trace = request.extensions["trace"]
+    for name in [
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "connection.start_tls.started",
+        "connection.start_tls.complete",
+        "http11.send_request_headers.started",
+        "http11.send_request_headers.complete",
+        "http11.send_request_body.started",
+        "http11.send_request_body.complete",
+        "http11.receive_response_headers.started",
+        "http11.receive_response_headers.complete",
+    ]:
+        trace(name, {})
+
+    assert _names(events) == ["http.connect", "http.tls", "http.first_byte"]
+    assert all(event.duration >= 0 for event in events)
+    assert events[0].attributes == {"method": "POST", "path": "/tts/bytes"}
+
+
+def test_observer_errors_do_not_fail_requests() -> None:
+    events: List[TimingEvent] = []
+
+    def broken(event: TimingEvent) -> None:  # noqa: ARG001
+        raise RuntimeError("boom")
+
+    Timings([broken, events.append]).emit("http.total", 0.5, path="/")
+
+    assert _names(events) == ["http.total"]
+    assert not Timings()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_sse_request_is_timed(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=SSE_BODY)
+    )
+    events: List[TimingEvent] = []
+
+    timed = client.copy(timing_observers=[events.append])
+    assert timed.copy()._timings.observers == (events.append,)
+    list(timed.tts.generate_sse(**GENERATE_SSE_ARGS))
+
+    assert _names(events) == [
+        "http.request_build",
+        "http.total",
+        "sse.decode",
+        "sse.step_time",
+        "sse.decode",
+        "sse.step_time",
+        "sse.decode",
+    ]
+    assert events[1].attributes == {"method": "POST", "path": "/tts/sse", "status_code": 200, "retries": 0}
+    assert [event.duration for event in events if event.name == "sse.step_time"] == [0.0125, 0.03]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_raw_audio_sse_decode_is_timed(client: Cartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=SSE_BODY)
+    )
+    events: List[TimingEvent] = []
+
+    list(client.copy(timing_observers=[events.append]).tts.generate_sse(**GENERATE_SSE_ARGS, raw_audio=True))
+
+    assert _names(events).count("sse.decode") == 3
+    assert _names(events).count("sse.step_time") == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_sse_request_is_timed(async_client: AsyncCartesia, respx_mock: MockRouter) -> None:
+    respx_mock.post("/tts/sse").mock(
+        return_value=httpx.Response(200, headers={"Content-Type": "text/event-stream"}, content=SSE_BODY)
+    )
+    events: List[TimingEvent] = []
+
+    stream = await async_client.copy(timing_observers=[events.append]).tts.generate_sse(**GENERATE_SSE_ARGS)
+    async for _ in stream:
+        pass
+
+    assert _names(events)[:2] == ["http.request_build", "http.total"]
+    assert _names(events).count("sse.decode") == 3
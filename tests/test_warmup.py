@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, List, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+
+from cartesia import Cartesia, AsyncCartesia
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        server: Any = self.server
+        with server.lock:
+            server.requests.append(self.client_address[1])
+        body = b'{"ok": true, "version": "test"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StatusHandler)
+        self.lock = threading.Lock()
+        # the client port of every request, which identifies the connection it was sent on
+        self.requests: List[int] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_warmup_opens_separate_connections(server: _Server) -> None:
+    with Cartesia(api_key="My API Key", base_url=server.url) as client:
+        client.warmup(3)
+        assert len(server.requests) == 3
+        assert len(set(server.requests)) == 3
+
+        # the first real request goes out on one of the warm connections
+        client.get_status()
+        assert server.requests[-1] in server.requests[:3]
+
+
+def test_keep_alive_reuses_warm_connections_until_close(server: _Server) -> None:
+    client = Cartesia(api_key="My API Key", base_url=server.url)
+    client.warmup(2, keep_alive_interval=0.05)
+
+    deadline = time.monotonic() + 5
+    while len(server.requests) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    client.close()
+
+    assert len(server.requests) >= 6
+    assert len(set(server.requests)) == 2
+
+    sent = len(server.requests)
+    time.sleep(0.15)
+    assert len(server.requests) == sent
+
+
+def test_warmup_rejects_invalid_arguments(server: _Server) -> None:
+    with Cartesia(api_key="My API Key", base_url=server.url) as client:
+        with pytest.raises(ValueError):
+            client.warmup(0)
+        with pytest.raises(ValueError):
+            client.warmup(keep_alive_interval=0)
+
+
+async def test_async_warmup_opens_separate_connections(server: _Server) -> None:
+    async with AsyncCartesia(api_key="My API Key", base_url=server.url) as client:
+        await client.warmup(3, keep_alive_interval=60)
+        assert len(set(server.requests)) == 3
+        assert client._keep_alive is not None
+    assert client._keep_alive is None
+
+
+async def test_async_warmup_raises_connection_errors() -> None:
+    from cartesia import APIConnectionError
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+    async with AsyncCartesia(api_key="My API Key", base_url="http://localhost", http_client=http_client) as client:
+        with pytest.raises(APIConnectionError):
+            await client.warmup(2)